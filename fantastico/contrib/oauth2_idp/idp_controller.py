@@ -21,12 +21,14 @@ import json
 import urllib
 
 from fantastico.contrib.oauth2_idp.models.user_repository import UserRepository
+from fantastico.exceptions import FantasticoDbError
 from fantastico.mvc.base_controller import BaseController
 from fantastico.mvc.controller_decorators import Controller, ControllerProvider, \
     CorsEnabled
 from fantastico.mvc.models.model_filter import ModelFilter
 from fantastico.mvc.models.model_filter_compound import ModelFilterAnd
-from fantastico.oauth2.exceptions import OAuth2MissingQueryParamError, OAuth2AuthenticationError, OAuth2Error
+from fantastico.oauth2.exceptions import OAuth2MissingQueryParamError, OAuth2AuthenticationError, OAuth2Error, \
+    OAuth2TemporarilyUnavailableError
 from fantastico.oauth2.models.return_urls import ClientReturnUrl
 from fantastico.oauth2.oauth2_decorators import RequiredScopes
 from fantastico.oauth2.passwords_hasher_factory import PasswordsHasherFactory
@@ -38,7 +40,11 @@ from webob.response import Response
 
 @ControllerProvider()
 class IdpController(BaseController):
-    '''This class provides the controller for all routes / APIs provided by oauth2 default Fantastico Identity Provider.'''
+    '''This class provides the controller for all routes / APIs provided by oauth2 default Fantastico Identity Provider.
+
+    Passwords are verified on the hashing executor of :py:class:`fantastico.oauth2.passwords_hasher_factory.PasswordsHasherFactory`
+    (not on the request thread). Passwords stored using another algorithm than the configured one (oauth2_idp
+    passwords_hasher setting) or using weaker parameters are rehashed after a successful login.'''
 
     REDIRECT_PARAM = "redirect_uri"
 
@@ -49,7 +55,9 @@ class IdpController(BaseController):
         self._idp_client_id = self._idp_config["client_id"]
         self._idp_expires_in = self._idp_config["expires_in"]
         self._login_tpl = self._idp_config["template"]
-        self._passwords_hasher = passwords_hasher_cls().get_hasher(PasswordsHasherFactory.SHA512_SALT)
+        self._hash_alg = self._idp_config.get("passwords_hasher", PasswordsHasherFactory.SHA512_SALT)
+        self._passwords_hasher_factory = passwords_hasher_cls()
+        self._passwords_hasher = self._passwords_hasher_factory.get_hasher(self._hash_alg)
 
     @Controller(url="^/oauth/idp/ui/login$")
     def show_login(self, request):
@@ -162,17 +170,44 @@ class IdpController(BaseController):
         if not user:
             raise OAuth2AuthenticationError("Username or password do not match.")
 
-        password_hash = self._passwords_hasher.hash_password(password, DictionaryObject({"salt": user.user_id}))
+        hash_alg = self._passwords_hasher_factory.detect_hash_alg(user.password)
+
+        hasher = self._passwords_hasher
+        if hash_alg != self._hash_alg:
+            hasher = self._passwords_hasher_factory.get_hasher(hash_alg)
 
-        if password_hash != user.password:
-            # when the account is created for the first time there is no user_id available so a default salt is used.
-            password_hash_default = self._passwords_hasher.hash_password(password)
+        if not self._passwords_hasher_factory.run_hashing(self._verify_password, hasher, hash_alg, password, user):
+            raise OAuth2AuthenticationError("Username or password do not match.")
 
-            if password_hash_default != user.password:
-                raise OAuth2AuthenticationError("Username or password do not match.")
+        if hash_alg != self._hash_alg or hasher.needs_rehash(user.password):
+            self._rehash_password(user, password, user_repo)
 
         return user
 
+    def _verify_password(self, hasher, hash_alg, password, user):
+        '''This method checks the given password against the user password hash. It runs on the hashing executor.'''
+
+        if hasher.verify_password(password, user.password, DictionaryObject({"salt": user.user_id})):
+            return True
+
+        if hash_alg != PasswordsHasherFactory.SHA512_SALT:
+            return False
+
+        # when the account is created for the first time there is no user_id available so a default salt is used.
+        return hasher.verify_password(password, user.password)
+
+    def _rehash_password(self, user, password, user_repo):
+        '''This method replaces the user password hash with a hash generated by the configured passwords hasher. If the hashing
+        executor is busy or the hash can not be saved, the password is rehashed on a following login.'''
+
+        try:
+            password_hash = self._passwords_hasher_factory.run_hashing(self._passwords_hasher.hash_password, password,
+                                                                        DictionaryObject({"salt": user.user_id}))
+
+            user_repo.update_password(user, password_hash)
+        except (OAuth2TemporarilyUnavailableError, FantasticoDbError):
+            pass
+
     def _generate_token(self, user_id, tokens_service):
         '''This method generates a login token using the given user_id and tokens_service.'''
 
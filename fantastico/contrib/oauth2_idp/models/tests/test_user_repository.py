@@ -64,3 +64,13 @@ class UserRepositoryTests(FantasticoUnitTestsCase):
 
         with self.assertRaises(FantasticoDbNotFoundError):
             self._repo.load_by_username("john.doe")
+
+    def test_update_password(self):
+        '''This test case ensures the password hash of a loaded user can be replaced.'''
+
+        user = User(username="john.doe@gmail.com", password="abcd", person_id=1)
+
+        self._repo.update_password(user, "$pbkdf2-sha256$100000$salt$hash")
+
+        self.assertEqual("$pbkdf2-sha256$100000$salt$hash", user.password)
+        self._user_facade.update.assert_called_once_with(user, user)
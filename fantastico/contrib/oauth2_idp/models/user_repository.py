@@ -38,3 +38,10 @@ class UserRepository(object):
             raise FantasticoDbNotFoundError("User %s does not exist." % username)
 
         return users[0]
+
+    def update_password(self, user, passwd_hash):
+        '''This method replaces the password hash of the given (already loaded) user.'''
+
+        user.password = passwd_hash
+
+        self._user_facade.update(user, user)
@@ -19,6 +19,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico.contrib.oauth2_idp.models.persons import Person
 from fantastico.contrib.oauth2_idp.models.users import User
 from fantastico.contrib.oauth2_idp.models.validators.user_validator import UserValidator
+from fantastico.oauth2.exceptions import OAuth2TemporarilyUnavailableError
 from fantastico.oauth2.passwords_hasher_factory import PasswordsHasherFactory
 from fantastico.roa.roa_exceptions import FantasticoRoaError
 from fantastico.tests.base_case import FantasticoUnitTestsCase
@@ -39,6 +40,7 @@ class UserValidatorTests(FantasticoUnitTestsCase):
     def init(self):
         self._hasher = Mock()
         self._hasher.get_hasher = Mock(return_value=self._hasher)
+        self._hasher.run_hashing = Mock(side_effect=lambda func, *args: func(*args))
         hasher_factory = Mock(return_value=self._hasher)
 
         self._person_facade = Mock()
@@ -96,6 +98,33 @@ class UserValidatorTests(FantasticoUnitTestsCase):
 
         self._test_validate_user_template(resource, request)
 
+    def test_validate_user_hashing_busy(self):
+        '''This test case ensures a 503 validation error is raised if the hashing executor is busy.'''
+
+        request = Request.blank("/test", {})
+        request.method = 'PUT'
+
+        resource = User(username="john.doe@gmail.com", password="123abcd")
+        resource.user_id = 55
+
+        self._hasher.run_hashing = Mock(side_effect=OAuth2TemporarilyUnavailableError("Executor is busy."))
+
+        with self.assertRaises(FantasticoRoaError) as ctx:
+            self._validator.validate(resource, request)
+
+        self.assertEqual(503, ctx.exception.http_code)
+
+    def test_validate_user_configured_hasher(self):
+        '''This test case ensures passwords are hashed using the algorithm configured for oauth2 identity provider.'''
+
+        settings_facade = Mock()
+        settings_facade.get = Mock(return_value={"passwords_hasher": PasswordsHasherFactory.SCRYPT})
+
+        UserValidator(password_hasher_factory=Mock(return_value=self._hasher), settings_facade_cls=Mock(return_value=settings_facade))
+
+        settings_facade.get.assert_called_once_with("oauth2_idp")
+        self._hasher.get_hasher.assert_called_with(PasswordsHasherFactory.SCRYPT)
+
     def test_validate_user_missingusername(self):
         '''This test case ensures an exception is raised if username is attribute is not sent.'''
 
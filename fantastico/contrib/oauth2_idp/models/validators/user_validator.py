@@ -19,19 +19,26 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico import mvc
 from fantastico.contrib.oauth2_idp.models.persons import Person
 from fantastico.mvc.model_facade import ModelFacade
+from fantastico.oauth2.exceptions import OAuth2TemporarilyUnavailableError
 from fantastico.oauth2.passwords_hasher_factory import PasswordsHasherFactory
 from fantastico.roa.resource_validator import ResourceValidator
 from fantastico.roa.roa_exceptions import FantasticoRoaError
+from fantastico.settings import SettingsFacade
 from fantastico.utils.dictionary_object import DictionaryObject
 from fantastico.validate_email import validate_email
 from fantastico.exceptions import FantasticoDbError
 
 class UserValidator(ResourceValidator):
-    '''This class provides the user validator logic.'''
+    '''This class provides the user validator logic. Passwords are hashed on the hashing executor of
+    :py:class:`fantastico.oauth2.passwords_hasher_factory.PasswordsHasherFactory` using the algorithm configured in oauth2_idp
+    passwords_hasher setting.'''
 
     def __init__(self, password_hasher_factory=PasswordsHasherFactory, model_facade_cls=ModelFacade,
-                 conn_manager=None):
-        self._passwd_hasher = password_hasher_factory().get_hasher(PasswordsHasherFactory.SHA512_SALT)
+                 conn_manager=None, settings_facade_cls=SettingsFacade):
+        hash_alg = settings_facade_cls().get("oauth2_idp").get("passwords_hasher", PasswordsHasherFactory.SHA512_SALT)
+
+        self._passwd_hasher_factory = password_hasher_factory()
+        self._passwd_hasher = self._passwd_hasher_factory.get_hasher(hash_alg)
         self._model_facade_cls = model_facade_cls
         self._conn_manager = conn_manager or mvc.CONN_MANAGER
 
@@ -76,7 +83,12 @@ class UserValidator(ResourceValidator):
         '''This method hashes the password from the given resource.'''
 
         hash_ctx = {"salt": resource.user_id}
-        resource.password = self._passwd_hasher.hash_password(resource.password, DictionaryObject(hash_ctx))
+
+        try:
+            resource.password = self._passwd_hasher_factory.run_hashing(self._passwd_hasher.hash_password, resource.password,
+                                                                        DictionaryObject(hash_ctx))
+        except OAuth2TemporarilyUnavailableError as ex:
+            raise FantasticoRoaError(str(ex), http_code=503)
 
     def _validate_person(self, resource, request):
         '''This method ensures person_id attribute is not set for resource. Additionally if the resource is new a default person
@@ -74,4 +74,16 @@ CREATE TABLE IF NOT EXISTS oauth2_client_scopes(
 	PRIMARY KEY(client_id, scope_id),
 	CONSTRAINT fk_oauth2clientscopes_client FOREIGN KEY(client_id) REFERENCES oauth2_clients(client_id),
 	CONSTRAINT fk_oauth2clientscopes_scope FOREIGN KEY(scope_id) REFERENCES oauth2_scopes(scope_id)
-);
\ No newline at end of file
+);
+CREATE TABLE IF NOT EXISTS oauth2_revoked_tokens(
+	token_id VARCHAR(36) NOT NULL,
+	expiration_time INTEGER NOT NULL,
+	revocation_time INTEGER NOT NULL,
+	PRIMARY KEY(token_id),
+	INDEX idx_revokedtokens_revocationtime(revocation_time)
+);
+CREATE TABLE IF NOT EXISTS oauth2_cache_versions(
+	cache_name VARCHAR(50) NOT NULL,
+	version INTEGER NOT NULL,
+	PRIMARY KEY(cache_name)
+);
@@ -20,8 +20,10 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico.contrib.oauth2_idp.models.users import User
 from fantastico.mvc.models.model_filter import ModelFilter
 from fantastico.mvc.models.model_filter_compound import ModelFilterAnd
-from fantastico.oauth2.exceptions import OAuth2MissingQueryParamError, OAuth2AuthenticationError, OAuth2Error
+from fantastico.oauth2.exceptions import OAuth2MissingQueryParamError, OAuth2AuthenticationError, OAuth2Error, \
+    OAuth2TemporarilyUnavailableError
 from fantastico.oauth2.models.return_urls import ClientReturnUrl
+from fantastico.oauth2.passwords_hasher import PasswordsHasher
 from fantastico.oauth2.passwords_hasher_factory import PasswordsHasherFactory
 from fantastico.oauth2.token import Token
 from fantastico.oauth2.tokengenerator_factory import TokenGeneratorFactory
@@ -56,6 +58,9 @@ class IdpControllerTests(FantasticoUnitTestsCase):
 
         self._hasher = Mock()
         self._hasher.get_hasher = Mock(return_value=self._hasher)
+        self._hasher.detect_hash_alg = Mock(return_value=PasswordsHasherFactory.SHA512_SALT)
+        self._hasher.needs_rehash = Mock(return_value=False)
+        self._hasher.run_hashing = Mock(side_effect=lambda func, *args: func(*args))
         hasher_cls = Mock(return_value=self._hasher)
 
         settings_facade = Mock()
@@ -167,6 +172,74 @@ class IdpControllerTests(FantasticoUnitTestsCase):
         tokens_service.encrypt.assert_called_once_with(token, token.client_id)
 
 
+    def test_authenticate_rehash_password(self):
+        '''This test case ensures passwords stored using an old algorithm are verified and rehashed using the configured
+        algorithm after a successful login.'''
+
+        from fantastico.contrib.oauth2_idp.idp_controller import IdpController
+
+        settings_facade = Mock()
+        settings_facade.get = Mock(return_value={"client_id": self._IDP_CLIENTID,
+                                                 "template": self._TPL_LOGIN,
+                                                 "expires_in": self._EXPIRES_IN,
+                                                 "passwords_hasher": PasswordsHasherFactory.PBKDF2_SHA256})
+
+        self._idp_controller = IdpController(settings_facade)
+
+        user = User(username="john.doe@gmail.com", password="12345", person_id=1)
+        user.user_id = 123
+
+        request, user_repo_cls, user_repo, tokens_service_cls, _, _ = \
+            self._mock_authenticate_dependencies(Token({"client_id": self._IDP_CLIENTID}), user, "/test/url")
+
+        user.password = PasswordsHasherFactory().get_hasher(PasswordsHasherFactory.SHA512_SALT).hash_password(
+                                                                        "12345", DictionaryObject({"salt": user.user_id}))
+
+        self._idp_controller.authenticate(request, tokens_service_cls=tokens_service_cls, user_repo_cls=user_repo_cls)
+
+        self.assertEqual(1, user_repo.update_password.call_count)
+
+        passwd_hash = user_repo.update_password.call_args[0][1]
+
+        self.assertEqual(PasswordsHasherFactory.PBKDF2_SHA256, PasswordsHasherFactory().detect_hash_alg(passwd_hash))
+        self.assertTrue(PasswordsHasherFactory().get_hasher(PasswordsHasherFactory.PBKDF2_SHA256).verify_password("12345",
+                                                                                                              passwd_hash))
+
+    def test_authenticate_rehash_busy(self):
+        '''This test case ensures login succeeds even if the password can not be rehashed because hashing executor is busy.'''
+
+        user = User(username="john.doe@gmail.com", password="12345", person_id=1)
+        user.user_id = 123
+
+        request, user_repo_cls, user_repo, tokens_service_cls, _, _ = \
+            self._mock_authenticate_dependencies(Token({"client_id": self._IDP_CLIENTID}), user, "/test/url")
+
+        self._hasher.needs_rehash = Mock(return_value=True)
+        self._hasher.run_hashing = Mock(side_effect=[True, OAuth2TemporarilyUnavailableError("Executor is busy.")])
+
+        response = self._idp_controller.authenticate(request, tokens_service_cls=tokens_service_cls,
+                                                     user_repo_cls=user_repo_cls)
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual(0, user_repo.update_password.call_count)
+
+    def test_authenticate_hashing_busy(self):
+        '''This test case ensures login attempts are rejected with 503 when the hashing executor is busy.'''
+
+        user = User(username="john.doe@gmail.com", password="12345", person_id=1)
+        user.user_id = 123
+
+        request, user_repo_cls, _, tokens_service_cls, tokens_service, _ = \
+            self._mock_authenticate_dependencies(Token({"client_id": self._IDP_CLIENTID}), user, "/test/url")
+
+        self._hasher.run_hashing = Mock(side_effect=OAuth2TemporarilyUnavailableError("Executor is busy."))
+
+        with self.assertRaises(OAuth2TemporarilyUnavailableError) as ctx:
+            self._idp_controller.authenticate(request, tokens_service_cls=tokens_service_cls, user_repo_cls=user_repo_cls)
+
+        self.assertEqual(503, ctx.exception.http_code)
+        self.assertEqual(0, tokens_service.generate.call_count)
+
     def test_authenticate_missing_username(self):
         '''This test case ensures an exception is raised when the username is not posted.'''
 
@@ -474,6 +547,8 @@ class IdpControllerTests(FantasticoUnitTestsCase):
         user_repo_cls = Mock(return_value=user_repo)
 
         self._hasher.hash_password = Mock(return_value="12345")
+        self._hasher.verify_password = Mock(side_effect=lambda plain_passwd, passwd_hash, hash_ctx=None: \
+                                                PasswordsHasher.verify_password(self._hasher, plain_passwd, passwd_hash, hash_ctx))
 
         tokens_service = Mock()
         tokens_service_cls = Mock(return_value=tokens_service)
@@ -18,7 +18,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 from fantastico import mvc
 from fantastico.contrib.roa_discovery import roa_helper
-from fantastico.exceptions import FantasticoDbError
+from fantastico.exceptions import FantasticoDbError, FantasticoDbNotFoundError, FantasticoNotSupportedError
 from fantastico.mvc.base_controller import BaseController
 from fantastico.mvc.controller_decorators import ControllerProvider, Controller, \
     CorsEnabled
@@ -27,13 +27,18 @@ from fantastico.mvc.models.model_filter import ModelFilter
 from fantastico.mvc.models.model_filter_compound import ModelFilterAnd
 from fantastico.oauth2.exceptions import OAuth2UnauthorizedError, OAuth2Error
 from fantastico.roa.query_parser import QueryParser
+from fantastico.roa.resource_decorator import Resource
 from fantastico.roa.resource_json_serializer import ResourceJsonSerializer
 from fantastico.roa.resources_registry import ResourcesRegistry
 from fantastico.roa.roa_exceptions import FantasticoRoaError
+from fantastico.routing_engine.custom_responses import StreamedResponse
 from fantastico.settings import SettingsFacade
 from fantastico.utils.dictionary_object import DictionaryObject
+from fantastico.utils.lru_cache import LruCache
 from webob.response import Response
+import itertools
 import json
+import threading
 
 @ControllerProvider()
 class RoaController(BaseController):
@@ -48,6 +53,10 @@ class RoaController(BaseController):
     OFFSET_DEFAULT = 0
     LIMIT_DEFAULT = 100
 
+    TOTAL_ITEMS_CACHE_SIZE = 1024
+    _TOTAL_ITEMS_CACHES = {}
+    _TOTAL_ITEMS_LOCK = threading.Lock()
+
     def __init__(self, settings_facade, resources_registry_cls=ResourcesRegistry, model_facade_cls=ModelFacade,
                  conn_manager=mvc,
                  json_serializer_cls=ResourceJsonSerializer,
@@ -141,6 +150,17 @@ class RoaController(BaseController):
                                                     (url, version),
                                           error_details=self._errors_url % error_code)
 
+    def _handle_resource_noitems(self, version, url):
+        '''This method builds the response sent to the client when a batch request body is not a json array.'''
+
+        error_code = 10020
+
+        return self._build_error_response(http_code=400,
+                                          error_code=error_code,
+                                          error_description="Resource %s version %s batch body must be a json array." % \
+                                                    (url, version),
+                                          error_details=self._errors_url % error_code)
+
     def _handle_resource_dberror(self, version, url, dbex):
         '''This method builds a resource dberror response which is sent to the client.'''
 
@@ -152,6 +172,17 @@ class RoaController(BaseController):
                                                     (url, version, str(dbex)),
                                           error_details=self._errors_url % error_code)
 
+    def _handle_resource_invalid_continuation(self, version, url, ex):
+        '''This method builds an invalid continuation token response which is sent to the client.'''
+
+        error_code = 10050
+
+        return self._build_error_response(http_code=400,
+                                          error_code=error_code,
+                                          error_description="Resource %s version %s can not be paged: %s" % \
+                                                    (url, version, str(ex)),
+                                          error_details=self._errors_url % error_code)
+
     def _get_current_connection(self, request):
         '''This method returns the current db connection for this request.'''
 
@@ -184,7 +215,23 @@ class RoaController(BaseController):
             var response = {"items": [
                                 // resources represented as json objects.
                             ],
-                            "totalItems": 100}
+                            "totalItems": 100,
+                            "continuationToken": "eyJrZXlzZXQiOlsxMDBdLCJvcmRlciI6W119"}
+
+        **totalItems** is obtained according to the resource totalItems policy
+        (:py:attr:`fantastico.roa.resource_decorator.Resource.total_items`). Clients which do not need it can send
+        **total=false** query parameter; in this case (and for resources using **none** policy) **totalItems** is omitted and
+        no count is done.
+
+        **continuationToken** is an opaque token returned for each full page. When it is sent back as **continuation** query
+        parameter (an empty value starts from the first page), the next page is retrieved in seek mode (on the sort key
+        followed by the primary key) instead of offset mode, so deep pages are retrieved as fast as the first one. The token is
+        valid only for the order expression used when it was obtained.
+
+        Collections of resources which define a **stream_batch_size**
+        (:py:attr:`fantastico.roa.resource_decorator.Resource.stream_batch_size`) are streamed: items are fetched from a server
+        side cursor and the response body is sent in chunks as items are serialized, so big pages are served in constant
+        memory. Errors which occur after the first chunk was sent can not be reported to the client.
 
         If a resource is not found or the resource version does not exist the following response is returned:
 
@@ -221,26 +268,280 @@ class RoaController(BaseController):
 
         sort_expr = self._parse_sort(params.order_expr, resource.model)
 
+        keyset = None
+
+        try:
+            if params.continuation is not None:
+                keyset = []
+
+            if params.continuation:
+                keyset = roa_helper.decode_continuation_token(params.continuation, params.order_expr)
+        except FantasticoRoaError as ex:
+            return self._handle_resource_invalid_continuation(version, resource_url, ex)
+
         model_facade = self._model_facade_cls(resource.model, self._get_current_connection(request))
+        projection = self._get_projection(resource, json_serializer, params.fields)
+        eager_load = self._get_eager_load(resource, projection)
+
+        total_items = resource.total_items if params.total else Resource.TOTAL_ITEMS_NONE
+        models_count = None
+
+        try:
+            if resource.stream_batch_size:
+                models = model_facade.iter_records_paged(start_record=params.offset, end_record=params.offset + params.limit,
+                                                         filter_expr=filter_expr,
+                                                         sort_expr=sort_expr,
+                                                         keyset=keyset,
+                                                         batch_size=resource.stream_batch_size,
+                                                         projection=projection,
+                                                         eager_load=eager_load)
+            elif total_items == Resource.TOTAL_ITEMS_EXACT and keyset is None:
+                models, models_count = model_facade.get_records_paged_counted(start_record=params.offset,
+                                                                              end_record=params.offset + params.limit,
+                                                                              filter_expr=filter_expr,
+                                                                              sort_expr=sort_expr,
+                                                                              projection=projection,
+                                                                              eager_load=eager_load)
+            else:
+                models = model_facade.get_records_paged(start_record=params.offset, end_record=params.offset + params.limit,
+                                                        filter_expr=filter_expr,
+                                                        sort_expr=sort_expr,
+                                                        keyset=keyset,
+                                                        projection=projection,
+                                                        eager_load=eager_load)
+        except FantasticoNotSupportedError as ex:
+            return self._handle_resource_invalid_continuation(version, resource_url, ex)
+
+        if total_items != Resource.TOTAL_ITEMS_NONE and models_count is None:
+            models_count = self._count_collection(resource, model_facade, filter_expr, params.filter_expr,
+                                                  self._get_resource_user(resource, access_token))
+
+        if resource.stream_batch_size:
+            response = StreamedResponse(self._stream_collection(request, resource, json_serializer, model_facade, models,
+                                                                models_count, params, sort_expr),
+                                        content_type="application/json")
+            self._add_cache_headers(response, resource)
+
+            return response
+
+        # collections are validated only by entity tags: the newest modify date of a page does not change when items are
+        # deleted or when the page membership changes.
+        etag = None
+
+        if resource.etag_attr:
+            etag = roa_helper.calculate_etag(self._get_resource_user(resource, access_token), params.fields, params.order_expr,
+                                             models_count, *[self._get_model_version(model_facade, resource, model)
+                                                             for model in models])
+
+        if etag and roa_helper.is_not_modified(request, etag):
+            return self._handle_resource_notmodified(resource, etag)
+
+        body = json.dumps(self._build_collection(request, resource, json_serializer, model_facade, models, models_count, params,
+                                                 sort_expr))
+
+        return self._build_conditional_response(request, resource, access_token, body, etag)
+
+    def _get_projection(self, resource, json_serializer, fields):
+        '''This method returns the model attributes which must be loaded from database for the given fields (None if all
+        attributes must be loaded).'''
+
+        projection = json_serializer.get_projection(fields)
+
+        if not projection:
+            return None
+
+        if resource.etag_attr:
+            projection.append(resource.etag_attr)
+
+        return projection
+
+    def _get_eager_load(self, resource, projection):
+        '''This method returns the loading strategies of the subresources requested in the given projection.'''
+
+        requested_attrs = {attr_path.partition(".")[0] for attr_path in projection or []}
+
+        return {subresource_name: strategy for subresource_name, strategy in resource.subresources_loading.items()
+                if subresource_name in requested_attrs} or None
+
+    def _get_resource_user(self, resource, access_token):
+        '''This method returns the user the representation of the given resource is built for. For user independent
+        resources None is returned.'''
+
+        return access_token.user_id if resource.user_dependent else None
+
+    def _get_model_version(self, model_facade, resource, model):
+        '''This method returns the primary key values of the given model followed by the value of the resource version
+        attribute (:py:attr:`fantastico.roa.resource_decorator.Resource.etag_attr`).'''
+
+        return [getattr(model, pk_attr) for pk_attr in model_facade.model_pk_attrs] + [getattr(model, resource.etag_attr)]
+
+    def _get_last_modified(self, resource, model):
+        '''This method returns the modification date of the given model
+        (:py:attr:`fantastico.roa.resource_decorator.Resource.last_modified_attr`). If the resource does not declare a last
+        modified attribute None is returned.'''
+
+        if not resource.last_modified_attr:
+            return None
+
+        return getattr(model, resource.last_modified_attr)
+
+    def _build_conditional_response(self, request, resource, access_token, body, etag=None, last_modified=None):
+        '''This method builds the response for the given serialized resource body. If no entity tag is given it is calculated
+        from the body; if the client already holds the body a **304 Not Modified** response is built instead.'''
+
+        if etag is None:
+            etag = roa_helper.calculate_etag(self._get_resource_user(resource, access_token), body)
+
+            if roa_helper.is_not_modified(request, etag, last_modified):
+                return self._handle_resource_notmodified(resource, etag, last_modified)
+
+        response = Response(text=body, content_type="application/json", status_code=200)
+        self._add_cache_headers(response, resource, etag, last_modified)
+
+        return response
+
+    def _handle_resource_notmodified(self, resource, etag, last_modified=None):
+        '''This method builds a **304 Not Modified** response (without body) for a representation already held by the
+        client.'''
 
-        models = model_facade.get_records_paged(start_record=params.offset, end_record=params.offset + params.limit,
-                                                filter_expr=filter_expr,
-                                                sort_expr=sort_expr)
-        items = [json_serializer.serialize(model, params.fields) for model in models]
+        response = Response(status_code=304, content_type="application/json")
+        self._add_cache_headers(response, resource, etag, last_modified)
+
+        return response
+
+    def _add_cache_headers(self, response, resource, etag=None, last_modified=None):
+        '''This method adds cors and caching headers (**ETag**, **Last-Modified**, **Cache-Control**) to the given resource
+        response.'''
+
+        self._add_cors_headers(response)
+
+        if etag:
+            response.etag = etag
+
+        if last_modified:
+            response.last_modified = last_modified
+
+        if resource.cache_control:
+            response.headers["Cache-Control"] = resource.cache_control
+        elif resource.user_dependent:
+            response.headers["Cache-Control"] = "private"
+
+    def _build_collection(self, request, resource, json_serializer, model_facade, models, models_count, params, sort_expr):
+        '''This method builds the body of a collection response in memory.'''
+
+        items = json_serializer.serialize_list(models, params.fields)
 
         if resource.validator:
             resource.validator().format_collection(items, request)
 
-        models_count = model_facade.count_records(filter_expr=filter_expr)
+        body = {"items": items}
 
-        body = {"items": items,
-                "totalItems": models_count}
+        if models_count is not None:
+            body["totalItems"] = models_count
 
-        response = Response(text=json.dumps(body), content_type="application/json", status_code=200)
+        continuation_token = self._build_continuation_token(model_facade, models[-1] if models else None, len(models), params,
+                                                            sort_expr)
 
-        self._add_cors_headers(response)
+        if continuation_token:
+            body["continuationToken"] = continuation_token
 
-        return response
+        return body
+
+    def _stream_collection(self, request, resource, json_serializer, model_facade, models, models_count, params, sort_expr):
+        '''This method yields the body of a collection response in chunks of resource **stream_batch_size** items. Each chunk
+        is serialized (and formatted by resource validator) as soon as its models are fetched from database so at most one
+        chunk is held in memory.'''
+
+        models = iter(models)
+        models_read = 0
+        last_model = None
+
+        separator = ""
+        chunk = "{\"items\": ["
+
+        batch = list(itertools.islice(models, resource.stream_batch_size))
+
+        while batch:
+            items = json_serializer.serialize_list(batch, params.fields)
+
+            if resource.validator:
+                resource.validator().format_collection(items, request)
+
+            chunk += separator + ", ".join(json.dumps(item) for item in items)
+            separator = ", "
+
+            yield chunk.encode()
+
+            chunk = ""
+            models_read += len(batch)
+            last_model = batch[-1]
+
+            batch = list(itertools.islice(models, resource.stream_batch_size))
+
+        chunk += "]"
+
+        if models_count is not None:
+            chunk += ", \"totalItems\": %s" % json.dumps(models_count)
+
+        continuation_token = self._build_continuation_token(model_facade, last_model, models_read, params, sort_expr)
+
+        if continuation_token:
+            chunk += ", \"continuationToken\": %s" % json.dumps(continuation_token)
+
+        yield (chunk + "}").encode()
+
+    def _count_collection(self, resource, model_facade, filter_expr, filter_str, user_id):
+        '''This method obtains the number of items of a collection using the resource **totalItems** policy
+        (:py:attr:`fantastico.roa.resource_decorator.Resource.total_items`).'''
+
+        if resource.total_items == Resource.TOTAL_ITEMS_ESTIMATED and filter_expr is None:
+            return model_facade.estimate_records()
+
+        if resource.total_items != Resource.TOTAL_ITEMS_CACHED:
+            return model_facade.count_records(filter_expr=filter_expr)
+
+        counts_cache = self._get_total_items_cache(resource)
+        count_key = (filter_str, user_id)
+
+        models_count = counts_cache.get(count_key)
+
+        if models_count is None:
+            models_count = model_facade.count_records(filter_expr=filter_expr)
+            counts_cache.put(count_key, models_count)
+
+        return models_count
+
+    @classmethod
+    def _get_total_items_cache(cls, resource):
+        '''This method returns the per process cache holding **totalItems** of the given resource collections.'''
+
+        cache_key = (resource.name, resource.version)
+        counts_cache = cls._TOTAL_ITEMS_CACHES.get(cache_key)
+
+        if counts_cache is None:
+            with cls._TOTAL_ITEMS_LOCK:
+                counts_cache = cls._TOTAL_ITEMS_CACHES.get(cache_key)
+
+                if counts_cache is None:
+                    counts_cache = LruCache(cls.TOTAL_ITEMS_CACHE_SIZE, ttl=resource.total_items_ttl)
+                    cls._TOTAL_ITEMS_CACHES[cache_key] = counts_cache
+
+        return counts_cache
+
+    def _build_continuation_token(self, model_facade, last_model, models_count, params, sort_expr):
+        '''This method builds the continuation token for the next page of a collection (starting after the given last model
+        of the current page). A token is built only for full pages sorted by model attributes. If the sort key values of the
+        last model are NULL or can not be encoded no token is built and clients continue using offset paging.'''
+
+        if not models_count or models_count < params.limit:
+            return None
+
+        try:
+            keyset = model_facade.get_keyset(last_model, sort_expr)
+
+            return roa_helper.encode_continuation_token(keyset, params.order_expr)
+        except FantasticoNotSupportedError:
+            return None
 
     @Controller(url=BASE_LATEST_URL + "$", method="GET")
     def get_collection_latest(self, request, resource_url):
@@ -341,6 +642,16 @@ class RoaController(BaseController):
         if not model:
             return self._handle_resource_item_notfound(version, resource_url, resource_id)
 
+        last_modified = self._get_last_modified(resource, model)
+        etag = None
+
+        if resource.etag_attr:
+            etag = roa_helper.calculate_etag(self._get_resource_user(resource, access_token), fields,
+                                             *self._get_model_version(model_facade, resource, model))
+
+        if (etag or last_modified) and roa_helper.is_not_modified(request, etag, last_modified):
+            return self._handle_resource_notmodified(resource, etag, last_modified)
+
         json_serializer = self._json_serializer_cls(resource)
 
         resource_body = json_serializer.serialize(model, fields)
@@ -350,10 +661,7 @@ class RoaController(BaseController):
 
         resource_body = json.dumps(resource_body)
 
-        response = Response(body=resource_body.encode(), content_type="application/json", status_code=200)
-        self._add_cors_headers(response)
-
-        return response
+        return self._build_conditional_response(request, resource, access_token, resource_body, etag, last_modified)
 
     @Controller(url=BASE_LATEST_URL + "/(?P<resource_id>.*?)$", method="GET")
     def get_item_latest(self, request, resource_url, resource_id):
@@ -381,6 +689,9 @@ class RoaController(BaseController):
             * **10020** - Whenever we try to create a resource without passing a valid body.
             * **10030** - Whenever we try to create a resource and an unexpected database exception occurs.
 
+        If the body is a json array of resources, all valid resources are created in a single transaction (read more on
+        :ref:`roa-batch-operations`).
+
         You can find more information about typical REST ROA APIs response on :doc:`/features/roa/rest_responses`.'''
 
         if version != "latest":
@@ -391,6 +702,9 @@ class RoaController(BaseController):
         if not resource:
             return self._handle_resource_notfound(version, resource_url)
 
+        if request.body and request.body.lstrip()[:1] == b"[":
+            return self._create_items(request, version, resource)
+
         model = self._validate_resource(resource, request, request.body)
         access_token = request.context.security.access_token
 
@@ -473,15 +787,17 @@ class RoaController(BaseController):
             if not existing_model or not self._is_model_owned_by(existing_model, access_token, resource):
                 return self._handle_resource_item_notfound(version, resource_url, resource_id)
 
-            setattr(model, pk_col.name, resource_id)
+            setattr(model, model_facade.model_pk_attrs[0], resource_id)
 
             if resource.validator:
                 resource.validator().on_pre_update(model, request)            
             
-            model_facade.update(model)
+            model_facade.update(model, existing_model)
             
             if resource.validator:
                 resource.validator().on_post_update(model, request)
+        except FantasticoDbNotFoundError:
+            return self._handle_resource_item_notfound(version, resource_url, resource_id)
         except FantasticoDbError as dbex:
             return self._handle_resource_dberror(resource.version, resource.url, dbex)
 
@@ -559,6 +875,262 @@ class RoaController(BaseController):
 
         return self.delete_item(request, "latest", self._trim_resource_url(resource_url), resource_id)
 
+    @Controller(url=BASE_URL + "$", method="PUT")
+    def update_items(self, request, version, resource_url):
+        '''This method provides the route for updating multiple existing resources of a collection in a single transaction. The
+        body is a json array of resources; each resource must contain its unique identifier. Each resource is validated
+        exactly like in :py:meth:`update_item` and the status of each resource is reported in the response (read more on
+        :ref:`roa-batch-operations`):
+
+        .. code-block:: html
+
+            207 Multi-Status
+            Content-Type: application/json
+
+            {"items": [{"status": 204, "id": 1},
+                       {"status": 404, "id": 2, "error_code": 10040, ...}]}
+
+        Below you can find all error response codes which might be returned for the whole batch:
+
+            * **10000** - Whenever we try to update resources with unknown type. (Not registered to ROA).
+            * **10020** - Whenever we try to update resources without passing a json array of resources.
+            * **10030** - Whenever we try to update resources and an unexpected database exception occurs (no resource is
+              updated).'''
+
+        if version != "latest":
+            version = float(version)
+
+        resource = self._resources_registry.find_by_url(resource_url, version)
+
+        if not resource:
+            return self._handle_resource_notfound(version, resource_url)
+
+        items = self._get_items_body(request)
+
+        if items is None:
+            return self._handle_resource_noitems(version, resource_url)
+
+        self._inject_security_context(request, resource.model)
+        access_token = self.validate_security_context(request, "update")
+
+        model_facade = self._model_facade_cls(resource.model, self._get_current_connection(request))
+        pk_col = model_facade.model_pk_cols[0]
+
+        pk_attr = model_facade.model_pk_attrs[0]
+
+        items_ids = [item.get(pk_attr) if isinstance(item, dict) else None for item in items]
+        statuses, models = self._validate_items(resource, request, items, items_ids)
+
+        try:
+            existing_models = model_facade.find_by_pks([{pk_col: items_ids[idx]} for idx, _ in models])
+            models = self._filter_owned_items(resource, access_token, statuses, models, existing_models, items_ids)
+
+            validator = resource.validator() if resource.validator else None
+
+            for _, model in models:
+                if validator:
+                    validator.on_pre_update(model, request)
+
+            model_facade.bulk_update([model for _, model in models])
+
+            for idx, model in models:
+                if validator:
+                    validator.on_post_update(model, request)
+
+                statuses[idx] = {"status": 204, "id": items_ids[idx]}
+        except FantasticoDbError as dbex:
+            return self._handle_resource_dberror(version, resource_url, dbex)
+
+        return self._build_items_response(statuses)
+
+    @Controller(url=BASE_LATEST_URL + "$", method="PUT")
+    def update_items_latest(self, request, resource_url):
+        '''This is the route handler for latest update existing items api.'''
+
+        return self.update_items(request, "latest", self._trim_resource_url(resource_url))
+
+    @Controller(url=BASE_URL + "$", method="DELETE")
+    def delete_items(self, request, version, resource_url):
+        '''This method provides the route for deleting multiple existing resources of a collection in a single transaction. The
+        body is a json array of resources unique identifiers. The status of each resource is reported in the response exactly
+        like for :py:meth:`update_items`.
+
+        Below you can find all error response codes which might be returned for the whole batch:
+
+            * **10000** - Whenever we try to delete resources with unknown type. (Not registered to ROA).
+            * **10020** - Whenever we try to delete resources without passing a json array of identifiers.
+            * **10030** - Whenever we try to delete resources and an unexpected database exception occurs (no resource is
+              deleted).'''
+
+        if version != "latest":
+            version = float(version)
+
+        resource = self._resources_registry.find_by_url(resource_url, version)
+
+        if not resource:
+            return self._handle_resource_notfound(version, resource_url)
+
+        items_ids = self._get_items_body(request)
+
+        if items_ids is None:
+            return self._handle_resource_noitems(version, resource_url)
+
+        self._inject_security_context(request, resource.model)
+        access_token = self.validate_security_context(request, "delete")
+
+        model_facade = self._model_facade_cls(resource.model, self._get_current_connection(request))
+        pk_col = model_facade.model_pk_cols[0]
+
+        statuses = [None] * len(items_ids)
+
+        try:
+            existing_models = model_facade.find_by_pks([{pk_col: resource_id} for resource_id in items_ids])
+            models = self._filter_owned_items(resource, access_token, statuses, list(enumerate(existing_models)),
+                                              existing_models, items_ids)
+
+            validator = resource.validator() if resource.validator else None
+
+            for _, model in models:
+                if validator:
+                    validator.on_pre_delete(model, request)
+
+            model_facade.bulk_delete([model for _, model in models])
+
+            for idx, model in models:
+                if validator:
+                    validator.on_post_delete(model, request)
+
+                statuses[idx] = {"status": 204, "id": items_ids[idx]}
+        except FantasticoDbError as dbex:
+            return self._handle_resource_dberror(version, resource_url, dbex)
+
+        return self._build_items_response(statuses)
+
+    @Controller(url=BASE_LATEST_URL + "$", method="DELETE")
+    def delete_items_latest(self, request, resource_url):
+        '''This method provides the functionality for delete items latest version api route.'''
+
+        return self.delete_items(request, "latest", self._trim_resource_url(resource_url))
+
+    def _create_items(self, request, version, resource):
+        '''This method creates all valid resources from the json array received as body in a single transaction. The status
+        of each resource is reported in the response.'''
+
+        items = self._get_items_body(request)
+
+        if items is None:
+            return self._handle_resource_noitems(version, resource.url)
+
+        self._inject_security_context(request, resource.model)
+        access_token = self.validate_security_context(request, "create")
+
+        statuses, models = self._validate_items(resource, request, items)
+
+        try:
+            validator = resource.validator() if resource.validator else None
+
+            for _, model in models:
+                if resource.user_dependent and access_token:
+                    model.user_id = access_token.user_id
+
+                if validator:
+                    validator.on_pre_create(model, request)
+
+            model_facade = self._model_facade_cls(resource.model, self._get_current_connection(request))
+            models_ids = model_facade.bulk_create([model for _, model in models])
+
+            for (idx, model), model_id in zip(models, models_ids):
+                if validator:
+                    validator.on_post_create(model, request)
+
+                statuses[idx] = {"status": 201, "id": model_id[0]}
+        except FantasticoDbError as dbex:
+            return self._handle_resource_dberror(version, resource.url, dbex)
+
+        return self._build_items_response(statuses)
+
+    def _get_items_body(self, request):
+        '''This method decodes the json array received as body of batch requests. If the body is not a json array None is
+        returned.'''
+
+        if not request.body:
+            return None
+
+        try:
+            items = json.loads(request.body.decode())
+        except ValueError:
+            return None
+
+        if not isinstance(items, list):
+            return None
+
+        return items
+
+    def _validate_items(self, resource, request, items, items_ids=None):
+        '''This method converts the given json resources to models and validates them using the resource validator. It
+        returns the list of statuses (an error status for each invalid resource and None for valid resources) and the list of
+        valid models (together with their index in the batch).'''
+
+        json_serializer = self._json_serializer_cls(resource)
+        validator = resource.validator() if resource.validator else None
+
+        statuses = [None] * len(items)
+        models = []
+
+        for idx, item in enumerate(items):
+            resource_id = items_ids[idx] if items_ids else None
+
+            try:
+                if items_ids and resource_id is None:
+                    raise FantasticoRoaError("Resource unique identifier is missing.")
+
+                model = json_serializer.deserialize(item)
+
+                if validator:
+                    validator.validate(model, request, resource_id)
+            except FantasticoRoaError as ex:
+                statuses[idx] = self._build_item_error(ex.http_code, 10010, "Resource %s version %s is invalid: %s" % \
+                                                            (resource.url, resource.version, str(ex)), resource_id)
+                continue
+
+            models.append((idx, model))
+
+        return statuses, models
+
+    def _filter_owned_items(self, resource, access_token, statuses, models, existing_models, items_ids):
+        '''This method returns the given models (together with their index in the batch) which exist and are owned by the
+        current user. For all other models a not found status is set.'''
+
+        owned_models = []
+
+        for (idx, model), existing_model in zip(models, existing_models):
+            if not existing_model or not self._is_model_owned_by(existing_model, access_token, resource):
+                statuses[idx] = self._build_item_error(404, 10040, "Resource %s version %s id %s does not exist." % \
+                                                            (resource.url, resource.version, items_ids[idx]), items_ids[idx])
+                continue
+
+            owned_models.append((idx, model))
+
+        return owned_models
+
+    def _build_item_error(self, http_code, error_code, error_description, resource_id=None):
+        '''This method builds the status of a batch item which could not be processed. The status is compliant with
+        :doc:`/features/roa/rest_responses` specification.'''
+
+        return {"status": http_code,
+                "id": resource_id,
+                "error_code": error_code,
+                "error_description": error_description,
+                "error_details": self._errors_url % error_code}
+
+    def _build_items_response(self, statuses):
+        '''This method builds the **207 Multi-Status** response of a batch request from the given items statuses.'''
+
+        response = Response(text=json.dumps({"items": statuses}), status_code=207, content_type="application/json")
+        self._add_cors_headers(response)
+
+        return response
+
     def validate_security_context(self, request, attr_scope):
         '''This method triggers security context validation and converts unexpected exceptions to OAuth2UnauthorizedError.
         If everything is fine this method return the access_token from security context.'''
@@ -633,6 +1205,19 @@ class CollectionParams(object):
 
         return self._fields
 
+    @property
+    def total(self):
+        '''This property returns False if the client sent **total=false** query parameter (totalItems is not needed) and True
+        otherwise.'''
+
+        return self._total
+
+    @property
+    def continuation(self):
+        '''This property returns **continuation** query parameter (the continuation token) received by collection.'''
+
+        return self._continuation
+
     def __init__(self, request, offset_default, limit_default):
         self._offset = request.params.get("offset", offset_default)
 
@@ -652,3 +1237,5 @@ class CollectionParams(object):
             self._order = json.loads(self._order)
 
         self._fields = request.params.get("fields")
+        self._continuation = request.params.get("continuation")
+        self._total = str(request.params.get("total", "true")).lower() not in ["false", "0"]
@@ -16,6 +16,15 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.contrib.roa_discovery.roa_helper
 '''
+from fantastico.exceptions import FantasticoNotSupportedError
+from fantastico.roa.roa_exceptions import FantasticoRoaError
+from webob.etag import NoETag
+import base64
+import datetime
+import decimal
+import hashlib
+import json
+import uuid
 
 def calculate_resource_url(roa_api, resource, version):
     '''This method calculates resource API url based on the given resource object and version.'''
@@ -41,3 +50,116 @@ def normalize_absolute_roa_uri(roa_api):
         return ""
 
     return "/%s" % "/".join(segments[3:])
+
+def _encode_keyset_value(value):
+    '''This method converts a keyset value to a json compatible value which preserves its type (timezone of datetime and
+    time values included).
+
+    :raises fantastico.exceptions.FantasticoNotSupportedError: Raised for NULL values (rows can not be sought after a NULL
+        sort value) and for values which can not be encoded.'''
+
+    if value is None:
+        raise FantasticoNotSupportedError("Continuation tokens do not support NULL keyset values.")
+
+    if isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+
+    if isinstance(value, datetime.date):
+        return {"date": value.isoformat()}
+
+    if isinstance(value, datetime.time):
+        return {"time": value.isoformat()}
+
+    if isinstance(value, decimal.Decimal):
+        return {"decimal": str(value)}
+
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+
+    raise FantasticoNotSupportedError("Continuation tokens do not support keyset value %s (%s)." % \
+                                      (value, value.__class__.__name__))
+
+def _decode_keyset_value(value):
+    '''This method converts a json value obtained from a continuation token back to the original keyset value.'''
+
+    if not isinstance(value, dict):
+        return value
+
+    if "datetime" in value:
+        return datetime.datetime.fromisoformat(value["datetime"])
+
+    if "date" in value:
+        return datetime.date.fromisoformat(value["date"])
+
+    if "time" in value:
+        return datetime.time.fromisoformat(value["time"])
+
+    if "decimal" in value:
+        return decimal.Decimal(value["decimal"])
+
+    if "uuid" in value:
+        return uuid.UUID(value["uuid"])
+
+    raise ValueError("Unsupported keyset value %s." % value)
+
+def encode_continuation_token(keyset, order_expr):
+    '''This method builds an opaque continuation token for the given keyset (sort key values of the last item from a
+    collection page) and the order expression used for retrieving the page.
+
+    :raises fantastico.exceptions.FantasticoNotSupportedError: Raised if the keyset contains NULL values or values which can
+        not be encoded.'''
+
+    token = json.dumps({"keyset": [_encode_keyset_value(value) for value in keyset],
+                        "order": order_expr or []}, separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(token.encode()).decode()
+
+def decode_continuation_token(token, order_expr):
+    '''This method decodes the keyset from the given continuation token. The token is valid only for the order expression
+    used when it was built.
+
+    :raises fantastico.roa.roa_exceptions.FantasticoRoaError: Raised if the token is malformed or it was built for a different
+        order expression.'''
+
+    try:
+        token = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+
+        if token["order"] != (order_expr or []):
+            raise ValueError("Token order %s does not match order %s." % (token["order"], order_expr))
+
+        return [_decode_keyset_value(value) for value in token["keyset"]]
+    except Exception as ex:
+        raise FantasticoRoaError("Invalid continuation token: %s" % str(ex))
+
+def calculate_etag(*parts):
+    '''This method calculates a strong entity tag from the given representation parts (e.g the serialized body or the version
+    attribute values of the models together with the user the representation was built for).'''
+
+    digest = hashlib.sha1()
+
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+def is_not_modified(request, etag=None, last_modified=None):
+    '''This method determines if the representation identified by the given entity tag and last modified date is already held
+    by the client (RFC 7232). If **If-None-Match** header is sent, only the entity tag is compared; otherwise
+    **If-Modified-Since** header is compared with the given last modified date (naive dates are considered UTC).'''
+
+    if request.if_none_match is not NoETag:
+        return etag is not None and etag in request.if_none_match
+
+    if_modified_since = request.if_modified_since
+
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=datetime.timezone.utc)
+
+    return last_modified.replace(microsecond=0) <= if_modified_since
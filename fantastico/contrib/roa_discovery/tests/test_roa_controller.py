@@ -17,16 +17,20 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.contrib.roa_discovery.tests.test_roa_controller
 '''
 
-from fantastico.exceptions import FantasticoDbError
+from fantastico.contrib.roa_discovery import roa_helper
+from fantastico.exceptions import FantasticoDbError, FantasticoDbNotFoundError, FantasticoNotSupportedError
 from fantastico.oauth2.exceptions import OAuth2UnauthorizedError, OAuth2Error
 from fantastico.oauth2.token import Token
 from fantastico.roa.resource_decorator import Resource
 from fantastico.roa.resource_validator import ResourceValidator
 from fantastico.roa.roa_exceptions import FantasticoRoaError
+from fantastico.routing_engine.custom_responses import StreamedResponse
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
 from sqlalchemy.schema import Column
 from sqlalchemy.types import Integer, String, Text
+from webob.etag import ETagMatcher, NoETag
+import datetime
 import json
 
 class RoaControllerTests(FantasticoUnitTestsCase):
@@ -51,8 +55,12 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         self._settings_facade = Mock()
         self._resources_registry = Mock()
         self._model_facade = Mock()
+        self._model_facade.model_pk_attrs = ["id"]
         self._conn_manager = Mock()
         self._json_serializer = Mock()
+        self._json_serializer.serialize_list = lambda models, fields: [self._json_serializer.serialize(model, fields)
+                                                                       for model in models]
+        self._json_serializer.get_projection = Mock(return_value=None)
         self._query_parser = Mock()
         self._doc_base = "https://fantastico/html/"
 
@@ -80,15 +88,38 @@ class RoaControllerTests(FantasticoUnitTestsCase):
 
         raise Exception("Unexpected setting %s." % setting_name)
 
+    def _mock_request(self):
+        '''This method mocks a request which does not send conditional headers.'''
+
+        request = Mock()
+        request.if_none_match = NoETag
+        request.if_modified_since = None
+
+        return request
+
+    def _mock_resource(self):
+        '''This method mocks a resource which uses default collection streaming and caching settings.'''
+
+        resource = Mock()
+        resource.stream_batch_size = None
+        resource.etag_attr = None
+        resource.last_modified_attr = None
+        resource.cache_control = None
+        resource.subresources_loading = {}
+
+        return resource
+
     def _mock_model_facade(self, records, records_count):
         '''This method mocks the current model facade object in order to return the specified values.'''
 
         self._model_facade.get_records_paged = Mock(return_value=records)
         self._model_facade.count_records = Mock(return_value=records_count)
+        self._model_facade.get_keyset = Mock(return_value=[len(records)])
 
     def _assert_get_collection_response(self, request, response, records, records_count, offset, limit,
                                         expected_filter=None,
-                                        expected_sort=None):
+                                        expected_sort=None,
+                                        expected_keyset=None):
         '''This test case assert the given response against expected values.'''
 
         self.assertIsNotNone(response)
@@ -105,7 +136,9 @@ class RoaControllerTests(FantasticoUnitTestsCase):
 
         self._model_facade.get_records_paged.assert_called_once_with(start_record=offset, end_record=limit,
                                                                      filter_expr=expected_filter,
-                                                                     sort_expr=expected_sort)
+                                                                     sort_expr=expected_sort,
+                                                                     keyset=expected_keyset,
+                                                                     projection=None, eager_load=None)
         self._model_facade.count_records.assert_called_once_with(filter_expr=expected_filter)
         self._controller.validate_security_context.assert_called_once_with(request, "read")
 
@@ -127,10 +160,10 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         version = "1.0"
         resource_url = "/sample-resources"
 
-        request = Mock()
+        request = self._mock_request()
         request.params = {}
 
-        resource = Mock()
+        resource = self._mock_resource()
         resource.user_dependent = False
         resource.model = Mock()
 
@@ -165,13 +198,13 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         version = "latest"
         resource_url = "/sample-resources"
 
-        request = Mock()
+        request = self._mock_request()
         request.params = {"offset": "0", "limit": "2",
                           "filter": "like(name, \"resource 1\")",
                           "order": "asc(name)",
                           "fields": expected_fields}
 
-        resource = Mock()
+        resource = self._mock_resource()
         resource.user_dependent = False
         resource.model = Mock()
 
@@ -179,9 +212,6 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         self._query_parser.parse_sort = Mock(return_value=expected_sort)
 
         self._mock_model_facade(records=expected_records, records_count=expected_records_count)
-        self._model_facade.get_records_paged = Mock(return_value=expected_records)
-        self._model_facade.count_records = Mock(return_value=expected_records_count)
-
         self._resources_registry.find_by_url = Mock(return_value=resource)
 
         def mock_serialize(model, fields):
@@ -206,6 +236,303 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         self._query_parser.parse_filter.assert_called_once_with(request.params["filter"], resource.model)
         self._query_parser.parse_sort.assert_called_once_with([request.params["order"]], resource.model)
 
+        body = json.loads(response.body.decode())
+
+        self.assertEqual([2], roa_helper.decode_continuation_token(body["continuationToken"], ["asc(name)"]))
+        self._model_facade.get_keyset.assert_called_once_with(expected_records[-1], expected_sort)
+
+    def _get_collection_keyset(self, continuation, order="asc(name)"):
+        '''This method retrieves a collection page in seek mode using the given continuation token.'''
+
+        self._controller.validate_security_context = Mock(return_value=None)
+
+        request = self._mock_request()
+        request.params = {"limit": "2", "order": order, "continuation": continuation}
+
+        resource = self._mock_resource()
+        resource.user_dependent = False
+        resource.validator = None
+
+        self._query_parser.parse_sort = Mock(return_value=[Mock()])
+        self._json_serializer.serialize = lambda model, fields: model
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+
+        return request, self._controller.get_collection(request, "1.0", "/sample-resources")
+
+    def _get_collection_total_items(self, total_items, params=None, user_dependent=False):
+        '''This method retrieves a collection page for a resource using the given totalItems policy.'''
+
+        self._controller.validate_security_context = Mock(return_value=Token({"user_id": 5}))
+
+        request = self._mock_request()
+        request.params = params or {}
+
+        resource = self._mock_resource()
+        resource.name = "sample-resource"
+        resource.version = 1.0
+        resource.user_dependent = user_dependent
+        resource.validator = None
+        resource.total_items = total_items
+        resource.total_items_ttl = 60
+
+        self._json_serializer.serialize = lambda model, fields: model
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+
+        response = self._controller.get_collection(request, "1.0", "/sample-resources")
+
+        self.assertEqual(200, response.status_code)
+
+        return json.loads(response.body.decode())
+
+    def test_get_collection_total_exact(self):
+        '''This test case ensures exact totalItems policy selects the page and the total in a single query.'''
+
+        self._mock_model_facade(records=[], records_count=0)
+        self._model_facade.get_records_paged_counted = Mock(return_value=([{"id": 1}], 11))
+
+        body = self._get_collection_total_items(Resource.TOTAL_ITEMS_EXACT)
+
+        self.assertEqual({"items": [{"id": 1}], "totalItems": 11}, body)
+        self._model_facade.get_records_paged_counted.assert_called_once_with(start_record=0, end_record=100,
+                                                                             filter_expr=None, sort_expr=None,
+                                                                             projection=None, eager_load=None)
+        self.assertEqual(0, self._model_facade.get_records_paged.call_count)
+        self.assertEqual(0, self._model_facade.count_records.call_count)
+
+    def test_get_collection_fields_projection(self):
+        '''This test case ensures requested fields (together with the resource versioning attributes) are the only attributes
+        loaded from database for a collection page and requested subresources are eagerly loaded using their declared
+        strategy.'''
+
+        self._mock_model_facade(records=[], records_count=0)
+        self._json_serializer.get_projection = Mock(return_value=["name", "address.city"])
+
+        self._controller.validate_security_context = Mock(return_value=Token({"user_id": 5}))
+
+        request = self._mock_request()
+        request.params = {"fields": "name,address(city)", "total": "false"}
+
+        resource = self._mock_resource()
+        resource.user_dependent = False
+        resource.etag_attr = "version"
+        resource.last_modified_attr = "update_date"
+        resource.subresources_loading = {"address": Resource.LOAD_JOINED, "phones": Resource.LOAD_SUBQUERY}
+
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+
+        response = self._controller.get_collection(request, "1.0", "/sample-resources")
+
+        self.assertEqual(200, response.status_code)
+        self._json_serializer.get_projection.assert_called_once_with("name,address(city)")
+        self._model_facade.get_records_paged.assert_called_once_with(start_record=0, end_record=100, filter_expr=None,
+                                                                     sort_expr=None, keyset=None,
+                                                                     projection=["name", "address.city", "version"],
+                                                                     eager_load={"address": Resource.LOAD_JOINED})
+
+    def test_get_collection_total_exact_keyset(self):
+        '''This test case ensures exact totalItems policy counts the items separately in seek mode (the total can not be
+        selected together with a seek page).'''
+
+        self._mock_model_facade(records=[{"id": 1}], records_count=11)
+        self._model_facade.get_records_paged_counted = Mock()
+
+        body = self._get_collection_total_items(Resource.TOTAL_ITEMS_EXACT, {"continuation": ""})
+
+        self.assertEqual({"items": [{"id": 1}], "totalItems": 11}, body)
+        self.assertEqual(0, self._model_facade.get_records_paged_counted.call_count)
+        self._model_facade.count_records.assert_called_once_with(filter_expr=None)
+
+    def test_get_collection_total_estimated(self):
+        '''This test case ensures estimated totalItems policy uses table statistics for unfiltered collections and counts
+        filtered collections exactly.'''
+
+        self._mock_model_facade(records=[{"id": 1}], records_count=11)
+        self._model_facade.estimate_records = Mock(return_value=1000)
+
+        self.assertEqual(1000, self._get_collection_total_items(Resource.TOTAL_ITEMS_ESTIMATED)["totalItems"])
+        self.assertEqual(0, self._model_facade.count_records.call_count)
+
+        body = self._get_collection_total_items(Resource.TOTAL_ITEMS_ESTIMATED, {"filter": "eq(id, 1)"})
+
+        self.assertEqual(11, body["totalItems"])
+        self._model_facade.count_records.assert_called_once_with(filter_expr=self._query_parser.parse_filter.return_value)
+        self.assertEqual(1, self._model_facade.estimate_records.call_count)
+
+    def test_get_collection_total_cached(self):
+        '''This test case ensures cached totalItems policy counts the items once per filter and user.'''
+
+        from fantastico.contrib.roa_discovery.roa_controller import RoaController
+
+        RoaController._TOTAL_ITEMS_CACHES.clear()
+
+        self._mock_model_facade(records=[{"id": 1}], records_count=11)
+
+        for idx in range(3):
+            self.assertEqual(11, self._get_collection_total_items(Resource.TOTAL_ITEMS_CACHED)["totalItems"])
+
+        self.assertEqual(1, self._model_facade.count_records.call_count)
+
+        self._model_facade.count_records.return_value = 3
+
+        self.assertEqual(3, self._get_collection_total_items(Resource.TOTAL_ITEMS_CACHED, {"filter": "eq(id, 1)"})["totalItems"])
+        self.assertEqual(3, self._get_collection_total_items(Resource.TOTAL_ITEMS_CACHED, user_dependent=True)["totalItems"])
+        self.assertEqual(11, self._get_collection_total_items(Resource.TOTAL_ITEMS_CACHED)["totalItems"])
+
+        self.assertEqual(3, self._model_facade.count_records.call_count)
+        self.assertEqual(60, RoaController._TOTAL_ITEMS_CACHES[("sample-resource", 1.0)].ttl)
+
+        RoaController._TOTAL_ITEMS_CACHES.clear()
+
+    def test_get_collection_total_omitted(self):
+        '''This test case ensures totalItems is omitted (and no count is done) for resources using none policy or when the
+        client does not need it.'''
+
+        self._mock_model_facade(records=[{"id": 1}], records_count=11)
+        self._model_facade.get_records_paged_counted = Mock()
+
+        for total_items, params in [(Resource.TOTAL_ITEMS_NONE, {}), (Resource.TOTAL_ITEMS_EXACT, {"total": "false"}),
+                                    (Resource.TOTAL_ITEMS_CACHED, {"total": "0"})]:
+            self.assertEqual({"items": [{"id": 1}]}, self._get_collection_total_items(total_items, params))
+
+        self.assertEqual(0, self._model_facade.count_records.call_count)
+        self.assertEqual(0, self._model_facade.get_records_paged_counted.call_count)
+        self.assertEqual(3, self._model_facade.get_records_paged.call_count)
+
+    def _get_collection_streamed(self, records, params):
+        '''This method retrieves a streamed collection page and returns the response together with its body chunks.'''
+
+        self._controller.validate_security_context = Mock(return_value=None)
+        self._mock_model_facade(records=[], records_count=len(records))
+        self._model_facade.get_records_paged_counted = Mock()
+        self._model_facade.iter_records_paged = Mock(return_value=iter(records))
+
+        request = self._mock_request()
+        request.params = params
+
+        resource = self._mock_resource()
+        resource.user_dependent = False
+        resource.total_items = Resource.TOTAL_ITEMS_EXACT
+        resource.stream_batch_size = 2
+
+        self._query_parser.parse_sort = Mock(return_value=None)
+        self._json_serializer.serialize = lambda model, fields: dict(model)
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+
+        response = self._controller.get_collection(request, "1.0", "/sample-resources")
+
+        self.assertIsInstance(response, StreamedResponse)
+        self.assertEqual("application/json", response.content_type)
+        self._assert_cors_headers(response)
+
+        return resource, list(response.app_iter)
+
+    def test_get_collection_streamed(self):
+        '''This test case ensures collections of resources which define a stream batch size are fetched from a server side
+        cursor and sent in chunks of stream batch size items.'''
+
+        records = [{"id": idx} for idx in range(5)]
+
+        resource, chunks = self._get_collection_streamed(records, {"limit": "5"})
+
+        self.assertEqual(4, len(chunks))
+
+        body = json.loads(b"".join(chunks).decode())
+
+        self.assertEqual(records, body["items"])
+        self.assertEqual(5, body["totalItems"])
+        self.assertIn("continuationToken", body)
+
+        self._model_facade.iter_records_paged.assert_called_once_with(start_record=0, end_record=5, filter_expr=None,
+                                                                      sort_expr=None, keyset=None, batch_size=2,
+                                                                      projection=None, eager_load=None)
+        self._model_facade.count_records.assert_called_once_with(filter_expr=None)
+        self._model_facade.get_keyset.assert_called_once_with(records[-1], None)
+        self.assertEqual(0, self._model_facade.get_records_paged.call_count)
+        self.assertEqual(0, self._model_facade.get_records_paged_counted.call_count)
+        self.assertEqual(3, resource.validator.return_value.format_collection.call_count)
+
+    def test_get_collection_streamed_emptyresult(self):
+        '''This test case ensures empty streamed collections produce a valid body without continuation token.'''
+
+        _, chunks = self._get_collection_streamed([], {})
+
+        self.assertEqual({"items": [], "totalItems": 0}, json.loads(b"".join(chunks).decode()))
+        self.assertEqual(0, self._model_facade.get_keyset.call_count)
+
+    def test_get_collection_keyset_firstpage(self):
+        '''This test case ensures an empty continuation token retrieves the first page in seek mode.'''
+
+        self._mock_model_facade(records=[{"id": 1}], records_count=1)
+
+        request, response = self._get_collection_keyset("")
+
+        self._assert_get_collection_response(request, response, records=[{"id": 1}], records_count=1, offset=0, limit=2,
+                                             expected_sort=self._query_parser.parse_sort.return_value,
+                                             expected_keyset=[])
+
+        self.assertNotIn("continuationToken", json.loads(response.body.decode()))
+
+    def test_get_collection_keyset_nextpage(self):
+        '''This test case ensures the keyset held by a continuation token is used for seeking the next page.'''
+
+        records = [{"id": 3}, {"id": 4}]
+        self._mock_model_facade(records=records, records_count=10)
+
+        token = roa_helper.encode_continuation_token(["resource 2", 2], ["asc(name)"])
+
+        request, response = self._get_collection_keyset(token)
+
+        self._assert_get_collection_response(request, response, records=records, records_count=10, offset=0, limit=2,
+                                             expected_sort=self._query_parser.parse_sort.return_value,
+                                             expected_keyset=["resource 2", 2])
+
+        body = json.loads(response.body.decode())
+
+        self.assertEqual([2], roa_helper.decode_continuation_token(body["continuationToken"], ["asc(name)"]))
+
+    def test_get_collection_keyset_notencodable(self):
+        '''This test case ensures no continuation token is built (clients fall back to offset paging) when the sort key values
+        of the last item are NULL or can not be encoded.'''
+
+        records = [{"id": 3}, {"id": 4}]
+
+        for keyset in [["resource 4", None], [object(), 4]]:
+            self._mock_model_facade(records=records, records_count=10)
+            self._model_facade.get_keyset = Mock(return_value=keyset)
+
+            request, response = self._get_collection_keyset("")
+
+            self._assert_get_collection_response(request, response, records=records, records_count=10, offset=0, limit=2,
+                                                 expected_sort=self._query_parser.parse_sort.return_value,
+                                                 expected_keyset=[])
+
+            self.assertNotIn("continuationToken", json.loads(response.body.decode()))
+
+    def test_get_collection_keyset_invalidtoken(self):
+        '''This test case ensures malformed continuation tokens and tokens obtained for other order expressions are
+        rejected.'''
+
+        self._mock_model_facade(records=[], records_count=0)
+
+        token = roa_helper.encode_continuation_token(["resource 2", 2], ["desc(name)"])
+
+        for continuation in ["invalid token", token]:
+            _, response = self._get_collection_keyset(continuation)
+
+            self._assert_resource_error(response, 400, 10050, "1.0", "/sample-resources")
+
+        self.assertEqual(0, self._model_facade.get_records_paged.call_count)
+
+    def test_get_collection_keyset_notsupported(self):
+        '''This test case ensures seek mode is rejected if the sort expression is not supported by seek pagination.'''
+
+        self._mock_model_facade(records=[], records_count=0)
+        self._model_facade.get_records_paged.side_effect = FantasticoNotSupportedError("Not supported sort.")
+
+        _, response = self._get_collection_keyset("")
+
+        self._assert_resource_error(response, 400, 10050, "1.0", "/sample-resources")
+
     def _assert_resource_error(self, response, http_code, error_code, version, url):
         '''This method asserts a given error response against expected resource error format.'''
 
@@ -377,6 +704,133 @@ class RoaControllerTests(FantasticoUnitTestsCase):
 
         self._controller.validate_security_context.assert_called_once_with(request, "create")
 
+    def _mock_batch_request(self, items):
+        '''This method mocks a batch request for a user dependent resource validated by MockSimpleResourceValidator.'''
+
+        self._controller.validate_security_context = Mock(return_value=Token({"user_id": 5}))
+
+        resource = Resource(name="Mock Simple Resource", url="/mock-simple-resources", version=1.0,
+                            validator=MockSimpleResourceValidator, user_dependent=True)
+        resource(MockSimpleResourceRoa, self._resources_registry)
+
+        request = Mock()
+        request.body = json.dumps(items).encode()
+
+        def deserialize(body):
+            if not isinstance(body, dict):
+                raise FantasticoRoaError("Resource body must be a json object.")
+
+            model = MockSimpleResourceRoa(body.get("name"), body.get("description"))
+
+            if "id" in body:
+                model.id = body["id"]
+
+            return model
+
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+        self._json_serializer.deserialize = deserialize
+        self._model_facade.model_pk_cols = [MockSimpleResourceRoa.id]
+
+        return resource, request
+
+    def _assert_batch_response(self, response, expected_statuses):
+        '''This method asserts the statuses of each item from the given batch response.'''
+
+        self.assertEqual(207, response.status_code)
+        self.assertEqual("application/json", response.content_type)
+        self._assert_cors_headers(response)
+
+        items = json.loads(response.body.decode())["items"]
+
+        self.assertEqual(expected_statuses, [(item["status"], item["id"], item.get("error_code")) for item in items])
+
+    def test_create_items_ok(self):
+        '''This test case ensures all valid resources of a batch are created in a single transaction and the status of each
+        resource is reported.'''
+
+        resource, request = self._mock_batch_request([{"name": "resource 1"}, {"description": "no name"}, [],
+                                                      {"name": "resource 2"}])
+
+        self._model_facade.bulk_create = Mock(return_value=[[11], [12]])
+
+        response = self._controller.create_item(request, "1.0", resource.url)
+
+        self._assert_batch_response(response, [(201, 11, None), (400, None, 10010), (400, None, 10010), (201, 12, None)])
+
+        models = self._model_facade.bulk_create.call_args[0][0]
+
+        self.assertEqual(["resource 1", "resource 2"], [model.name for model in models])
+        self.assertEqual([5, 5], [model.user_id for model in models])
+        self.assertEqual(0, self._model_facade.create.call_count)
+        self._controller.validate_security_context.assert_called_once_with(request, "create")
+
+    def test_update_items_ok(self):
+        '''This test case ensures existing resources owned by the current user are updated in a single transaction and the
+        status of each resource is reported.'''
+
+        resource, request = self._mock_batch_request([{"id": 1, "name": "resource 1"}, {"name": "no id"},
+                                                      {"id": 2, "name": "resource 2"}, {"id": 3, "name": "resource 3"},
+                                                      {"id": 4, "description": "no name"}])
+
+        self._model_facade.find_by_pks = Mock(return_value=[Mock(user_id=5), None, Mock(user_id=6)])
+
+        response = self._controller.update_items(request, "1.0", resource.url)
+
+        self._assert_batch_response(response, [(204, 1, None), (400, None, 10010), (404, 2, 10040), (404, 3, 10040),
+                                               (400, 4, 10010)])
+
+        pk_col = MockSimpleResourceRoa.id
+
+        self._model_facade.find_by_pks.assert_called_once_with([{pk_col: 1}, {pk_col: 2}, {pk_col: 3}])
+        self.assertEqual(["resource 1"], [model.name for model in self._model_facade.bulk_update.call_args[0][0]])
+        self._controller.validate_security_context.assert_called_once_with(request, "update")
+
+    def test_delete_items_ok(self):
+        '''This test case ensures existing resources owned by the current user are deleted in a single transaction and the
+        status of each resource is reported.'''
+
+        resource, request = self._mock_batch_request([1, 2, 3])
+
+        existing_models = [Mock(user_id=5), None, Mock(user_id=6)]
+
+        self._model_facade.find_by_pks = Mock(return_value=existing_models)
+
+        response = self._controller.delete_items(request, "1.0", resource.url)
+
+        self._assert_batch_response(response, [(204, 1, None), (404, 2, 10040), (404, 3, 10040)])
+        self._model_facade.bulk_delete.assert_called_once_with([existing_models[0]])
+        self._controller.validate_security_context.assert_called_once_with(request, "delete")
+
+    def test_batch_invalid_body(self):
+        '''This test case ensures batch requests whose body is not a json array are rejected.'''
+
+        resource, request = self._mock_batch_request({"name": "resource 1"})
+
+        for body in [None, b"[invalid", request.body]:
+            request.body = body
+
+            for response in [self._controller.update_items(request, "1.0", resource.url),
+                             self._controller.delete_items(request, "1.0", resource.url)]:
+                self.assertEqual(400, response.status_code)
+                self.assertEqual(10020, json.loads(response.body.decode())["error_code"])
+
+        request.body = b"[invalid"
+
+        self.assertEqual(10020, json.loads(self._controller.create_item(request, "1.0", resource.url).body.decode())["error_code"])
+
+    def test_batch_dbexception(self):
+        '''This test case ensures an error response is returned (and no resource is written) if an unexpected db error
+        occurs.'''
+
+        resource, request = self._mock_batch_request([{"name": "resource 1"}])
+
+        self._model_facade.bulk_create = Mock(side_effect=FantasticoDbError("Unexpected db error."))
+
+        response = self._controller.create_item(request, "1.0", resource.url)
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual(10030, json.loads(response.body.decode())["error_code"])
+
     def test_create_item_dbexception(self):
         '''This test case ensures an error response is received if an unexpected db error occurs when creating the resource.'''
 
@@ -461,7 +915,7 @@ class RoaControllerTests(FantasticoUnitTestsCase):
                             version=float(version))
         resource(MockSimpleResourceRoa, self._resources_registry)
 
-        request = Mock()
+        request = self._mock_request()
         request.params = {"fields": fields}
 
         resource_id = 1986
@@ -495,6 +949,165 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         self._json_serializer.serialize(model, fields)
         self._controller.validate_security_context.assert_called_once_with(request, "read")
 
+    def _get_item_conditional(self, resource, model, user_id=5, if_none_match=NoETag, if_modified_since=None):
+        '''This method retrieves the given model using the given conditional headers.'''
+
+        self._controller.validate_security_context = Mock(return_value=Token({"user_id": user_id}))
+
+        resource(MockSimpleResourceRoa, self._resources_registry)
+
+        request = self._mock_request()
+        request.params = {}
+        request.if_none_match = if_none_match
+        request.if_modified_since = if_modified_since
+
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+        self._model_facade.model_pk_cols = [MockSimpleResourceRoa.id]
+        self._model_facade.find_by_pk = Mock(return_value=model)
+
+        response = self._controller.get_item(request, "1.0", "/simple-resources", model.id)
+
+        self._assert_cors_headers(response)
+
+        return response
+
+    def test_get_item_notmodified_etag_attr(self):
+        '''This test case ensures entity tags of resources declaring a version attribute are calculated without serializing
+        the resource, they vary by user and matching conditional requests receive 304 Not Modified.'''
+
+        resource = Resource(name="Mock Simple Resource", url="/simple-resources", user_dependent=True, etag_attr="revision")
+        model = Mock(id=1986, revision=3, user_id=5)
+
+        self._json_serializer.serialize = Mock(return_value={"id": 1986})
+
+        response = self._get_item_conditional(resource, model)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("private", response.headers["Cache-Control"])
+
+        etag = response.etag
+
+        response = self._get_item_conditional(resource, model, if_none_match=ETagMatcher([etag]))
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.body)
+        self.assertEqual(etag, response.etag)
+        self.assertEqual("private", response.headers["Cache-Control"])
+        self.assertEqual(1, self._json_serializer.serialize.call_count)
+
+        model.user_id = 6
+        response = self._get_item_conditional(resource, model, user_id=6, if_none_match=ETagMatcher([etag]))
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.etag)
+
+        model.user_id = 5
+        model.revision = 4
+        response = self._get_item_conditional(resource, model, if_none_match=ETagMatcher([etag]))
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.etag)
+
+    def test_get_item_notmodified_body(self):
+        '''This test case ensures entity tags are calculated from the serialized body if the resource does not declare a
+        version attribute and last modified dates are used for If-Modified-Since conditional requests.'''
+
+        resource = Resource(name="Mock Simple Resource", url="/simple-resources", last_modified_attr="modify_date",
+                            cache_control="max-age=30")
+        model = Mock(id=1986, modify_date=datetime.datetime(2014, 1, 1, 10, 0, 0))
+
+        self._json_serializer.serialize = Mock(return_value={"id": 1986})
+
+        response = self._get_item_conditional(resource, model)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("max-age=30", response.headers["Cache-Control"])
+        self.assertEqual("Wed, 01 Jan 2014 10:00:00 GMT", response.headers["Last-Modified"])
+        self.assertEqual(roa_helper.calculate_etag(None, response.body.decode()), response.etag)
+
+        response = self._get_item_conditional(resource, model, if_none_match=ETagMatcher([response.etag]))
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(2, self._json_serializer.serialize.call_count)
+
+        response = self._get_item_conditional(resource, model,
+                                              if_modified_since=datetime.datetime(2014, 1, 1, 10, 0, 0,
+                                                                                  tzinfo=datetime.timezone.utc))
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual("Wed, 01 Jan 2014 10:00:00 GMT", response.headers["Last-Modified"])
+        self.assertEqual(2, self._json_serializer.serialize.call_count)
+
+    def test_get_collection_notmodified(self):
+        '''This test case ensures collections of resources declaring a version attribute are not serialized when the client
+        already holds the current page.'''
+
+        self._controller.validate_security_context = Mock(return_value=None)
+
+        records = [Mock(id=1, revision=1), Mock(id=2, revision=7)]
+
+        self._mock_model_facade(records=records, records_count=2)
+        self._model_facade.model_pk_cols = [MockSimpleResourceRoa.id]
+        self._json_serializer.serialize = Mock(return_value={})
+
+        resource = self._mock_resource()
+        resource.user_dependent = False
+        resource.total_items = Resource.TOTAL_ITEMS_NONE
+        resource.etag_attr = "revision"
+        resource.validator = None
+
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+
+        request = self._mock_request()
+        request.params = {}
+
+        response = self._controller.get_collection(request, "1.0", "/sample-resources")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, self._json_serializer.serialize.call_count)
+
+        request.if_none_match = ETagMatcher([response.etag])
+
+        response = self._controller.get_collection(request, "1.0", "/sample-resources")
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(2, self._json_serializer.serialize.call_count)
+        self._assert_cors_headers(response)
+
+        records[1].revision = 8
+
+        self.assertEqual(200, self._controller.get_collection(request, "1.0", "/sample-resources").status_code)
+
+    def test_get_collection_ignores_modified_since(self):
+        '''This test case ensures collections are never validated using If-Modified-Since header: deleting an item does not
+        change the most recent modification date of a page.'''
+
+        self._controller.validate_security_context = Mock(return_value=None)
+
+        records = [Mock(id=1, modify_date=datetime.datetime(2014, 1, 1, 10, 0, 0))]
+
+        self._mock_model_facade(records=records, records_count=1)
+        self._json_serializer.serialize = Mock(return_value={})
+
+        resource = self._mock_resource()
+        resource.user_dependent = False
+        resource.total_items = Resource.TOTAL_ITEMS_NONE
+        resource.etag_attr = None
+        resource.last_modified_attr = "modify_date"
+        resource.cache_control = None
+        resource.validator = None
+
+        self._resources_registry.find_by_url = Mock(return_value=resource)
+
+        request = self._mock_request()
+        request.params = {}
+        request.if_modified_since = datetime.datetime(2014, 1, 2, 10, 0, 0, tzinfo=datetime.timezone.utc)
+
+        response = self._controller.get_collection(request, "1.0", "/sample-resources")
+
+        self.assertEqual(200, response.status_code)
+        self.assertIsNone(response.headers.get("Last-Modified"))
+
     def test_get_item_unexpected_dbex(self):
         '''This test case ensures an exception response is received whenever a database exception occurs.'''
 
@@ -655,6 +1268,13 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         self._json_serializer_cls.assert_called_once_with(resource)
         self._json_serializer.deserialize.assert_called_once_with(json.dumps(expected_body))
 
+        self._model_facade.find_by_pk = Mock(side_effect=FantasticoDbNotFoundError("Model does not exist."))
+
+        response = self._controller.update_item(request, version, url, resource_id)
+
+        self._assert_resource_error(response, 404, 10040, version, url)
+        self.assertEqual(0, self._model_facade.update.call_count)
+
     def test_update_item_ok(self):
         '''This test case covers scenario when an item can be updated successfully.'''
 
@@ -699,7 +1319,7 @@ class RoaControllerTests(FantasticoUnitTestsCase):
         self._model_facade.find_by_pk.assert_called_once_with({MockSimpleResourceRoa.id: resource_id})
         self._json_serializer_cls.assert_called_once_with(resource)
         self._json_serializer.deserialize.assert_called_once_with(json.dumps(expected_body))
-        self._model_facade.update.assert_called_once_with(model)
+        self._model_facade.update.assert_called_once_with(model, model)
         self._controller.validate_security_context.assert_called_once_with(request, "update")
 
     def test_delete_item_resource_unknown(self):
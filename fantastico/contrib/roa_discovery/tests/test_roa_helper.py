@@ -17,8 +17,15 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.contrib.roa_discovery.tests.test_roa_helper
 '''
 from fantastico.contrib.roa_discovery import roa_helper
+from fantastico.exceptions import FantasticoNotSupportedError
+from fantastico.roa.roa_exceptions import FantasticoRoaError
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
+from webob.request import Request
+import base64
+import datetime
+import decimal
+import uuid
 
 class RoaHelperTests(FantasticoUnitTestsCase):
     '''This class provides the test cases for ensuring roa helper methods work as expected.'''
@@ -66,3 +73,82 @@ class RoaHelperTests(FantasticoUnitTestsCase):
         roa_api = "https://api.fantastico.com/api/sandboxed"
 
         self.assertEqual("/api/sandboxed", roa_helper.normalize_absolute_roa_uri(roa_api))
+
+    def test_continuation_token_ok(self):
+        '''This test case ensures keyset values are preserved (including their types) by continuation tokens.'''
+
+        tz_offset = datetime.timezone(datetime.timedelta(hours=2))
+
+        keyset = [datetime.datetime(2014, 1, 2, 3, 4, 5, 6), datetime.datetime(2014, 1, 2, 3, 4, 5, tzinfo=tz_offset),
+                  datetime.date(2014, 1, 2), datetime.time(3, 4, 5, 6), datetime.time(3, 4, tzinfo=tz_offset),
+                  decimal.Decimal("1.25"), uuid.UUID("11111111-1111-1111-1111-111111111111"), "name", 1, 1.5, True]
+
+        token = roa_helper.encode_continuation_token(keyset, ["asc(name)"])
+        decoded_keyset = roa_helper.decode_continuation_token(token, ["asc(name)"])
+
+        self.assertNotIn("/", token)
+        self.assertEqual(keyset, decoded_keyset)
+        self.assertEqual([value.__class__ for value in keyset], [value.__class__ for value in decoded_keyset])
+        self.assertIsNone(decoded_keyset[0].tzinfo)
+        self.assertEqual(tz_offset, decoded_keyset[1].tzinfo)
+        self.assertEqual(tz_offset, decoded_keyset[4].tzinfo)
+
+        token = roa_helper.encode_continuation_token([1], None)
+
+        self.assertEqual([1], roa_helper.decode_continuation_token(token, None))
+
+    def test_continuation_token_invalid(self):
+        '''This test case ensures malformed tokens or tokens built for other order expressions are rejected.'''
+
+        token = roa_helper.encode_continuation_token([1], ["asc(name)"])
+
+        for token, order_expr in [(token, ["desc(name)"]), (token, None), ("invalid token", None),
+                                  (base64.urlsafe_b64encode(b'{"keyset":[{"unknown":1}],"order":[]}').decode(), None)]:
+            with self.assertRaises(FantasticoRoaError):
+                roa_helper.decode_continuation_token(token, order_expr)
+
+    def test_continuation_token_notsupported(self):
+        '''This test case ensures continuation tokens can not be built for NULL keyset values or for values which can not be
+        encoded.'''
+
+        for value in [None, object(), {"unknown": 1}, [1, 2]]:
+            with self.assertRaises(FantasticoNotSupportedError):
+                roa_helper.encode_continuation_token(["name", value], ["asc(name)"])
+
+    def test_calculate_etag(self):
+        '''This test case ensures entity tags are stable for the same representation parts and vary with each of them.'''
+
+        etag = roa_helper.calculate_etag(None, b'{"id": 1}')
+
+        self.assertEqual(etag, roa_helper.calculate_etag(None, b'{"id": 1}'))
+        self.assertNotEqual(etag, roa_helper.calculate_etag(1, b'{"id": 1}'))
+        self.assertNotEqual(etag, roa_helper.calculate_etag(None, b'{"id": 2}'))
+        self.assertNotEqual(roa_helper.calculate_etag("ab", "c"), roa_helper.calculate_etag("a", "bc"))
+
+    def test_is_not_modified_etag(self):
+        '''This test case ensures If-None-Match header is evaluated against the entity tag and it takes precedence over
+        If-Modified-Since header.'''
+
+        last_modified = datetime.datetime(2014, 1, 1, 10, 0, 0)
+
+        request = Request.blank("/", headers={"If-None-Match": '"abc", W/"def"',
+                                              "If-Modified-Since": "Wed, 01 Jan 2014 10:00:00 GMT"})
+
+        self.assertTrue(roa_helper.is_not_modified(request, "abc"))
+        self.assertTrue(roa_helper.is_not_modified(request, "def"))
+        self.assertFalse(roa_helper.is_not_modified(request, "xyz", last_modified))
+        self.assertFalse(roa_helper.is_not_modified(request, None, last_modified))
+        self.assertTrue(roa_helper.is_not_modified(Request.blank("/", headers={"If-None-Match": "*"}), "xyz"))
+
+    def test_is_not_modified_date(self):
+        '''This test case ensures If-Modified-Since header is evaluated against the last modified date with second
+        precision.'''
+
+        request = Request.blank("/", headers={"If-Modified-Since": "Wed, 01 Jan 2014 10:00:00 GMT"})
+
+        self.assertTrue(roa_helper.is_not_modified(request, "abc", datetime.datetime(2014, 1, 1, 10, 0, 0, 500)))
+        self.assertTrue(roa_helper.is_not_modified(request, None, datetime.datetime(2013, 12, 31)))
+        self.assertFalse(roa_helper.is_not_modified(request, "abc", datetime.datetime(2014, 1, 1, 10, 0, 1)))
+        self.assertFalse(roa_helper.is_not_modified(request, "abc"))
+        self.assertFalse(roa_helper.is_not_modified(Request.blank("/"), "abc", datetime.datetime(2013, 12, 31)))
+
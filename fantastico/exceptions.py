@@ -109,3 +109,10 @@ class FantasticoInsufficientArgumentsError(FantasticoError):
 class FantasticoUrlInvokerError(FantasticoError):
     '''This exception is usually thrown when an internal url invoker fails. For instance, if a component reusage rendering
     fails then this exception is raised.'''
+
+class FantasticoExecutorBusyError(FantasticoError):
+    '''This exception is raised when a task is submitted to a bounded executor which has no free slot (all workers are busy
+    and the queue is full). See :py:class:`fantastico.utils.bounded_executor.BoundedExecutor`.'''
+
+    def __init__(self, msg=None, http_code=503):
+        super(FantasticoExecutorBusyError, self).__init__(msg, http_code)
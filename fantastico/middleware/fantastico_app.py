@@ -17,47 +17,55 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.middleware.fantastico_app
 '''
 
-from fantastico.exceptions import FantasticoContentTypeError, FantasticoNoRequestError, FantasticoRouteNotFoundError
+from fantastico.exceptions import FantasticoContentTypeError, FantasticoNoRequestError, FantasticoRouteNotFoundError, \
+    FantasticoSettingNotFoundError
+from fantastico.middleware.middleware_pipeline import MiddlewarePipeline, CompiledMiddlewarePipeline
+from fantastico.routing_engine.router import Router
 from fantastico.settings import SettingsFacade
-from fantastico.utils import instantiator
 
 class FantasticoApp(object):
     '''This class represents the wsgi application entry point. It is designed to wrap together all configured middlewares
-    and to return an http response.'''
+    and to return an http response. Configured middlewares are chained only once, when the application is built, into a
+    :py:class:`fantastico.middleware.middleware_pipeline.MiddlewarePipeline`. If the standard middlewares are configured and
+    **middleware_pipeline_compiled** setting is enabled, the compiled fast path
+    (:py:class:`fantastico.middleware.middleware_pipeline.CompiledMiddlewarePipeline`) is used.'''
 
-    class OldCallableApp(object):
-        '''Class used to save __call__ method from a wsgi middleware. It is used before chaining it at startup.'''
+    @property
+    def pipeline(self):
+        '''This property returns the middlewares pipeline used by this application.'''
 
-        def __init__(self, callable_obj):
-            self._callable_obj = callable_obj
-
-        def __call__(self, environ, start_response):
-            '''Take the same number of arguments as any other middleware __call__ method.'''
-
-            return self._callable_obj(environ, start_response)
+        return self._pipeline
 
     def __init__(self, settings_facade=SettingsFacade):
         self._settings_facade = settings_facade()
 
-        self._wrap_middlewares()
+        self._pipeline = self._build_pipeline()
 
-    def _wrap_middlewares(self):
-        '''Method used to register all configured middlewares in the correct order.'''
+    def _build_pipeline(self):
+        '''Method used to chain all configured middlewares in the correct order.'''
 
         installed_middlewares = self._settings_facade.get("installed_middleware")
 
-        curr_app_cls, curr_app_inst = FantasticoApp, FantasticoApp.OldCallableApp(self.__call__)
-
-        for middleware_cls in reversed(installed_middlewares):
-            middleware = instantiator.instantiate_class(middleware_cls, [curr_app_inst])
+        try:
+            compiled = self._settings_facade.get("middleware_pipeline_compiled")
+        except FantasticoSettingNotFoundError:
+            compiled = False
 
-            curr_app_cls.__call__ = lambda inst, *args: middleware(*args)
+        if compiled and CompiledMiddlewarePipeline.supports(installed_middlewares):
+            return CompiledMiddlewarePipeline(installed_middlewares, self.handle_request)
 
-            curr_app_cls, curr_app_inst = middleware.__class__, FantasticoApp.OldCallableApp(middleware.__call__)
+        return MiddlewarePipeline(installed_middlewares, self.handle_request)
 
     def __call__(self, environ, start_response):
         '''This method is used to execute the application and all configured middlewares in the correct order.'''
 
+        return self._pipeline(environ, start_response)
+
+    def handle_request(self, environ, start_response):
+        '''This method is used to execute the controller which handles the current request. It is invoked after all configured
+        middlewares were executed. The response body iterable is returned unchanged to the WSGI server so that streamed
+        responses (:py:class:`fantastico.routing_engine.custom_responses.StreamedResponse`) are never buffered in memory.'''
+
         request = environ.get("fantastico.request")
 
         if hasattr(request, "context"):
@@ -66,26 +74,23 @@ class FantasticoApp(object):
         if not request:
             raise FantasticoNoRequestError()
 
-        route_handler_key = "route_%s_handler" % request.path
-        route_handler = environ.get(route_handler_key)
+        route_match = environ.get(Router.ROUTE_MATCH_KEY)
 
-        if not route_handler:
-            raise FantasticoRouteNotFoundError("Route handler %s is not correctly built in the current request cycle." % \
-                                               route_handler_key)
+        if not route_match:
+            raise FantasticoRouteNotFoundError("Route match for %s is not correctly built in the current request cycle." % \
+                                               request.path)
 
-        route_contr = route_handler.get("controller")
+        route_contr = route_match.controller
         if not route_contr:
-            raise FantasticoRouteNotFoundError("Route handler %s does not contain a controller instance." % route_handler_key)
+            raise FantasticoRouteNotFoundError("Route match for %s does not contain a controller instance." % request.path)
 
-        route_method = route_handler.get("method")
+        route_method = route_match.method
         if not route_method:
-            raise FantasticoRouteNotFoundError("Route handler %s does not contain a method to execute." % route_handler_key)
+            raise FantasticoRouteNotFoundError("Route match for %s does not contain a method to execute." % request.path)
 
         contr_method = getattr(route_contr, route_method)
 
-        kwargs = route_handler.get("url_params") or {}
-
-        response = contr_method(request, **kwargs)
+        response = contr_method(request, **route_match.url_params)
 
         if request.accept.quality(response.content_type) is None:
             raise FantasticoContentTypeError("User brower accepts %s but received %s." % \
@@ -95,7 +100,7 @@ class FantasticoApp(object):
         
         start_response(response.status, response.headerlist)
 
-        return [response.body]
+        return response.app_iter
 
     def _append_global_response_headers(self, response):
         '''This method appends all global response headers into the given response.'''
@@ -0,0 +1,134 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.middleware.middleware_pipeline
+'''
+from fantastico.exceptions import FantasticoNotSupportedError
+from fantastico.oauth2.exceptions import OAuth2Error
+from fantastico.routing_engine.custom_responses import release_after
+from fantastico.utils import instantiator
+
+class MiddlewarePipeline(object):
+    '''This class provides the precomputed chain of configured middlewares. Each middleware is instantiated only once and
+    receives a direct reference to the next stage of the pipeline; the last middleware receives the application callable.
+    Invoking the pipeline invokes the first configured middleware directly.
+
+    .. code-block:: python
+
+        pipeline = MiddlewarePipeline(["fantastico.middleware.request_middleware.RequestMiddleware",
+                                       "fantastico.middleware.routing_middleware.RoutingMiddleware"], app.handle_request)
+
+        print(pipeline.stages) # [RequestMiddleware instance, RoutingMiddleware instance]
+
+        pipeline(environ, start_response)'''
+
+    @property
+    def stages(self):
+        '''This property returns the list of middleware instances in execution order.'''
+
+        return self._stages
+
+    def __init__(self, middlewares, app, instantiate_fn=instantiator.instantiate_class):
+        '''
+        :param middlewares: A list of middleware classes full names in execution order.
+        :type middlewares: list
+        :param app: The wsgi callable executed after all middlewares.
+        :type app: callable
+        :param instantiate_fn: The function used to instantiate each middleware (class full name, [next stage]). It is here
+            only for easing dependency injection and unit testing.
+        :type instantiate_fn: callable
+        '''
+
+        self._stages = []
+
+        next_stage = app
+
+        for middleware_cls in reversed(middlewares):
+            next_stage = instantiate_fn(middleware_cls, [next_stage])
+
+            self._stages.insert(0, next_stage)
+
+        self._entry = next_stage
+
+    def __call__(self, environ, start_response):
+        '''This method executes the pipeline for the given request.'''
+
+        return self._entry(environ, start_response)
+
+class CompiledMiddlewarePipeline(MiddlewarePipeline):
+    '''This class provides a compiled fast path for the standard middlewares configured in
+    :py:attr:`fantastico.settings.BasicSettings.installed_middleware`. Instead of passing through each middleware
+    **__call__** method, the logic of all standard middlewares is executed inline by a single method which produces exactly the
+    same result as the middlewares chain:
+
+    #. build the request (:py:class:`fantastico.middleware.request_middleware.RequestMiddleware`).
+    #. initialize db session manager and mark the request db session as in use while the request is handled
+       (:py:class:`fantastico.middleware.model_session_middleware.ModelSessionMiddleware`).
+    #. route the request (:py:class:`fantastico.middleware.routing_middleware.RoutingMiddleware`).
+    #. build the security context (:py:class:`fantastico.oauth2.middleware.tokens_middleware.OAuth2TokensMiddleware`).
+    #. execute the application and convert oauth2 errors to responses
+       (:py:class:`fantastico.oauth2.middleware.exceptions_middleware.OAuth2ExceptionsMiddleware`).
+    #. release the request resources (for streamed responses, after the whole body was sent).'''
+
+    STANDARD_MIDDLEWARES = ["fantastico.middleware.request_middleware.RequestMiddleware",
+                            "fantastico.middleware.model_session_middleware.ModelSessionMiddleware",
+                            "fantastico.middleware.routing_middleware.RoutingMiddleware",
+                            "fantastico.oauth2.middleware.exceptions_middleware.OAuth2ExceptionsMiddleware",
+                            "fantastico.oauth2.middleware.tokens_middleware.OAuth2TokensMiddleware"]
+
+    def __init__(self, middlewares, app, instantiate_fn=instantiator.instantiate_class):
+        if not self.supports(middlewares):
+            raise FantasticoNotSupportedError("Compiled pipeline supports only standard middlewares: %s" % self.STANDARD_MIDDLEWARES)
+
+        super(CompiledMiddlewarePipeline, self).__init__(middlewares, app, instantiate_fn)
+
+        self._app = app
+        self._request_mw, self._session_mw, self._routing_mw, self._exceptions_mw, self._tokens_mw = self._stages
+
+    @classmethod
+    def supports(cls, middlewares):
+        '''This method determines if the given middlewares list can be executed by compiled pipeline.'''
+
+        return list(middlewares or []) == cls.STANDARD_MIDDLEWARES
+
+    def __call__(self, environ, start_response):
+        '''This method executes the standard middlewares logic inline for the given request.'''
+
+        request = self._request_mw.prepare_request(environ)
+
+        try:
+            self._session_mw.init_session()
+
+            app_iter = self._session_mw.run_in_session(environ, lambda: self._handle_request(environ, start_response))
+        except Exception:
+            self._request_mw.release_request(request)
+
+            raise
+
+        return release_after(app_iter, lambda: self._request_mw.release_request(request))
+
+    def _handle_request(self, environ, start_response):
+        '''This method routes the request, builds the security context and executes the application. OAuth2 errors are
+        converted to responses.'''
+
+        self._routing_mw.route_request(environ)
+
+        try:
+            self._tokens_mw.build_security(environ)
+
+            return self._app(environ, start_response)
+        except OAuth2Error as ex:
+            return self._exceptions_mw.handle_error(ex, environ, start_response)
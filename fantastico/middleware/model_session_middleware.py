@@ -18,25 +18,97 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 
 from fantastico import mvc
+from fantastico.routing_engine.custom_responses import StreamedBody
 from fantastico.settings import SettingsFacade
+import threading
 
 class ModelSessionMiddleware(object):
     '''This class is responsible for managing database connections across requests. It also takes care of
     connection data pools. By default, the middleware is automatically configured to open a connection. If
     you don't need mvc (really improbable but still) you simply need to change your project active settings
-    profile. You can read more on :py:class:`fantastico.settings.BasicSettings`'''
+    profile. You can read more on :py:class:`fantastico.settings.BasicSettings`
+
+    The db session manager (and its connections pool) is initialized only once per wsgi worker, when the first request is
+    handled. Engine pool settings (pool size, max overflow, recycle, pre ping) are read from **database_config** setting.
+    The leaked sessions reaper of the db session manager is started at the same time. The session of each request is marked
+    as in use while the request is handled (:py:meth:`run_in_session`) so that the reaper never closes it.'''
 
     def __init__(self, app, settings_facade=SettingsFacade):
         self._app = app
         self._settings_facade = settings_facade()
+        self._conn_manager = None
+        self._conn_manager_lock = threading.Lock()
 
-    def __call__(self, environ, start_response, create_engine=None, create_session=None):
+    def init_session(self, create_engine=None, create_session=None):
         '''This method actively creates a db session class ready to be used. Create_ parameters are here
         only for easing dependency injection and unit testing. You should not use them.'''
 
-        db_config = self._settings_facade.get("database_config")
+        conn_manager = self._conn_manager
+
+        if conn_manager is None:
+            with self._conn_manager_lock:
+                conn_manager = self._conn_manager
+
+                if conn_manager is None:
+                    db_config = self._settings_facade.get("database_config")
+
+                    conn_manager = mvc.init_dm_db_engine(db_config, echo=db_config.get("show_sql", False),
+                                                         create_engine_fn=create_engine, create_session_fn=create_session)
+                    conn_manager.start_reaper()
+
+                    self._conn_manager = conn_manager
+
+        mvc.CONN_MANAGER = conn_manager
+
+    def run_in_session(self, environ, app_fn):
+        '''This method executes the given callable while the db session of the current request is marked as in use
+        (:py:meth:`fantastico.mvc.LazySession.in_use`) so that the leaked sessions reaper never closes it from another thread.
+        For streamed bodies (:py:class:`fantastico.routing_engine.custom_responses.StreamedBody`) the session is also marked
+        as in use while each chunk is produced. Both chained and compiled middlewares pipelines use this method.
+
+        :param environ: The current WSGI environ. The request id is read from **fantastico.current_request_id** key.
+        :type environ: dict
+        :param app_fn: A callable without arguments which handles the request and returns the response body.
+        :type app_fn: callable
+        :returns: The response body returned by app_fn.'''
+
+        request_id = environ.get("fantastico.current_request_id")
+
+        if mvc.CONN_MANAGER is None or request_id is None:
+            return app_fn()
+
+        session = mvc.CONN_MANAGER.get_connection(request_id)
+
+        with session.in_use():
+            app_iter = app_fn()
+
+        if isinstance(app_iter, StreamedBody):
+            app_iter.guard_with(session.in_use)
+
+        return app_iter
+
+    def get_pool_stats(self):
+        '''This method returns the connections pool utilisation of the current worker
+        (:py:meth:`fantastico.mvc.DbSessionManager.get_pool_stats`). If no request was handled yet, None is returned.'''
+
+        if self._conn_manager is None:
+            return None
+
+        return self._conn_manager.get_pool_stats()
+
+    def get_sessions_stats(self):
+        '''This method returns the live and leaked sessions gauges of the current worker
+        (:py:meth:`fantastico.mvc.DbSessionManager.get_sessions_stats`). If no request was handled yet, None is returned.'''
+
+        if self._conn_manager is None:
+            return None
+
+        return self._conn_manager.get_sessions_stats()
+
+    def __call__(self, environ, start_response, create_engine=None, create_session=None):
+        '''This method actively creates a db session class ready to be used. Create_ parameters are here
+        only for easing dependency injection and unit testing. You should not use them.'''
 
-        mvc.CONN_MANAGER = mvc.init_dm_db_engine(db_config, echo=db_config.get("show_sql", False),
-                                                 create_engine_fn=create_engine, create_session_fn=create_session)
+        self.init_session(create_engine, create_session)
 
-        return self._app(environ, start_response)
+        return self.run_in_session(environ, lambda: self._app(environ, start_response))
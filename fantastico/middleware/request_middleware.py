@@ -20,7 +20,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico import mvc
 from fantastico.locale.language import Language
 from fantastico.middleware.request_context import RequestContext
-from fantastico.routing_engine.custom_responses import RedirectResponse
+from fantastico.routing_engine.custom_responses import RedirectResponse, release_after
 from fantastico.settings import SettingsFacade
 from webob.request import Request
 import uuid
@@ -71,7 +71,12 @@ class RequestMiddleware(object):
 
         return RedirectResponse(destination=destination, query_params=query_params)
 
-    def __call__(self, environ, start_response, uuid_generator=uuid.uuid4):
+    def prepare_request(self, environ, uuid_generator=uuid.uuid4):
+        '''This method builds the request (with context and request id) and saves it into the given WSGI environ.
+
+        :returns: The built request.
+        :rtype: :py:class:`webob.request.Request`'''
+
         request = Request(environ)
         self._build_context(request)
 
@@ -85,8 +90,25 @@ class RequestMiddleware(object):
         environ["fantastico.current_request_id"] = request.request_id
         environ["fantastico.request"] = request
 
+        return request
+
+    def release_request(self, request):
+        '''This method releases all resources held by the given request. It must be invoked after the request was handled,
+        even if an exception occurred. For streamed responses
+        (:py:class:`fantastico.routing_engine.custom_responses.StreamedResponse`) it is invoked after the whole body was
+        sent.'''
+
+        if mvc.CONN_MANAGER:
+            mvc.CONN_MANAGER.close_connection(request.request_id)
+
+    def __call__(self, environ, start_response, uuid_generator=uuid.uuid4):
+        request = self.prepare_request(environ, uuid_generator)
+
         try:
-            return self._app(environ, start_response)
-        finally:
-            if mvc.CONN_MANAGER:
-                mvc.CONN_MANAGER.close_connection(request.request_id)
+            app_iter = self._app(environ, start_response)
+        except Exception:
+            self.release_request(request)
+
+            raise
+
+        return release_after(app_iter, lambda: self.release_request(request))
@@ -39,8 +39,8 @@ class RoutingMiddleware(object):
         self._router.get_loaders()
         self._router.register_routes()
         
-    def __call__(self, environ, start_response):
-        '''Method invoked when a new request must be solved by the routing engine.'''
+    def route_request(self, environ):
+        '''Method used to solve the current request (saved in WSGI environ) by the routing engine.'''
         
         request = environ.get("fantastico.request")
         
@@ -52,4 +52,9 @@ class RoutingMiddleware(object):
         except Exception as ex:
             raise FantasticoError(ex)
         
+    def __call__(self, environ, start_response):
+        '''Method invoked when a new request must be solved by the routing engine.'''
+        
+        self.route_request(environ)
+        
         return self._app(environ, start_response)
\ No newline at end of file
@@ -0,0 +1,147 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.middleware.tests.bench_middleware_pipeline
+
+This module provides a micro benchmark which measures the per request overhead of chaining middlewares. It compares the
+original chaining algorithm (class level **__call__** lambdas wrapped into callable objects) with
+:py:class:`fantastico.middleware.middleware_pipeline.MiddlewarePipeline` and with
+:py:class:`fantastico.middleware.middleware_pipeline.CompiledMiddlewarePipeline`. All middlewares used by the benchmark do
+nothing so that only chaining overhead is measured.
+
+.. code-block:: bash
+
+    python -m fantastico.middleware.tests.bench_middleware_pipeline
+'''
+from fantastico.middleware.middleware_pipeline import MiddlewarePipeline, CompiledMiddlewarePipeline
+from fantastico.utils import instantiator
+import timeit
+
+class NoopMiddleware(object):
+    '''This class provides a middleware which simply invokes the next stage.'''
+
+    def __init__(self, app):
+        self._app = app
+
+    def __call__(self, environ, start_response):
+        return self._app(environ, start_response)
+
+class NoopMiddleware2(NoopMiddleware):
+    '''Second no operation middleware.'''
+
+class NoopMiddleware3(NoopMiddleware):
+    '''Third no operation middleware.'''
+
+class NoopMiddleware4(NoopMiddleware):
+    '''Fourth no operation middleware.'''
+
+class NoopMiddleware5(NoopMiddleware):
+    '''Fifth no operation middleware.'''
+
+class NoopStages(object):
+    '''This class provides no operation implementations of all standard middlewares stages.'''
+
+    def prepare_request(self, environ):
+        return environ
+
+    def release_request(self, request):
+        pass
+
+    def init_session(self):
+        pass
+
+    def route_request(self, environ):
+        pass
+
+    def build_security(self, environ):
+        pass
+
+NOOP_MIDDLEWARES = ["%s.%s" % (__name__, cls_name) for cls_name in ["NoopMiddleware", "NoopMiddleware2", "NoopMiddleware3",
+                                                                      "NoopMiddleware4", "NoopMiddleware5"]]
+
+class LegacyApp(object):
+    '''This class reproduces the middlewares chaining algorithm used before the pipeline was introduced.'''
+
+    class OldCallableApp(object):
+        '''Class used to save __call__ method from a wsgi middleware.'''
+
+        def __init__(self, callable_obj):
+            self._callable_obj = callable_obj
+
+        def __call__(self, environ, start_response):
+            return self._callable_obj(environ, start_response)
+
+    def __init__(self, middlewares):
+        curr_app_cls, curr_app_inst = LegacyApp, LegacyApp.OldCallableApp(self.__call__)
+
+        for middleware_cls in reversed(middlewares):
+            middleware = instantiator.instantiate_class(middleware_cls, [curr_app_inst])
+
+            curr_app_cls.__call__ = lambda inst, *args, middleware=middleware: middleware(*args)
+
+            curr_app_cls, curr_app_inst = middleware.__class__, LegacyApp.OldCallableApp(middleware.__call__)
+
+    def __call__(self, environ, start_response):
+        return None
+
+def handle_request(environ, start_response):
+    '''This function replaces the application controller execution.'''
+
+    return None
+
+def build_compiled_pipeline():
+    '''This method builds a compiled pipeline whose stages do nothing.'''
+
+    pipeline = CompiledMiddlewarePipeline.__new__(CompiledMiddlewarePipeline)
+    pipeline._app = handle_request
+
+    stages = NoopStages()
+    pipeline._request_mw = pipeline._session_mw = pipeline._routing_mw = pipeline._tokens_mw = stages
+    pipeline._exceptions_mw = None
+
+    return pipeline
+
+def measure(app, requests_count):
+    '''This method returns the per request duration (in microseconds) of the given wsgi callable.'''
+
+    duration = min(timeit.repeat(lambda: app({}, None), number=requests_count, repeat=3))
+
+    return duration * 1000000 / requests_count
+
+def run_benchmark(requests_count=200000):
+    '''This method executes the benchmark and returns the per request overhead (in microseconds) of each chaining
+    algorithm. Legacy chain is measured last because it changes middlewares classes **__call__** methods.'''
+
+    results = [("pipeline", measure(MiddlewarePipeline(NOOP_MIDDLEWARES, handle_request), requests_count)),
+               ("compiled pipeline", measure(build_compiled_pipeline(), requests_count))]
+
+    original_calls = [(cls, cls.__dict__.get("__call__")) for cls in [LegacyApp, NoopMiddleware, NoopMiddleware2,
+                                                                      NoopMiddleware3, NoopMiddleware4, NoopMiddleware5]]
+
+    try:
+        results.insert(0, ("legacy chain", measure(LegacyApp(NOOP_MIDDLEWARES), requests_count)))
+    finally:
+        for cls, call_method in original_calls:
+            if call_method is None:
+                delattr(cls, "__call__")
+            else:
+                cls.__call__ = call_method
+
+    return results
+
+if __name__ == "__main__":
+    for bench_name, overhead in run_benchmark():
+        print("%-20s %.3f us / request" % (bench_name, overhead))
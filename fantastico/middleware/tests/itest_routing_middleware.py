@@ -19,6 +19,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico.exceptions import FantasticoNoRequestError
 from fantastico.middleware.routing_middleware import RoutingMiddleware
 from fantastico.routing_engine.dummy_routeloader import DummyRouteLoader
+from fantastico.routing_engine.router import Router
 from fantastico.tests.base_case import FantasticoIntegrationTestCase
 from mock import Mock
 from webob.request import Request
@@ -44,11 +45,11 @@ class RoutingMiddlewareIntegration(FantasticoIntegrationTestCase):
 
         self._routing_middleware(environ, Mock())
 
-        route_handler = environ.get("route_%s_handler" % DummyRouteLoader.DUMMY_ROUTE)
+        route_handler = environ.get(Router.ROUTE_MATCH_KEY)
 
         self.assertIsNotNone(route_handler)
-        self.assertIsInstance(route_handler.get("controller"), DummyRouteLoader)
-        self.assertEqual("display_test", route_handler.get("method"))
+        self.assertIsInstance(route_handler.controller, DummyRouteLoader)
+        self.assertEqual("display_test", route_handler.method)
 
     def test_route_handling_before_requestbuild(self):
         '''This test cases ensures that a fantastico exception is thrown if RequestMiddleware was not executed before.'''
@@ -19,6 +19,9 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico.exceptions import FantasticoClassNotFoundError, FantasticoContentTypeError, FantasticoNoRequestError, \
     FantasticoRouteNotFoundError
 from fantastico.middleware.fantastico_app import FantasticoApp
+from fantastico.middleware.middleware_pipeline import MiddlewarePipeline, CompiledMiddlewarePipeline
+from fantastico.routing_engine.custom_responses import StreamedResponse
+from fantastico.routing_engine.router import Router, RouteMatch
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
 from webob.request import Request
@@ -38,9 +41,8 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
         self._request.accept = "text/html;q=1"
         self._controller = Mock()
         self._controller.exec_logic = Mock(return_value=Response(content_type="text/html"))
-        self._environ = {"fantastico.request": self._request, 
-                         "route_/simple/request_handler": {"controller": self._controller,
-                                                           "method": "exec_logic"}}
+        self._environ = {"fantastico.request": self._request,
+                         Router.ROUTE_MATCH_KEY: RouteMatch(self._controller, "exec_logic")}
  
     def cleanup(self):
         FantasticoApp.__call__ = self._old_call
@@ -87,6 +89,24 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
         self.assertEqual(3, len(chained_resp))
         self.assertEqual(["middleware", "middleware2", "middleware3"], chained_resp)
         
+    def test_pipeline_compiled_only_standard(self):
+        '''This test case ensures compiled pipeline is not used for custom middlewares even if it is enabled.'''
+
+        def get(key):
+            if key == "installed_middleware":
+                return ["fantastico.middleware.tests.test_fantastico_app.MockedMiddleware"]
+
+            if key == "middleware_pipeline_compiled":
+                return True
+
+        self._settings_facade.get = get
+
+        app = FantasticoApp(self._settings_facade_cls)
+
+        self.assertIsInstance(app.pipeline, MiddlewarePipeline)
+        self.assertNotIsInstance(app.pipeline, CompiledMiddlewarePipeline)
+        self.assertIsInstance(app.pipeline.stages[0], MockedMiddleware)
+
     def test_wrap_no_middleware(self):
         '''Test case that ensures the app entry point works as expected even if no middlewares are installed.'''
         
@@ -141,6 +161,25 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
         self.assertEqual(global_headers["X-Custom-Header1"], response.headers["X-Custom-Header1"])
         self.assertEqual(global_headers["X-Custom-Header2"], response.headers["X-Custom-Header2"])
     
+    def test_exec_controller_streamed(self):
+        '''This test case ensures streamed response bodies are passed to the wsgi server unchanged (they are not buffered).'''
+
+        self._settings_facade.get = \
+            lambda key: ["fantastico.middleware.tests.test_fantastico_app.MockedMiddleware"] \
+                            if key == "installed_middleware" else None
+
+        app_middleware = FantasticoApp(self._settings_facade_cls)
+
+        chunks = iter([b"Hello ", b"world"])
+        response = StreamedResponse(chunks, content_type="text/html")
+
+        self._controller.exec_logic = lambda request: response
+
+        app_iter = app_middleware(self._environ, Mock())
+
+        self.assertEqual(response.app_iter, app_iter)
+        self.assertEqual([b"Hello ", b"world"], list(app_iter))
+
     def test_exec_controller_url_params_ok(self):
         '''This test case ensures that requested route is executed and url_params are passed correctly.'''
 
@@ -155,7 +194,8 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
         comp_name = "component"
         path =  "path/here"
         
-        self._environ["route_/simple/request_handler"]["url_params"] = {"comp_name": comp_name, "path": path}
+        self._environ[Router.ROUTE_MATCH_KEY] = RouteMatch(self._controller, "exec_logic",
+                                                           {"comp_name": comp_name, "path": path})
         
         self._controller.exec_logic = lambda request, comp_name, path: Response(content_type="text/html; charset=UTF-8",
                                                                                 text="/%s/%s" % (comp_name, path))
@@ -174,7 +214,8 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
         comp_name = "component"
         path =  "path/here"
         
-        self._environ["route_/simple/request_handler"]["url_params"] = {"comp_name": comp_name, "path": path}
+        self._environ[Router.ROUTE_MATCH_KEY] = RouteMatch(self._controller, "exec_logic",
+                                                           {"comp_name": comp_name, "path": path})
         
         self._controller.exec_logic = lambda request: None
         
@@ -203,10 +244,10 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
                 
         app_middleware = FantasticoApp(self._settings_facade_cls)
 
-        del self._environ["route_/simple/request_handler"]
+        del self._environ[Router.ROUTE_MATCH_KEY]
         self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])
         
-        self._environ["route_/simple/request_handler"] = None
+        self._environ[Router.ROUTE_MATCH_KEY] = None
         self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])
     
     def test_route_nomethod(self):
@@ -216,15 +257,10 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
                 
         app_middleware = FantasticoApp(self._settings_facade_cls)
         
-        route_handler = "route_/simple/request_handler" 
-        
-        del self._environ[route_handler]["method"]        
-        self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])
-        
-        self._environ[route_handler]["method"] = None
+        self._environ[Router.ROUTE_MATCH_KEY] = RouteMatch(self._controller, None)
         self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])
 
-        self._environ[route_handler]["method"] = ""
+        self._environ[Router.ROUTE_MATCH_KEY] = RouteMatch(self._controller, "")
         self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])
         
     def test_route_nocontroller(self):
@@ -234,12 +270,7 @@ class FantasticoAppTests(FantasticoUnitTestsCase):
                 
         app_middleware = FantasticoApp(self._settings_facade_cls)
         
-        route_handler = "route_/simple/request_handler" 
-        
-        del self._environ[route_handler]["controller"]
-        self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])        
-
-        self._environ[route_handler]["controller"] = None
+        self._environ[Router.ROUTE_MATCH_KEY] = RouteMatch(None, "exec_logic")
         self.assertRaises(FantasticoRouteNotFoundError, app_middleware, *[self._environ, Mock()])        
         
     def test_mistmatch_content_headers(self):
@@ -0,0 +1,306 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.middleware.tests.test_middleware_pipeline
+'''
+from fantastico import mvc
+from fantastico.exceptions import FantasticoNotSupportedError
+from fantastico.middleware.middleware_pipeline import MiddlewarePipeline, CompiledMiddlewarePipeline
+from fantastico.middleware.model_session_middleware import ModelSessionMiddleware
+from fantastico.middleware.request_middleware import RequestMiddleware
+from fantastico.middleware.routing_middleware import RoutingMiddleware
+from fantastico.oauth2.exceptions import OAuth2InvalidTokenDescriptorError
+from fantastico.oauth2.middleware.exceptions_middleware import OAuth2ExceptionsMiddleware
+from fantastico.oauth2.middleware.tokens_middleware import OAuth2TokensMiddleware
+from fantastico.middleware.tests.test_fantastico_app import MockedMiddleware, MockedMiddleware2, MockedMiddleware3
+from fantastico.oauth2.exceptions import OAuth2Error
+from fantastico.routing_engine.custom_responses import StreamedBody
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from fantastico.utils.lru_cache import LruCache
+from mock import Mock, MagicMock
+from webob.request import Request
+
+class MiddlewarePipelineTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases for middlewares pipelines.'''
+
+    MIDDLEWARES = ["fantastico.middleware.tests.test_fantastico_app.MockedMiddleware",
+                   "fantastico.middleware.tests.test_fantastico_app.MockedMiddleware2",
+                   "fantastico.middleware.tests.test_fantastico_app.MockedMiddleware3"]
+
+    def cleanup(self):
+        '''This method resets the db session manager after each test case.'''
+
+        mvc.CONN_MANAGER = None
+
+    def test_pipeline_stages_ok(self):
+        '''This test case ensures middlewares are chained in the configured order and each stage holds a direct reference to
+        the next one.'''
+
+        app = Mock(return_value=[b"Hello world"])
+
+        pipeline = MiddlewarePipeline(self.MIDDLEWARES, app)
+        stages = pipeline.stages
+
+        self.assertEqual(3, len(stages))
+        self.assertIsInstance(stages[0], MockedMiddleware)
+        self.assertIsInstance(stages[1], MockedMiddleware2)
+        self.assertIsInstance(stages[2], MockedMiddleware3)
+        self.assertTrue(stages[0]._app is stages[1])
+        self.assertTrue(stages[1]._app is stages[2])
+        self.assertTrue(stages[2]._app is app)
+
+        environ = {}
+        start_response = Mock()
+
+        self.assertEqual([b"Hello world"], pipeline(environ, start_response))
+        self.assertEqual(["middleware", "middleware2", "middleware3"], environ["middlewares_responses"])
+
+        app.assert_called_once_with(environ, start_response)
+
+    def test_pipeline_empty(self):
+        '''This test case ensures an empty pipeline executes the application directly.'''
+
+        app = Mock(return_value=[b"Hello world"])
+
+        pipeline = MiddlewarePipeline([], app)
+
+        self.assertEqual([], pipeline.stages)
+        self.assertEqual([b"Hello world"], pipeline({}, Mock()))
+
+    def test_compiled_supports(self):
+        '''This test case ensures compiled pipeline is supported only for the standard middlewares.'''
+
+        self.assertTrue(CompiledMiddlewarePipeline.supports(list(CompiledMiddlewarePipeline.STANDARD_MIDDLEWARES)))
+        self.assertFalse(CompiledMiddlewarePipeline.supports(self.MIDDLEWARES))
+        self.assertFalse(CompiledMiddlewarePipeline.supports(list(reversed(CompiledMiddlewarePipeline.STANDARD_MIDDLEWARES))))
+        self.assertFalse(CompiledMiddlewarePipeline.supports(None))
+
+        self.assertRaises(FantasticoNotSupportedError, CompiledMiddlewarePipeline, *[self.MIDDLEWARES, Mock()])
+
+    def _mock_compiled_pipeline(self, app):
+        '''This method builds a compiled pipeline whose stages are mocked. All stages invocations are recorded in the returned
+        list.'''
+
+        calls = []
+
+        pipeline = CompiledMiddlewarePipeline.__new__(CompiledMiddlewarePipeline)
+        pipeline._app = app
+
+        request = Mock()
+
+        pipeline._request_mw = Mock()
+        pipeline._request_mw.prepare_request = Mock(side_effect=lambda environ: calls.append("prepare_request") or request)
+        pipeline._request_mw.release_request = Mock(side_effect=lambda request: calls.append("release_request"))
+        pipeline._session_mw = ModelSessionMiddleware(Mock(), Mock())
+        pipeline._session_mw.init_session = Mock(side_effect=lambda: calls.append("init_session"))
+        pipeline._routing_mw = Mock()
+        pipeline._routing_mw.route_request = Mock(side_effect=lambda environ: calls.append("route_request"))
+        pipeline._tokens_mw = Mock()
+        pipeline._tokens_mw.build_security = Mock(side_effect=lambda environ: calls.append("build_security"))
+        pipeline._exceptions_mw = Mock()
+        pipeline._exceptions_mw.handle_error = Mock(return_value=[b"error"])
+
+        return pipeline, calls
+
+    def test_compiled_pipeline_ok(self):
+        '''This test case ensures compiled pipeline executes standard middlewares logic in the correct order.'''
+
+        app = Mock(return_value=[b"Hello world"])
+        pipeline, calls = self._mock_compiled_pipeline(app)
+
+        self.assertEqual([b"Hello world"], pipeline({}, Mock()))
+        self.assertEqual(["prepare_request", "init_session", "route_request", "build_security", "release_request"], calls)
+
+    def test_compiled_pipeline_streamed(self):
+        '''This test case ensures compiled pipeline releases request resources only after a streamed body was sent.'''
+
+        body = StreamedBody([b"Hello world"])
+        pipeline, calls = self._mock_compiled_pipeline(Mock(return_value=body))
+
+        self.assertEqual(body, pipeline({}, Mock()))
+        self.assertEqual(["prepare_request", "init_session", "route_request", "build_security"], calls)
+
+        body.close()
+
+        self.assertEqual("release_request", calls[-1])
+
+    def test_compiled_pipeline_session_in_use(self):
+        '''This test case ensures compiled pipeline marks the request db session as in use while the application handles the
+        request and while each chunk of a streamed body is produced.'''
+
+        conn_manager = MagicMock()
+        session = conn_manager.get_connection.return_value
+
+        mvc.CONN_MANAGER = conn_manager
+
+        in_use = []
+
+        def handle_request(environ, start_response):
+            in_use.append(session.in_use.return_value.__exit__.call_count < session.in_use.call_count)
+
+            return StreamedBody([b"Hello ", b"world"])
+
+        pipeline, calls = self._mock_compiled_pipeline(Mock(side_effect=handle_request))
+
+        environ = {"fantastico.current_request_id": "abc"}
+
+        body = pipeline(environ, Mock())
+
+        conn_manager.get_connection.assert_called_once_with("abc")
+        self.assertEqual([True], in_use)
+        self.assertEqual(1, session.in_use.call_count)
+
+        self.assertEqual([b"Hello ", b"world"], list(body))
+        self.assertEqual(4, session.in_use.call_count)
+        self.assertEqual(4, session.in_use.return_value.__exit__.call_count)
+
+        body.close()
+
+        self.assertEqual("release_request", calls[-1])
+
+    def test_compiled_pipeline_oauth2_error(self):
+        '''This test case ensures compiled pipeline converts oauth2 errors to responses and releases request resources.'''
+
+        ex = OAuth2Error(error_code=-1)
+        app = Mock(side_effect=ex)
+        pipeline, calls = self._mock_compiled_pipeline(app)
+
+        environ, start_response = {}, Mock()
+
+        self.assertEqual([b"error"], pipeline(environ, start_response))
+        self.assertEqual("release_request", calls[-1])
+
+        pipeline._exceptions_mw.handle_error.assert_called_once_with(ex, environ, start_response)
+
+    def test_compiled_pipeline_unexpected_error(self):
+        '''This test case ensures compiled pipeline does not handle non oauth2 errors but it still releases request
+        resources.'''
+
+        app = Mock(side_effect=Exception("Unexpected error"))
+        pipeline, calls = self._mock_compiled_pipeline(app)
+
+        self.assertRaises(Exception, pipeline, *[{}, Mock()])
+        self.assertEqual("release_request", calls[-1])
+        self.assertEqual(0, pipeline._exceptions_mw.handle_error.call_count)
+
+    def _build_standard_pipeline(self, pipeline_cls, app, conn_manager):
+        '''This method builds the given pipeline class over the standard middlewares. Middlewares are the real ones but their
+        dependencies (db session manager, router, tokens service) are mocked.'''
+
+        def route(path, environ):
+            if path == "/missing":
+                raise Exception("No route found.")
+
+            environ["fantastico.route_match"] = path
+
+        def decrypt(encrypted_token):
+            raise OAuth2InvalidTokenDescriptorError("token")
+
+        def build_session_mw(app):
+            middleware = ModelSessionMiddleware(app, Mock())
+            middleware._conn_manager = conn_manager
+
+            return middleware
+
+        router = Mock()
+        router.handle_route = Mock(side_effect=route)
+
+        tokens_service = Mock()
+        tokens_service.decrypt = Mock(side_effect=decrypt)
+
+        revocation_store = Mock()
+        revocation_store.sync_due = Mock(return_value=False)
+
+        settings_facade = Mock()
+        settings_facade.get = Mock(return_value="http://doc/")
+
+        stages_builders = {
+            "fantastico.middleware.request_middleware.RequestMiddleware": RequestMiddleware,
+            "fantastico.middleware.model_session_middleware.ModelSessionMiddleware": build_session_mw,
+            "fantastico.middleware.routing_middleware.RoutingMiddleware": \
+                lambda app: RoutingMiddleware(app, Mock(return_value=router)),
+            "fantastico.oauth2.middleware.exceptions_middleware.OAuth2ExceptionsMiddleware": \
+                lambda app: OAuth2ExceptionsMiddleware(app, Mock(return_value=settings_facade)),
+            "fantastico.oauth2.middleware.tokens_middleware.OAuth2TokensMiddleware": \
+                lambda app: OAuth2TokensMiddleware(app, Mock(return_value=tokens_service), LruCache(10),
+                                                   revocation_store=revocation_store)}
+
+        return pipeline_cls(CompiledMiddlewarePipeline.STANDARD_MIDDLEWARES, app,
+                            lambda middleware_cls, args: stages_builders[middleware_cls](*args))
+
+    def _execute_standard_pipeline(self, pipeline_cls, url, app):
+        '''This method executes a request through the standard middlewares using the given pipeline class and returns
+        everything observable about the request handling: response body (or raised exception), started response,
+        security context and db session manager interactions.'''
+
+        conn_manager = MagicMock()
+        start_response = Mock()
+        pipeline = self._build_standard_pipeline(pipeline_cls, app, conn_manager)
+
+        environ = Request.blank(url, headers={"Accept-Language": "en-US"}).environ
+        environ["fantastico.current_request_id"] = "req-1"
+
+        try:
+            app_iter = pipeline(environ, start_response)
+            result = list(app_iter)
+
+            if isinstance(app_iter, StreamedBody):
+                app_iter.close()
+        except Exception as ex:
+            result = (ex.__class__, str(ex))
+
+        security = getattr(environ["fantastico.request"].context, "security", None)
+
+        return {"result": result,
+                "start_response": start_response.call_args_list,
+                "route_match": environ.get("fantastico.route_match"),
+                "security": security.access_token if security else "no security",
+                "conn_manager": [call[0] for call in conn_manager.mock_calls],
+                "closed": conn_manager.close_connection.call_args_list}
+
+    def test_compiled_pipeline_parity(self):
+        '''This test case ensures compiled pipeline produces exactly the same result as the chained standard middlewares for
+        successful, streamed and failed requests.'''
+
+        def handle_ok(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/plain")])
+
+            return [b"Hello world"]
+
+        def handle_streamed(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/plain")])
+
+            return StreamedBody([b"Hello ", b"world"])
+
+        def handle_oauth2_error(environ, start_response):
+            raise OAuth2Error(error_code=-1, msg="Unexpected oauth2 error.", http_code=401)
+
+        def handle_unexpected_error(environ, start_response):
+            raise ValueError("Unexpected error.")
+
+        scenarios = [("/index.html", handle_ok),
+                     ("/export", handle_streamed),
+                     ("/index.html", handle_oauth2_error),
+                     ("/index.html", handle_unexpected_error),
+                     ("/index.html?token=invalid", handle_ok),
+                     ("/missing", handle_ok)]
+
+        for url, app in scenarios:
+            expected = self._execute_standard_pipeline(MiddlewarePipeline, url, app)
+            result = self._execute_standard_pipeline(CompiledMiddlewarePipeline, url, app)
+
+            self.assertEqual(expected, result, "%s (%s)" % (url, app.__name__))
+            self.assertEqual(1, len(result["closed"]))
@@ -22,7 +22,9 @@ from fantastico.exceptions import FantasticoError
 from fantastico.middleware.model_session_middleware import ModelSessionMiddleware
 from fantastico.mvc import DbSessionManager
 from fantastico.tests.base_case import FantasticoUnitTestsCase
-from mock import Mock
+from fantastico.routing_engine.custom_responses import StreamedBody
+from mock import Mock, MagicMock
+from threading import Thread
 import uuid
 
 class ModelSessionMiddlewareTests(FantasticoUnitTestsCase):
@@ -71,6 +73,28 @@ class ModelSessionMiddlewareTests(FantasticoUnitTestsCase):
         self.assertEqual(self._normal_response, response)
         self.assertIsInstance(mvc.CONN_MANAGER, DbSessionManager)
 
+    def test_session_in_use_while_handling(self):
+        '''This test case ensures the request session is marked as in use while the application handles the request and while
+        each chunk of a streamed body is produced.'''
+
+        conn_manager = MagicMock()
+        session = conn_manager.get_connection.return_value
+
+        self._middleware.init_session = Mock()
+        mvc.CONN_MANAGER = conn_manager
+
+        self._app.return_value = StreamedBody([b"Hello ", b"world"])
+        self._environ["fantastico.current_request_id"] = "abc"
+
+        body = self._middleware(self._environ, Mock())
+
+        conn_manager.get_connection.assert_called_once_with("abc")
+        self.assertEqual(1, session.in_use.call_count)
+
+        self.assertEqual([b"Hello ", b"world"], list(body))
+        self.assertEqual(4, session.in_use.call_count)
+        self.assertEqual(4, session.in_use.return_value.__exit__.call_count)
+
     def test_init_session_scoped_cache(self):
         '''This test case ensures a session is cached correctly across multiple requests.'''
         
@@ -91,14 +115,14 @@ class ModelSessionMiddlewareTests(FantasticoUnitTestsCase):
         
         self.assertEqual(self._normal_response, response)
         self.assertIsInstance(mvc.CONN_MANAGER, DbSessionManager)
-        self.assertEqual(session, mvc.CONN_MANAGER.get_connection(request_id))
+        self.assertEqual(session.query, mvc.CONN_MANAGER.get_connection(request_id).query)
         
         response = self._middleware(self._environ, Mock(), create_engine=create_engine, 
                             create_session=create_session)
 
         self.assertEqual(self._normal_response, response)
         self.assertIsInstance(mvc.CONN_MANAGER, DbSessionManager)
-        self.assertEqual(session, mvc.CONN_MANAGER.get_connection(request_id))
+        self.assertEqual(session.query, mvc.CONN_MANAGER.get_connection(request_id).query)
     
     def test_session_init_exception_unhandled(self):
         '''This test case ensures unhandled exception raised during initialization are gracefully transformed
@@ -116,6 +140,79 @@ class ModelSessionMiddlewareTests(FantasticoUnitTestsCase):
         
         with self.assertRaises(FantasticoError):
             self._middleware(self._environ, Mock(), create_engine=Mock(), create_session=create_session)
-            mvc.CONN_MANAGER.get_connection(uuid.uuid4())
+            mvc.CONN_MANAGER.get_connection(uuid.uuid4()).query
         
-        self.assertIsNotNone(mvc.CONN_MANAGER)
\ No newline at end of file
+        self.assertIsNotNone(mvc.CONN_MANAGER)
+    def test_session_manager_initialized_once(self):
+        '''This test case ensures db session manager is built only once per worker even if multiple threads handle requests
+        concurrently.'''
+
+        get_setting = Mock(side_effect=self._get_db_config)
+        self._settings_facade.get = get_setting
+
+        def handle_request():
+            self._middleware(self._environ, Mock(), create_engine=Mock(), create_session=Mock())
+
+        threads = [Thread(target=handle_request) for idx in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(100)
+
+        conn_manager = mvc.CONN_MANAGER
+
+        handle_request()
+
+        self.assertIsInstance(conn_manager, DbSessionManager)
+        self.assertTrue(conn_manager is mvc.CONN_MANAGER)
+        self.assertEqual(1, get_setting.call_count)
+
+    def test_sessions_stats_ok(self):
+        '''This test case ensures live / leaked sessions gauges are exposed once db session manager is initialized and the
+        leaked sessions reaper is started.'''
+
+        self.assertIsNone(self._middleware.get_sessions_stats())
+
+        def get_db_config(key):
+            db_config = self._get_db_config(key)
+            db_config["session_timeout"] = 300
+
+            return db_config
+
+        self._settings_facade.get = get_db_config
+
+        self._middleware(self._environ, Mock(), create_engine=Mock(), create_session=Mock())
+
+        try:
+            self.assertEqual({"live_sessions": 0, "leaked_sessions": 0}, self._middleware.get_sessions_stats())
+            self.assertTrue(mvc.CONN_MANAGER._reaper.is_alive())
+        finally:
+            mvc.CONN_MANAGER.stop_reaper()
+
+    def test_pool_stats(self):
+        '''This test case ensures connections pool utilisation is reported correctly.'''
+
+        self.assertIsNone(self._middleware.get_pool_stats())
+
+        self._settings_facade.get = self._get_db_config
+
+        self._middleware(self._environ, Mock(), create_engine=Mock(), create_session=Mock())
+
+        pool = Mock()
+        pool.size = Mock(return_value=20)
+        pool.checkedin = Mock(return_value=15)
+        pool.checkedout = Mock(return_value=5)
+        pool.overflow = Mock(return_value=-15)
+        pool.status = Mock(return_value="Pool status")
+
+        old_engine = DbSessionManager.ENGINE
+        DbSessionManager.ENGINE = Mock()
+        DbSessionManager.ENGINE.pool = pool
+
+        try:
+            self.assertEqual({"pool_size": 20, "checked_in": 15, "checked_out": 5, "overflow": -15, "status": "Pool status"},
+                             self._middleware.get_pool_stats())
+        finally:
+            DbSessionManager.ENGINE = old_engine
@@ -21,9 +21,9 @@ from fantastico import mvc
 from fantastico.middleware.request_middleware import RequestMiddleware
 from fantastico.settings import BasicSettings
 from fantastico.tests.base_case import FantasticoUnitTestsCase
-from mock import Mock
+from mock import MagicMock, Mock
 import os
-from fantastico.routing_engine.custom_responses import RedirectResponse
+from fantastico.routing_engine.custom_responses import RedirectResponse, StreamedBody
 
 
 class RequestMiddlewareTests(FantasticoUnitTestsCase):
@@ -139,7 +139,7 @@ class RequestMiddlewareTests(FantasticoUnitTestsCase):
     def test_connection_closed(self):
         '''This test case ensures connection is closed once the request is done.'''
 
-        conn_manager = Mock()
+        conn_manager = MagicMock()
 
         mvc.CONN_MANAGER = conn_manager
 
@@ -153,6 +153,24 @@ class RequestMiddlewareTests(FantasticoUnitTestsCase):
 
         self.assertEqual("Connection closed.", str(cm.exception))
 
+    def test_connection_closed_after_streamed_body(self):
+        '''This test case ensures connection is closed only after a streamed response body was sent.'''
+
+        conn_manager = MagicMock()
+
+        mvc.CONN_MANAGER = conn_manager
+
+        body = StreamedBody([b"Hello ", b"world"])
+        self._app.return_value = body
+
+        self.assertEqual(body, self._middleware(self._environ, self._start_response))
+        self.assertEqual([b"Hello ", b"world"], list(body))
+        self.assertEqual(0, conn_manager.close_connection.call_count)
+
+        body.close()
+
+        conn_manager.close_connection.assert_called_once_with(self._environ["fantastico.current_request_id"])
+
     def test_redirect_appended(self):
         '''This test case ensures redirect method is correctly appended to the current request.'''
 
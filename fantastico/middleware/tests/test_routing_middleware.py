@@ -18,6 +18,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 from fantastico.exceptions import FantasticoNoRequestError, FantasticoError
 from fantastico.middleware.routing_middleware import RoutingMiddleware
+from fantastico.routing_engine.router import Router, RouteMatch
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
 from webob.request import Request
@@ -39,17 +40,17 @@ class RoutingMiddlewareTests(FantasticoUnitTestsCase):
         
         def handle_route(url, environ):
             if url == "/simple/request":
-                environ["route_/simple/request_handler"] = {"controller": SimpleController(), "method": "do_request"}
+                environ[Router.ROUTE_MATCH_KEY] = RouteMatch(SimpleController(), "do_request")
         
         self._router.handle_route = handle_route
         
         self._routing_middleware(self._environ, Mock())
         
-        route_handler = self._environ.get("route_/simple/request_handler")
+        route_handler = self._environ.get(Router.ROUTE_MATCH_KEY)
         
         self.assertIsNotNone(route_handler)
-        self.assertIsInstance(route_handler.get("controller"), SimpleController)
-        self.assertEqual("do_request", route_handler.get("method"))
+        self.assertIsInstance(route_handler.controller, SimpleController)
+        self.assertEqual("do_request", route_handler.method)
         
     def test_route_norequest_built(self):
         '''This test case ensures an exception is raised if no request is available in wsgi environ.'''
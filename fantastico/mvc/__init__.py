@@ -23,16 +23,120 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
+import contextlib
+import threading
+import time
 
 BASEMODEL = declarative_base()
 
+class LazySession(object):
+    '''This class provides a lazy proxy for the db session of a request. The session is opened (using the given factory) only
+    when one of its attributes is first accessed, so requests which never use the database (static assets, CORS requests)
+    never open a session or checkout a pooled connection.
+
+    .. code-block:: python
+
+        session = LazySession(lambda: scoped_session(session_maker))
+
+        session.acquired # False
+        session.query(Blog).all()
+        session.acquired # True
+
+    The session keeps track of its last activity and it is marked as in use while the request thread works with it
+    (:py:meth:`in_use`) so that :py:class:`DbSessionManager` reaper never closes a session which is still used.'''
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+        self._session = None
+        self._lock = threading.RLock()
+        self._reaped = False
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+    @property
+    def acquired(self):
+        '''This property returns True if the underlining session was opened and False otherwise.'''
+
+        return self._session is not None
+
+    def _acquire(self):
+        '''This method opens the underlining session if it is not opened yet.'''
+
+        if self._reaped:
+            raise FantasticoDbError("Session was closed after being idle for longer than configured session_timeout.")
+
+        if self._session is None:
+            self._session = self._session_factory()
+
+        return self._session
+
+    def __getattr__(self, name):
+        self.last_used_at = time.monotonic()
+
+        return getattr(self._acquire(), name)
+
+    @contextlib.contextmanager
+    def in_use(self):
+        '''This method returns a context manager which marks the session as in use for the enclosed block. The session can not
+        be reaped while it is in use and its last activity is refreshed when the block ends.'''
+
+        with self._lock:
+            try:
+                yield self
+            finally:
+                self.last_used_at = time.monotonic()
+
+    def close_if_idle(self, idle_before):
+        '''This method closes the session if it is not in use and it was not used since the given monotonic time. It never
+        waits for a thread which uses the session.
+
+        :returns: True if the session was closed and False otherwise.
+        :rtype: bool'''
+
+        if not self._lock.acquire(blocking=False):
+            return False
+
+        try:
+            if self.last_used_at >= idle_before:
+                return False
+
+            self._reaped = True
+
+            try:
+                self.remove()
+                self.close()
+            except Exception:
+                pass
+
+            return True
+        finally:
+            self._lock.release()
+
+    def remove(self):
+        '''This method removes the underlining scoped session (if opened).'''
+
+        if self._session is not None:
+            self._session.remove()
+
+    def close(self):
+        '''This method closes the underlining session (if opened).'''
+
+        if self._session is not None:
+            self._session.close()
+
 class DbSessionManager(object):
     '''This class is responsible for managing db connections for fantastico framework. The current strategy implemented
     is based on a request id. This means once a request is done, it receives a request identifier which remains constant
-    for the whole request.'''
+    for the whole request.
+
+    Sessions registry is safe to be used concurrently by all threads of a worker. Sessions which are not closed at the end of
+    the request (e.g the WSGI server never closes a streamed body) are considered leaked once they are not in use and they
+    were idle for longer than **session_timeout** seconds (configured through database config). Leaked sessions are closed by
+    :py:meth:`reap_sessions` which is periodically executed by a background reaper thread (:py:meth:`start_reaper`).'''
 
     ENGINE = None
     SESSION = None
+    ENGINE_LOCK = threading.Lock()
 
     def __init__(self, db_config, echo=False, create_engine_fn=None, create_session_fn=None):
         try:
@@ -45,7 +149,17 @@ class DbSessionManager(object):
         self._create_engine_fn = create_engine_fn
         self._create_session_fn = create_session_fn
 
+        self._session_timeout = db_config.get("session_timeout")
+
         self._cached_conns = {}
+        self._conns_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._requests_count = 0
+        self._untouched_requests_count = 0
+        self._leaked_sessions_count = 0
+
+        self._reaper = None
+        self._reaper_stop = threading.Event()
 
     def _build_conn_props(self, db_config):
         '''This method is used to build the connection properties required for connecting to fantastico configured database.'''
@@ -61,51 +175,187 @@ class DbSessionManager(object):
         return conn_props
 
     def get_connection(self, request_id):
-        '''This method is responsible for retrieving an active session for the given request.'''
+        '''This method is responsible for retrieving the session for the given request. The returned session is a
+        :py:class:`LazySession`: the underlining session (and its pooled connection) is opened only when the session is first
+        used.'''
+
+        with self._conns_lock:
+            session = self._cached_conns.get(request_id)
+
+            if session is None:
+                session = LazySession(lambda: self._open_session(request_id))
+
+                self._cached_conns[request_id] = session
 
-        session = self._cached_conns.get(request_id)
+        return session
 
-        if session:
-            return session
+    def _open_session(self, request_id):
+        '''This method opens a new session for the given request. It is invoked when the lazy session of the request is first
+        used.'''
 
         try:
             conn_data = URL(**self._conn_props)
 
             if not DbSessionManager.ENGINE:
-                DbSessionManager.ENGINE = self._create_engine_fn(conn_data,
-                                                                 echo=self._echo, **self._engine_params)
-                DbSessionManager.SESSION = sessionmaker(bind=DbSessionManager.ENGINE)
+                with DbSessionManager.ENGINE_LOCK:
+                    if not DbSessionManager.ENGINE:
+                        engine = self._create_engine_fn(conn_data, echo=self._echo, **self._engine_params)
 
-            session = self._create_session_fn(DbSessionManager.SESSION, lambda: request_id)
+                        DbSessionManager.SESSION = sessionmaker(bind=engine)
+                        DbSessionManager.ENGINE = engine
 
-            self._cached_conns[request_id] = session
-
-            return session
+            return self._create_session_fn(DbSessionManager.SESSION, lambda: request_id)
         except Exception as ex:
-            self.close_connection(request_id)
+            with self._conns_lock:
+                self._cached_conns.pop(request_id, None)
 
             raise FantasticoDbError(ex)
 
+    def get_sessions_stats(self):
+        '''This method returns the number of sessions currently registered (requests in progress) and the number of leaked
+        sessions closed by the reaper since the worker started.
+
+        :returns: A dictionary containing **live_sessions** and **leaked_sessions** keys.
+        :rtype: dict'''
+
+        with self._conns_lock:
+            live_sessions = len(self._cached_conns)
+
+        with self._stats_lock:
+            return {"live_sessions": live_sessions, "leaked_sessions": self._leaked_sessions_count}
+
+    def reap_sessions(self, now=None):
+        '''This method closes all sessions which are not in use and were idle for longer than configured **session_timeout**.
+        If no timeout is configured nothing is closed.
+
+        :param now: The monotonic time used as reference (mainly useful for testing).
+        :type now: float
+        :returns: The number of closed sessions.
+        :rtype: int'''
+
+        if not self._session_timeout or self._session_timeout <= 0:
+            return 0
+
+        now = now if now is not None else time.monotonic()
+        expired_before = now - self._session_timeout
+
+        with self._conns_lock:
+            idle = [(request_id, session) for request_id, session in self._cached_conns.items()
+                    if session.last_used_at < expired_before]
+
+        leaked = [(request_id, session) for request_id, session in idle if session.close_if_idle(expired_before)]
+
+        with self._conns_lock:
+            for request_id, session in leaked:
+                if self._cached_conns.get(request_id) is session:
+                    del self._cached_conns[request_id]
+
+        with self._stats_lock:
+            self._leaked_sessions_count += len(leaked)
+
+        return len(leaked)
+
+    def start_reaper(self, interval=None):
+        '''This method starts the background thread which periodically closes leaked sessions. By default the reaper runs
+        every **session_timeout** seconds. If no timeout is configured or the reaper is already started nothing happens.
+
+        :returns: True if the reaper is running and False otherwise.
+        :rtype: bool'''
+
+        if not self._session_timeout or self._session_timeout <= 0:
+            return False
+
+        with self._conns_lock:
+            if self._reaper is not None:
+                return True
+
+            interval = interval or self._session_timeout
+
+            self._reaper_stop.clear()
+            self._reaper = threading.Thread(target=self._run_reaper, args=(interval,), name="fantastico-sessions-reaper",
+                                            daemon=True)
+            self._reaper.start()
+
+        return True
+
+    def stop_reaper(self):
+        '''This method stops the background reaper thread (if started).'''
+
+        with self._conns_lock:
+            reaper = self._reaper
+            self._reaper = None
+
+        if reaper is None:
+            return
+
+        self._reaper_stop.set()
+        reaper.join()
+
+    def _run_reaper(self, interval):
+        '''This method periodically reaps leaked sessions till the reaper is stopped.'''
+
+        while not self._reaper_stop.wait(interval):
+            self.reap_sessions()
+
+    def get_requests_stats(self):
+        '''This method returns the number of closed requests and how many of them never used the database.
+
+        :returns: A dictionary containing **requests** and **untouched_requests** keys.
+        :rtype: dict'''
+
+        with self._stats_lock:
+            return {"requests": self._requests_count, "untouched_requests": self._untouched_requests_count}
+
+    def get_pool_stats(self):
+        '''This method returns the utilisation of the connections pool used by the current worker. If the engine is not yet
+        created or the configured pool does not provide statistics, only the available keys are returned.
+
+        :returns: A dictionary containing **pool_size**, **checked_in**, **checked_out**, **overflow** and **status** keys.
+        :rtype: dict'''
+
+        stats = {"pool_size": None, "checked_in": None, "checked_out": None, "overflow": None, "status": None}
+
+        engine = DbSessionManager.ENGINE
+        pool = getattr(engine, "pool", None)
+
+        if pool is None:
+            return stats
+
+        for key, pool_meth in [("pool_size", "size"), ("checked_in", "checkedin"), ("checked_out", "checkedout"),
+                               ("overflow", "overflow"), ("status", "status")]:
+            pool_meth = getattr(pool, pool_meth, None)
+
+            if callable(pool_meth):
+                stats[key] = pool_meth()
+
+        return stats
+
     def close_connection(self, request_id):
         '''This method is used to close the active session for a given request. It is recommended to invoke this only
         once per request cycle. Fantastico framework does this automatically at the end of each request cycle so you don't have
         to call this manually.'''
 
-        session = self._cached_conns.get(request_id)
+        with self._conns_lock:
+            session = self._cached_conns.pop(request_id, None)
+
+        with self._stats_lock:
+            self._requests_count += 1
 
-        if not session:
+            if session is None or not session.acquired:
+                self._untouched_requests_count += 1
+
+        if session is None:
             return
 
         session.remove()
         session.close()
 
-        del self._cached_conns[request_id]
-
 CONN_MANAGER = None
 
 def init_dm_db_engine(db_config, echo=False, create_engine_fn=None, create_session_fn=None):
     '''Method used to configure the SQL Alchemy ORM behavior for Fantastico framework. It must be executed once per wsgi
-    fantastico worker.'''
+    fantastico worker (:py:class:`fantastico.middleware.model_session_middleware.ModelSessionMiddleware` takes care of this).
+    Engine connections pool is configured through **additional_engine_settings** key of the given db config.'''
 
     create_engine_fn = create_engine_fn or create_engine
     create_session_fn = create_session_fn or scoped_session
@@ -23,33 +23,58 @@ from jinja2.environment import Environment
 from jinja2.exceptions import TemplateNotFound
 from jinja2.loaders import FileSystemLoader
 import os
+import threading
 from fantastico.settings import BasicSettings
 
+class RequestAwareEnvironment(Environment):
+    '''This class provides a jinja environment which holds the http request being rendered per thread. This allows a single
+    environment (and its compiled templates) to be shared by all threads of a worker.'''
+
+    def __init__(self, *args, **kwargs):
+        self._request_local = threading.local()
+
+        super(RequestAwareEnvironment, self).__init__(*args, **kwargs)
+
+    @property
+    def fantastico_request(self):
+        '''This property returns the http request rendered by the current thread.'''
+
+        return getattr(self._request_local, "request", None)
+
+    @fantastico_request.setter
+    def fantastico_request(self, request):
+        '''This method sets the http request rendered by the current thread.'''
+
+        self._request_local.request = request
+
 class BaseController(object):
     '''This class provides common methods useful for every concrete controller. Even if no type checking is done in
-    Fantastico it is recommended that every controller implementation inherits this class.'''
+    Fantastico it is recommended that every controller implementation inherits this class.
+
+    Controller instances might be reused between requests and shared between threads
+    (:py:class:`fantastico.routing_engine.controllers_pool.ControllersPool`) so the current request is held per thread.'''
 
     def __init__(self, settings_facade):
         self._settings_facade = settings_facade
 
         self._tpl_loader = None
         self._tpl_env = None
-        self._curr_request = None
+        self._request_local = threading.local()
 
     @property
     def curr_request(self):
         '''This property returns the current http request being processed.'''
 
-        return self._curr_request
+        return getattr(self._request_local, "request", None)
 
     @curr_request.setter
     def curr_request(self, curr_request):
         '''This method sets the current request being processed by this controller.'''
 
-        self._curr_request = curr_request
+        self._request_local.request = curr_request
 
         if self._tpl_env:
-            self._tpl_env.fantastico_request = self._curr_request
+            self._tpl_env.fantastico_request = curr_request
 
     def __init_jinja_context(self):
         '''This method initialize the jinja context in order to make the controller able to render jinja2 files.'''
@@ -57,8 +82,8 @@ class BaseController(object):
         views_folder = ("%s%s/views/" % (self._settings_facade.get_root_folder(), self.get_component_folder()))
 
         self._tpl_loader = FileSystemLoader(searchpath=views_folder)
-        self._tpl_env = Environment(loader=self._tpl_loader, **self._settings_facade.get("templates_config"))
-        self._tpl_env.fantastico_request = self._curr_request
+        self._tpl_env = RequestAwareEnvironment(loader=self._tpl_loader, **self._settings_facade.get("templates_config"))
+        self._tpl_env.fantastico_request = self.curr_request
 
     def get_component_folder(self):
         '''This method is used to retrieve the component folder name under which this controller is defined.'''
@@ -28,11 +28,46 @@ from webob.response import Response
 
 
 class ModelsHolder(dict):
-    '''This class is used for holding all models injected into a controller.'''
+    '''This class is used for holding all models injected into a controller. Model facades are built lazily (bound to the
+    request session) only when they are first accessed by the controller.'''
+
+    def __init__(self, models_cls=None, session=None, model_facade=None):
+        super(ModelsHolder, self).__init__()
+
+        self._models_cls = models_cls or {}
+        self._session = session
+        self._model_facade = model_facade
+
+    def __missing__(self, name):
+        '''This method builds the facade of the given model name when it is first accessed.'''
+
+        model_cls = self._models_cls.get(name)
+
+        if model_cls is None:
+            raise KeyError(name)
+
+        facade = self._model_facade(model_cls, self._session)
+        self[name] = facade
+
+        return facade
+
+    def __contains__(self, name):
+        return name in self._models_cls or super(ModelsHolder, self).__contains__(name)
+
+    def get(self, name, default=None):
+        '''This method retrieves the facade of the given model name or the default value if the model is not injected.'''
+
+        try:
+            return self[name]
+        except KeyError:
+            return default
 
     def __getattr__(self, name):
         '''This method allows dictionary keys to be accessed as attributes.'''
 
+        if name.startswith("_"):
+            raise AttributeError(name)
+
         return self.get(name)
 
 class Controller(object):
@@ -131,6 +166,7 @@ class Controller(object):
         self._models = models
         self._model_facade = kwargs.get("model_facade", ModelFacade)
         self._conn_manager = kwargs.get("conn_manager")
+        self._models_cls = None
 
         self._fn_handler = None
 
@@ -150,18 +186,25 @@ class Controller(object):
 
         return cls._REGISTERED_ROUTES
 
-    def _inject_models(self, request, session):
-        '''This method is used to inject the models required by a controller into request. Model fully qualified
-        name is resolved to a class and appended to request.models attribute.'''
+    def _resolve_models(self):
+        '''This method resolves the fully qualified names of the required models to classes. Models are resolved only once,
+        when the controller is first invoked.'''
 
-        models_to_inject = ModelsHolder()
+        models_cls = self._models_cls
 
-        for model_name in self.models:
-            model_cls = instantiator.import_class(self.models[model_name])
+        if models_cls is None:
+            models_cls = {model_name: instantiator.import_class(model_path) for model_name, model_path in self.models.items()}
 
-            models_to_inject[model_name] = self._model_facade(model_cls, session)
+            self._models_cls = models_cls
 
-        request.models = models_to_inject
+        return models_cls
+
+    def _inject_models(self, request, session):
+        '''This method is used to inject the models required by a controller into request. Model fully qualified
+        name is resolved to a class (only once per controller) and appended to request.models attribute. Model facades are
+        built only when the controller accesses them.'''
+
+        request.models = ModelsHolder(self._resolve_models(), session, self._model_facade)
 
     def __call__(self, orig_fn):
         '''This method takes care of registering the controller when the class is first loaded by python vm.'''
@@ -173,8 +216,11 @@ class Controller(object):
 
             self._validate_security_context(request)
 
-            conn_manager = self._conn_manager or mvc.CONN_MANAGER
-            db_conn = conn_manager.get_connection(request.request_id)
+            db_conn = None
+
+            if self.models:
+                conn_manager = self._conn_manager or mvc.CONN_MANAGER
+                db_conn = conn_manager.get_connection(request.request_id)
 
             self._inject_models(request, db_conn)
 
@@ -16,9 +16,16 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.mvc.model_facade
 '''
-from fantastico.exceptions import FantasticoIncompatibleClassError, FantasticoDbError, FantasticoDbNotFoundError
+from fantastico.exceptions import FantasticoIncompatibleClassError, FantasticoDbError, FantasticoDbNotFoundError, \
+    FantasticoNotSupportedError
+from fantastico.mvc.models.model_sort import ModelSort
 from sqlalchemy.ext.declarative.api import DeclarativeMeta
+from sqlalchemy.orm.attributes import InstrumentedAttribute, instance_state
+from sqlalchemy.orm.exc import UnmappedColumnError
+from sqlalchemy.orm.strategy_options import Load
 from sqlalchemy.orm.util import class_mapper
+from sqlalchemy.sql.expression import and_, or_, text
+from sqlalchemy.sql.functions import func
 
 class ModelFacade(object):
     '''This class provides a generic model facade factory. In order to work **Fantastico** base model it is recommended
@@ -28,6 +35,25 @@ class ModelFacade(object):
     _model_cls = None
     _session = None
 
+    _PRIMARY_KEYS = {}
+    _PRIMARY_KEY_ATTRS = {}
+    _COLUMN_ATTRS = {}
+
+    BULK_CHUNK_SIZE = 500
+
+    LOAD_SELECTIN = "selectin"
+    LOAD_JOINED = "joined"
+    LOAD_SUBQUERY = "subquery"
+
+    LOAD_STRATEGIES = {LOAD_SELECTIN: "selectinload", LOAD_JOINED: "joinedload", LOAD_SUBQUERY: "subqueryload"}
+
+    ESTIMATE_QUERIES = {"mysql": "SELECT table_rows FROM information_schema.tables "
+                                 "WHERE table_schema = DATABASE() AND table_name = :table_name",
+                        "postgresql": "SELECT CAST(reltuples AS BIGINT) FROM pg_class WHERE relname = :table_name"}
+
+    WINDOW_FUNCTIONS_VERSIONS = {"mysql": (8, 0), "mariadb": (10, 2), "postgresql": (8, 4), "sqlite": (3, 25),
+                                 "oracle": (8, 1), "mssql": (9, 0)}
+
     @property
     def model_cls(self):
         '''This property holds the model based on which this facade is built.'''
@@ -40,6 +66,13 @@ class ModelFacade(object):
 
         return self._model_pk
 
+    @property
+    def model_pk_attrs(self):
+        '''This property returns the names of the model attributes mapped on primary key columns (in the same order as
+        :py:attr:`model_pk_cols`). Attribute names might differ from column names.'''
+
+        return self._model_pk_attrs
+
     @property
     def session(self):
         '''This property returns the current sqlalchemy session used to access database.'''
@@ -59,6 +92,7 @@ class ModelFacade(object):
             raise FantasticoIncompatibleClassError("Class %s does not inherits BASEMODEL." % self.model_cls.__class__.__name__)
 
         self._model_pk = self._get_primary_key()
+        self._model_pk_attrs = self._get_primary_key_attrs()
 
     def new_model(self, *args, **kwargs):
         '''This method is used to obtain an instance of the underlining model. Below you can find a very simple example:
@@ -90,9 +124,28 @@ class ModelFacade(object):
         return self.model_cls(*args, **kwargs)
 
     def _get_primary_key(self):
-        '''This method introspects the underlining model and detects the primary key of the model.'''
+        '''This method introspects the underlining model and detects the primary key of the model. Primary key of each model
+        is introspected only once per process.'''
+
+        model_pk = ModelFacade._PRIMARY_KEYS.get(self.model_cls)
+
+        if model_pk is None:
+            model_pk = ModelFacade._PRIMARY_KEYS[self.model_cls] = class_mapper(self.model_cls).primary_key
+
+        return model_pk
+
+    def _get_primary_key_attrs(self):
+        '''This method returns the names of the attributes mapped on primary key columns. They are resolved only once per
+        model class.'''
+
+        pk_attrs = ModelFacade._PRIMARY_KEY_ATTRS.get(self.model_cls)
+
+        if pk_attrs is None:
+            mapper = class_mapper(self.model_cls)
+            pk_attrs = ModelFacade._PRIMARY_KEY_ATTRS[self.model_cls] = [mapper.get_property_by_column(pk_col).key
+                                                                         for pk_col in self._model_pk]
 
-        return class_mapper(self.model_cls).primary_key
+        return pk_attrs
 
     def create(self, model):
         '''This method add the given model in the database.
@@ -124,7 +177,7 @@ class ModelFacade(object):
             self._session.add(model)
             self._session.commit()
 
-            return [getattr(model, pk_key.name) for pk_key in self._model_pk]
+            return [getattr(model, pk_attr) for pk_attr in self._model_pk_attrs]
         except Exception as ex:
             self._session.rollback()
 
@@ -135,13 +188,26 @@ class ModelFacade(object):
 
         pk_values = {}
 
-        for pk_col in self._model_pk:
-            pk_values[pk_col] = getattr(model, pk_col.name)
+        for pk_col, pk_attr in zip(self._model_pk, self._model_pk_attrs):
+            pk_values[pk_col] = getattr(model, pk_attr)
 
         return pk_values
 
-    def update(self, model):
-        '''This method updates an existing model from the database based on primary key.
+    def _get_column_values(self, model):
+        '''This method returns the values of the column attributes set on the given model (indexed by attribute name).'''
+
+        column_attrs = self._COLUMN_ATTRS.get(self.model_cls)
+
+        if column_attrs is None:
+            column_attrs = self._COLUMN_ATTRS[self.model_cls] = [attr.key for attr in class_mapper(self.model_cls).column_attrs]
+
+        model_values = instance_state(model).dict
+
+        return {attr_name: model_values[attr_name] for attr_name in column_attrs if attr_name in model_values}
+
+    def update(self, model, existing_model=None):
+        '''This method updates an existing model from the database based on primary key. Only the column attributes set on
+        the given model are updated.
 
         .. code-block:: python
 
@@ -162,17 +228,51 @@ class ModelFacade(object):
             model.id = 5
             facade.update(model)
 
+        The model is updated using a single **UPDATE ... WHERE pk = ...** statement (no record is selected); the number of
+        matched rows is used for detecting models which do not exist. If the record was already loaded in the current session
+        (e.g for checking ownership) it can be given as **existing_model**: the changes are applied on it and only the changed
+        columns are updated.
+
+        .. code-block:: python
+
+            existing_model = facade.find_by_pk({PersonModel.id: 5})
+            facade.update(model, existing_model)
+
+        :param existing_model: The already loaded record of the given model.
         :raises fantastico.exceptions.FantasticoDbNotFoundError: Raised when the given model does not exist in database.
             By default, session is rollback automatically so that other consumers can still work as expected.
         :raises fantastico.exceptions.FantasticoDbError: Raised when an unhandled exception occurs. By default, session
             is rollback automatically so that other consumers can still work as expected.
         '''
 
-        self.find_by_pk(self._get_pk_values(model))
+        values = self._get_column_values(model)
+
+        for pk_attr in self._model_pk_attrs:
+            values.pop(pk_attr, None)
 
         try:
-            self._session.merge(model)
+            if existing_model is not None:
+                for attr_name, attr_value in values.items():
+                    setattr(existing_model, attr_name, attr_value)
+            else:
+                pk_values = self._get_pk_values(model)
+                query = self._session.query(self.model_cls)
+
+                for pk_col in pk_values.keys():
+                    query = query.filter(pk_col == pk_values[pk_col])
+
+                rows_count = query.update(values, synchronize_session=False) if values else query.count()
+
+                if not rows_count:
+                    pk_msg = ["%s=%s" % (pk_col, pk_values[pk_col]) for pk_col in pk_values.keys()]
+
+                    raise FantasticoDbNotFoundError("Model %s does not exist." % ",".join(pk_msg))
+
             self._session.commit()
+        except FantasticoDbError:
+            self._session.rollback()
+
+            raise
         except Exception as ex:
             self._session.rollback()
 
@@ -246,9 +346,155 @@ class ModelFacade(object):
 
             raise FantasticoDbError(ex)
 
-    def get_records_paged(self, start_record, end_record, filter_expr=None, sort_expr=None):
+    def find_by_pks(self, pk_values):
+        '''This method returns the entities which match the given list of primary key values using as few queries as possible
+        (primary keys are selected in chunks of :py:attr:`BULK_CHUNK_SIZE`). The result is aligned with the given list: for
+        primary key values which do not exist None is returned.
+
+        .. code-block:: python
+
+            facade = ModelFacade(PersonModel, fantastico.mvc.SESSION)
+            models = facade.find_by_pks([{PersonModel.id: 1}, {PersonModel.id: 2}])
+
+        :param pk_values: A list of primary key values dictionaries (the same format as for :py:meth:`find_by_pk`).
+        :type pk_values: list
+        :returns: A list of models (or None).
+        :rtype: list
+        :raises fantastico.exceptions.FantasticoDbError: Raised when an unhandled exception occurs. By default, session
+            is rollback automatically so that other consumers can still work as expected.
+        '''
+
+        pk_values = [{self._get_pk_column(pk_key).key: value for pk_key, value in values.items()} for values in pk_values]
+        records = {}
+
+        try:
+            for idx in range(0, len(pk_values), self.BULK_CHUNK_SIZE):
+                query = self._session.query(self.model_cls)
+                query = query.filter(self._build_pks_condition(pk_values[idx:idx + self.BULK_CHUNK_SIZE]))
+
+                for record in query.all():
+                    records[tuple(str(getattr(record, pk_attr)) for pk_attr in self._model_pk_attrs)] = record
+        except Exception as ex:
+            self._session.rollback()
+
+            raise FantasticoDbError(ex)
+
+        return [records.get(tuple(str(values[pk_col.key]) for pk_col in self._model_pk)) for values in pk_values]
+
+    def _get_pk_column(self, pk_key):
+        '''This method returns the primary key column for the given key (model attribute or column).'''
+
+        if isinstance(pk_key, InstrumentedAttribute):
+            return pk_key.property.columns[0]
+
+        return pk_key
+
+    def _build_pks_condition(self, pk_values):
+        '''This method builds the condition which matches all given primary key values (indexed by primary key columns
+        keys).'''
+
+        if len(self._model_pk) == 1:
+            pk_col = self._model_pk[0]
+
+            return pk_col.in_([values[pk_col.key] for values in pk_values])
+
+        return or_(*[and_(*[pk_col == values[pk_col.key] for pk_col in self._model_pk]) for values in pk_values])
+
+    def bulk_create(self, models):
+        '''This method adds all given models in the database in a single transaction using SQLAlchemy bulk operations (no
+        unit of work bookkeeping is done for the given models).
+
+        .. code-block:: python
+
+            facade = ModelFacade(PersonModel, fantastico.mvc.SESSION)
+            pks = facade.bulk_create([facade.new_model("John", "Doe"), facade.new_model("Jane", "Doe")])
+
+        :returns: The list of newly generated primary keys (or the specified primary keys) of each given model.
+        :rtype: list
+        :raises fantastico.exceptions.FantasticoDbError: Raised when an unhandled exception occurs. No model is added and the
+            session is rollback automatically so that other consumers can still work as expected.
+        '''
+
+        try:
+            self._session.bulk_save_objects(models, return_defaults=True)
+            self._session.commit()
+
+            return [[getattr(model, pk_attr) for pk_attr in self._model_pk_attrs] for model in models]
+        except Exception as ex:
+            self._session.rollback()
+
+            raise FantasticoDbError(ex)
+
+    def bulk_update(self, models):
+        '''This method updates all given models (based on primary key) in a single transaction using SQLAlchemy bulk
+        operations. Only the attributes set on each model are updated. Models which do not exist in database are ignored (use
+        :py:meth:`find_by_pks` in order to find them).
+
+        .. code-block:: python
+
+            facade = ModelFacade(PersonModel, fantastico.mvc.SESSION)
+            facade.bulk_update([PersonModel(id=1, first_name="John"), PersonModel(id=2, first_name="Jane")])
+
+        :raises fantastico.exceptions.FantasticoDbError: Raised when an unhandled exception occurs. No model is updated and the
+            session is rollback automatically so that other consumers can still work as expected.
+        '''
+
+        mappings = [self._get_column_values(model) for model in models]
+
+        try:
+            self._session.bulk_update_mappings(self.model_cls, mappings)
+            self._session.commit()
+        except Exception as ex:
+            self._session.rollback()
+
+            raise FantasticoDbError(ex)
+
+    def bulk_delete(self, models):
+        '''This method deletes all given models (based on primary key) in a single transaction. Models are deleted in chunks
+        of :py:attr:`BULK_CHUNK_SIZE` models, each chunk using a single statement.
+
+        .. code-block:: python
+
+            facade = ModelFacade(PersonModel, fantastico.mvc.SESSION)
+            facade.bulk_delete(facade.find_by_pks([{PersonModel.id: 1}, {PersonModel.id: 2}]))
+
+        :raises fantastico.exceptions.FantasticoDbError: Raised when an unhandled exception occurs. No model is deleted and the
+            session is rollback automatically so that other consumers can still work as expected.
+        '''
+
+        pk_values = [{pk_col.key: getattr(model, pk_attr) for pk_col, pk_attr in zip(self._model_pk, self._model_pk_attrs)}
+                     for model in models]
+
+        try:
+            for idx in range(0, len(pk_values), self.BULK_CHUNK_SIZE):
+                query = self._session.query(self.model_cls)
+                query = query.filter(self._build_pks_condition(pk_values[idx:idx + self.BULK_CHUNK_SIZE]))
+                query.delete(synchronize_session=False)
+
+            self._session.commit()
+        except Exception as ex:
+            self._session.rollback()
+
+            raise FantasticoDbError(ex)
+
+    def get_records_paged(self, start_record, end_record, filter_expr=None, sort_expr=None, keyset=None, projection=None,
+                          eager_load=None):
         '''This method retrieves all records matching the given filters sorted by the given expression.
 
+        By default, records are paged using offset / limit which degrades linearly on deep pages. If **keyset** is given
+        (the sort key values of the last record from the previous page obtained through :py:meth:`get_keyset` or an empty
+        list for the first page) records are retrieved in seek mode: the query seeks directly after the given keyset and
+        start_record is relative to the seek position. In seek mode, records are always sorted by the given sort expression
+        followed by the primary key of the model (which makes the sort order total).
+
+        .. code-block:: python
+
+            sort_expr = [ModelSort(Blog.create_date, ModelSort.DESC)]
+
+            records = facade.get_records_paged(start_record=0, end_record=100, sort_expr=sort_expr, keyset=[])
+            records = facade.get_records_paged(start_record=0, end_record=100, sort_expr=sort_expr,
+                                               keyset=facade.get_keyset(records[-1], sort_expr))
+
         .. code-block:: python
 
             records = facade.get_records_paged(start_record=0, end_record=5,
@@ -258,6 +504,28 @@ class ModelFacade(object):
                                                        ModelFilter(Blog.id, 1, ModelFilter.GT),
                                                        ModelFilter(Blog.id, 5, ModelFilter.LT))))
 
+        If **projection** is given (a list of attribute names), only the given attributes are selected from database; the other
+        column attributes are deferred and loaded on first access. Relationship attributes from projection (and the
+        relationship attributes given as **relationship.attribute**) are eagerly loaded using one additional query per
+        relationship for the whole page, so that accessing them does not issue one query per record.
+
+        .. code-block:: python
+
+            records = facade.get_records_paged(start_record=0, end_record=100,
+                                               projection=["title", "author.first_name", "author.last_name"])
+
+        Relationships accessed for each record can be eagerly loaded using **eager_load** (a dictionary containing the
+        loading strategy for each relationship): **ModelFacade.LOAD_SELECTIN** (one additional IN query per relationship),
+        **ModelFacade.LOAD_JOINED** (LEFT OUTER JOIN in the same query) or **ModelFacade.LOAD_SUBQUERY** (one additional query
+        per relationship which repeats the page query as subquery). Projected relationships which are not listed in
+        **eager_load** are loaded using **selectin** strategy.
+
+        .. code-block:: python
+
+            records = facade.get_records_paged(start_record=0, end_record=100,
+                                               eager_load={"author": ModelFacade.LOAD_JOINED,
+                                                           "comments": ModelFacade.LOAD_SELECTIN})
+
         :param start_record: A zero indexed integer that specifies the first record number.
         :type start_record: int
         :param end_record: A zero indexed integer that specifies the last record number.
@@ -266,34 +534,332 @@ class ModelFacade(object):
         :type filter_expr: list
         :param sort_expr: A list of :py:class:`fantastico.mvc.models.model_sort.ModelSort` which are applied in order.
         :type sort_expr: list
+        :param keyset: The sort key values after which records are retrieved (enables seek mode).
+        :type keyset: list
+        :param projection: The attributes which must be loaded for each record (by default all column attributes are loaded).
+        :type projection: list
+        :param eager_load: The loading strategy of each relationship which must be eagerly loaded.
+        :type eager_load: dict
         :returns: A list of matching records strongly converted to underlining model.
         :raises fantastico.exceptions.FantasticoDbError: This exception is raised whenever an exception occurs in retrieving
             desired dataset. The underlining session used is automatically rollbacked in order to guarantee data integrity.
+        :raises fantastico.exceptions.FantasticoNotSupportedError: This exception is raised in seek mode if the sort
+            expression does not belong to the model or the keyset does not match the sort expression (or contains NULL
+            values) or eager_load contains unknown relationships or loading strategies.
+        '''
+
+        return self._get_records_paged([self.model_cls], start_record, end_record, filter_expr, sort_expr, keyset,
+                                       projection=projection, eager_load=eager_load)
+
+    def iter_records_paged(self, start_record, end_record, filter_expr=None, sort_expr=None, keyset=None, batch_size=100,
+                           projection=None, eager_load=None):
+        '''This method retrieves exactly the same records as :py:meth:`get_records_paged` but, instead of loading the whole
+        page in memory, it returns an iterator over the matching records. Records are fetched from a server side cursor (when
+        supported by the database driver) in batches of **batch_size** records so that big pages are iterated in constant
+        memory. The query is executed when the iteration starts and the underlining session must remain opened until the
+        iteration ends.
+
+        .. code-block:: python
+
+            for record in facade.iter_records_paged(start_record=0, end_record=100000, batch_size=500):
+                export(record)
+
+        Collection relationships and relationships using **subquery** strategy are always loaded using **selectin** strategy
+        (one additional query per relationship for each batch) because they can not be combined with batch fetching.
+
+        :param batch_size: The number of records fetched from database at once.
+        :type batch_size: int
+        :returns: An iterator over matching records strongly converted to underlining model.
+        :raises fantastico.exceptions.FantasticoDbError: This exception is raised (while iterating) whenever an exception occurs
+            in retrieving desired dataset. The underlining session used is automatically rollbacked in order to guarantee data
+            integrity.
+        :raises fantastico.exceptions.FantasticoNotSupportedError: This exception is raised in seek mode if the sort
+            expression does not belong to the model or the keyset does not match the sort expression (or contains NULL
+            values).
         '''
 
+        return self._get_records_paged([self.model_cls], start_record, end_record, filter_expr, sort_expr, keyset,
+                                       batch_size=batch_size, projection=projection, eager_load=eager_load)
+
+    def get_records_paged_counted(self, start_record, end_record, filter_expr=None, sort_expr=None, projection=None,
+                                  eager_load=None):
+        '''This method retrieves a page of records (exactly like :py:meth:`get_records_paged` in offset mode) together with
+        the total number of records matching the given filters in a single database round trip. Total is selected using
+        **COUNT(*) OVER ()** window function if the database supports window functions (see
+        :py:attr:`WINDOW_FUNCTIONS_VERSIONS`); otherwise (e.g MySQL before 8.0) or if the requested page is out of range,
+        total is obtained using :py:meth:`count_records`.
+
+        .. code-block:: python
+
+            records, records_count = facade.get_records_paged_counted(start_record=0, end_record=5,
+                                                                      filter_expr=ModelFilter(Blog.id, 1, ModelFilter.GT))
+
+        :returns: A tuple containing the list of matching records and the total number of matching records.
+        :rtype: tuple
+        :raises fantastico.exceptions.FantasticoDbError: This exception is raised whenever an exception occurs in retrieving
+            desired dataset. The underlining session used is automatically rollbacked in order to guarantee data integrity.
+        '''
+
+        if not self._supports_window_functions():
+            records = self.get_records_paged(start_record, end_record, filter_expr, sort_expr, projection=projection,
+                                             eager_load=eager_load)
+
+            return records, self.count_records(filter_expr)
+
+        rows = self._get_records_paged([self.model_cls, func.count().over()], start_record, end_record, filter_expr, sort_expr,
+                                       projection=projection, eager_load=eager_load)
+
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+
+        if start_record == 0:
+            return [], 0
+
+        return [], self.count_records(filter_expr)
+
+    def _supports_window_functions(self):
+        '''This method returns True if the database of the current session supports window functions. Server version is known
+        only after the first connection was opened; until then window functions are considered not supported.'''
+
+        try:
+            dialect = self._session.get_bind().dialect
+        except Exception:
+            return False
+
+        server_version = getattr(dialect, "server_version_info", None)
+
+        if not isinstance(server_version, tuple):
+            return False
+
+        dialect_name = dialect.name
+
+        if dialect_name == "mysql" and "MariaDB" in server_version:
+            dialect_name = "mariadb"
+
+        min_version = self.WINDOW_FUNCTIONS_VERSIONS.get(dialect_name)
+
+        if min_version is None:
+            return False
+
+        return tuple(part for part in server_version if isinstance(part, int)) >= min_version
+
+    def _get_records_paged(self, entities, start_record, end_record, filter_expr=None, sort_expr=None, keyset=None,
+                           batch_size=None, projection=None, eager_load=None):
+        '''This method selects the given entities for the requested page of records. If batch_size is given, an iterator
+        fetching the records in batches is returned. If projection is given, only the projected attributes are loaded.'''
+
         if filter_expr and not isinstance(filter_expr, list):
             filter_expr = [filter_expr]
 
         if sort_expr and not isinstance(sort_expr, list):
             sort_expr = [sort_expr]
 
-        query = self._session.query(self.model_cls)
+        keyset_cols = None
+
+        if keyset is not None:
+            keyset_cols = self._get_keyset_columns(sort_expr)
+
+            if keyset and len(keyset) != len(keyset_cols):
+                raise FantasticoNotSupportedError("Keyset %s does not match sort expression." % keyset)
+
+            if any(value is None for value in keyset):
+                raise FantasticoNotSupportedError("Seek pagination does not support NULL keyset values: %s." % keyset)
+
+            sort_expr = [ModelSort(column, sort_dir) for column, sort_dir, _ in keyset_cols]
+
+        loader_options = self._build_loader_options(projection, sort_expr, eager_load, batch_size)
+
+        query = self._session.query(*entities)
 
         try:
+            if loader_options:
+                query = query.options(*loader_options)
+
             for model_filter in filter_expr or []:
                 query = model_filter.build(query)
 
             for model_sort in sort_expr or []:
                 query = model_sort.build(query)
 
+            if keyset:
+                query = query.filter(self._build_keyset_condition(keyset_cols, keyset))
+
             query = query.offset(start_record).limit(end_record - start_record)
 
+            if batch_size:
+                return self._iter_query(query.yield_per(batch_size))
+
             return query.all()
         except Exception as ex:
             self._session.rollback()
 
             raise FantasticoDbError(ex)
 
+    def _build_loader_options(self, projection=None, sort_expr=None, eager_load=None, batch_size=None):
+        '''This method builds the query loader options which load only the projected column attributes (together with the
+        primary key, the sort attributes and the columns required for loading eager relationships) and eagerly load the
+        projected relationships and the relationships from eager_load. If projection contains attributes which are not mapped
+        (e.g python properties which might depend on any column) all column attributes are loaded.'''
+
+        mapper = class_mapper(self.model_cls)
+        eager_load = eager_load or {}
+
+        attrs = [mapper.get_property_by_column(column).key for column in self.model_pk_cols]
+        relationships = {}
+
+        for rel_name, strategy in eager_load.items():
+            if rel_name not in mapper.relationships:
+                raise FantasticoNotSupportedError("Model %s does not have relationship %s." % (self.model_cls.__name__, rel_name))
+
+            if strategy not in self.LOAD_STRATEGIES:
+                raise FantasticoNotSupportedError("Loading strategy %s is not supported." % strategy)
+
+            relationships[rel_name] = []
+
+        for model_sort in sort_expr or []:
+            column = model_sort.column
+
+            if isinstance(column, InstrumentedAttribute):
+                column = column.property.columns[0]
+
+            attrs.extend(self._get_columns_attrs(mapper, [column]))
+
+        load_columns = bool(projection)
+
+        for attr_path in projection or []:
+            attr_name, _, subattr_name = attr_path.partition(".")
+
+            if attr_name in mapper.relationships:
+                subattrs = relationships.setdefault(attr_name, [])
+
+                if subattr_name:
+                    subattrs.append(subattr_name)
+            elif attr_name in mapper.column_attrs and not subattr_name:
+                attrs.append(attr_name)
+            else:
+                load_columns = False
+
+        options = []
+
+        for rel_name, subattrs in relationships.items():
+            relationship = mapper.relationships[rel_name]
+            strategy = eager_load.get(rel_name, self.LOAD_SELECTIN)
+
+            if batch_size and (relationship.uselist or strategy == self.LOAD_SUBQUERY):
+                strategy = self.LOAD_SELECTIN
+
+            attrs.extend(self._get_columns_attrs(mapper, relationship.local_columns))
+
+            loader = getattr(Load(self.model_cls), self.LOAD_STRATEGIES[strategy])(getattr(self.model_cls, rel_name))
+
+            if subattrs and all(subattr_name in relationship.mapper.column_attrs for subattr_name in subattrs):
+                loader = loader.load_only(*subattrs)
+
+            options.append(loader)
+
+        if load_columns:
+            options.append(Load(self.model_cls).load_only(*attrs))
+
+        return options
+
+    def _get_columns_attrs(self, mapper, columns):
+        '''This method returns the names of the attributes mapped on the given columns. Columns which are not mapped by the
+        given mapper are ignored.'''
+
+        attrs = []
+
+        for column in columns:
+            try:
+                attrs.append(mapper.get_property_by_column(column).key)
+            except UnmappedColumnError:
+                continue
+
+        return attrs
+
+    def _iter_query(self, query):
+        '''This method iterates over the results of the given query. The query is executed when the iteration starts.'''
+
+        try:
+            for record in query:
+                yield record
+        except Exception as ex:
+            self._session.rollback()
+
+            raise FantasticoDbError(ex)
+
+    def get_keyset(self, model, sort_expr=None):
+        '''This method returns the sort key values of the given model (sort expression values followed by primary key values).
+        The result can be used as keyset for retrieving the next page in seek mode (:py:meth:`get_records_paged`).
+
+        :param model: The last model from the current page.
+        :param sort_expr: A list of :py:class:`fantastico.mvc.models.model_sort.ModelSort` used for retrieving the page.
+        :type sort_expr: list
+        :returns: A list of values.
+        :rtype: list
+        :raises fantastico.exceptions.FantasticoNotSupportedError: This exception is raised if the sort expression does not
+            belong to the model.'''
+
+        if sort_expr and not isinstance(sort_expr, list):
+            sort_expr = [sort_expr]
+
+        return [getattr(model, attr_name) for _, _, attr_name in self._get_keyset_columns(sort_expr)]
+
+    def _get_keyset_columns(self, sort_expr):
+        '''This method returns (column, sort direction, attribute name) tuples for seek pagination: the columns of the given
+        sort expression followed by the primary key columns which are not sorted explicitly.'''
+
+        mapper = class_mapper(self.model_cls)
+        keyset_cols = []
+        sorted_cols = set()
+
+        for model_sort in sort_expr or []:
+            column = model_sort.column
+
+            if isinstance(column, InstrumentedAttribute):
+                column = column.property.columns[0]
+
+            try:
+                attr_name = mapper.get_property_by_column(column).key
+            except Exception:
+                raise FantasticoNotSupportedError("Seek pagination does not support sorting by %s." % column)
+
+            keyset_cols.append((column, model_sort.sort_dir, attr_name))
+            sorted_cols.add(column)
+
+        for column in self.model_pk_cols:
+            if column not in sorted_cols:
+                keyset_cols.append((column, ModelSort.ASC, mapper.get_property_by_column(column).key))
+
+        return keyset_cols
+
+    def _build_keyset_condition(self, keyset_cols, keyset):
+        '''This method builds the condition which selects all rows placed after the given keyset in the keyset columns order:
+        c1 >= v1 and ((c1 > v1) or (c1 = v1 and c2 > v2) or ...). The redundant leading condition allows databases to seek
+        using an index on the sort columns.'''
+
+        conditions = []
+
+        for idx, (column, sort_dir, _) in enumerate(keyset_cols):
+            value = keyset[idx]
+
+            if sort_dir == ModelSort.DESC:
+                seek_cond = column < value
+            else:
+                seek_cond = column > value
+
+            equal_conds = [prev_column == keyset[prev_idx] for prev_idx, (prev_column, _, _) in enumerate(keyset_cols[:idx])]
+
+            conditions.append(and_(*(equal_conds + [seek_cond])))
+
+        first_column, first_dir, _ = keyset_cols[0]
+
+        if first_dir == ModelSort.DESC:
+            range_cond = first_column <= keyset[0]
+        else:
+            range_cond = first_column >= keyset[0]
+
+        return and_(range_cond, or_(*conditions))
+
     def count_records(self, filter_expr=None):
         '''This method is used for counting the number of records from underlining facade. In addition it applies the
         filter expressions specified (if any).
@@ -325,3 +891,32 @@ class ModelFacade(object):
             self._session.rollback()
 
             raise FantasticoDbError(ex)
+
+    def estimate_records(self):
+        '''This method returns the estimated number of records from underlining model table using database table statistics
+        (no table scan is done). Statistics are available for MySQL and PostgreSQL databases; for other databases or if
+        statistics are not available an exact count is done using :py:meth:`count_records`.
+
+        :returns: The estimated number of records.
+        :rtype: int
+        :raises fantastico.exceptions.FantasticoDbError: This exception is raised whenever an exception occurs in retrieving
+            table statistics.
+        '''
+
+        try:
+            estimate_query = self.ESTIMATE_QUERIES.get(self._session.get_bind().dialect.name)
+
+            records_count = None
+
+            if estimate_query:
+                records_count = self._session.execute(text(estimate_query),
+                                                      {"table_name": self.model_cls.__table__.name}).scalar()
+        except Exception as ex:
+            self._session.rollback()
+
+            raise FantasticoDbError(ex)
+
+        if records_count is None:
+            return self.count_records()
+
+        return int(records_count)
@@ -0,0 +1,86 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. py:module:: fantastico.mvc.tests.bench_model_facade_paging
+
+This module provides a micro benchmark which compares the latency of retrieving a deep collection page through
+:py:meth:`fantastico.mvc.model_facade.ModelFacade.get_records_paged` in offset mode and in seek (keyset) mode. The benchmark
+uses an in memory sqlite database so only the relative difference between the two modes is relevant.
+
+.. code-block:: bash
+
+    python -m fantastico.mvc.tests.bench_model_facade_paging
+'''
+from fantastico.mvc.model_facade import ModelFacade
+from fantastico.mvc.models.model_sort import ModelSort
+from sqlalchemy import create_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import Column, Index
+from sqlalchemy.types import Integer, String
+import timeit
+
+BENCH_BASEMODEL = declarative_base()
+
+class PagedPerson(BENCH_BASEMODEL):
+    '''This class provides the model paged by the benchmark.'''
+
+    __tablename__ = "bench_paged_persons"
+    __table_args__ = (Index("ix_bench_paged_persons_name", "name", "id"),)
+
+    id = Column("id", Integer, primary_key=True)
+    name = Column("name", String(50))
+
+def build_facade(records_count):
+    '''This method builds a facade bound to an in memory database which contains the given number of records.'''
+
+    engine = create_engine("sqlite://")
+    BENCH_BASEMODEL.metadata.create_all(engine)
+
+    engine.execute(PagedPerson.__table__.insert(), [{"id": idx, "name": "person %08d" % (idx % 5000)}
+                                                    for idx in range(1, records_count + 1)])
+
+    return ModelFacade(PagedPerson, sessionmaker(bind=engine)())
+
+def measure(fetch_page, repeat):
+    '''This method returns the duration (in milliseconds) of retrieving a page.'''
+
+    return min(timeit.repeat(fetch_page, number=1, repeat=repeat)) * 1000
+
+def run_benchmark(page=1000, page_size=100, repeat=20):
+    '''This method executes the benchmark and returns the latency (in milliseconds) of retrieving the given page in offset
+    mode and in seek mode.'''
+
+    facade = build_facade((page + 1) * page_size)
+    sort_expr = [ModelSort(PagedPerson.name, ModelSort.ASC)]
+    start_record = (page - 1) * page_size
+
+    previous_page = facade.get_records_paged(start_record=start_record - page_size, end_record=start_record,
+                                             sort_expr=sort_expr + [ModelSort(PagedPerson.id, ModelSort.ASC)])
+    keyset = facade.get_keyset(previous_page[-1], sort_expr)
+
+    offset_page = lambda: facade.get_records_paged(start_record=start_record, end_record=start_record + page_size,
+                                                   sort_expr=sort_expr + [ModelSort(PagedPerson.id, ModelSort.ASC)])
+    seek_page = lambda: facade.get_records_paged(start_record=0, end_record=page_size, sort_expr=sort_expr, keyset=keyset)
+
+    if [model.id for model in offset_page()] != [model.id for model in seek_page()]:
+        raise AssertionError("Offset and seek modes retrieved different pages.")
+
+    return [("offset", measure(offset_page, repeat)),
+            ("seek", measure(seek_page, repeat))]
+
+if __name__ == "__main__":
+    for bench_name, latency in run_benchmark():
+        print("%-10s %.3f ms / page 1000" % (bench_name, latency))
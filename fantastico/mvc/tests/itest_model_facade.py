@@ -167,6 +167,21 @@ class ModelFacadeIntegration(FantasticoIntegrationTestCase):
         self.assertEqual(self.MESSAGES[2], records[1].message)
         self.assertLess(records[0].id, records[1].id)
     
+    def test_retrieve_subset_keyset_desc(self):
+        '''This test case ensures pages retrieved in seek mode match the pages retrieved in offset mode.'''
+
+        model_filter_like = ModelFilter(ModelFacadeMessage.message, "%%world%%", ModelFilter.LIKE)
+        model_sort = ModelSort(ModelFacadeMessage.message, ModelSort.DESC)
+
+        first_page = self.model_facade.get_records_paged(0, 2, filter_expr=model_filter_like, sort_expr=model_sort, keyset=[])
+        keyset = self.model_facade.get_keyset(first_page[-1], model_sort)
+
+        records = self.model_facade.get_records_paged(0, 2, filter_expr=model_filter_like, sort_expr=model_sort,
+                                                      keyset=keyset)
+
+        self.assertEqual([self.MESSAGES[-1], self.MESSAGES[-2]], [record.message for record in first_page])
+        self.assertEqual([self.MESSAGES[-3], self.MESSAGES[-4]], [record.message for record in records])
+
     def test_retrieve_subset_ordered_asc_in(self):
         '''This test case ensures a subset of records is retrieved correctly when order expression and in 
         filter are specified.'''
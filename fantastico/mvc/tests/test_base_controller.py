@@ -22,6 +22,7 @@ from fantastico.mvc.base_controller import BaseController
 from fantastico.mvc import controller_decorators
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
+from threading import Thread
 from webob.response import Response
 
 NewControllerTesting = None
@@ -111,4 +112,38 @@ class BaseControllerTests(FantasticoUnitTestsCase):
         with self.assertRaises(FantasticoError) as cm:
             controller.load_template("no_fun", get_template=get_template)
             
-        self.assertTrue(str(cm.exception).find("Unexpected error") > -1)
\ No newline at end of file
+        self.assertTrue(str(cm.exception).find("Unexpected error") > -1)
+    def test_curr_request_per_thread(self):
+        '''This test case ensures current request of a shared controller instance (and of its templates environment) is isolated
+        between threads.'''
+
+        self._settings_facade.get = Mock(return_value={})
+
+        controller = NewControllerTesting(self._settings_facade)
+        controller.load_template("/say_hello.html")
+
+        request_main = Mock()
+        controller.curr_request = request_main
+
+        requests = {}
+
+        def handle_request(idx):
+            request = Mock()
+            controller.curr_request = request
+
+            requests[idx] = (request, controller.curr_request, controller._tpl_env.fantastico_request)
+
+        threads = [Thread(target=handle_request, args=(idx,)) for idx in range(5)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(100)
+
+        self.assertEqual(request_main, controller.curr_request)
+        self.assertEqual(request_main, controller._tpl_env.fantastico_request)
+
+        for request, curr_request, tpl_request in requests.values():
+            self.assertEqual(request, curr_request)
+            self.assertEqual(request, tpl_request)
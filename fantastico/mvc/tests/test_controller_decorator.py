@@ -122,6 +122,44 @@ class ControllerDecoratorTests(FantasticoUnitTestsCase):
         self.assertEqual(request.models.Model2.model_cls, Model2)
         self.assertIsNone(request.models.NotFoundModel)
 
+    def test_controller_model_injection_lazy(self):
+        '''This test case ensures model classes are resolved only once per controller and model facades are built only when
+        they are accessed.'''
+
+        model_facade = Mock(side_effect=lambda model_cls, session: (model_cls, session))
+        conn_manager = Mock()
+
+        contr = controller_decorators.Controller(url="/simple/controller", method="GET",
+            models={"Model1": "fantastico.mvc.tests.test_controller_decorator.Model1",
+                    "Model2": "fantastico.mvc.tests.test_controller_decorator.Model2"},
+            model_facade=model_facade,
+            conn_manager=conn_manager)
+
+        do_stuff = contr(lambda request: request.models.Model1)
+
+        for idx in range(3):
+            request = Mock()
+
+            self.assertEqual((Model1, conn_manager.get_connection.return_value), do_stuff(request))
+            self.assertIs(request.models.Model1, request.models["Model1"])
+            self.assertTrue("Model2" in request.models)
+            self.assertFalse("Model3" in request.models)
+
+        self.assertEqual(3, model_facade.call_count)
+        self.assertEqual({"Model1": Model1, "Model2": Model2}, contr._models_cls)
+
+    def test_controller_nomodels_nosession(self):
+        '''This test case ensures no db session is requested for controllers which do not require any model.'''
+
+        conn_manager = Mock()
+
+        @controller_decorators.Controller(url="/simple/controller", method="GET", conn_manager=conn_manager)
+        def do_stuff(request):
+            pass
+
+        self.assertIsNone(do_stuff(Mock()))
+        self.assertEqual(0, conn_manager.get_connection.call_count)
+
     def test_controller_model_injection_clsnotfound(self):
         '''This test case ensures a fantastico exception is raised when a model is not found.'''
 
@@ -20,6 +20,7 @@ from fantastico.exceptions import FantasticoDbError
 from fantastico.mvc import DbSessionManager
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
+from threading import Thread
 
 class DbSessionManagerTests(FantasticoUnitTestsCase):
     '''This class provides the test cases for db session manager class. It is extremely important to kkep this running so that
@@ -75,6 +76,12 @@ class DbSessionManagerTests(FantasticoUnitTestsCase):
         self.assertIsNotNone(session2)
         self.assertEqual(session, session2)
 
+        self.assertEqual(0, self._create_engine_fn.call_count)
+        self.assertEqual(0, self._create_session_fn.call_count)
+
+        self.assertEqual(self._session.query, session.query)
+        self.assertEqual(self._session.query, session2.query)
+
         self.assertEqual(1, self._create_engine_fn.call_count)
         self.assertEqual(1, self._create_session_fn.call_count)
 
@@ -91,8 +98,12 @@ class DbSessionManagerTests(FantasticoUnitTestsCase):
 
         request_id = 1
 
+        session = self._db_manager.get_connection(request_id)
+
         with self.assertRaises(FantasticoDbError) as ex:
-            self._db_manager.get_connection(request_id)
+            session.query
+
+        self.assertIsNot(session, self._db_manager.get_connection(request_id))
 
         self.assertTrue(str(ex).find("Unexpected error"))
 
@@ -107,3 +118,149 @@ class DbSessionManagerTests(FantasticoUnitTestsCase):
 
         self._db_manager.close_connection(request_id)
         self.assertEqual(1, self._session.remove.call_count)
+
+    def test_close_connection_untouched(self):
+        '''This test case ensures a session which was never used by the request is not checked out from the pool and the
+        request is accounted as untouched.'''
+
+        session = self._db_manager.get_connection(1)
+
+        self.assertFalse(session.acquired)
+
+        self._db_manager.close_connection(1)
+        self._db_manager.close_connection(2)
+
+        self.assertEqual(0, self._create_engine_fn.call_count)
+        self.assertEqual(0, self._create_session_fn.call_count)
+        self.assertEqual(0, self._session.remove.call_count)
+        self.assertEqual({"requests": 2, "untouched_requests": 2}, self._db_manager.get_requests_stats())
+
+    def test_close_connection_touched(self):
+        '''This test case ensures a session used by the request is correctly released and not accounted as untouched.'''
+
+        session = self._db_manager.get_connection(1)
+        session.commit()
+
+        self.assertTrue(session.acquired)
+
+        self._db_manager.close_connection(1)
+
+        self.assertEqual(1, self._session.commit.call_count)
+        self.assertEqual(1, self._session.remove.call_count)
+        self.assertEqual(1, self._session.close.call_count)
+        self.assertEqual({"requests": 1, "untouched_requests": 0}, self._db_manager.get_requests_stats())
+
+    def test_get_connection_concurrent(self):
+        '''This test case ensures concurrent threads of the same request receive the same session and only one engine is
+        created per worker.'''
+
+        sessions = []
+
+        def get_session():
+            session = self._db_manager.get_connection(1)
+            session.query
+
+            sessions.append(session)
+
+        threads = [Thread(target=get_session) for idx in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(100)
+
+        self.assertEqual(10, len(sessions))
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+        self.assertEqual(1, self._create_engine_fn.call_count)
+        self.assertEqual({"live_sessions": 1, "leaked_sessions": 0}, self._db_manager.get_sessions_stats())
+
+    def test_reap_sessions_ok(self):
+        '''This test case ensures sessions idle for longer than configured timeout are closed and accounted as leaked.'''
+
+        self._db_config["session_timeout"] = 10
+        self._db_manager = DbSessionManager(self._db_config,
+                                            create_engine_fn=self._create_engine_fn,
+                                            create_session_fn=self._create_session_fn)
+
+        leaked = self._db_manager.get_connection(1)
+        leaked.query
+        active = self._db_manager.get_connection(2)
+        active.last_used_at = leaked.last_used_at + 5
+
+        self.assertEqual(0, self._db_manager.reap_sessions(leaked.last_used_at + 5))
+        self.assertEqual(1, self._db_manager.reap_sessions(leaked.last_used_at + 10.001))
+        self.assertEqual(1, self._session.remove.call_count)
+        self.assertEqual(1, self._session.close.call_count)
+        self.assertEqual({"live_sessions": 1, "leaked_sessions": 1}, self._db_manager.get_sessions_stats())
+
+        self._db_manager.close_connection(1)
+
+        self.assertEqual(1, self._session.remove.call_count)
+
+        with self.assertRaises(FantasticoDbError):
+            leaked.query
+
+    def test_reap_sessions_inuse(self):
+        '''This test case ensures sessions in use (long requests, streamed bodies) or recently used are never reaped.'''
+
+        self._db_config["session_timeout"] = 10
+        self._db_manager = DbSessionManager(self._db_config,
+                                            create_engine_fn=self._create_engine_fn,
+                                            create_session_fn=self._create_session_fn)
+
+        session = self._db_manager.get_connection(1)
+        session.query
+
+        reaped = []
+
+        with session.in_use():
+            thread = Thread(target=lambda: reaped.append(self._db_manager.reap_sessions(session.last_used_at + 3600)))
+            thread.start()
+            thread.join(100)
+
+        self.assertEqual([0], reaped)
+
+        session.last_used_at += 100
+
+        self.assertEqual(0, self._db_manager.reap_sessions(session.last_used_at + 5))
+        self.assertEqual(0, self._session.close.call_count)
+        self.assertEqual({"live_sessions": 1, "leaked_sessions": 0}, self._db_manager.get_sessions_stats())
+
+    def test_reap_sessions_notimeout(self):
+        '''This test case ensures no session is closed and no reaper is started when session timeout is not configured.'''
+
+        session = self._db_manager.get_connection(1)
+
+        self.assertEqual(0, self._db_manager.reap_sessions(session.last_used_at + 3600))
+        self.assertFalse(self._db_manager.start_reaper())
+        self.assertEqual({"live_sessions": 1, "leaked_sessions": 0}, self._db_manager.get_sessions_stats())
+
+    def test_reaper_lifecycle(self):
+        '''This test case ensures the background reaper can be started only once and it is correctly stopped.'''
+
+        self._db_config["session_timeout"] = 300
+        self._db_manager = DbSessionManager(self._db_config,
+                                            create_engine_fn=self._create_engine_fn,
+                                            create_session_fn=self._create_session_fn)
+
+        try:
+            self.assertTrue(self._db_manager.start_reaper())
+            reaper = self._db_manager._reaper
+
+            self.assertTrue(reaper.daemon)
+            self.assertTrue(reaper.is_alive())
+
+            self.assertTrue(self._db_manager.start_reaper())
+            self.assertIs(reaper, self._db_manager._reaper)
+        finally:
+            self._db_manager.stop_reaper()
+
+        self.assertFalse(reaper.is_alive())
+        self.assertIsNone(self._db_manager._reaper)
+
+    def test_pool_stats_noengine(self):
+        '''This test case ensures pool statistics are empty if no engine was created yet.'''
+
+        self.assertEqual({"pool_size": None, "checked_in": None, "checked_out": None, "overflow": None, "status": None},
+                         self._db_manager.get_pool_stats())
@@ -16,14 +16,19 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.mvc.tests.test_model_facade
 '''
-from fantastico.exceptions import FantasticoIncompatibleClassError, FantasticoDbError, FantasticoDbNotFoundError
+from fantastico.exceptions import FantasticoIncompatibleClassError, FantasticoDbError, FantasticoDbNotFoundError, \
+    FantasticoNotSupportedError
 from fantastico.mvc import BASEMODEL
 from fantastico.mvc.model_facade import ModelFacade
 from fantastico.mvc.models.model_filter import ModelFilter
 from fantastico.mvc.models.model_sort import ModelSort
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
-from sqlalchemy.schema import Column
+from sqlalchemy.engine import create_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm.query import Query
+from sqlalchemy.schema import Column, ForeignKey
 from sqlalchemy.types import Integer, String
 
 class PersonModelTest(BASEMODEL):
@@ -39,6 +44,46 @@ class PersonModelTest(BASEMODEL):
         self.first_name = first_name
         self.last_name = last_name
 
+PROJECTION_BASEMODEL = declarative_base()
+
+class AddressModelTest(PROJECTION_BASEMODEL):
+    '''This is a simple model referenced by a projected model in unit tests.'''
+
+    __tablename__ = "addresses"
+
+    id = Column("id", Integer, autoincrement=True, primary_key=True)
+    city = Column("city", String(50))
+    street = Column("street", String(50))
+
+class CustomerModelTest(PROJECTION_BASEMODEL):
+    '''This is a simple model with a relationship used for testing projections.'''
+
+    __tablename__ = "customers"
+
+    id = Column("id", Integer, autoincrement=True, primary_key=True)
+    name = Column("name", String(50))
+    notes = Column("notes", String(500))
+    address_id = Column("address_id", Integer, ForeignKey(AddressModelTest.id))
+
+    address = relationship(AddressModelTest)
+    orders = relationship("OrderModelTest")
+
+class OrderModelTest(PROJECTION_BASEMODEL):
+    '''This is a simple model which belongs to a customer used for testing eager loading of collections.'''
+
+    __tablename__ = "orders"
+
+    id = Column("id", Integer, autoincrement=True, primary_key=True)
+    customer_id = Column("customer_id", Integer, ForeignKey(CustomerModelTest.id))
+
+class InvoiceModelTest(PROJECTION_BASEMODEL):
+    '''This is a simple model whose attribute names differ from column names used for testing primary key handling.'''
+
+    __tablename__ = "invoices"
+
+    id = Column("invoice_id", Integer, autoincrement=True, primary_key=True)
+    number = Column("invoice_number", String(50))
+
 class ModelFacadeTests(FantasticoUnitTestsCase):
     '''This class provides test suite for generating a model facade for BaseModel classes.'''
     
@@ -59,6 +104,13 @@ class ModelFacadeTests(FantasticoUnitTestsCase):
             self.assertEqual("John", model.first_name)
             self.assertEqual("Doe", model.last_name)
             
+    def test_primary_key_introspected_once(self):
+        '''This test case ensures model primary key is introspected only once per model class.'''
+
+        self.assertIs(self._facade.model_pk_cols, ModelFacade(PersonModelTest, Mock()).model_pk_cols)
+        self.assertEqual([PersonModelTest.id.property.columns[0]], list(self._facade.model_pk_cols))
+        self.assertIn(PersonModelTest, ModelFacade._PRIMARY_KEYS)
+
     def test_new_model_incompatible(self):
         '''This test case makes sure a model facade instance raises an exception if given model class does not
         extend **BASEMODEL**.'''
@@ -101,64 +153,80 @@ class ModelFacadeTests(FantasticoUnitTestsCase):
         self.assertTrue(self._rollbacked)
         
     def test_update_ok(self):
-        '''This test case ensures a model can be updated correctly using model facade.'''
-        
-        model = PersonModelTest(first_name="John", last_name="Doe")
+        '''This test case ensures a model can be updated correctly using model facade. The model is updated using a single
+        statement (no record is selected).'''
+
+        model = PersonModelTest(first_name="John Changed", last_name=None)
         model.id = 1
-        
+        del model.last_name
+
         self._session.query = Mock(return_value=self._session)
         self._session.filter = Mock(return_value=self._session)
-        self._session.all = Mock(return_value=[model])
+        self._session.update = Mock(return_value=1)
 
-        
-        def merge(model):
-            model.first_name = "John Changed"
-        
-        self._session.merge = merge
-        
         self._facade.update(model)
-        
-        self.assertFalse(self._rollbacked)
-        self.assertEqual("John Changed", model.first_name)
-        
+
+        self._session.update.assert_called_once_with({"first_name": "John Changed"}, synchronize_session=False)
+        self.assertEqual("persons.id = :id_1", str(self._session.filter.call_args[0][0]))
+        self._session.commit.assert_called_once_with()
+        self.assertEqual(0, self._session.all.call_count)
+        self.assertEqual(0, self._session.merge.call_count)
+        self.assertEqual(0, self._session.rollback.call_count)
+
+    def test_update_existing_model_ok(self):
+        '''This test case ensures changes are applied on an already loaded model without selecting it again.'''
+
+        model = PersonModelTest(first_name="John Changed", last_name="Doe")
+        model.id = "1"
+
+        existing_model = PersonModelTest(first_name="John", last_name="Doe")
+        existing_model.id = 1
+
+        self._facade.update(model, existing_model)
+
+        self.assertEqual("John Changed", existing_model.first_name)
+        self.assertEqual(1, existing_model.id)
+        self._session.commit.assert_called_once_with()
+        self.assertEqual(0, self._session.query.call_count)
+
     def test_update_exception_unhandled(self):
         '''This test case ensures a model update gracefully handles all unhandled exceptions.'''
-        
+
         model = PersonModelTest(first_name="John", last_name="Doe")
         model.id = 1
-        
+
         self._session.query = Mock(return_value=self._session)
         self._session.filter = Mock(return_value=self._session)
-        self._session.all = Mock(return_value=[model])
+        self._session.update = Mock(side_effect=Exception("Unhandled exception"))
 
-        self._session.merge = Mock(side_effect=Exception("Unhandled exception"))
-        
         def rollback():
             self._rollbacked = True
-            
-        self._session.rollback = rollback        
-        
+
+        self._session.rollback = rollback
+
         self.assertRaises(FantasticoDbError, self._facade.update, *[model])
         self.assertTrue(self._rollbacked)
-        
+
     def test_update_exception_notfound(self):
-        '''This test case ensures a model update exception is raised when the given model does not exist.'''
-        
+        '''This test case ensures a model update exception is raised when the given model does not exist (no row is matched
+        by the update statement).'''
+
         model = PersonModelTest(first_name="John", last_name="Doe")
         model.id = 1
-        
+
         self._session.query = Mock(return_value=self._session)
         self._session.filter = Mock(return_value=self._session)
-        self._session.all = Mock(return_value=[])
-        
+        self._session.update = Mock(return_value=0)
+
         def rollback():
             self._rollbacked = True
-            
+
         self._session.rollback = rollback
-        
+
         self.assertRaises(FantasticoDbNotFoundError, self._facade.update, *[model])
         self.assertTrue(self._rollbacked)
-    
+        self.assertEqual(0, self._session.commit.call_count)
+
     def test_find_by_pk_ok(self):
         '''This test case ensures find_by_pk method retrieves a model instance when a record is found by id.'''
         
@@ -319,6 +387,377 @@ class ModelFacadeTests(FantasticoUnitTestsCase):
 
         self.assertTrue(self._rollbacked)
         
+    def test_get_keyset_ok(self):
+        '''This test case ensures keyset of a model contains the sorted attributes followed by the primary key.'''
+
+        model = PersonModelTest(first_name="John", last_name="Doe")
+        model.id = 5
+
+        self.assertEqual([5], self._facade.get_keyset(model))
+        self.assertEqual(["Doe", 5], self._facade.get_keyset(model, ModelSort(PersonModelTest.last_name, ModelSort.DESC)))
+        self.assertEqual([5, "John"], self._facade.get_keyset(model, [ModelSort(PersonModelTest.id, ModelSort.DESC),
+                                                                      ModelSort(PersonModelTest.first_name)]))
+
+    def test_get_keyset_notsupported(self):
+        '''This test case ensures keyset can not be built for sort columns which do not belong to the model.'''
+
+        with self.assertRaises(FantasticoNotSupportedError):
+            self._facade.get_keyset(Mock(), ModelSort(Column("other_col", Integer)))
+
+    def test_get_records_paged_keyset(self):
+        '''This test case ensures records are retrieved in seek mode after the given keyset (sort expression followed by
+        primary key).'''
+
+        self._session.query = Mock(return_value=self._session)
+        self._session._primary_entity.selectable = PersonModelTest.__table__
+        self._session.order_by = Mock(return_value=self._session)
+        self._session.filter = Mock(return_value=self._session)
+        self._session.offset = Mock(return_value=self._session)
+        self._session.limit = Mock(return_value=self._session)
+        self._session.all = Mock(return_value=[])
+
+        sort_expr = ModelSort(PersonModelTest.last_name, ModelSort.DESC)
+
+        records = self._facade.get_records_paged(start_record=0, end_record=10, sort_expr=sort_expr, keyset=["Doe", 5])
+
+        self.assertEqual([], records)
+        self.assertEqual(["persons.last_name DESC", "persons.id ASC"],
+                         [str(call[0][0]) for call in self._session.order_by.call_args_list])
+
+        condition = self._session.filter.call_args[0][0].compile()
+
+        self.assertEqual("persons.last_name <= :last_name_1 AND (persons.last_name < :last_name_2 OR "
+                         "persons.last_name = :last_name_3 AND persons.id > :id_1)", str(condition))
+        self.assertEqual({"last_name_1": "Doe", "last_name_2": "Doe", "last_name_3": "Doe", "id_1": 5}, condition.params)
+        self._session.offset.assert_called_once_with(0)
+        self._session.limit.assert_called_once_with(10)
+
+    def test_get_records_paged_keyset_null(self):
+        '''This test case ensures seek mode is rejected for keysets containing NULL values (the seek condition would silently
+        skip rows).'''
+
+        self._session.query = Mock(return_value=self._session)
+
+        sort_expr = ModelSort(PersonModelTest.last_name, ModelSort.DESC)
+
+        with self.assertRaises(FantasticoNotSupportedError):
+            self._facade.get_records_paged(start_record=0, end_record=10, sort_expr=sort_expr, keyset=[None, 5])
+
+    def test_get_records_paged_keyset_firstpage(self):
+        '''This test case ensures an empty keyset retrieves the first page sorted by primary key without seek condition.'''
+
+        self._session.query = Mock(return_value=self._session)
+        self._session._primary_entity.selectable = PersonModelTest.__table__
+        self._session.order_by = Mock(return_value=self._session)
+        self._session.offset = Mock(return_value=self._session)
+        self._session.limit = Mock(return_value=self._session)
+        self._session.all = Mock(return_value=[])
+
+        self._facade.get_records_paged(start_record=0, end_record=10, keyset=[])
+
+        self.assertEqual(["persons.id ASC"], [str(call[0][0]) for call in self._session.order_by.call_args_list])
+        self.assertEqual(0, self._session.filter.call_count)
+
+    def test_get_records_paged_keyset_invalid(self):
+        '''This test case ensures keysets which do not match the sort expression are rejected.'''
+
+        with self.assertRaises(FantasticoNotSupportedError):
+            self._facade.get_records_paged(start_record=0, end_record=10, keyset=["Doe", 5])
+
+    def test_get_records_paged_counted_ok(self):
+        '''This test case ensures a page of records and the total number of records are selected by a single query.'''
+
+        person = PersonModelTest("John", "Doe")
+
+        self._mock_dialect("mysql", (8, 0, 30))
+
+        self._session.query = Mock(return_value=self._session)
+        self._session.offset = Mock(return_value=self._session)
+        self._session.limit = Mock(return_value=self._session)
+        self._session.all = Mock(return_value=[(person, 21)])
+
+        records, records_count = self._facade.get_records_paged_counted(start_record=0, end_record=4)
+
+        self.assertEqual([person], records)
+        self.assertEqual(21, records_count)
+
+        entities = self._session.query.call_args[0]
+
+        self.assertEqual(PersonModelTest, entities[0])
+        self.assertEqual("count(*) OVER ()", str(entities[1]))
+        self.assertEqual(0, self._session.count.call_count)
+
+    def test_get_records_paged_counted_outofrange(self):
+        '''This test case ensures total number of records is counted separately if the requested page is empty.'''
+
+        self._mock_dialect("postgresql", (9, 6, 1))
+
+        self._session.query = Mock(return_value=self._session)
+        self._session.offset = Mock(return_value=self._session)
+        self._session.limit = Mock(return_value=self._session)
+        self._session.all = Mock(return_value=[])
+        self._session.count = Mock(return_value=3)
+
+        self.assertEqual(([], 0), self._facade.get_records_paged_counted(start_record=0, end_record=4))
+        self.assertEqual(([], 3), self._facade.get_records_paged_counted(start_record=4, end_record=8))
+        self.assertEqual(1, self._session.count.call_count)
+
+    def test_get_records_paged_counted_nowindow(self):
+        '''This test case ensures total number of records is counted separately if the database does not support window
+        functions (or its version is not known yet).'''
+
+        person = PersonModelTest("John", "Doe")
+
+        for dialect_name, server_version in [("mysql", (5, 7, 42)), ("mysql", None), ("mysql", (10, 1, 48, "MariaDB")),
+                                             ("sqlite", (3, 22, 0)), ("firebird", (3, 0))]:
+            self._mock_dialect(dialect_name, server_version)
+
+            self._session.query = Mock(return_value=self._session)
+            self._session.offset = Mock(return_value=self._session)
+            self._session.limit = Mock(return_value=self._session)
+            self._session.all = Mock(return_value=[person])
+            self._session.count = Mock(return_value=21)
+
+            self.assertEqual(([person], 21), self._facade.get_records_paged_counted(start_record=0, end_record=4))
+
+            self.assertEqual([((PersonModelTest,),)] * 2, [call[0:1] for call in self._session.query.call_args_list])
+            self.assertEqual(1, self._session.count.call_count)
+
+    def test_supports_window_functions(self):
+        '''This test case ensures window functions support is detected from database dialect and server version.'''
+
+        for dialect_name, server_version in [("mysql", (8, 0, 11)), ("mysql", (10, 2, 0, "MariaDB")),
+                                             ("postgresql", (12, 3)), ("sqlite", (3, 25, 0))]:
+            self._mock_dialect(dialect_name, server_version)
+
+            self.assertTrue(self._facade._supports_window_functions())
+
+        self._session.get_bind = Mock(side_effect=Exception("Unbound session."))
+
+        self.assertFalse(self._facade._supports_window_functions())
+
+    def _mock_dialect(self, dialect_name, server_version):
+        '''This method mocks the dialect of the current session bind.'''
+
+        dialect = self._session.get_bind.return_value.dialect
+        dialect.name = dialect_name
+        dialect.server_version_info = server_version
+
+    def test_iter_records_paged_ok(self):
+        '''This test case ensures records can be iterated in batches fetched from a server side cursor. The query is executed
+        only when the iteration starts.'''
+
+        persons = [PersonModelTest("John", "Doe"), PersonModelTest("Jane", "Doe")]
+
+        self._session.query = Mock(return_value=self._session)
+        self._session.offset = Mock(return_value=self._session)
+        self._session.limit = Mock(return_value=self._session)
+        self._session.yield_per = Mock(return_value=persons)
+
+        records = self._facade.iter_records_paged(start_record=0, end_record=2, batch_size=50)
+
+        self.assertNotIsInstance(records, list)
+        self.assertEqual(persons, list(records))
+        self._session.yield_per.assert_called_once_with(50)
+        self.assertEqual(0, self._session.all.call_count)
+
+    def test_iter_records_paged_unhandled_exception(self):
+        '''This test case ensures exceptions raised while iterating records are converted to db errors and the session is
+        rollbacked.'''
+
+        def fetch_records():
+            yield PersonModelTest("John", "Doe")
+
+            raise Exception("Connection lost.")
+
+        self._session.query = Mock(return_value=self._session)
+        self._session.offset = Mock(return_value=self._session)
+        self._session.limit = Mock(return_value=self._session)
+        self._session.yield_per = Mock(return_value=fetch_records())
+
+        records = self._facade.iter_records_paged(start_record=0, end_record=2)
+
+        self.assertEqual("John", next(records).first_name)
+
+        with self.assertRaises(FantasticoDbError):
+            next(records)
+
+        self._session.rollback.assert_called_once_with()
+
+    def _get_projection_query(self, facade, projection, sort_expr=None):
+        '''This method retrieves a page of records using the given projection and returns the query built from the loader
+        options received by session query.'''
+
+        session = facade.session
+        session.query = Mock(return_value=session)
+        session.options = Mock(return_value=session)
+        session._primary_entity.selectable = facade.model_cls.__table__
+        session.order_by = Mock(return_value=session)
+        session.offset = Mock(return_value=session)
+        session.limit = Mock(return_value=session)
+        session.all = Mock(return_value=[])
+
+        facade.get_records_paged(start_record=0, end_record=10, sort_expr=sort_expr, projection=projection)
+
+        options = session.options.call_args[0]
+
+        return options, str(Query(facade.model_cls).options(*options))
+
+    def test_get_records_paged_projection(self):
+        '''This test case ensures only the projected columns (together with primary key and sort columns) are selected.'''
+
+        options, query = self._get_projection_query(self._facade, ["first_name"],
+                                                    ModelSort(PersonModelTest.last_name, ModelSort.DESC))
+
+        self.assertEqual(1, len(options))
+        self.assertTrue(query.startswith("SELECT persons.id AS persons_id, persons.first_name AS persons_first_name, "
+                                         "persons.last_name AS persons_last_name \nFROM persons"))
+
+        _, query = self._get_projection_query(self._facade, ["first_name"])
+
+        self.assertNotIn("last_name", query)
+
+    def test_get_records_paged_projection_relationship(self):
+        '''This test case ensures projected relationships are eagerly loaded and the columns required for loading them are
+        selected.'''
+
+        facade = ModelFacade(CustomerModelTest, Mock())
+
+        options, query = self._get_projection_query(facade, ["name", "address.city"])
+
+        self.assertEqual(2, len(options))
+        self.assertIn("customers.address_id", query)
+        self.assertNotIn("customers.notes", query)
+
+    def test_get_records_paged_projection_unmapped(self):
+        '''This test case ensures all columns are loaded when the projection contains attributes which are not mapped.'''
+
+        facade = ModelFacade(CustomerModelTest, Mock())
+
+        options, query = self._get_projection_query(facade, ["name", "address", "description"])
+
+        self.assertEqual(1, len(options))
+        self.assertIn("customers.notes", query)
+
+    def _new_person(self, person_id, first_name=None, last_name=None):
+        '''This method builds a person with the given id.'''
+
+        person = PersonModelTest(first_name, last_name)
+        person.id = person_id
+
+        return person
+
+    def test_find_by_pks_ok(self):
+        '''This test case ensures multiple models are selected in chunks and the result is aligned with the given primary
+        keys.'''
+
+        persons = [self._new_person(1), self._new_person(3)]
+
+        self._facade.BULK_CHUNK_SIZE = 2
+        self._session.query = Mock(return_value=self._session)
+        self._session.filter = Mock(return_value=self._session)
+        self._session.all = Mock(side_effect=[persons, []])
+
+        records = self._facade.find_by_pks([{PersonModelTest.id: 1}, {PersonModelTest.id: "2"},
+                                            {self._facade.model_pk_cols[0]: "3"}])
+
+        self.assertEqual([persons[0], None, persons[1]], records)
+        self.assertEqual(["persons.id IN (:id_1, :id_2)", "persons.id IN (:id_1)"],
+                         [str(call[0][0]) for call in self._session.filter.call_args_list])
+
+    def test_bulk_create_ok(self):
+        '''This test case ensures multiple models are created in a single transaction using bulk operations.'''
+
+        persons = [PersonModelTest("John", "Doe"), PersonModelTest("Jane", "Doe")]
+
+        def bulk_save_objects(models, return_defaults):
+            self.assertTrue(return_defaults)
+
+            for idx, model in enumerate(models):
+                model.id = idx + 1
+
+        self._session.bulk_save_objects = Mock(side_effect=bulk_save_objects)
+
+        self.assertEqual([[1], [2]], self._facade.bulk_create(persons))
+        self._session.commit.assert_called_once_with()
+        self.assertEqual(0, self._session.add.call_count)
+
+    def test_bulk_update_ok(self):
+        '''This test case ensures only the attributes set on each model are updated using bulk operations.'''
+
+        person = PersonModelTest("John", None)
+        person.id = 1
+        del person.last_name
+
+        self._facade.bulk_update([person, self._new_person(2, "Jane", "Doe")])
+
+        self._session.bulk_update_mappings.assert_called_once_with(PersonModelTest,
+                                                                   [{"id": 1, "first_name": "John"},
+                                                                    {"id": 2, "first_name": "Jane", "last_name": "Doe"}])
+        self._session.commit.assert_called_once_with()
+
+    def test_bulk_delete_ok(self):
+        '''This test case ensures multiple models are deleted in a single transaction.'''
+
+        self._session.query = Mock(return_value=self._session)
+        self._session.filter = Mock(return_value=self._session)
+
+        self._facade.bulk_delete([self._new_person(1), self._new_person(2)])
+
+        self.assertEqual("persons.id IN (:id_1, :id_2)", str(self._session.filter.call_args[0][0]))
+        self._session.delete.assert_called_once_with(synchronize_session=False)
+        self._session.commit.assert_called_once_with()
+
+    def test_bulk_dberror(self):
+        '''This test case ensures bulk operations are rollbacked if an unexpected exception occurs.'''
+
+        self._session.commit = Mock(side_effect=Exception("Unexpected exception."))
+        self._session.query = Mock(return_value=self._session)
+        self._session.filter = Mock(return_value=self._session)
+
+        for bulk_method in [self._facade.bulk_create, self._facade.bulk_update, self._facade.bulk_delete]:
+            with self.assertRaises(FantasticoDbError):
+                bulk_method([self._new_person(1)])
+
+        self.assertEqual(3, self._session.rollback.call_count)
+
+    def test_estimate_records_ok(self):
+        '''This test case ensures table statistics are used for estimating the number of records on supported databases.'''
+
+        self._session.get_bind.return_value.dialect.name = "mysql"
+        self._session.execute.return_value.scalar = Mock(return_value=1000)
+
+        self.assertEqual(1000, self._facade.estimate_records())
+
+        self.assertEqual(ModelFacade.ESTIMATE_QUERIES["mysql"], str(self._session.execute.call_args[0][0]))
+        self.assertEqual({"table_name": "persons"}, self._session.execute.call_args[0][1])
+        self.assertEqual(0, self._session.count.call_count)
+
+    def test_estimate_records_fallback(self):
+        '''This test case ensures records are counted exactly when table statistics are not available.'''
+
+        self._session.query = Mock(return_value=self._session)
+        self._session.count = Mock(return_value=20)
+
+        for dialect_name in ["sqlite", "mysql"]:
+            self._session.get_bind.return_value.dialect.name = dialect_name
+            self._session.execute.return_value.scalar = Mock(return_value=None)
+
+            self.assertEqual(20, self._facade.estimate_records())
+
+        self.assertEqual(1, self._session.execute.call_count)
+
+    def test_estimate_records_unhandled_exception(self):
+        '''This test case ensures unexpected exceptions raised while reading table statistics are converted to db errors.'''
+
+        self._session.get_bind.return_value.dialect.name = "postgresql"
+        self._session.execute = Mock(side_effect=Exception("Unexpected exception"))
+
+        with self.assertRaises(FantasticoDbError):
+            self._facade.estimate_records()
+
+        self.assertEqual(1, self._session.rollback.call_count)
+
     def test_count_records_default_ok(self):
         '''This test case ensures count method works correctly.'''
 
@@ -373,4 +812,147 @@ class ModelFacadeTests(FantasticoUnitTestsCase):
         with self.assertRaises(FantasticoDbError):
             self._facade.count_records(self._model_filter)
 
-        self.assertTrue(self._rollbacked)        
\ No newline at end of file
+        self.assertTrue(self._rollbacked)
+
+class ModelFacadeEagerLoadTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases which ensure relationships of paged records are eagerly loaded (no query is issued
+    per record).'''
+
+    def init(self):
+        self._engine = create_engine("sqlite://")
+        PROJECTION_BASEMODEL.metadata.create_all(self._engine)
+
+        self._session = sessionmaker(bind=self._engine)()
+
+        for idx in range(10):
+            customer = CustomerModelTest(name="customer %s" % idx, address=AddressModelTest(city="city %s" % idx))
+            customer.orders = [OrderModelTest(), OrderModelTest()]
+
+            self._session.add(customer)
+
+        self._session.commit()
+        self._session.expunge_all()
+
+        self._facade = ModelFacade(CustomerModelTest, self._session)
+
+    def cleanup(self):
+        self._session.close()
+
+    def _access_relationships(self, customers):
+        '''This method accesses the relationships of the given customers exactly like a serializer would do.'''
+
+        return [(customer.name, customer.address.city, len(customer.orders)) for customer in customers]
+
+    def test_get_records_paged_lazyload(self):
+        '''This test case ensures relationships which are not eagerly loaded are lazy loaded for each record.'''
+
+        with self.assert_queries_count(self._engine, 11):
+            customers = self._facade.get_records_paged(start_record=0, end_record=5)
+
+            self._access_relationships(customers)
+
+    def test_get_records_paged_eager_load(self):
+        '''This test case ensures relationships are loaded using a constant number of queries for each loading strategy.'''
+
+        for strategy, expected_count in [(ModelFacade.LOAD_SELECTIN, 3), (ModelFacade.LOAD_JOINED, 1),
+                                         (ModelFacade.LOAD_SUBQUERY, 3)]:
+            self._session.expunge_all()
+
+            with self.assert_queries_count(self._engine, expected_count):
+                customers, customers_count = self._facade.get_records_paged_counted(
+                                                    start_record=0, end_record=5,
+                                                    eager_load={"address": strategy, "orders": strategy})
+
+                self.assertEqual(10, customers_count)
+                self.assertEqual([("customer %s" % idx, "city %s" % idx, 2) for idx in range(5)],
+                                 self._access_relationships(customers))
+
+    def test_iter_records_paged_eager_load(self):
+        '''This test case ensures relationships of streamed records are eagerly loaded for each batch (collections and
+        subquery relationships are loaded using selectin strategy).'''
+
+        for strategy, expected_count in [(ModelFacade.LOAD_JOINED, 3), (ModelFacade.LOAD_SUBQUERY, 5)]:
+            self._session.expunge_all()
+
+            with self.assert_queries_count(self._engine, expected_count):
+                customers = self._facade.iter_records_paged(start_record=0, end_record=5, batch_size=3,
+                                                            eager_load={"address": strategy, "orders": strategy})
+
+                self.assertEqual(5, len(self._access_relationships(customers)))
+
+    def test_get_records_paged_eager_load_projection(self):
+        '''This test case ensures projected relationships not listed in eager_load are loaded using selectin strategy.'''
+
+        with self.assert_queries_count(self._engine, 2) as statements:
+            customers = self._facade.get_records_paged(start_record=0, end_record=5, projection=["name", "address.city"])
+
+            self.assertEqual(["city %s" % idx for idx in range(5)], [customer.address.city for customer in customers])
+
+        self.assertNotIn("customers.notes", statements[0])
+        self.assertNotIn("addresses.street", statements[1])
+
+    def test_get_records_paged_eager_load_unsupported(self):
+        '''This test case ensures unknown relationships and loading strategies are rejected.'''
+
+        for eager_load in [{"invoices": ModelFacade.LOAD_SELECTIN}, {"address": "immediate"}]:
+            with self.assertRaises(FantasticoNotSupportedError):
+                self._facade.get_records_paged(start_record=0, end_record=5, eager_load=eager_load)
+
+    def test_assert_queries_count_fails(self):
+        '''This test case ensures query count assertion fails when an unexpected number of statements is executed.'''
+
+        with self.assertRaises(AssertionError):
+            with self.assert_queries_count(self._engine, 1):
+                self._access_relationships(self._facade.get_records_paged(start_record=0, end_record=1))
+
+class ModelFacadePkAttrsTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases which ensure primary keys are handled through model attributes even if attribute
+    names differ from column names.'''
+
+    def init(self):
+        self._engine = create_engine("sqlite://")
+        PROJECTION_BASEMODEL.metadata.create_all(self._engine)
+
+        self._session = sessionmaker(bind=self._engine)()
+        self._facade = ModelFacade(InvoiceModelTest, self._session)
+
+    def cleanup(self):
+        self._session.close()
+
+    def test_pk_attrs_ok(self):
+        '''This test case ensures primary key attributes are resolved from the model mapper.'''
+
+        self.assertEqual(["id"], self._facade.model_pk_attrs)
+        self.assertEqual(["invoice_id"], [pk_col.name for pk_col in self._facade.model_pk_cols])
+
+    def test_create_update_ok(self):
+        '''This test case ensures created models primary keys are returned and primary keys are never updated.'''
+
+        self.assertEqual([1], self._facade.create(InvoiceModelTest(number="INV-1")))
+        self.assertEqual([[2], [3]], self._facade.bulk_create([InvoiceModelTest(number="INV-2"),
+                                                               InvoiceModelTest(number="INV-3")]))
+
+        self._session.expunge_all()
+
+        with self.assert_queries_count(self._engine, 1) as statements:
+            self._facade.update(InvoiceModelTest(id=2, number="INV-2b"))
+
+        self.assertNotIn("SET invoice_id", statements[0])
+        self.assertEqual("INV-2b", self._facade.find_by_pk({InvoiceModelTest.id: 2}).number)
+
+    def test_find_delete_by_pks_ok(self):
+        '''This test case ensures models can be found by primary key attributes or columns and deleted in bulk.'''
+
+        self._facade.bulk_create([InvoiceModelTest(number="INV-%s" % idx) for idx in range(3)])
+
+        invoices = self._facade.find_by_pks([{InvoiceModelTest.id: 3}, {InvoiceModelTest.id: 5}, {InvoiceModelTest.id: 1}])
+
+        self.assertEqual(["INV-2", None, "INV-0"], [invoice.number if invoice else None for invoice in invoices])
+
+        invoices = self._facade.find_by_pks([{self._facade.model_pk_cols[0]: 2}])
+
+        self.assertEqual(["INV-1"], [invoice.number for invoice in invoices])
+
+        self._facade.bulk_delete(invoices)
+
+        self.assertEqual(2, self._facade.count_records())
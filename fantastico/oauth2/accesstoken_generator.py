@@ -19,6 +19,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 from fantastico.oauth2.token import Token
 from fantastico.oauth2.token_generator import TokenGenerator
 import time
+import uuid
 from fantastico.oauth2.exceptions import OAuth2InvalidTokenTypeError, OAuth2TokenExpiredError
 
 class AccessTokenGenerator(TokenGenerator):
@@ -34,6 +35,9 @@ class AccessTokenGenerator(TokenGenerator):
             * user_id - User unique identifier.
             * scopes - The scopes requested for this client (a space delimited list of strings).
             * expires_in - The time to live period (in seconds) for the newly generated access token.
+
+        Each access token receives a unique token_id used for revoking it
+        (:py:class:`fantastico.oauth2.revocation_store.RevocationStore`).
         '''
 
         token_desc = token_desc or {}
@@ -50,7 +54,8 @@ class AccessTokenGenerator(TokenGenerator):
 
         expiration_time = int(creation_time) + expires_in
 
-        token = Token({"client_id": client_id,
+        token = Token({"token_id": str(uuid.uuid4()),
+                       "client_id": client_id,
                        "type": "access",
                        "user_id": user_id,
                        "scopes": scopes,
@@ -62,9 +67,13 @@ class AccessTokenGenerator(TokenGenerator):
     def validate(self, token):
         '''This method validates a given access token. It checks for:
 
-            * valid client id
             * valid token type
             * token not expired
+            * valid client id
+
+        Type and expiration checks only use public token attributes so the header of a compact token
+        (:py:meth:`fantastico.oauth2.token_encryption.CompactTokenEncryption.read_header`) is enough for rejecting expired
+        tokens without decrypting them.
         '''
 
         if self.TOKEN_TYPE != token.type:
@@ -79,6 +79,14 @@ class OAuth2TokenExpiredError(OAuth2Error):
     def __init__(self, msg=None):
         super(OAuth2TokenExpiredError, self).__init__(self.ERROR_CODE, msg)
 
+class OAuth2TokenRevokedError(OAuth2Error):
+    '''This class provides a concrete exception used to notify that a token has been revoked.'''
+
+    ERROR_CODE = 12035
+
+    def __init__(self, msg=None):
+        super(OAuth2TokenRevokedError, self).__init__(self.ERROR_CODE, msg, http_code=401)
+
 class OAuth2TokenEncryptionError(OAuth2Error):
     '''This class provides a concrete exception used to notify an error during encrypt / decrypt token operations.'''
 
@@ -154,3 +162,12 @@ class OAuth2AuthenticationError(OAuth2Error):
 
     def __init__(self, msg, http_code=403):
         super(OAuth2AuthenticationError, self).__init__(self.ERROR_CODE, msg, http_code)
+
+class OAuth2TemporarilyUnavailableError(OAuth2Error):
+    '''This class provides a concrete exception used to notify that a request can not be handled at the moment because the
+    server is overloaded (e.g: all password hashing workers are busy). Clients should retry later.'''
+
+    ERROR_CODE = 12300
+
+    def __init__(self, msg):
+        super(OAuth2TemporarilyUnavailableError, self).__init__(self.ERROR_CODE, msg, http_code=503)
@@ -17,7 +17,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.oauth2.middleware.exceptions_middleware
 '''
 from fantastico.oauth2.exceptions import OAuth2MissingQueryParamError, OAuth2AuthenticationError, OAuth2InvalidClientError, \
-    OAuth2Error, OAuth2UnsupportedGrantError
+    OAuth2Error, OAuth2UnsupportedGrantError, OAuth2TemporarilyUnavailableError
 from fantastico.routing_engine.custom_responses import RedirectResponse
 from fantastico.settings import SettingsFacade
 from webob.response import Response
@@ -35,36 +35,45 @@ class OAuth2ExceptionsMiddleware(object):
         self._exceptions_factory = exceptions_factory_cls()
 
     def __call__(self, environ, start_response):
-        body = None
-        http_code = None
-
         try:
             return self._app(environ, start_response)
-        except OAuth2MissingQueryParamError as ex:
+        except OAuth2Error as ex:
+            return self.handle_error(ex, environ, start_response)
+
+    def handle_error(self, ex, environ, start_response):
+        '''This method converts the given OAuth2 exception into a concrete error response which is sent to the client.'''
+
+        if isinstance(ex, OAuth2MissingQueryParamError):
             body = {"error": "invalid_request",
                     "error_description": "%s query parameter is mandatory." % ex.param_name,
                     "error_uri": self._get_error_uri(ex.error_code)}
 
             http_code = ex.http_code
-        except OAuth2AuthenticationError as ex:
+        elif isinstance(ex, OAuth2AuthenticationError):
             body = {"error": "access_denied",
                     "error_description": str(ex),
                     "error_uri": self._get_error_uri(ex.error_code)}
 
             http_code = ex.http_code
-        except OAuth2InvalidClientError as ex:
+        elif isinstance(ex, OAuth2InvalidClientError):
             body = {"error": "invalid_client",
                     "error_description": str(ex),
                     "error_uri": self._get_error_uri(ex.error_code)}
 
             http_code = ex.http_code
-        except OAuth2UnsupportedGrantError as ex:
+        elif isinstance(ex, OAuth2TemporarilyUnavailableError):
+            body = {"error": "temporarily_unavailable",
+                    "error_description": str(ex),
+                    "error_uri": self._get_error_uri(ex.error_code)}
+
+            http_code = ex.http_code
+        elif isinstance(ex, OAuth2UnsupportedGrantError):
             body = {"error": "unsupported_grant_type",
                     "error_description": str(ex),
                     "error_uri": self._get_error_uri(ex.error_code)}
 
             http_code = ex.http_code
-        except OAuth2Error as ex:
+        else:
             body = {"error": "server_error",
                     "error_description": str(ex),
                     "error_uri": self._get_error_uri(ex.error_code)}
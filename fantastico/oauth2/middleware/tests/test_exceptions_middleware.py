@@ -18,7 +18,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 from fantastico.exception_formatters import ExceptionFormattersFactory
 from fantastico.oauth2.exceptions import OAuth2MissingQueryParamError, OAuth2AuthenticationError, OAuth2InvalidClientError, \
-    OAuth2Error, OAuth2UnsupportedGrantError
+    OAuth2Error, OAuth2UnsupportedGrantError, OAuth2TemporarilyUnavailableError
 from fantastico.oauth2.middleware.exceptions_middleware import OAuth2ExceptionsMiddleware
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
@@ -161,6 +161,19 @@ class ExceptionsMiddlewareTests(FantasticoUnitTestsCase):
                                   return_url="/example/cb#triplex=abcd")
 
 
+    def test_temporarily_unavailable_json(self):
+        '''This test case ensures oauth2 temporarily unavailable exceptions are converted to 503 temporarily_unavailable
+        responses.'''
+
+        ex = OAuth2TemporarilyUnavailableError("Executor is busy.")
+
+        body = self._test_exception_json(ex, expected_http_code=503)
+
+        self._assert_error_response(error="temporarily_unavailable",
+                                    description=str(ex),
+                                    uri=self._calculate_expected_uri(ex.error_code),
+                                    body=body)
+
     def test_generic_exception_json(self):
         '''This test case ensures non oauth2 exceptions are bubbled up.'''
 
@@ -185,7 +198,7 @@ class ExceptionsMiddlewareTests(FantasticoUnitTestsCase):
 
         return "%sfeatures/oauth2/exceptions/%s.html" % (self._DOC_BASE, error_code)
 
-    def _test_exception_json(self, ex):
+    def _test_exception_json(self, ex, expected_http_code=None):
         '''This method provides a template test case for ensuring invalid request error response is correctly built.'''
 
         request = Mock()
@@ -210,6 +223,8 @@ class ExceptionsMiddlewareTests(FantasticoUnitTestsCase):
         if http_code >= 500:
             http_code = 400
 
+        http_code = expected_http_code or http_code
+
         http_code = "%s %s" % (http_code, status_reasons[http_code])
         start_response.assert_called_once_with(http_code, [("Content-Type", "application/json; charset=UTF-8"),
                                                            ("Content-Length", str(content_length)),
@@ -18,10 +18,12 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 from fantastico.exceptions import FantasticoNoRequestError, FantasticoDbError
 from fantastico.middleware.request_context import RequestContext
+from fantastico.oauth2.exceptions import OAuth2TokenRevokedError
 from fantastico.oauth2.middleware.tokens_middleware import OAuth2TokensMiddleware
 from fantastico.oauth2.security_context import SecurityContext
 from fantastico.oauth2.token import Token
 from fantastico.tests.base_case import FantasticoUnitTestsCase
+from fantastico.utils.lru_cache import LruCache
 from mock import Mock
 
 class TokensMiddlewareTests(FantasticoUnitTestsCase):
@@ -55,8 +57,18 @@ class TokensMiddlewareTests(FantasticoUnitTestsCase):
         self._conn_manager.CONN_MANAGER = Mock()
         self._conn_manager.CONN_MANAGER.get_connection = Mock(return_value=self._db_conn)
 
+        self._tokens_cache = LruCache(10)
+        self._time_provider = Mock()
+        self._time_provider.time = Mock(return_value=1000)
+
+        self._revocation_store = Mock()
+        self._revocation_store.sync_due = Mock(return_value=False)
+        self._revocation_store.is_revoked = Mock(return_value=False)
+
         self._app = Mock()
-        self._middleware = OAuth2TokensMiddleware(self._app, tokens_service_cls=self._tokens_service_cls)
+        self._middleware = OAuth2TokensMiddleware(self._app, tokens_service_cls=self._tokens_service_cls,
+                                                  tokens_cache=self._tokens_cache, time_provider=self._time_provider,
+                                                  revocation_store=self._revocation_store)
 
     def test_middleware_ok_query(self):
         '''This test case ensures OAuth2TokensMiddleware executes correctly when configured according to spec (runs after all native
@@ -103,6 +115,118 @@ class TokensMiddlewareTests(FantasticoUnitTestsCase):
         self._tokens_service.validate.assert_called_once_with(token)
         self._app.assert_called_once_with(self._environ, start_response)
 
+    def test_middleware_cached_token(self):
+        '''This test case ensures validated tokens are cached until they expire and cached tokens are neither decrypted nor
+        validated again (no database connection is required).'''
+
+        param_token = "encrypted token value"
+        token = Token({"token_id": "token-1", "scopes": ["scope1"], "expiration_time": 1060})
+
+        self._request.params = {OAuth2TokensMiddleware.TOKEN_QPARAM: param_token}
+        self._request.headers = {}
+
+        self._test_middleware_template(param_token, token)
+
+        self._tokens_service_cls.reset_mock()
+        self._conn_manager.CONN_MANAGER.get_connection.reset_mock()
+
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self.assertIs(token, self._request.context.security.access_token)
+        self.assertEqual(0, self._tokens_service_cls.call_count)
+        self.assertEqual(0, self._conn_manager.CONN_MANAGER.get_connection.call_count)
+
+    def test_middleware_cached_token_expiry(self):
+        '''This test case ensures cached tokens expire at token expiration time.'''
+
+        now = [5000.0]
+        tokens_cache = LruCache(10, clock=lambda: now[0])
+        middleware = OAuth2TokensMiddleware(self._app, tokens_service_cls=self._tokens_service_cls, tokens_cache=tokens_cache,
+                                            time_provider=self._time_provider, revocation_store=self._revocation_store)
+
+        token = Token({"token_id": "token-1", "scopes": ["scope1"], "expiration_time": 1060})
+
+        self._tokens_service.decrypt = Mock(return_value=token)
+        self._request.params = {OAuth2TokensMiddleware.TOKEN_QPARAM: "encrypted token value"}
+        self._request.headers = {}
+
+        middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        now[0] = 5059.0
+        self.assertTrue("encrypted token value" in tokens_cache)
+
+        now[0] = 5060.0
+        self.assertFalse("encrypted token value" in tokens_cache)
+
+    def test_middleware_revoked_token(self):
+        '''This test case ensures revoked tokens are rejected even if they are already cached.'''
+
+        token = Token({"token_id": "token-1", "scopes": ["scope1"], "expiration_time": 1060})
+
+        self._tokens_service.decrypt = Mock(return_value=token)
+        self._request.params = {OAuth2TokensMiddleware.TOKEN_QPARAM: "encrypted token value"}
+        self._request.headers = {}
+
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self._revocation_store.is_revoked = Mock(return_value=True)
+
+        with self.assertRaises(OAuth2TokenRevokedError):
+            self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self._revocation_store.is_revoked.assert_called_once_with("token-1")
+        self.assertEqual(1, self._tokens_service.decrypt.call_count)
+
+    def test_middleware_revocations_sync(self):
+        '''This test case ensures revocation store is synchronized (using the request connection) only when it is due.'''
+
+        token = Token({"token_id": "token-1", "scopes": ["scope1"], "expiration_time": 1060})
+
+        self._tokens_service.decrypt = Mock(return_value=token)
+        self._request.params = {OAuth2TokensMiddleware.TOKEN_QPARAM: "encrypted token value"}
+        self._request.headers = {}
+
+        self._revocation_store.sync_due = Mock(return_value=True)
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self._revocation_store.sync.assert_called_once_with(self._db_conn)
+        self._conn_manager.CONN_MANAGER.get_connection.assert_called_once_with(self._request.request_id)
+
+        self._revocation_store.sync_due = Mock(return_value=False)
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self.assertEqual(1, self._revocation_store.sync.call_count)
+
+    def test_middleware_token_noexpiration_notcached(self):
+        '''This test case ensures tokens without expiration time are never cached.'''
+
+        token = Token({"scopes": ["scope1"]})
+
+        self._tokens_service.decrypt = Mock(return_value=token)
+        self._request.params = {OAuth2TokensMiddleware.TOKEN_QPARAM: "encrypted token value"}
+        self._request.headers = {}
+
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self.assertEqual(0, len(self._tokens_cache))
+        self.assertEqual(2, self._tokens_service.decrypt.call_count)
+
+    def test_middleware_token_noid_notcached(self):
+        '''This test case ensures tokens without token id (which can not be revoked) are never cached.'''
+
+        token = Token({"scopes": ["scope1"], "expiration_time": 1060})
+
+        self._tokens_service.decrypt = Mock(return_value=token)
+        self._request.params = {OAuth2TokensMiddleware.TOKEN_QPARAM: "encrypted token value"}
+        self._request.headers = {}
+
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+        self._middleware(self._environ, Mock(), conn_manager=self._conn_manager)
+
+        self.assertEqual(0, len(self._tokens_cache))
+        self.assertEqual(2, self._tokens_service.decrypt.call_count)
+
     def test_middleware_norequest(self):
         '''This test case ensures a Fantastico concrete exception is raised if request middleware did not execute.'''
 
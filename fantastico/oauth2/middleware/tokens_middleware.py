@@ -18,27 +18,51 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 from fantastico import mvc
 from fantastico.exceptions import FantasticoNoRequestError, FantasticoDbError
+from fantastico.oauth2.exceptions import OAuth2TokenRevokedError
 from fantastico.oauth2.security_context import SecurityContext
 from fantastico.oauth2.tokens_service import TokensService
+import time
 
 class OAuth2TokensMiddleware(object):
     '''This class provides a middleware responsible for decoding an access token (if exists) and building a security context. It
     is extremely import to configure this middleware to run after
     :py:class:`fantastico.middleware.request_middleware.RequestMiddleware` and after
     :py:class:`fantastico.middleware.model_session_middleware.ModelSessionMiddleware` because
-    it needs a valid request and connection manager saved in the current pipeline execution.'''
+    it needs a valid request and connection manager saved in the current pipeline execution.
+
+    Access tokens are usually reused for many requests so decrypted and validated tokens are cached (per process) until they
+    expire: requests sending a cached token do not decrypt the token and do not access the database. Only tokens which have
+    a token_id are cached so that tokens invalidated through
+    :py:meth:`fantastico.oauth2.tokens_service.TokensService.invalidate` are always rejected by the revocation store check
+    below.
+
+    Every token (cached or not) is checked against the revocation store
+    (:py:class:`fantastico.oauth2.revocation_store.RevocationStore`) which is periodically synchronized from database so
+    that tokens revoked by other processes are rejected as well.'''
 
     TOKEN_QPARAM = "token"
     AUTHORIZATION_FORMAT = "Bearer %s"
 
-    def __init__(self, app, tokens_service_cls=TokensService):
+    def __init__(self, app, tokens_service_cls=TokensService, tokens_cache=TokensService.VALIDATED_TOKENS, time_provider=time,
+                 revocation_store=TokensService.REVOKED_TOKENS):
         self._app = app
         self._tokens_service_cls = tokens_service_cls
+        self._tokens_cache = tokens_cache
+        self._revocation_store = revocation_store
+        self._time_provider = time_provider
 
     def __call__(self, environ, start_response, conn_manager=mvc):
         '''This method is invoked automatically during middleware pipeline execution. For tokens middleware, this is the place
         where oauth2 access tokens are decrypted and validated.'''
 
+        self.build_security(environ, conn_manager)
+
+        return self._app(environ, start_response)
+
+    def build_security(self, environ, conn_manager=mvc):
+        '''This method decrypts and validates the oauth2 access token of the current request (if any) and builds the request
+        security context.'''
+
         request = environ.get("fantastico.request")
         if not request:
             raise FantasticoNoRequestError("OAuth2TokensMiddleware must execute after RequestMiddleware.")
@@ -46,25 +70,42 @@ class OAuth2TokensMiddleware(object):
         if not conn_manager.CONN_MANAGER:
             raise FantasticoDbError(msg="OAuth2TokensMiddleware must execute after ModelSessionMiddleware.")
 
-        db_conn = conn_manager.CONN_MANAGER.get_connection(request.request_id)
-
         encrypted_token = request.params.get(self.TOKEN_QPARAM, self._get_token_from_header(request))
         if not encrypted_token:
             request.context.security = SecurityContext(None)
-            return self._app(environ, start_response)
+            return
 
-        request.context.security = self._build_security_context(encrypted_token, db_conn)
+        db_conn = None
 
-        return self._app(environ, start_response)
+        if self._revocation_store.sync_due():
+            db_conn = conn_manager.CONN_MANAGER.get_connection(request.request_id)
+            self._revocation_store.sync(db_conn)
+
+        token = self._tokens_cache.get(encrypted_token)
+
+        if token is None:
+            db_conn = db_conn or conn_manager.CONN_MANAGER.get_connection(request.request_id)
+            token = self._validate_token(encrypted_token, db_conn)
+
+        if self._revocation_store.is_revoked(token.dictionary.get("token_id")):
+            raise OAuth2TokenRevokedError("Access token has been revoked.")
 
-    def _build_security_context(self, encrypted_token, db_conn):
-        '''This method builds a security context using the current encrypted token and the currently opened db connection.'''
+        request.context.security = SecurityContext(token)
+
+    def _validate_token(self, encrypted_token, db_conn):
+        '''This method decrypts and validates the given encrypted token using the currently opened db connection. Validated
+        tokens which have a token_id (so they can be revoked) are cached until they expire.'''
 
         tokens_service = self._tokens_service_cls(db_conn)
         token = tokens_service.decrypt(encrypted_token)
         tokens_service.validate(token)
 
-        return SecurityContext(token)
+        expiration_time = token.dictionary.get("expiration_time")
+
+        if expiration_time and token.dictionary.get("token_id"):
+            self._tokens_cache.put(encrypted_token, token, ttl=expiration_time - self._time_provider.time())
+
+        return token
 
     def _get_token_from_header(self, request):
         '''This method retrieves the oauth2 bearer token from request. If the token is not found None is returned.'''
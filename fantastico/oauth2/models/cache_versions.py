@@ -0,0 +1,34 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.models.cache_versions
+'''
+from fantastico.mvc import BASEMODEL
+from sqlalchemy.schema import Column
+from sqlalchemy.types import String, Integer
+
+class CacheVersion(BASEMODEL):
+    '''This class provides the model for versions of per process oauth2 caches. Each time a cache must be flushed by all
+    processes (on all hosts) its version is incremented.'''
+
+    __tablename__ = "oauth2_cache_versions"
+
+    cache_name = Column("cache_name", String(50), primary_key=True)
+    version = Column("version", Integer, nullable=False)
+
+    def __init__(self, cache_name=None, version=None):
+        self.cache_name = cache_name
+        self.version = version
@@ -16,18 +16,68 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.models.client_repository
 '''
+from fantastico.exceptions import FantasticoDbError
 from fantastico.mvc.model_facade import ModelFacade
 from fantastico.mvc.models.model_filter import ModelFilter
+from fantastico.oauth2.models.cache_versions import CacheVersion
 from fantastico.oauth2.models.clients import Client
 from fantastico.oauth2.models.return_urls import ClientReturnUrl
+from fantastico.utils.dictionary_object import DictionaryObject
+from fantastico.utils.lru_cache import LruCache
+import base64
+import time
+
+class ClientDescriptor(DictionaryObject):
+    '''This class provides a read only client descriptor which can be cached between requests. Encryption vectors are already
+    decoded:
+
+    * client_id - Client unique identifier.
+    * name - Client name.
+    * grant_types - Client supported grant types.
+    * revoked - True if the client is revoked and False otherwise.
+    * token_iv - Token initialization vector (bytes).
+    * token_key - Token encryption key (bytes).
+    * return_urls - The list of client return urls.'''
+
+    @staticmethod
+    def from_client(client):
+        '''This method builds a descriptor from the given client model.'''
+
+        return ClientDescriptor({"client_id": client.client_id,
+                                 "name": client.name,
+                                 "grant_types": client.grant_types,
+                                 "revoked": client.revoked,
+                                 "token_iv": base64.b64decode(client.token_iv.encode()),
+                                 "token_key": base64.b64decode(client.token_key.encode()),
+                                 "return_urls": [url.return_url for url in client.return_urls]})
 
 class ClientRepository(object):
-    '''This class provides data access methods which can be used when working with Client objects.'''
+    '''This class provides data access methods which can be used when working with Client objects.
+
+    Client descriptors (:py:class:`ClientDescriptor`) used for encrypting / decrypting tokens are cached per process for
+    :py:attr:`CLIENTS_CACHE_TTL` seconds so that known clients are not loaded from database for each token operation. A
+    client descriptor can be explicitly removed from cache using :py:meth:`invalidate`. All running processes (on all hosts)
+    can be notified to flush their cache using :py:meth:`flush` (this is what **fsdk flush-oauth2-clients** does): the clients
+    cache version (:py:class:`fantastico.oauth2.models.cache_versions.CacheVersion`) is incremented in database and each
+    process checks it at most once every :py:attr:`FLUSH_CHECK_INTERVAL` seconds. If the version can not be read, cached
+    descriptors still expire after :py:attr:`CLIENTS_CACHE_TTL` seconds.'''
 
-    def __init__(self, db_conn, model_facade_cls=ModelFacade):
+    CLIENTS_CACHE_SIZE = 1000
+    CLIENTS_CACHE_TTL = 300
+    CLIENTS_CACHE = LruCache(CLIENTS_CACHE_SIZE, ttl=CLIENTS_CACHE_TTL)
+
+    CACHE_NAME = "oauth2_clients"
+    FLUSH_CHECK_INTERVAL = 5
+
+    _cache_version = None
+    _flush_checked_at = None
+
+    def __init__(self, db_conn, model_facade_cls=ModelFacade, time_provider=time):
         self._db_conn = db_conn
         self._client_facade = model_facade_cls(Client, self._db_conn)
         self._url_facade = model_facade_cls(ClientReturnUrl, self._db_conn)
+        self._version_facade = model_facade_cls(CacheVersion, self._db_conn)
+        self._time_provider = time_provider
 
     def load(self, client_id):
         '''This method is used to load a client by primary key.'''
@@ -36,6 +86,84 @@ class ClientRepository(object):
 
         return client
 
+    def load_descriptor(self, client_id):
+        '''This method returns the cached descriptor of the given client. If the client is not cached, it is loaded from
+        database.
+
+        :param client_id: Client unique identifier.
+        :type client_id: str
+        :returns: The client descriptor.
+        :rtype: :py:class:`ClientDescriptor`
+        :raises fantastico.exceptions.FantasticoDbNotFoundError: If the client does not exist.'''
+
+        self._check_cache_version()
+
+        descriptor = self.CLIENTS_CACHE.get(client_id)
+
+        if descriptor is None:
+            descriptor = ClientDescriptor.from_client(self.load(client_id))
+
+            self.CLIENTS_CACHE.put(client_id, descriptor)
+
+        return descriptor
+
+    def _check_cache_version(self):
+        '''This method flushes the clients cache of the current process if the clients cache version was changed since it was
+        last checked.'''
+
+        now = self._time_provider.time()
+        cls = ClientRepository
+
+        if cls._flush_checked_at is not None and now - cls._flush_checked_at < cls.FLUSH_CHECK_INTERVAL:
+            return
+
+        cls._flush_checked_at = now
+
+        try:
+            cache_version = self._load_cache_version()
+        except FantasticoDbError:
+            return
+
+        version = cache_version.version if cache_version else None
+
+        if version != cls._cache_version:
+            cls._cache_version = version
+            cls.CLIENTS_CACHE.clear()
+
+    def _load_cache_version(self):
+        '''This method loads the clients cache version record (None if the cache was never flushed).'''
+
+        results = self._version_facade.get_records_paged(
+                                    start_record=0, end_record=1,
+                                    filter_expr=ModelFilter(CacheVersion.cache_name, self.CACHE_NAME, ModelFilter.EQ))
+
+        return results[0] if results else None
+
+    @classmethod
+    def invalidate(cls, client_id=None):
+        '''This method removes the given client descriptor from the cache of the current process. If no client id is given,
+        all client descriptors are removed.'''
+
+        if client_id is None:
+            cls.CLIENTS_CACHE.clear()
+            return
+
+        cls.CLIENTS_CACHE.invalidate(client_id)
+
+    def flush(self):
+        '''This method flushes the clients cache of all processes: the clients cache version is incremented in database and
+        each process clears its cache when it notices the change.'''
+
+        cache_version = self._load_cache_version()
+
+        if cache_version is None:
+            self._version_facade.create(CacheVersion(self.CACHE_NAME, 1))
+        else:
+            cache_version.version += 1
+            self._version_facade.update(cache_version, cache_version)
+
+        self.invalidate()
+
     def load_client_by_returnurl(self, return_url):
         '''This method load the first available client descriptor which has the specified return url. Please make sure
         return url is decoded before invoking this method or it will not work otherwise.'''
@@ -0,0 +1,35 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.models.revoked_tokens
+'''
+from fantastico.mvc import BASEMODEL
+from sqlalchemy.schema import Column
+from sqlalchemy.types import String, Integer
+
+class RevokedToken(BASEMODEL):
+    '''This class provides the model for revoked oauth2 tokens. A revoked token is kept until its expiration time passes.'''
+
+    __tablename__ = "oauth2_revoked_tokens"
+
+    token_id = Column("token_id", String(36), primary_key=True)
+    expiration_time = Column("expiration_time", Integer, nullable=False)
+    revocation_time = Column("revocation_time", Integer, nullable=False)
+
+    def __init__(self, token_id=None, expiration_time=None, revocation_time=None):
+        self.token_id = token_id
+        self.expiration_time = expiration_time
+        self.revocation_time = revocation_time
@@ -16,14 +16,16 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.models.tests.test_client_repository
 '''
-from fantastico.exceptions import FantasticoDbNotFoundError
+from fantastico.exceptions import FantasticoDbError, FantasticoDbNotFoundError
 from fantastico.mvc.models.model_filter import ModelFilter
 from fantastico.mvc.models.model_filter_compound import ModelFilterAnd
-from fantastico.oauth2.models.client_repository import ClientRepository
+from fantastico.oauth2.models.cache_versions import CacheVersion
+from fantastico.oauth2.models.client_repository import ClientRepository, ClientDescriptor
 from fantastico.oauth2.models.clients import Client
 from fantastico.oauth2.models.return_urls import ClientReturnUrl
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
+import base64
 
 class ClientRepositoryTests(FantasticoUnitTestsCase):
     '''This class provides the tests suite for client repository.'''
@@ -32,6 +34,7 @@ class ClientRepositoryTests(FantasticoUnitTestsCase):
     _repo = None
     _client_facade = None
     _url_facade = None
+    _version_facade = None
 
     def init(self):
         '''This method is invoked automatically in order to set common dependencies for all test cases.'''
@@ -39,8 +42,25 @@ class ClientRepositoryTests(FantasticoUnitTestsCase):
         self._client_facade = Mock()
         self._url_facade = Mock()
 
+        self._version_facade = Mock()
+        self._version_facade.get_records_paged = Mock(return_value=[])
+
         self._db_conn = Mock()
-        self._repo = ClientRepository(self._db_conn, model_facade_cls=self._get_facade_instance)
+
+        self._time_provider = Mock()
+        self._time_provider.time = Mock(return_value=1000)
+
+        self._repo = ClientRepository(self._db_conn, model_facade_cls=self._get_facade_instance,
+                                      time_provider=self._time_provider)
+
+        ClientRepository.invalidate()
+
+    def cleanup(self):
+        '''This method is invoked automatically in order to reset the clients cache of the current process.'''
+
+        ClientRepository.invalidate()
+        ClientRepository._flush_checked_at = None
+        ClientRepository._cache_version = None
 
     def _get_facade_instance(self, facade_cls, db_conn):
         '''This method builds a model facade based on given facade cls.'''
@@ -50,6 +70,8 @@ class ClientRepositoryTests(FantasticoUnitTestsCase):
             return self._client_facade
         elif facade_cls == ClientReturnUrl:
             return self._url_facade
+        elif facade_cls == CacheVersion:
+            return self._version_facade
 
 
     def test_load_ok(self):
@@ -122,3 +144,115 @@ class ClientRepositoryTests(FantasticoUnitTestsCase):
         self._url_facade.get_records_paged = Mock(return_value=[])
 
         self.assertIsNone(self._repo.load_client_by_returnurl("/abc"))
+
+    def _mock_client(self, client_id="abcd"):
+        '''This method mocks the client facade in order to return a client with encryption keys and return urls.'''
+
+        client = Client(client_id=client_id, name="sample client", grant_types="token", revoked=False,
+                        token_iv=base64.b64encode(b"token iv").decode(), token_key=base64.b64encode(b"token key").decode())
+        client.return_urls = [ClientReturnUrl(client_id, "/cb")]
+
+        self._client_facade.find_by_pk = Mock(return_value=client)
+
+        return client
+
+    def test_load_descriptor_cached(self):
+        '''This test case ensures client descriptors hold decoded encryption keys and are loaded from database only once.'''
+
+        self._mock_client()
+
+        descriptor = self._repo.load_descriptor("abcd")
+
+        self.assertIsInstance(descriptor, ClientDescriptor)
+        self.assertEqual("abcd", descriptor.client_id)
+        self.assertEqual(b"token iv", descriptor.token_iv)
+        self.assertEqual(b"token key", descriptor.token_key)
+        self.assertEqual(["/cb"], descriptor.return_urls)
+        self.assertFalse(descriptor.revoked)
+
+        repo = ClientRepository(self._db_conn, model_facade_cls=self._get_facade_instance,
+                                time_provider=self._time_provider)
+
+        self.assertIs(descriptor, repo.load_descriptor("abcd"))
+        self._client_facade.find_by_pk.assert_called_once_with({Client.client_id: "abcd"})
+
+    def test_load_descriptor_invalidated(self):
+        '''This test case ensures invalidated client descriptors are loaded again from database.'''
+
+        self._mock_client()
+
+        self._repo.load_descriptor("abcd")
+        ClientRepository.invalidate("abcd")
+        self._repo.load_descriptor("abcd")
+
+        self.assertEqual(2, self._client_facade.find_by_pk.call_count)
+
+    def test_load_descriptor_notfound(self):
+        '''This test case ensures missing clients are not cached.'''
+
+        self._client_facade.find_by_pk = Mock(side_effect=FantasticoDbNotFoundError("Client not found."))
+
+        for _ in range(2):
+            with self.assertRaises(FantasticoDbNotFoundError):
+                self._repo.load_descriptor("abcd")
+
+        self.assertEqual(0, len(ClientRepository.CLIENTS_CACHE))
+
+    def test_load_descriptor_cache_version(self):
+        '''This test case ensures the clients cache is flushed once the clients cache version is changed in database (version
+        is checked at most once per check interval).'''
+
+        self._mock_client()
+
+        self._repo.load_descriptor("abcd")
+
+        self._version_facade.get_records_paged = Mock(return_value=[CacheVersion(ClientRepository.CACHE_NAME, 1)])
+        self._time_provider.time = Mock(return_value=1000 + ClientRepository.FLUSH_CHECK_INTERVAL - 0.5)
+
+        self._repo.load_descriptor("abcd")
+
+        self.assertEqual(1, self._client_facade.find_by_pk.call_count)
+        self.assertEqual(0, self._version_facade.get_records_paged.call_count)
+
+        self._time_provider.time = Mock(return_value=1000 + ClientRepository.FLUSH_CHECK_INTERVAL)
+
+        self._repo.load_descriptor("abcd")
+        self._repo.load_descriptor("abcd")
+
+        self.assertEqual(2, self._client_facade.find_by_pk.call_count)
+        self.assertEqual(1, self._version_facade.get_records_paged.call_count)
+
+        filter_expr = self._version_facade.get_records_paged.call_args[1]["filter_expr"]
+        self.assertEqual((CacheVersion.cache_name, ClientRepository.CACHE_NAME, ModelFilter.EQ),
+                         (filter_expr.column, filter_expr.ref_value, filter_expr.operation))
+
+    def test_load_descriptor_cache_version_dbex(self):
+        '''This test case ensures cached descriptors are still used if the clients cache version can not be read.'''
+
+        self._mock_client()
+        self._version_facade.get_records_paged = Mock(side_effect=FantasticoDbError("Unexpected db error."))
+
+        self._repo.load_descriptor("abcd")
+        self._repo.load_descriptor("abcd")
+
+        self.assertEqual(1, self._client_facade.find_by_pk.call_count)
+
+    def test_flush_ok(self):
+        '''This test case ensures flush increments the clients cache version and clears the cache of the current process.'''
+
+        self._mock_client()
+        self._repo.load_descriptor("abcd")
+
+        self._repo.flush()
+
+        cache_version = self._version_facade.create.call_args[0][0]
+        self.assertEqual((ClientRepository.CACHE_NAME, 1), (cache_version.cache_name, cache_version.version))
+        self.assertEqual(0, len(ClientRepository.CLIENTS_CACHE))
+
+        self._version_facade.get_records_paged = Mock(return_value=[cache_version])
+
+        self._repo.flush()
+
+        self.assertEqual(2, cache_version.version)
+        self._version_facade.update.assert_called_once_with(cache_version, cache_version)
+        self.assertEqual(1, self._version_facade.create.call_count)
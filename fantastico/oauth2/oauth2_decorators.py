@@ -104,6 +104,20 @@ class RequiredScopes(object):
         self._scopes = list(self._scopes)
         self._scopes.sort()
 
+        registry = SecurityContext.SCOPES_REGISTRY
+
+        self._bitsets = {"scopes": registry.register_all(self._scopes),
+                         "create": registry.register_all(self._create_scopes),
+                         "read": registry.register_all(self._read_scopes),
+                         "update": registry.register_all(self._update_scopes),
+                         "delete": registry.register_all(self._delete_scopes)}
+
+    def get_bitset(self, attr_scope="scopes"):
+        '''This method returns the bitset (see :py:class:`fantastico.oauth2.scopes_registry.ScopesRegistry`) of scopes required
+        for the given section. Valid values are: scopes, create, read, update or delete.'''
+
+        return self._bitsets[attr_scope]
+
     def _get_list_from_param(self, param_value):
         '''This method ensures param_value is a list. In case param value is string it is transformed to a list with
         one element.'''
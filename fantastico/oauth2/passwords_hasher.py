@@ -19,6 +19,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 
 from abc import ABCMeta # pylint: disable=W0611
 from abc import abstractmethod
+import hmac
 
 class PasswordsHasher(object, metaclass=ABCMeta):
     '''This class provides an abstract contract for password hasher. A password hasher is an algorithm that generates a strong
@@ -35,3 +36,19 @@ class PasswordsHasher(object, metaclass=ABCMeta):
         :returns: The strong hash generated.
         :rtype: str
         '''
+
+    def verify_password(self, plain_passwd, passwd_hash, hash_ctx=None):
+        '''This method checks if the given plain password matches the given hash (generated by this hasher). By default, the
+        plain password is hashed using the given hashing context and compared (in constant time) with the given hash.
+
+        :returns: True if the password matches and False otherwise.
+        :rtype: bool
+        '''
+
+        return hmac.compare_digest(self.hash_password(plain_passwd, hash_ctx).encode(), (passwd_hash or "").encode())
+
+    def needs_rehash(self, passwd_hash): # pylint: disable=W0613
+        '''This method returns True if the given hash (generated by this hasher) uses weaker parameters than the ones currently
+        configured for this hasher. By default, hashes never need to be recomputed.'''
+
+        return False
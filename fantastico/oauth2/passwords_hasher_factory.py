@@ -16,19 +16,42 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.passwords_hasher_factory
 '''
+from fantastico.exceptions import FantasticoExecutorBusyError
+from fantastico.oauth2.exceptions import OAuth2TokenEncryptionError, OAuth2TemporarilyUnavailableError
+from fantastico.oauth2.pbkdf2_passwords_hasher import Pbkdf2PasswordsHasher
+from fantastico.oauth2.scrypt_passwords_hasher import ScryptPasswordsHasher
 from fantastico.oauth2.sha512salt_passwords_hasher import Sha512SaltPasswordsHasher
-from fantastico.oauth2.exceptions import OAuth2TokenEncryptionError
+from fantastico.utils.bounded_executor import BoundedExecutor
+import os
 
 class PasswordsHasherFactory(object):
     '''This class provides a factory used to obtain concrete password hasher providers. At the moment, the following
     hashers are supported:
 
-        * SHA512_SALT'''
+        * SHA512_SALT
+        * PBKDF2_SHA256 (slow)
+        * SCRYPT (slow)
+
+    Slow hashers must not run on request threads: use :py:meth:`run_hashing` which executes hashing operations on
+    :py:attr:`HASHING_EXECUTOR` (a bounded thread pool shared by the process). When all hashing workers are busy and the
+    hashing queue is full, operations are rejected immediately with
+    :py:class:`fantastico.oauth2.exceptions.OAuth2TemporarilyUnavailableError` (http 503) instead of piling up request threads.
+
+    Hashes generated by slow hashers are self describing so the algorithm of a stored hash can be detected using
+    :py:meth:`detect_hash_alg` (this allows transparently rehashing passwords once the configured algorithm changes).'''
 
     SHA512_SALT = "sha512-salt"
+    PBKDF2_SHA256 = "pbkdf2-sha256"
+    SCRYPT = "scrypt"
+
+    HASHING_WORKERS = os.cpu_count() or 1
+    HASHING_QUEUE_SIZE = 4 * HASHING_WORKERS
+    HASHING_EXECUTOR = BoundedExecutor(HASHING_WORKERS, HASHING_QUEUE_SIZE, thread_name_prefix="fantastico-hashing")
 
     def __init__(self):
-        self._supported_hashers = {self.SHA512_SALT: Sha512SaltPasswordsHasher}
+        self._supported_hashers = {self.SHA512_SALT: Sha512SaltPasswordsHasher,
+                                   self.PBKDF2_SHA256: Pbkdf2PasswordsHasher,
+                                   self.SCRYPT: ScryptPasswordsHasher}
 
     def get_hasher(self, hash_alg):
         '''This method obtains a concrete passwords hasher provider based on the requested hash algorithm. See the constants
@@ -47,3 +70,26 @@ class PasswordsHasherFactory(object):
             raise OAuth2TokenEncryptionError("Hashing algorithm %s is not supported." % hash_alg)
 
         return hasher()
+
+    def detect_hash_alg(self, passwd_hash):
+        '''This method returns the algorithm used for generating the given hash. Hashes which do not start with a known
+        algorithm prefix (e.g: $pbkdf2-sha256$) were generated by SHA512_SALT hasher.'''
+
+        if passwd_hash and passwd_hash.startswith("$"):
+            hash_alg = passwd_hash[1:].split("$", 1)[0]
+
+            if hash_alg in self._supported_hashers:
+                return hash_alg
+
+        return self.SHA512_SALT
+
+    def run_hashing(self, func, *args, **kwargs):
+        '''This method executes the given hashing operation (e.g: hasher.hash_password) on :py:attr:`HASHING_EXECUTOR` and
+        returns its result.
+
+        :raises fantastico.oauth2.exceptions.OAuth2TemporarilyUnavailableError: if the hashing executor is busy.'''
+
+        try:
+            return self.HASHING_EXECUTOR.run(func, *args, **kwargs)
+        except FantasticoExecutorBusyError as ex:
+            raise OAuth2TemporarilyUnavailableError(str(ex))
@@ -0,0 +1,94 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.pbkdf2_passwords_hasher
+'''
+from fantastico.oauth2.passwords_hasher import PasswordsHasher
+import base64
+import hashlib
+import hmac
+import os
+
+class Pbkdf2PasswordsHasher(PasswordsHasher):
+    '''This class provides the PBKDF2-HMAC-SHA256 implementation for password hashing. It is deliberately slow (the cost is
+    given by the number of iterations) so hashing must not happen on request threads (see
+    :py:attr:`fantastico.oauth2.passwords_hasher_factory.PasswordsHasherFactory.HASHING_EXECUTOR`). A random salt is generated
+    for each hash and stored, together with the number of iterations, in the hash itself:
+
+    .. code-block:: text
+
+        $pbkdf2-sha256$<iterations>$<base64 salt>$<base64 hash>
+
+    In order to use this hasher try the code snippet below:
+
+    .. code-block:: python
+
+        pbkdf2_hasher = PasswordsHasherFactory().get_hasher(PasswordsHasherFactory.PBKDF2_SHA256)
+        hashed_passwd = pbkdf2_hasher.hash_password("abcd")
+        pbkdf2_hasher.verify_password("abcd", hashed_passwd) # True'''
+
+    HASH_PREFIX = "$pbkdf2-sha256$"
+    ITERATIONS = 100000
+    SALT_SIZE = 16
+
+    def __init__(self, iterations=ITERATIONS, salt_size=SALT_SIZE):
+        self._iterations = iterations
+        self._salt_size = salt_size
+
+    def hash_password(self, plain_passwd, hash_ctx=None):
+        '''This method hashes the given plain password using a new random salt. Hashing context is ignored.'''
+
+        salt = os.urandom(self._salt_size)
+
+        return self._build_hash(plain_passwd, salt, self._iterations)
+
+    def verify_password(self, plain_passwd, passwd_hash, hash_ctx=None):
+        '''This method hashes the given plain password using the salt and iterations stored in the given hash and compares the
+        result (in constant time) with the given hash.'''
+
+        try:
+            iterations, salt = self._parse_hash(passwd_hash)
+        except ValueError:
+            return False
+
+        return hmac.compare_digest(self._build_hash(plain_passwd, salt, iterations).encode(), passwd_hash.encode())
+
+    def needs_rehash(self, passwd_hash):
+        '''This method returns True if the given hash was computed using fewer iterations than currently configured.'''
+
+        return self._parse_hash(passwd_hash)[0] < self._iterations
+
+    def _build_hash(self, plain_passwd, salt, iterations):
+        '''This method computes the hash of the given plain password and encodes it together with the hashing parameters.'''
+
+        plain_passwd = (plain_passwd or "").strip()
+
+        hashed_passwd = hashlib.pbkdf2_hmac("sha256", plain_passwd.encode(), salt, iterations)
+
+        return "%s%s$%s$%s" % (self.HASH_PREFIX, iterations, base64.b64encode(salt).decode(),
+                               base64.b64encode(hashed_passwd).decode())
+
+    def _parse_hash(self, passwd_hash):
+        '''This method returns a tuple (iterations, salt) from the given hash.
+
+        :raises ValueError: if the given hash was not generated by this hasher.'''
+
+        if not passwd_hash or not passwd_hash.startswith(self.HASH_PREFIX):
+            raise ValueError("Hash is not a pbkdf2-sha256 hash.")
+
+        iterations, salt, _ = passwd_hash[len(self.HASH_PREFIX):].split("$")
+
+        return int(iterations), base64.b64decode(salt.encode())
@@ -0,0 +1,163 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.revocation_store
+'''
+from fantastico.mvc.model_facade import ModelFacade
+from fantastico.mvc.models.model_filter import ModelFilter
+from fantastico.oauth2.models.revoked_tokens import RevokedToken
+from fantastico.utils.bloom_filter import BloomFilter
+import threading
+import time
+
+class RevocationStore(object):
+    '''This class provides an in memory index of revoked tokens (keyed by token id) which can be checked on every request
+    without accessing the database:
+
+        * a :py:class:`fantastico.utils.bloom_filter.BloomFilter` answers most lookups (tokens which were never revoked).
+        * an exact dictionary (token id -> expiration time) confirms the keys reported by the filter.
+
+    Revoked tokens are persisted (:py:class:`fantastico.oauth2.models.revoked_tokens.RevokedToken`) so that every process
+    learns about them: the store is synchronized from database every **sync_interval** seconds (only tokens revoked since
+    the previous synchronization are loaded). Each synchronization reads again the last **sync_overlap** seconds so that
+    revocations committed late (long transactions) or stamped by hosts whose clocks are behind are not missed. Entries are dropped once their token expiration time passes (the filter is
+    rebuilt from the remaining entries).
+
+    .. code-block:: python
+
+        store = RevocationStore()
+
+        if store.sync_due():
+            store.sync(db_conn)
+
+        store.revoke(db_conn, token.token_id, token.expiration_time)
+        store.is_revoked(token.token_id) # True'''
+
+    EXPECTED_ITEMS = 100000
+    FALSE_POSITIVE_RATE = 0.001
+    SYNC_INTERVAL = 30
+    SYNC_OVERLAP = 300
+    MAX_SYNC_RECORDS = 1000000
+
+    def __init__(self, expected_items=EXPECTED_ITEMS, false_positive_rate=FALSE_POSITIVE_RATE, sync_interval=SYNC_INTERVAL,
+                 sync_overlap=SYNC_OVERLAP, model_facade_cls=ModelFacade, time_provider=time):
+        self._expected_items = expected_items
+        self._false_positive_rate = false_positive_rate
+        self._sync_interval = sync_interval
+        self._sync_overlap = sync_overlap
+        self._model_facade_cls = model_facade_cls
+        self._time_provider = time_provider
+
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._revoked = {}
+        self._bloom = BloomFilter(expected_items, false_positive_rate)
+        self._next_sync = 0
+        self._last_sync = None
+
+    def __len__(self):
+        '''This method returns the number of revoked tokens currently held by the store (expired ones included until the next
+        synchronization).'''
+
+        return len(self._revoked)
+
+    def is_revoked(self, token_id):
+        '''This method returns True if the token with the given id is revoked and not expired yet.'''
+
+        if token_id is None or token_id not in self._bloom:
+            return False
+
+        expiration_time = self._revoked.get(token_id)
+
+        return expiration_time is not None and expiration_time >= self._time_provider.time()
+
+    def revoke(self, db_conn, token_id, expiration_time):
+        '''This method revokes the token with the given id until its expiration time. The revocation is persisted using the
+        given database connection so that other processes pick it up at their next synchronization.'''
+
+        if self.is_revoked(token_id):
+            return
+
+        model_facade = self._model_facade_cls(RevokedToken, db_conn)
+        model_facade.create(RevokedToken(token_id, expiration_time, int(self._time_provider.time())))
+
+        with self._lock:
+            self._add(token_id, expiration_time)
+
+    def sync_due(self):
+        '''This method returns True if the store must be synchronized from database.'''
+
+        return self._time_provider.time() >= self._next_sync
+
+    def sync(self, db_conn):
+        '''This method loads the tokens revoked since the previous synchronization minus the overlap window (all not expired
+        tokens for the first one) and drops expired entries. Concurrent synchronizations are skipped.'''
+
+        if not self._sync_lock.acquire(blocking=False):
+            return
+
+        try:
+            now = int(self._time_provider.time())
+            self._next_sync = now + self._sync_interval
+
+            if self._last_sync is None:
+                filter_expr = ModelFilter(RevokedToken.expiration_time, now, ModelFilter.GE)
+            else:
+                filter_expr = ModelFilter(RevokedToken.revocation_time, self._last_sync - self._sync_overlap,
+                                          ModelFilter.GE)
+
+            model_facade = self._model_facade_cls(RevokedToken, db_conn)
+
+            revoked_tokens = [(revoked_token.token_id, revoked_token.expiration_time)
+                              for revoked_token in model_facade.iter_records_paged(0, self.MAX_SYNC_RECORDS,
+                                                                                   filter_expr=filter_expr, batch_size=1000)]
+
+            with self._lock:
+                for token_id, expiration_time in revoked_tokens:
+                    self._add(token_id, expiration_time)
+
+                self._purge(now)
+
+            self._last_sync = now
+        finally:
+            self._sync_lock.release()
+
+    def _add(self, token_id, expiration_time):
+        '''This method adds the given token id into the exact index and into the bloom filter.'''
+
+        if token_id not in self._revoked:
+            self._bloom.add(token_id)
+
+        self._revoked[token_id] = expiration_time
+
+    def _purge(self, now):
+        '''This method drops the expired entries and rebuilds the bloom filter if any entry was dropped or if the filter holds
+        more keys than it was sized for.'''
+
+        revoked = {token_id: expiration_time for token_id, expiration_time in self._revoked.items()
+                   if expiration_time >= now}
+
+        if len(revoked) == len(self._revoked) and len(self._bloom) <= self._expected_items:
+            return
+
+        bloom = BloomFilter(max(self._expected_items, 2 * len(revoked)), self._false_positive_rate)
+
+        for token_id in revoked:
+            bloom.add(token_id)
+
+        self._revoked = revoked
+        self._bloom = bloom
+        self._expected_items = max(self._expected_items, 2 * len(revoked))
@@ -0,0 +1,87 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.scopes_registry
+'''
+import threading
+
+class ScopesRegistry(object):
+    '''This class provides a process wide registry which assigns a bit to each known scope. This allows scopes lists to be
+    represented as integer bitsets so that authorization checks become a single bitwise operation:
+
+    .. code-block:: python
+
+        registry = ScopesRegistry()
+
+        required = registry.register_all(["greet.read", "greet.verbose"])
+        granted = registry.get_bitset(["greet.read", "greet.verbose", "unknown.scope"])
+
+        granted & required == required # True
+
+    Only scopes required by resources and controllers are registered (:py:class:`fantastico.oauth2.oauth2_decorators.RequiredScopes`
+    registers them when it is instantiated). Scopes which are not registered are simply ignored when bitsets are obtained
+    because no requirement can reference them.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bits = {}
+
+    def __len__(self):
+        '''This method returns the number of registered scopes.'''
+
+        return len(self._bits)
+
+    def register(self, scope):
+        '''This method assigns the next available bit to the given scope (if not already registered) and returns it.'''
+
+        bit = self._bits.get(scope)
+
+        if bit is not None:
+            return bit
+
+        with self._lock:
+            bit = self._bits.get(scope)
+
+            if bit is None:
+                bit = self._bits[scope] = 1 << len(self._bits)
+
+        return bit
+
+    def register_all(self, scopes):
+        '''This method registers all given scopes and returns the bitset describing them.'''
+
+        bitset = 0
+
+        for scope in scopes or []:
+            bitset |= self.register(scope)
+
+        return bitset
+
+    def get_bitset(self, scopes):
+        '''This method returns the bitset describing the given scopes. Unknown scopes are ignored.'''
+
+        bits = self._bits
+        bitset = 0
+
+        for scope in scopes or []:
+            bitset |= bits.get(scope, 0)
+
+        return bitset
+
+    def get_scopes(self, bitset):
+        '''This method returns the sorted list of registered scopes described by the given bitset.'''
+
+        return sorted(scope for scope, bit in list(self._bits.items()) if bitset & bit)
@@ -0,0 +1,101 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.scrypt_passwords_hasher
+'''
+from fantastico.oauth2.passwords_hasher import PasswordsHasher
+import base64
+import hashlib
+import hmac
+import os
+
+class ScryptPasswordsHasher(PasswordsHasher):
+    '''This class provides the scrypt implementation for password hashing. It is deliberately slow and memory hard (the cost
+    is given by n, r and p parameters) so hashing must not happen on request threads (see
+    :py:attr:`fantastico.oauth2.passwords_hasher_factory.PasswordsHasherFactory.HASHING_EXECUTOR`). A random salt is generated
+    for each hash and stored, together with the cost parameters, in the hash itself:
+
+    .. code-block:: text
+
+        $scrypt$<n>$<r>$<p>$<base64 salt>$<base64 hash>
+
+    In order to use this hasher try the code snippet below:
+
+    .. code-block:: python
+
+        scrypt_hasher = PasswordsHasherFactory().get_hasher(PasswordsHasherFactory.SCRYPT)
+        hashed_passwd = scrypt_hasher.hash_password("abcd")
+        scrypt_hasher.verify_password("abcd", hashed_passwd) # True'''
+
+    HASH_PREFIX = "$scrypt$"
+    COST = 2 ** 14
+    BLOCK_SIZE = 8
+    PARALLELISM = 1
+    SALT_SIZE = 16
+    HASH_SIZE = 64
+
+    def __init__(self, cost=COST, block_size=BLOCK_SIZE, parallelism=PARALLELISM, salt_size=SALT_SIZE):
+        self._cost = cost
+        self._block_size = block_size
+        self._parallelism = parallelism
+        self._salt_size = salt_size
+
+    def hash_password(self, plain_passwd, hash_ctx=None):
+        '''This method hashes the given plain password using a new random salt. Hashing context is ignored.'''
+
+        salt = os.urandom(self._salt_size)
+
+        return self._build_hash(plain_passwd, salt, self._cost, self._block_size, self._parallelism)
+
+    def verify_password(self, plain_passwd, passwd_hash, hash_ctx=None):
+        '''This method hashes the given plain password using the salt and cost parameters stored in the given hash and
+        compares the result (in constant time) with the given hash.'''
+
+        try:
+            cost, block_size, parallelism, salt = self._parse_hash(passwd_hash)
+        except ValueError:
+            return False
+
+        return hmac.compare_digest(self._build_hash(plain_passwd, salt, cost, block_size, parallelism).encode(),
+                                   passwd_hash.encode())
+
+    def needs_rehash(self, passwd_hash):
+        '''This method returns True if the given hash was computed using other cost parameters than currently configured.'''
+
+        return self._parse_hash(passwd_hash)[:3] != (self._cost, self._block_size, self._parallelism)
+
+    def _build_hash(self, plain_passwd, salt, cost, block_size, parallelism):
+        '''This method computes the hash of the given plain password and encodes it together with the hashing parameters.'''
+
+        plain_passwd = (plain_passwd or "").strip()
+
+        hashed_passwd = hashlib.scrypt(plain_passwd.encode(), salt=salt, n=cost, r=block_size, p=parallelism,
+                                       maxmem=256 * cost * block_size * parallelism, dklen=self.HASH_SIZE)
+
+        return "%s%s$%s$%s$%s$%s" % (self.HASH_PREFIX, cost, block_size, parallelism, base64.b64encode(salt).decode(),
+                                     base64.b64encode(hashed_passwd).decode())
+
+    def _parse_hash(self, passwd_hash):
+        '''This method returns a tuple (cost, block size, parallelism, salt) from the given hash.
+
+        :raises ValueError: if the given hash was not generated by this hasher.'''
+
+        if not passwd_hash or not passwd_hash.startswith(self.HASH_PREFIX):
+            raise ValueError("Hash is not a scrypt hash.")
+
+        cost, block_size, parallelism, salt, _ = passwd_hash[len(self.HASH_PREFIX):].split("$")
+
+        return int(cost), int(block_size), int(parallelism), base64.b64decode(salt.encode())
@@ -16,6 +16,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.security_context
 '''
+from fantastico.oauth2.scopes_registry import ScopesRegistry
 
 class SecurityContext(object):
     '''This class provides the OAuth2 security context. Security context is available for each request and can be accessed
@@ -28,8 +29,12 @@ class SecurityContext(object):
            security_ctx = request.context.security
 
            # do something with security context
+
+    Access token scopes and required scopes are compared as integer bitsets obtained from :py:attr:`SCOPES_REGISTRY`.
     '''
 
+    SCOPES_REGISTRY = ScopesRegistry()
+
     @property
     def access_token(self):
         '''This property returns the current access token passed to the current http request. Access token is already decoded
@@ -46,27 +51,46 @@ class SecurityContext(object):
     def __init__(self, access_token, required_scopes=None):
         self._access_token = access_token
         self._required_scopes = required_scopes
+        self._access_token_bitset = None
+        self._registry_size = None
+
+    def _get_access_token_bitset(self):
+        '''This method returns the bitset of access token granted scopes. It is computed on first usage and recomputed
+        whenever new scopes were registered meanwhile (their bits were unknown when the bitset was computed).'''
+
+        registry_size = len(self.SCOPES_REGISTRY)
+
+        if self._registry_size != registry_size:
+            scopes = self._access_token.scopes if self._access_token else None
+
+            self._access_token_bitset = self.SCOPES_REGISTRY.get_bitset(scopes)
+            self._registry_size = registry_size
+
+        return self._access_token_bitset
+
+    def _get_required_bitset(self, attr_scope):
+        '''This method returns the bitset of required scopes for the given section. Required scopes objects which do not
+        provide bitsets are registered on the fly.'''
+
+        get_bitset = getattr(self._required_scopes, "get_bitset", None)
 
-        self._access_token_scopes = {}
-        if self._access_token:
-            self._access_token_scopes = {scope: True for scope in self._access_token.scopes}
+        if get_bitset is not None:
+            return get_bitset(attr_scope)
+
+        if attr_scope != "scopes":
+            attr_scope = "%s_scopes" % attr_scope
+
+        return self.SCOPES_REGISTRY.register_all(getattr(self._required_scopes, attr_scope))
 
     def validate_context(self, attr_scope="scopes"):
         '''This method tries to validate the current security context using the current access token and required scopes.
         Internally, the method simply ensures required scopes are present in access token granted scopes. Moreover, it receives
         an optional parameter which allows requester to decide what section of required scopes it wants to validates. Valid
-        values are: scopes, create_scopes, read_scopes, update_scopes or delete_scopes.'''
+        values are: scopes, create, read, update or delete.'''
 
         if not self._required_scopes:
             return True
 
-        if attr_scope != "scopes":
-            attr_scope = "%s_scopes" % attr_scope
-
-        required_scopes = getattr(self._required_scopes, attr_scope)
-
-        for scope in required_scopes:
-            if not self._access_token_scopes.get(scope):
-                return False
+        required_bitset = self._get_required_bitset(attr_scope)
 
-        return True
+        return self._get_access_token_bitset() & required_bitset == required_bitset
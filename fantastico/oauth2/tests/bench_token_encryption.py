@@ -0,0 +1,80 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. py:module:: fantastico.mvc.tests.bench_model_facade_paging
+.. py:module:: fantastico.oauth2.tests.bench_token_encryption
+
+This module provides a micro benchmark which compares the throughput (operations per second) of encoding / decoding an
+access token using the public format (:py:class:`fantastico.oauth2.token_encryption.PublicTokenEncryption` over
+:py:class:`fantastico.oauth2.token_encryption.AesTokenEncryption`), plain :py:class:`fantastico.oauth2.token_encryption.AesTokenEncryption`
+and the compact format (:py:class:`fantastico.oauth2.token_encryption.CompactTokenEncryption`). Encryption keys are given
+explicitly so no client descriptor is loaded.
+
+.. code-block:: bash
+
+    python -m fantastico.oauth2.tests.bench_token_encryption
+'''
+from Crypto import Random
+from fantastico.oauth2.token import Token
+from fantastico.oauth2.token_encryption import AesTokenEncryption, PublicTokenEncryption, CompactTokenEncryption
+import time
+import timeit
+
+def build_token():
+    '''This method builds the access token encoded / decoded by the benchmark.'''
+
+    creation_time = int(time.time())
+
+    return Token({"client_id": "11111111-1111-1111-1111-111111111111",
+                  "type": "access",
+                  "user_id": 1,
+                  "scopes": ["greet.verbose", "greet.read", "greet.write"],
+                  "creation_time": creation_time,
+                  "expiration_time": creation_time + 3600})
+
+def measure(operation, number, repeat):
+    '''This method returns the number of operations per second achieved by the given operation.'''
+
+    return number / min(timeit.repeat(operation, number=number, repeat=repeat))
+
+def run_benchmark(number=2000, repeat=5):
+    '''This method executes the benchmark and returns a list of tuples (encryptor name, token length, encode ops/sec,
+    decode ops/sec).'''
+
+    token = build_token()
+    token_iv = Random.new().read(16)
+    token_key = Random.new().read(16)
+
+    results = []
+
+    for encryptor_name, encryptor in [("aes", AesTokenEncryption()),
+                                      ("public", PublicTokenEncryption(AesTokenEncryption())),
+                                      ("compact", CompactTokenEncryption())]:
+        encrypted_str = encryptor.encrypt_token(token, token_iv, token_key)
+
+        if encryptor.decrypt_token(encrypted_str, token_iv, token_key).dictionary != token.dictionary:
+            raise AssertionError("%s encryptor does not preserve token attributes." % encryptor_name)
+
+        encode = lambda encryptor=encryptor: encryptor.encrypt_token(token, token_iv, token_key)
+        decode = lambda encryptor=encryptor, encrypted_str=encrypted_str: \
+                        encryptor.decrypt_token(encrypted_str, token_iv, token_key)
+
+        results.append((encryptor_name, len(encrypted_str), measure(encode, number, repeat), measure(decode, number, repeat)))
+
+    return results
+
+if __name__ == "__main__":
+    for bench_name, token_length, encode_ops, decode_ops in run_benchmark():
+        print("%-10s %4d chars %10.0f encode/s %10.0f decode/s" % (bench_name, token_length, encode_ops, decode_ops))
@@ -23,6 +23,7 @@ from fantastico.oauth2.exceptions import OAuth2InvalidTokenDescriptorError, OAut
 from fantastico.oauth2.models.clients import Client
 from fantastico.oauth2.models.scopes import Scope
 from fantastico.oauth2.token import Token
+from fantastico.oauth2.token_encryption import CompactTokenEncryption
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
 import time
@@ -71,6 +72,9 @@ class AccessTokenGeneratorTests(FantasticoUnitTestsCase):
         self.assertEqual(int(creation_time), token.creation_time)
         self.assertEqual(int(creation_time) + token_desc["expires_in"], token.expiration_time)
 
+        self.assertEqual(36, len(token.token_id))
+        self.assertNotEqual(token.token_id, self._generator.generate(token_desc, time_provider).token_id)
+
     def test_generate_noclientid(self):
         '''This test case ensures an exception is raised if no client id is specified.'''
 
@@ -226,6 +230,23 @@ class AccessTokenGeneratorTests(FantasticoUnitTestsCase):
         with self.assertRaises(OAuth2TokenExpiredError):
             self._generator.validate(token)
 
+    def test_validate_compact_header_expired(self):
+        '''This test case ensures an expired compact token is rejected using only its header (no decryption and no client
+        lookup).'''
+
+        token = Token({"client_id": "sample-app",
+                       "type": "access",
+                       "user_id": 1,
+                       "creation_time": int(time.time() - 7200),
+                       "expiration_time": int(time.time() - 3600)})
+
+        encrypted_str = CompactTokenEncryption().encrypt_token(token, b"1" * 16, b"2" * 16)
+
+        with self.assertRaises(OAuth2TokenExpiredError):
+            self._generator.validate(CompactTokenEncryption().read_header(encrypted_str))
+
+        self.assertEqual(0, self._model_facade.find_by_pk.call_count)
+
     def test_validate_token_clientrevoked(self):
         '''This test case ensures an expection is raised if the token client is not valid.'''
 
@@ -0,0 +1,211 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.tests.test_compact_tokenencryption
+'''
+from Crypto import Random
+from fantastico.oauth2.exceptions import OAuth2InvalidTokenDescriptorError, OAuth2TokenEncryptionError, \
+    OAuth2TokenExpiredError, OAuth2InvalidClientError
+from fantastico.oauth2.models.client_repository import ClientDescriptor
+from fantastico.oauth2.token import Token
+from fantastico.oauth2.token_encryption import CompactTokenEncryption
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from mock import Mock
+import base64
+
+class CompactTokenEncryptionTests(FantasticoUnitTestsCase):
+    '''This class provides the tests suite for compact binary token encryption.'''
+
+    _time_provider = None
+    _encryptor = None
+    _token_iv = None
+    _token_key = None
+    _token = None
+
+    def init(self):
+        '''This method is invoked automatically in order to setup common dependencies for all test cases.'''
+
+        self._time_provider = Mock()
+        self._time_provider.time = Mock(return_value=1380000000)
+
+        self._encryptor = CompactTokenEncryption(time_provider=self._time_provider)
+
+        self._token_iv = Random.new().read(16)
+        self._token_key = Random.new().read(16)
+
+        self._token = Token({"client_id": "11111111-1111-1111-1111-111111111111",
+                             "type": "access",
+                             "user_id": 1,
+                             "scopes": ["greet.verbose", "greet.read"],
+                             "creation_time": 1380000000,
+                             "expiration_time": 1380003600})
+
+    def test_encrypt_decrypt_ok(self):
+        '''This test case ensures compact tokens can be decrypted back for all supported key lengths.'''
+
+        for key_length in [16, 24, 32]:
+            token_key = Random.new().read(key_length)
+
+            encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, token_key)
+
+            self.assertNotIn("=", encrypted_str)
+
+            token = self._encryptor.decrypt_token(encrypted_str, self._token_iv, token_key)
+
+            self.assertEqual(self._token.dictionary, token.dictionary)
+
+    def test_encrypt_random_nonce(self):
+        '''This test case ensures the same token encrypted twice has different representations (random nonce).'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+
+        self.assertNotEqual(encrypted_str, self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key))
+
+    def test_read_header_ok(self):
+        '''This test case ensures public token attributes are read without knowing the encryption keys.'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+
+        token = self._encryptor.read_header(encrypted_str)
+
+        self.assertEqual({"client_id": self._token.client_id,
+                          "type": self._token.type,
+                          "expiration_time": self._token.expiration_time}, token.dictionary)
+
+    def test_decrypt_expired_nokeys(self):
+        '''This test case ensures expired tokens are rejected before loading client keys.'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+
+        self._time_provider.time = Mock(return_value=self._token.expiration_time + 1)
+
+        client_repo = Mock()
+
+        with self.assertRaises(OAuth2TokenExpiredError):
+            self._encryptor.decrypt_token(encrypted_str, client_repo=client_repo)
+
+        self.assertEqual(0, client_repo.load_descriptor.call_count)
+
+    def test_encrypt_decrypt_clientrepo(self):
+        '''This test case ensures encryption keys are loaded from client descriptor if they are not given.'''
+
+        client_repo = Mock()
+        client_repo.load_descriptor = Mock(return_value=ClientDescriptor({"token_iv": self._token_iv,
+                                                                          "token_key": self._token_key}))
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, client_repo=client_repo)
+        token = self._encryptor.decrypt_token(encrypted_str, client_repo=client_repo)
+
+        self.assertEqual(self._token.dictionary, token.dictionary)
+
+        client_repo.load_descriptor.assert_called_with(self._token.client_id)
+        self.assertEqual(2, client_repo.load_descriptor.call_count)
+
+    def test_decrypt_clientrepo_ex(self):
+        '''This test case ensures an invalid client error is raised if client keys can not be loaded.'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+
+        client_repo = Mock()
+        client_repo.load_descriptor = Mock(side_effect=Exception("Unexpected exception."))
+
+        with self.assertRaises(OAuth2InvalidClientError):
+            self._encryptor.decrypt_token(encrypted_str, client_repo=client_repo)
+
+    def test_decrypt_tampered(self):
+        '''This test case ensures tokens with a tampered header or payload are rejected.'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+        raw_token = base64.urlsafe_b64decode(encrypted_str + "=" * (-len(encrypted_str) % 4))
+
+        for idx in [5, 7, len(raw_token) - 20]:
+            tampered_token = bytearray(raw_token)
+            tampered_token[idx] ^= 1
+            tampered_str = base64.urlsafe_b64encode(bytes(tampered_token)).decode()
+
+            with self.assertRaises(OAuth2TokenEncryptionError):
+                self._encryptor.decrypt_token(tampered_str, self._token_iv, self._token_key)
+
+    def test_decrypt_wrongkey(self):
+        '''This test case ensures tokens can not be decrypted using another client key.'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+
+        with self.assertRaises(OAuth2TokenEncryptionError):
+            self._encryptor.decrypt_token(encrypted_str, self._token_iv, Random.new().read(16))
+
+    def test_decrypt_invalid_format(self):
+        '''This test case ensures strings which are not compact tokens are rejected.'''
+
+        for encrypted_str in ["abc", base64.urlsafe_b64encode(b"\x09\x01\x00\x00\x00\x00\x00" + b"a" * 40).decode()]:
+            with self.assertRaises(OAuth2TokenEncryptionError):
+                self._encryptor.decrypt_token(encrypted_str, self._token_iv, self._token_key)
+
+        for encrypted_str in [None, "", "   "]:
+            with self.assertRaises(OAuth2InvalidTokenDescriptorError):
+                self._encryptor.decrypt_token(encrypted_str, self._token_iv, self._token_key)
+
+    def test_gcm_unsupported(self):
+        '''This test case ensures compact token encryptor can not be built when AES GCM mode is not available (legacy
+        pycrypto).'''
+
+        aes_module = Mock(spec=["new", "MODE_CBC"])
+
+        with self.assertRaises(OAuth2TokenEncryptionError) as ctx:
+            CompactTokenEncryption(time_provider=self._time_provider, aes_module=aes_module)
+
+        self.assertTrue(str(ctx.exception).find("pycryptodome") > -1)
+
+    def test_decrypt_cipher_ex(self):
+        '''This test case ensures all cipher failures raised while decrypting a compact token are converted to token
+        encryption errors.'''
+
+        encrypted_str = self._encryptor.encrypt_token(self._token, self._token_iv, self._token_key)
+
+        aes_module = Mock()
+        aes_module.new = Mock(side_effect=TypeError("nonce is not supported"))
+
+        encryptor = CompactTokenEncryption(time_provider=self._time_provider, aes_module=aes_module)
+
+        with self.assertRaises(OAuth2TokenEncryptionError) as ctx:
+            encryptor.decrypt_token(encrypted_str, self._token_iv, self._token_key)
+
+        self.assertTrue(str(ctx.exception).find("nonce is not supported") > -1)
+
+        self.assertRaises(OAuth2TokenEncryptionError, encryptor.encrypt_token, *[self._token, self._token_iv, self._token_key])
+
+    def test_encrypt_unsupported_type(self):
+        '''This test case ensures tokens of unknown types can not be encrypted.'''
+
+        token = Token({"client_id": "11111111-1111-1111-1111-111111111111",
+                       "type": "code",
+                       "expiration_time": 1380003600})
+
+        with self.assertRaises(OAuth2TokenEncryptionError):
+            self._encryptor.encrypt_token(token, self._token_iv, self._token_key)
+
+    def test_encrypt_missing_args(self):
+        '''This test case ensures encrypt fails if token or encryption keys are missing.'''
+
+        with self.assertRaises(OAuth2InvalidTokenDescriptorError) as ctx:
+            self._encryptor.encrypt_token(None)
+
+        self.assertEqual("token", ctx.exception.attr_name)
+
+        with self.assertRaises(OAuth2InvalidTokenDescriptorError) as ctx:
+            self._encryptor.encrypt_token(self._token, self._token_iv)
+
+        self.assertEqual("token_key", ctx.exception.attr_name)
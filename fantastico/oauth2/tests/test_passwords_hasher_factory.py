@@ -16,10 +16,14 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.tests.test_passwords_hasher_factory
 '''
+from fantastico.exceptions import FantasticoExecutorBusyError
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from fantastico.oauth2.passwords_hasher_factory import PasswordsHasherFactory
+from fantastico.oauth2.pbkdf2_passwords_hasher import Pbkdf2PasswordsHasher
+from fantastico.oauth2.scrypt_passwords_hasher import ScryptPasswordsHasher
 from fantastico.oauth2.sha512salt_passwords_hasher import Sha512SaltPasswordsHasher
-from fantastico.oauth2.exceptions import OAuth2TokenEncryptionError
+from fantastico.oauth2.exceptions import OAuth2TokenEncryptionError, OAuth2TemporarilyUnavailableError
+from mock import Mock
 
 class PasswordsHasherFactoryTests(FantasticoUnitTestsCase):
     '''This class provides the tests suite which ensures passwords hasher factory correct behavior.'''
@@ -43,3 +47,46 @@ class PasswordsHasherFactoryTests(FantasticoUnitTestsCase):
 
         with self.assertRaises(OAuth2TokenEncryptionError):
             self._factory.get_hasher("unknown algorithm")
+
+    def test_slow_hashers_get(self):
+        '''This test case ensures pbkdf2 and scrypt passwords hashers can be instantiated using the factory.'''
+
+        self.assertIsInstance(self._factory.get_hasher(PasswordsHasherFactory.PBKDF2_SHA256), Pbkdf2PasswordsHasher)
+        self.assertIsInstance(self._factory.get_hasher(PasswordsHasherFactory.SCRYPT), ScryptPasswordsHasher)
+
+    def test_detect_hash_alg(self):
+        '''This test case ensures the algorithm of a stored hash is correctly detected (legacy hashes are sha512 with salt).'''
+
+        for passwd_hash, hash_alg in [("$pbkdf2-sha256$1000$c2FsdA==$aGFzaA==", PasswordsHasherFactory.PBKDF2_SHA256),
+                                      ("$scrypt$16384$8$1$c2FsdA==$aGFzaA==", PasswordsHasherFactory.SCRYPT),
+                                      ("$unknown$c2FsdA==", PasswordsHasherFactory.SHA512_SALT),
+                                      ("MTIzNDU2Nzg5MA==", PasswordsHasherFactory.SHA512_SALT),
+                                      (None, PasswordsHasherFactory.SHA512_SALT)]:
+            self.assertEqual(hash_alg, self._factory.detect_hash_alg(passwd_hash))
+
+    def test_run_hashing_ok(self):
+        '''This test case ensures hashing operations are executed on the hashing executor.'''
+
+        executor = Mock()
+        executor.run = Mock(return_value="hash")
+
+        self._factory.HASHING_EXECUTOR = executor
+
+        hasher = self._factory.get_hasher(PasswordsHasherFactory.SHA512_SALT)
+
+        self.assertEqual("hash", self._factory.run_hashing(hasher.hash_password, "abcd"))
+
+        executor.run.assert_called_once_with(hasher.hash_password, "abcd")
+
+    def test_run_hashing_busy(self):
+        '''This test case ensures a busy hashing executor is reported as a temporarily unavailable oauth2 error (503).'''
+
+        executor = Mock()
+        executor.run = Mock(side_effect=FantasticoExecutorBusyError("Executor is busy."))
+
+        self._factory.HASHING_EXECUTOR = executor
+
+        with self.assertRaises(OAuth2TemporarilyUnavailableError) as ctx:
+            self._factory.run_hashing(Mock(), "abcd")
+
+        self.assertEqual(503, ctx.exception.http_code)
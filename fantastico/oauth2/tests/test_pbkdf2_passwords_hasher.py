@@ -0,0 +1,65 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.tests.test_pbkdf2_passwords_hasher
+'''
+from fantastico.oauth2.pbkdf2_passwords_hasher import Pbkdf2PasswordsHasher
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from fantastico.utils.dictionary_object import DictionaryObject
+
+class Pbkdf2PasswordsHasherTests(FantasticoUnitTestsCase):
+    '''This class provides the tests suite for pbkdf2-sha256 hashing provider.'''
+
+    _hasher = None
+
+    def init(self):
+        '''This method is invoked automatically in order to setup common dependencies for all test cases.'''
+
+        self._hasher = Pbkdf2PasswordsHasher(iterations=1000)
+
+    def test_hash_ok(self):
+        '''This test case ensures hashes contain the hashing parameters and a random salt.'''
+
+        passwd_hash = self._hasher.hash_password("abc123test", DictionaryObject({"salt": 123}))
+
+        self.assertTrue(passwd_hash.startswith("$pbkdf2-sha256$1000$"))
+        self.assertEqual(4, len(passwd_hash.split("$")[1:]))
+        self.assertNotEqual(passwd_hash, self._hasher.hash_password("abc123test"))
+
+    def test_verify_ok(self):
+        '''This test case ensures plain passwords are verified using the parameters stored in the hash.'''
+
+        passwd_hash = self._hasher.hash_password("abc123test")
+
+        self.assertTrue(self._hasher.verify_password("abc123test", passwd_hash))
+        self.assertTrue(self._hasher.verify_password("  abc123test ", passwd_hash))
+        self.assertTrue(Pbkdf2PasswordsHasher(iterations=2000).verify_password("abc123test", passwd_hash))
+        self.assertFalse(self._hasher.verify_password("abc123tesx", passwd_hash))
+
+    def test_verify_invalidhash(self):
+        '''This test case ensures hashes generated by other algorithms never match.'''
+
+        for passwd_hash in [None, "", "MTIzNDU2Nzg5MA==", "$scrypt$16384$8$1$c2FsdA==$aGFzaA=="]:
+            self.assertFalse(self._hasher.verify_password("abc123test", passwd_hash))
+
+    def test_needs_rehash(self):
+        '''This test case ensures hashes computed with fewer iterations than configured must be recomputed.'''
+
+        passwd_hash = self._hasher.hash_password("abc123test")
+
+        self.assertFalse(self._hasher.needs_rehash(passwd_hash))
+        self.assertFalse(Pbkdf2PasswordsHasher(iterations=500).needs_rehash(passwd_hash))
+        self.assertTrue(Pbkdf2PasswordsHasher(iterations=2000).needs_rehash(passwd_hash))
@@ -19,7 +19,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 
 from fantastico.oauth2.exceptions import OAuth2InvalidTokenDescriptorError, OAuth2Error, OAuth2TokenEncryptionError, \
     OAuth2InvalidClientError
-from fantastico.oauth2.models.clients import Client
+from fantastico.oauth2.models.client_repository import ClientDescriptor
 from fantastico.oauth2.token import Token
 from fantastico.oauth2.token_encryption import PublicTokenEncryption
 from fantastico.tests.base_case import FantasticoUnitTestsCase
@@ -128,11 +128,10 @@ class PublicTokenEncryptionTests(FantasticoUnitTestsCase):
               "type": "access",
               "attr1": "cool-attr"})
 
-        client = Client(token_iv=base64.b64encode(token_iv).decode(),
-                        token_key=base64.b64encode(token_key).decode())
+        client = ClientDescriptor({"token_iv": token_iv, "token_key": token_key})
 
         client_repo = Mock()
-        client_repo.load = Mock(return_value=client)
+        client_repo.load_descriptor = Mock(return_value=client)
 
         self._symmetric_encryptor.encrypt_token = Mock(return_value="test")
 
@@ -149,14 +148,14 @@ class PublicTokenEncryptionTests(FantasticoUnitTestsCase):
         self.assertEqual(token.type, public_token.get("type"))
         self.assertEqual("test", public_token.get("encrypted"))
 
-        client_repo.load.assert_called_once_with(token.client_id)
+        client_repo.load_descriptor.assert_called_once_with(token.client_id)
         self._symmetric_encryptor.encrypt_token.assert_called_once_with(token, token_iv, token_key)
 
     def test_encrypt_clientrepo_ex(self):
         '''This test case ensures all client repo exceptions are casted to oauth2 concrete exceptions.'''
 
         client_repo = Mock()
-        client_repo.load = Mock(side_effect=Exception("Unexpected exception."))
+        client_repo.load_descriptor = Mock(side_effect=Exception("Unexpected exception."))
 
         with self.assertRaises(OAuth2InvalidClientError):
             self._public_encryptor.encrypt_token(Token({"client_id": "mock-client"}), client_repo=client_repo)
@@ -247,11 +246,10 @@ class PublicTokenEncryptionTests(FantasticoUnitTestsCase):
         encrypted_str = base64.b64encode(json.dumps(token_desc).encode())
         encrypted_token = Token(encrypted_token_desc)
 
-        client = Client(token_iv=base64.b64encode(token_iv).decode(),
-                        token_key=base64.b64encode(token_key).decode())
+        client = ClientDescriptor({"token_iv": token_iv, "token_key": token_key})
 
         client_repo = Mock()
-        client_repo.load = Mock(return_value=client)
+        client_repo.load_descriptor = Mock(return_value=client)
 
         self._symmetric_encryptor.decrypt_token = Mock(return_value=encrypted_token)
 
@@ -260,7 +258,7 @@ class PublicTokenEncryptionTests(FantasticoUnitTestsCase):
         self.assertIsNotNone(token)
         self.assertEqual(encrypted_token, token)
 
-        client_repo.load.assert_called_once_with(token_desc["client_id"])
+        client_repo.load_descriptor.assert_called_once_with(token_desc["client_id"])
         self._symmetric_encryptor.decrypt_token.assert_called_once_with("abc", token_iv, token_key)
 
     def test_decrypt_client_repo_ex(self):
@@ -273,7 +271,7 @@ class PublicTokenEncryptionTests(FantasticoUnitTestsCase):
         encrypted_str = base64.b64encode(json.dumps(token_desc).encode()).decode()
 
         client_repo = Mock()
-        client_repo.load = Mock(side_effect=Exception("Unexpected exception."))
+        client_repo.load_descriptor = Mock(side_effect=Exception("Unexpected exception."))
 
         with self.assertRaises(OAuth2InvalidClientError):
             self._public_encryptor.decrypt_token(encrypted_str, client_repo=client_repo)
@@ -92,6 +92,19 @@ class RequiredScopesTests(FantasticoUnitTestsCase):
 
         self.assertEqual(required_scopes, resource.get_required_scopes())
 
+    def test_roa_scopes_bitsets(self):
+        '''This test case ensures required scopes are registered and exposed as bitsets for each section.'''
+
+        required_scopes = MockRoaResource.get_required_scopes()
+        registry = SecurityContext.SCOPES_REGISTRY
+
+        for attr_scope in ["create", "read", "update", "delete"]:
+            bitset = required_scopes.get_bitset(attr_scope)
+
+            self.assertEqual(["sample.%s" % attr_scope], registry.get_scopes(bitset))
+
+        self.assertEqual(required_scopes.scopes, registry.get_scopes(required_scopes.get_bitset()))
+
     def _test_required_scopes_method(self, method, expected_scopes):
         '''This method provides a template test case for invoking and asserting result of a method decorated with
         @RequiredScopes.'''
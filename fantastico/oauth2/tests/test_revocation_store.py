@@ -0,0 +1,160 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.tests.test_revocation_store
+'''
+from fantastico.mvc.models.model_filter import ModelFilter
+from fantastico.oauth2.models.revoked_tokens import RevokedToken
+from fantastico.oauth2.revocation_store import RevocationStore
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from mock import Mock
+
+class RevocationStoreTests(FantasticoUnitTestsCase):
+    '''This class provides the tests suite for revoked tokens in memory index.'''
+
+    _db_conn = None
+    _model_facade = None
+    _model_facade_cls = None
+    _time_provider = None
+    _store = None
+
+    def init(self):
+        '''This method is invoked automatically in order to setup common dependencies for all test cases.'''
+
+        self._db_conn = Mock()
+
+        self._model_facade = Mock()
+        self._model_facade.iter_records_paged = Mock(return_value=[])
+        self._model_facade_cls = Mock(return_value=self._model_facade)
+
+        self._time_provider = Mock()
+        self._time_provider.time = Mock(return_value=1000)
+
+        self._store = RevocationStore(expected_items=10, sync_interval=30, sync_overlap=60,
+                                      model_facade_cls=self._model_facade_cls,
+                                      time_provider=self._time_provider)
+
+    def test_revoke_ok(self):
+        '''This test case ensures revoked tokens are persisted and reported as revoked until they expire.'''
+
+        self.assertFalse(self._store.is_revoked("token-1"))
+        self.assertFalse(self._store.is_revoked(None))
+
+        self._store.revoke(self._db_conn, "token-1", 1060)
+        self._store.revoke(self._db_conn, "token-1", 1060)
+
+        self.assertTrue(self._store.is_revoked("token-1"))
+        self.assertFalse(self._store.is_revoked("token-2"))
+
+        self._model_facade_cls.assert_called_once_with(RevokedToken, self._db_conn)
+        self.assertEqual(1, self._model_facade.create.call_count)
+
+        revoked_token = self._model_facade.create.call_args[0][0]
+        self.assertEqual(("token-1", 1060, 1000),
+                         (revoked_token.token_id, revoked_token.expiration_time, revoked_token.revocation_time))
+
+        self._time_provider.time = Mock(return_value=1061)
+
+        self.assertFalse(self._store.is_revoked("token-1"))
+
+    def test_revoke_db_ex(self):
+        '''This test case ensures tokens are not revoked in memory if they can not be persisted.'''
+
+        self._model_facade.create = Mock(side_effect=Exception("Unexpected exception."))
+
+        with self.assertRaises(Exception):
+            self._store.revoke(self._db_conn, "token-1", 1060)
+
+        self.assertFalse(self._store.is_revoked("token-1"))
+
+    def test_sync_ok(self):
+        '''This test case ensures the first synchronization loads all not expired revoked tokens and the next ones load only
+        tokens revoked since previous synchronization (including the overlap window).'''
+
+        self.assertTrue(self._store.sync_due())
+
+        self._model_facade.iter_records_paged = Mock(return_value=[RevokedToken("token-1", 1060, 990),
+                                                                    RevokedToken("token-2", 1100, 995)])
+
+        self._store.sync(self._db_conn)
+
+        self.assertTrue(self._store.is_revoked("token-1"))
+        self.assertTrue(self._store.is_revoked("token-2"))
+        self.assertFalse(self._store.sync_due())
+
+        filter_expr = self._model_facade.iter_records_paged.call_args[1]["filter_expr"]
+        self.assertEqual((RevokedToken.expiration_time, 1000, ModelFilter.GE),
+                         (filter_expr.column, filter_expr.ref_value, filter_expr.operation))
+
+        self._time_provider.time = Mock(return_value=1030)
+        self.assertTrue(self._store.sync_due())
+
+        self._model_facade.iter_records_paged = Mock(return_value=[RevokedToken("token-3", 1200, 1020)])
+
+        self._store.sync(self._db_conn)
+
+        self.assertTrue(self._store.is_revoked("token-3"))
+
+        filter_expr = self._model_facade.iter_records_paged.call_args[1]["filter_expr"]
+        self.assertEqual((RevokedToken.revocation_time, 940, ModelFilter.GE),
+                         (filter_expr.column, filter_expr.ref_value, filter_expr.operation))
+
+    def test_sync_late_revocation(self):
+        '''This test case ensures revocations committed after a synchronization but stamped before it (long transactions,
+        clocks behind) are loaded by the next synchronization.'''
+
+        self._store.sync(self._db_conn)
+
+        self._time_provider.time = Mock(return_value=1030)
+
+        self._model_facade.iter_records_paged = Mock(return_value=[RevokedToken("token-1", 1200, 990),
+                                                                    RevokedToken("token-2", 1200, 1025)])
+
+        self._store.sync(self._db_conn)
+
+        self.assertTrue(self._store.is_revoked("token-1"))
+        self.assertTrue(self._store.is_revoked("token-2"))
+        self.assertEqual(2, len(self._store))
+
+        filter_expr = self._model_facade.iter_records_paged.call_args[1]["filter_expr"]
+        self.assertEqual(940, filter_expr.ref_value)
+
+    def test_sync_purge_expired(self):
+        '''This test case ensures expired entries are dropped during synchronization.'''
+
+        self._store.revoke(self._db_conn, "token-1", 1060)
+        self._store.revoke(self._db_conn, "token-2", 1100)
+
+        self._time_provider.time = Mock(return_value=1070)
+
+        self._store.sync(self._db_conn)
+
+        self.assertEqual(1, len(self._store))
+        self.assertFalse(self._store.is_revoked("token-1"))
+        self.assertTrue(self._store.is_revoked("token-2"))
+
+    def test_sync_grow_filter(self):
+        '''This test case ensures the bloom filter is resized when the store holds more tokens than expected.'''
+
+        self._model_facade.iter_records_paged = Mock(return_value=[RevokedToken("token-%s" % idx, 1060, 990)
+                                                                    for idx in range(50)])
+
+        self._store.sync(self._db_conn)
+
+        self.assertEqual(50, len(self._store))
+
+        for idx in range(50):
+            self.assertTrue(self._store.is_revoked("token-%s" % idx))
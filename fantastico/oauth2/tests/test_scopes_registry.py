@@ -0,0 +1,61 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.tests.test_scopes_registry
+'''
+from fantastico.oauth2.scopes_registry import ScopesRegistry
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+
+class ScopesRegistryTests(FantasticoUnitTestsCase):
+    '''This class provides the tests suite for ScopesRegistry class.'''
+
+    _registry = None
+
+    def init(self):
+        '''This method is invoked automatically in order to setup common dependencies for all test cases.'''
+
+        self._registry = ScopesRegistry()
+
+    def test_register_ok(self):
+        '''This test case ensures each scope receives a distinct bit which is kept on subsequent registrations.'''
+
+        self.assertEqual(1, self._registry.register("scope1"))
+        self.assertEqual(2, self._registry.register("scope2"))
+        self.assertEqual(1, self._registry.register("scope1"))
+        self.assertEqual(2, len(self._registry))
+
+        self.assertEqual(5, self._registry.register_all(["scope1", "scope3", "scope3"]))
+        self.assertEqual(0, self._registry.register_all(None))
+        self.assertEqual(3, len(self._registry))
+
+    def test_get_bitset_unknown(self):
+        '''This test case ensures unknown scopes are ignored when bitsets are obtained and they are never registered.'''
+
+        self._registry.register_all(["scope1", "scope2"])
+
+        self.assertEqual(2, self._registry.get_bitset(["scope2", "unknown"]))
+        self.assertEqual(0, self._registry.get_bitset(["unknown"]))
+        self.assertEqual(0, self._registry.get_bitset(None))
+        self.assertEqual(2, len(self._registry))
+
+    def test_get_scopes(self):
+        '''This test case ensures bitsets can be converted back to the scopes they describe.'''
+
+        bitset = self._registry.register_all(["scope2", "scope1"])
+        self._registry.register("scope3")
+
+        self.assertEqual(["scope1", "scope2"], self._registry.get_scopes(bitset))
+        self.assertEqual([], self._registry.get_scopes(0))
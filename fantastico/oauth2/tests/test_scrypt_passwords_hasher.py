@@ -0,0 +1,60 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.oauth2.tests.test_scrypt_passwords_hasher
+'''
+from fantastico.oauth2.scrypt_passwords_hasher import ScryptPasswordsHasher
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+
+class ScryptPasswordsHasherTests(FantasticoUnitTestsCase):
+    '''This class provides the tests suite for scrypt hashing provider.'''
+
+    _hasher = None
+
+    def init(self):
+        '''This method is invoked automatically in order to setup common dependencies for all test cases.'''
+
+        self._hasher = ScryptPasswordsHasher(cost=2 ** 10)
+
+    def test_hash_ok(self):
+        '''This test case ensures hashes contain the hashing parameters and a random salt.'''
+
+        passwd_hash = self._hasher.hash_password("abc123test")
+
+        self.assertTrue(passwd_hash.startswith("$scrypt$1024$8$1$"))
+        self.assertEqual(6, len(passwd_hash.split("$")[1:]))
+        self.assertNotEqual(passwd_hash, self._hasher.hash_password("abc123test"))
+
+    def test_verify_ok(self):
+        '''This test case ensures plain passwords are verified using the parameters stored in the hash.'''
+
+        passwd_hash = self._hasher.hash_password("abc123test")
+
+        self.assertTrue(self._hasher.verify_password("abc123test", passwd_hash))
+        self.assertTrue(ScryptPasswordsHasher(cost=2 ** 11).verify_password("abc123test", passwd_hash))
+        self.assertFalse(self._hasher.verify_password("abc123tesx", passwd_hash))
+
+        for passwd_hash in [None, "MTIzNDU2Nzg5MA==", "$pbkdf2-sha256$1000$c2FsdA==$aGFzaA=="]:
+            self.assertFalse(self._hasher.verify_password("abc123test", passwd_hash))
+
+    def test_needs_rehash(self):
+        '''This test case ensures hashes computed with other cost parameters than configured must be recomputed.'''
+
+        passwd_hash = self._hasher.hash_password("abc123test")
+
+        self.assertFalse(self._hasher.needs_rehash(passwd_hash))
+        self.assertTrue(ScryptPasswordsHasher(cost=2 ** 11).needs_rehash(passwd_hash))
+        self.assertTrue(ScryptPasswordsHasher(cost=2 ** 10, block_size=16).needs_rehash(passwd_hash))
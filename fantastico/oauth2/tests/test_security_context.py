@@ -20,6 +20,7 @@ from fantastico.oauth2.oauth2_decorators import RequiredScopes
 from fantastico.oauth2.security_context import SecurityContext
 from fantastico.oauth2.token import Token
 from fantastico.tests.base_case import FantasticoUnitTestsCase
+from mock import Mock
 
 class SecurityContextTests(FantasticoUnitTestsCase):
     '''This class provides the tests suite for SecurityContext class.'''
@@ -57,6 +58,49 @@ class SecurityContextTests(FantasticoUnitTestsCase):
             security_ctx = SecurityContext(access_token, required_scopes_obj)
             self.assertFalse(security_ctx.validate_context(attr_scope))
 
+    def test_validate_context_unknown_scopes(self):
+        '''This test case ensures access token scopes which are not required by any resource are ignored.'''
+
+        access_token = Token({"scopes": ["scope1", "security_ctx.unknown.scope"]})
+        security_ctx = SecurityContext(access_token, RequiredScopes(read="scope1", update=["scope1", "scope2"]))
+
+        self.assertTrue(security_ctx.validate_context("read"))
+        self.assertFalse(security_ctx.validate_context("update"))
+        self.assertEqual(0, SecurityContext.SCOPES_REGISTRY.get_bitset(["security_ctx.unknown.scope"]))
+
+    def test_validate_context_scopes_registered_later(self):
+        '''This test case ensures the access token bitset is recomputed when scopes of another section are registered after
+        the first validation.'''
+
+        required_scopes = Mock(spec=["read_scopes", "update_scopes"])
+        required_scopes.read_scopes = ["security_ctx.later.read"]
+        required_scopes.update_scopes = ["security_ctx.later.update"]
+
+        access_token = Token({"scopes": ["security_ctx.later.read", "security_ctx.later.update"]})
+        security_ctx = SecurityContext(access_token, required_scopes)
+
+        self.assertTrue(security_ctx.validate_context("read"))
+        self.assertTrue(security_ctx.validate_context("update"))
+
+    def test_validate_context_noaccesstoken(self):
+        '''This test case ensures a security context without access token is invalid when scopes are required.'''
+
+        security_ctx = SecurityContext(None, self._mock_required_scopes_obj("scopes", ["scope1"]))
+
+        self.assertFalse(security_ctx.validate_context())
+
+    def test_validate_context_plain_requiredscopes(self):
+        '''This test case ensures required scopes objects which do not provide bitsets are still validated.'''
+
+        required_scopes = Mock(spec=["scopes", "update_scopes"])
+        required_scopes.scopes = ["scope1", "security_ctx.plain.scope"]
+        required_scopes.update_scopes = ["scope1"]
+
+        security_ctx = SecurityContext(Token({"scopes": ["scope1"]}), required_scopes)
+
+        self.assertTrue(security_ctx.validate_context("update"))
+        self.assertFalse(security_ctx.validate_context())
+
     def _mock_required_scopes_obj(self, attr_scopes, required_scopes):
         '''This method builds a mock RequiredScopes which returns for the given attribute the list defined.'''
 
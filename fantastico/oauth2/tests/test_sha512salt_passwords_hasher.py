@@ -60,3 +60,16 @@ class Sha512SaltPasswordsHasherTests(FantasticoUnitTestsCase):
         for hash_ctx in [None, {}, {"unknown_attr": "sample value"}]:
             passwd = self._hasher.hash_password("123", DictionaryObject(hash_ctx))
             self.assertEqual(passwd, self._hasher.hash_password("123", DictionaryObject({"salt": 9999})))
+
+    def test_verify_ok(self):
+        '''This test case ensures plain passwords are verified against sha512 with salt hashes and these hashes never need to
+        be recomputed.'''
+
+        hash_ctx = DictionaryObject({"salt": 123})
+        passwd_hash = self._hasher.hash_password("abc123test", hash_ctx)
+
+        self.assertTrue(self._hasher.verify_password("abc123test", passwd_hash, hash_ctx))
+        self.assertFalse(self._hasher.verify_password("abc123test", passwd_hash))
+        self.assertFalse(self._hasher.verify_password("abc123tesx", passwd_hash, hash_ctx))
+        self.assertFalse(self._hasher.verify_password("abc123test", None, hash_ctx))
+        self.assertFalse(self._hasher.needs_rehash(passwd_hash))
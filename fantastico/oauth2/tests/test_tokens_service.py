@@ -16,13 +16,14 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.tests.test_tokens_service.TokensService
 '''
-from fantastico.oauth2.exceptions import OAuth2Error, OAuth2InvalidTokenTypeError, OAuth2InvalidClientError
-from fantastico.oauth2.models.clients import Client
+from fantastico.oauth2.exceptions import OAuth2Error, OAuth2InvalidTokenTypeError, OAuth2InvalidClientError, \
+    OAuth2TokenEncryptionError
+from fantastico.oauth2.models.client_repository import ClientDescriptor
 from fantastico.oauth2.token import Token
+from fantastico.oauth2.token_encryption import PublicTokenEncryption, CompactTokenEncryption
 from fantastico.oauth2.tokens_service import TokensService
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
-import base64
 
 class TokensServiceTests(FantasticoUnitTestsCase):
     '''This class provides the tests suite for tokens service implementation.'''
@@ -206,6 +207,39 @@ class TokensServiceTests(FantasticoUnitTestsCase):
         self._tokens_factory.get_generator.assert_called_once_with(token.type, self._db_conn)
         self._tokens_generator.invalidate.assert_called_once_with(token)
 
+    def test_invalidate_cached_token(self):
+        '''This test case ensures validated tokens cache is not scanned when a token is invalidated: cached tokens are
+        rejected by the revocation store.'''
+
+        token = Token({"token_id": "token-1", "type": "access", "client_id": "sample-client", "expiration_time": 1060})
+
+        validated_tokens, revoked_tokens = TokensService.VALIDATED_TOKENS, TokensService.REVOKED_TOKENS
+        TokensService.VALIDATED_TOKENS, TokensService.REVOKED_TOKENS = Mock(), Mock()
+
+        try:
+            self._tokens_service.invalidate(token)
+
+            self.assertEqual([], TokensService.VALIDATED_TOKENS.mock_calls)
+            TokensService.REVOKED_TOKENS.revoke.assert_called_once_with(self._db_conn, "token-1", 1060)
+        finally:
+            TokensService.VALIDATED_TOKENS, TokensService.REVOKED_TOKENS = validated_tokens, revoked_tokens
+
+    def test_invalidate_revoke_token(self):
+        '''This test case ensures invalidated tokens which have a token id are revoked until they expire.'''
+
+        token = Token({"token_id": "token-1", "type": "access", "client_id": "sample-client", "expiration_time": 1060})
+
+        revoked_tokens = TokensService.REVOKED_TOKENS
+        TokensService.REVOKED_TOKENS = Mock()
+
+        try:
+            self._tokens_service.invalidate(token)
+            self._tokens_service.invalidate(Token({"type": "access", "expiration_time": 1060}))
+
+            TokensService.REVOKED_TOKENS.revoke.assert_called_once_with(self._db_conn, "token-1", 1060)
+        finally:
+            TokensService.REVOKED_TOKENS = revoked_tokens
+
     def test_invalidate_factory_oauth2ex(self):
         '''This test case ensures factory oauth2 exceptions are bubbled up.'''
 
@@ -268,23 +302,22 @@ class TokensServiceTests(FantasticoUnitTestsCase):
         token = Token({})
         encrypted_str = "abcd"
 
-        client = Client(token_iv=base64.b64encode(token_iv).decode(),
-                        token_key=base64.b64encode(token_key).decode())
+        client = ClientDescriptor({"token_iv": token_iv, "token_key": token_key})
 
-        self._client_repo.load = Mock(return_value=client)
+        self._client_repo.load_descriptor = Mock(return_value=client)
         self._encryptor.encrypt_token = Mock(return_value=encrypted_str)
 
         result = self._tokens_service.encrypt(token, client_id)
 
         self.assertEqual(encrypted_str, result)
 
-        self._client_repo.load.assert_called_once_with(client_id)
+        self._client_repo.load_descriptor.assert_called_once_with(client_id)
         self._encryptor.encrypt_token.assert_called_once_with(token, token_iv, token_key)
 
     def test_encrypt_invalidclient(self):
         '''This test case ensures all exceptions occuring during client load are converted to oauth2 invalid client exceptions.'''
 
-        self._client_repo.load = Mock(side_effect=Exception("Unexpected exception."))
+        self._client_repo.load_descriptor = Mock(side_effect=Exception("Unexpected exception."))
 
         with self.assertRaises(OAuth2InvalidClientError):
             self._tokens_service.encrypt(Token({}), "mock-client")
@@ -298,12 +331,11 @@ class TokensServiceTests(FantasticoUnitTestsCase):
 
         token = Token({})
 
-        client = Client(token_iv=base64.b64encode(token_iv).decode(),
-                        token_key=base64.b64encode(token_key).decode())
+        client = ClientDescriptor({"token_iv": token_iv, "token_key": token_key})
 
         ex = Exception("Unexpected exception.")
 
-        self._client_repo.load = Mock(return_value=client)
+        self._client_repo.load_descriptor = Mock(return_value=client)
         self._encryptor.encrypt_token = Mock(side_effect=ex)
 
         with self.assertRaises(Exception) as ctx:
@@ -336,3 +368,26 @@ class TokensServiceTests(FantasticoUnitTestsCase):
             self._tokens_service.decrypt("encrypted text.")
 
         self.assertEqual(ex, ctx.exception)
+
+    def test_encryptor_from_settings(self):
+        '''This test case ensures the token encryptor is chosen based on oauth2_token_format setting.'''
+
+        for token_format, encryptor_cls in [(TokensService.FORMAT_PUBLIC, PublicTokenEncryption),
+                                            (TokensService.FORMAT_COMPACT, CompactTokenEncryption)]:
+            settings_facade = Mock()
+            settings_facade.get = Mock(return_value=token_format)
+
+            tokens_service = TokensService(self._db_conn, Mock(), Mock(), settings_facade_cls=Mock(return_value=settings_facade))
+
+            self.assertIsInstance(tokens_service._encryptor, encryptor_cls)
+
+            settings_facade.get.assert_called_once_with("oauth2_token_format")
+
+    def test_encryptor_from_settings_unsupported(self):
+        '''This test case ensures an exception is raised if the configured token format is not supported.'''
+
+        settings_facade = Mock()
+        settings_facade.get = Mock(return_value="jwt")
+
+        with self.assertRaises(OAuth2TokenEncryptionError):
+            TokensService(self._db_conn, Mock(), Mock(), settings_facade_cls=Mock(return_value=settings_facade))
@@ -17,13 +17,16 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.oauth2.token_encryption
 '''
 
+from Crypto import Random
 from Crypto.Cipher import AES
 from abc import abstractmethod, ABCMeta # pylint: disable=W0611
 from fantastico.oauth2.exceptions import OAuth2InvalidTokenDescriptorError, OAuth2TokenEncryptionError, OAuth2Error, \
-    OAuth2InvalidClientError
+    OAuth2InvalidClientError, OAuth2TokenExpiredError
 from fantastico.oauth2.token import Token
 import base64
 import json
+import struct
+import time
 
 class TokenEncryption(object, metaclass=ABCMeta):
     '''This class provides an abstract model for token encryption providers. A token encryption provider must be able
@@ -67,6 +70,17 @@ class TokenEncryption(object, metaclass=ABCMeta):
         if not token_key:
             raise OAuth2InvalidTokenDescriptorError("token_key")
 
+    def _load_encryption_keys(self, client_id, client_repo):
+        '''This method is used to load the encryption keys for the specified client using the given repo (client descriptors
+        are cached so known clients are not loaded from database).'''
+
+        try:
+            client = client_repo.load_descriptor(client_id)
+        except Exception as ex:
+            raise OAuth2InvalidClientError("Client %s is not valid: %s" % (client_id, str(ex)))
+
+        return (client.token_iv, client.token_key)
+
 class AesTokenEncryption(TokenEncryption):
     '''This class provides a generic AES token encryption provider. It allows developers to specify the number of bits used
     for AES (128 / 192 / 256 bits).'''
@@ -81,7 +95,7 @@ class AesTokenEncryption(TokenEncryption):
         self._validate_encryption_args(token_iv, token_key)
 
         try:
-            text = json.dumps(token.dictionary)
+            text = json.dumps(token.dictionary).encode()
 
             cipher = AES.new(token_key, AES.MODE_CFB, token_iv)
 
@@ -169,15 +183,128 @@ class PublicTokenEncryption(TokenEncryption):
         except Exception as ex:
             raise OAuth2TokenEncryptionError("Unexpected symmetric encryption error: %s" % str(ex))
 
-    def _load_encryption_keys(self, client_id, client_repo):
-        '''This method is used to load the encryption keys for the specified client using the given repo.'''
+class CompactTokenEncryption(TokenEncryption):
+    '''This class provides a compact binary token encryption. Each token has the following layout (urlsafe base64 encoded
+    without padding):
+
+        * header - format version, token type, expiration time (unix timestamp) and client id (plain).
+        * nonce - 12 random bytes generated for each token.
+        * payload - the remaining token attributes as JSON, encrypted with AES in GCM mode (client token_key).
+        * tag - the 16 bytes GCM authentication tag which covers the payload and the header (associated data).
+
+    Because header is not encrypted, token expiration is checked before loading client keys or doing any cryptographic
+    operation: :py:meth:`read_header` returns a token which contains only client_id, type and expiration_time and it can
+    be validated by :py:meth:`fantastico.oauth2.accesstoken_generator.AccessTokenGenerator.validate`. Tampered tokens
+    (header included) fail authentication and are rejected without parsing their payload.
+
+    AES GCM mode is provided by **pycryptodome** (legacy **pycrypto** does not support it); building a compact token encryptor
+    without GCM support raises :py:class:`fantastico.oauth2.exceptions.OAuth2TokenEncryptionError`.'''
+
+    VERSION = 2
+    TOKEN_TYPES = ("access", "login")
+    HEADER = struct.Struct(">BBIB")
+    NONCE_SIZE = 12
+    TAG_SIZE = 16
+
+    def __init__(self, time_provider=time, aes_module=AES):
+        if not hasattr(aes_module, "MODE_GCM"):
+            raise OAuth2TokenEncryptionError("Compact tokens require AES GCM mode which is provided by pycryptodome.")
+
+        self._time_provider = time_provider
+        self._aes = aes_module
+
+    def encrypt_token(self, token, token_iv=None, token_key=None, client_repo=None):
+        '''This method takes a concrete token object and returns its compact representation. In the rare cases where the
+        encryption key is not known client_repo is used to obtain it from client descriptor.'''
+
+        if not token:
+            raise OAuth2InvalidTokenDescriptorError("token")
+
+        if (not token_iv or not token_key) and client_repo:
+            token_iv, token_key = self._load_encryption_keys(token.client_id, client_repo)
+
+        self._validate_encryption_args(token_iv, token_key)
 
         try:
-            client = client_repo.load(client_id)
+            token_desc = dict(token.dictionary)
+            client_id = token_desc.pop("client_id").encode()
+            token_type = self.TOKEN_TYPES.index(token_desc.pop("type")) + 1
+
+            header = self.HEADER.pack(self.VERSION, token_type, token_desc.pop("expiration_time"), len(client_id)) + client_id
+
+            nonce = Random.new().read(self.NONCE_SIZE)
+
+            cipher = self._aes.new(token_key, self._aes.MODE_GCM, nonce=nonce, mac_len=self.TAG_SIZE)
+            cipher.update(header)
+
+            payload, tag = cipher.encrypt_and_digest(json.dumps(token_desc, separators=(",", ":")).encode())
+
+            return base64.urlsafe_b64encode(header + nonce + payload + tag).decode().rstrip("=")
         except Exception as ex:
-            raise OAuth2InvalidClientError("Client %s is not valid: %s" % (client_id, str(ex)))
+            raise OAuth2TokenEncryptionError("Unable to encode compact token: %s" % str(ex))
+
+    def decrypt_token(self, encrypted_str, token_iv=None, token_key=None, client_repo=None):
+        '''This method receives a compact token representation and returns a concrete token object. Expired tokens are
+        rejected before obtaining client keys (from the given client_repo when token_iv and token_key are not known).'''
+
+        raw_token, header_size, header_desc = self._parse(encrypted_str)
+
+        if header_desc["expiration_time"] < self._time_provider.time():
+            raise OAuth2TokenExpiredError("Token is expired.")
+
+        if not token_iv or not token_key:
+            token_iv, token_key = self._load_encryption_keys(header_desc["client_id"], client_repo)
+
+        nonce = raw_token[header_size:header_size + self.NONCE_SIZE]
+
+        try:
+            cipher = self._aes.new(token_key, self._aes.MODE_GCM, nonce=nonce, mac_len=self.TAG_SIZE)
+            cipher.update(raw_token[:header_size])
+
+            payload = cipher.decrypt_and_verify(raw_token[header_size + self.NONCE_SIZE:-self.TAG_SIZE],
+                                                raw_token[-self.TAG_SIZE:])
+        except ValueError:
+            raise OAuth2TokenEncryptionError("Token signature is not valid.")
+        except Exception as ex:
+            raise OAuth2TokenEncryptionError("Unable to decrypt compact token: %s" % str(ex))
+
+        try:
+            token_desc = json.loads(payload.decode())
+            token_desc.update(header_desc)
+
+            return Token(token_desc)
+        except Exception as ex:
+            raise OAuth2TokenEncryptionError("Unable to decode compact token: %s" % str(ex))
+
+    def read_header(self, encrypted_str):
+        '''This method returns a token object which contains only the public attributes of the given compact token (client_id,
+        type and expiration_time). No cryptographic operation is done so the returned token is not authenticated.'''
+
+        return Token(self._parse(encrypted_str)[2])
+
+    def _parse(self, encrypted_str):
+        '''This method decodes the given compact token and returns a tuple (raw token, header size, header attributes).'''
+
+        if not encrypted_str or len(encrypted_str.strip()) == 0:
+            raise OAuth2InvalidTokenDescriptorError("encrypted_str")
 
-        token_iv = base64.b64decode(client.token_iv.encode())
-        token_key = base64.b64decode(client.token_key.encode())
+        try:
+            raw_token = base64.urlsafe_b64decode((encrypted_str + "=" * (-len(encrypted_str) % 4)).encode())
+
+            version, token_type, expiration_time, client_id_size = self.HEADER.unpack_from(raw_token)
+            header_size = self.HEADER.size + client_id_size
+        except Exception as ex:
+            raise OAuth2TokenEncryptionError("Unable to decode compact token: %s" % str(ex))
+
+        if version != self.VERSION or not 0 < token_type <= len(self.TOKEN_TYPES) or \
+                len(raw_token) < header_size + self.NONCE_SIZE + self.TAG_SIZE:
+            raise OAuth2TokenEncryptionError("Token is not a compact token.")
+
+        try:
+            client_id = raw_token[self.HEADER.size:header_size].decode()
+        except Exception as ex:
+            raise OAuth2TokenEncryptionError("Unable to decode compact token: %s" % str(ex))
 
-        return (token_iv, token_key)
+        return raw_token, header_size, {"client_id": client_id,
+                                        "type": self.TOKEN_TYPES[token_type - 1],
+                                        "expiration_time": expiration_time}
@@ -16,23 +16,60 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.oauth2.tokens_service
 '''
-from fantastico.oauth2.exceptions import OAuth2InvalidTokenTypeError, OAuth2Error, OAuth2InvalidClientError
+from fantastico.oauth2.exceptions import OAuth2InvalidTokenTypeError, OAuth2Error, OAuth2InvalidClientError, \
+    OAuth2TokenEncryptionError
 from fantastico.oauth2.models.client_repository import ClientRepository
-from fantastico.oauth2.token_encryption import PublicTokenEncryption, AesTokenEncryption
+from fantastico.oauth2.revocation_store import RevocationStore
+from fantastico.oauth2.token_encryption import PublicTokenEncryption, AesTokenEncryption, CompactTokenEncryption
 from fantastico.oauth2.tokengenerator_factory import TokenGeneratorFactory
-import base64
+from fantastico.settings import SettingsFacade
+from fantastico.utils.lru_cache import LruCache
 
 class TokensService(object):
     '''This class provides an abstraction for working with all supported token types. Internally it uses
     :py:class:`fantastico.oauth2.tokengenerator_factory.TokenGeneratorFactory` for obtaining a correct token generator. Then,
-    it delegates all calls to that token generator.'''
+    it delegates all calls to that token generator.
+
+    Decrypted and validated tokens are cached per process in :py:attr:`VALIDATED_TOKENS` (indexed by their encrypted
+    representation) until they expire by :py:class:`fantastico.oauth2.middleware.tokens_middleware.OAuth2TokensMiddleware`.
+    Only tokens which have a token_id are cached. Tokens invalidated through :py:meth:`invalidate` are revoked in
+    :py:attr:`REVOKED_TOKENS` until they expire; revoked tokens are rejected even if they are cached so the cache is never
+    scanned on invalidation.
+
+    Tokens are encrypted using the format configured in oauth2_token_format setting (see :py:attr:`TOKEN_FORMATS`) unless
+    an explicit encryptor_cls is given.'''
+
+    VALIDATED_TOKENS_SIZE = 10000
+    VALIDATED_TOKENS = LruCache(VALIDATED_TOKENS_SIZE)
+
+    REVOKED_TOKENS = RevocationStore()
+
+    FORMAT_PUBLIC = "public"
+    FORMAT_COMPACT = "compact"
+
+    TOKEN_FORMATS = {FORMAT_PUBLIC: lambda: PublicTokenEncryption(AesTokenEncryption()),
+                     FORMAT_COMPACT: CompactTokenEncryption}
 
     def __init__(self, db_conn, factory_cls=TokenGeneratorFactory, client_repo_cls=ClientRepository,
-                 encryptor_cls=PublicTokenEncryption):
+                 encryptor_cls=None, settings_facade_cls=SettingsFacade):
         self._db_conn = db_conn
         self._tokens_factory = factory_cls()
         self._client_repo = client_repo_cls(self._db_conn)
-        self._encryptor = encryptor_cls(AesTokenEncryption())
+
+        if encryptor_cls:
+            self._encryptor = encryptor_cls(AesTokenEncryption())
+        else:
+            self._encryptor = self._build_encryptor(settings_facade_cls().get("oauth2_token_format"))
+
+    def _build_encryptor(self, token_format):
+        '''This method builds the token encryptor which corresponds to the given token format.'''
+
+        encryptor_builder = self.TOKEN_FORMATS.get(token_format)
+
+        if not encryptor_builder:
+            raise OAuth2TokenEncryptionError("Token format %s is not supported." % token_format)
+
+        return encryptor_builder()
 
     @property
     def db_conn(self):
@@ -113,19 +150,20 @@ class TokensService(object):
         except Exception as ex:
             raise OAuth2InvalidTokenTypeError(token.type, "Unable to invalidate token: %s" % str(ex))
 
+        token_id = token.dictionary.get("token_id")
+        if token_id:
+            self.REVOKED_TOKENS.revoke(self._db_conn, token_id, token.expiration_time)
+
     def encrypt(self, token, client_id):
         '''This method encrypts a given token and returns the encrypted string representation. Client id is required in order
-        to obtain the encryption keys.'''
+        to obtain the encryption keys (from clients cache).'''
 
         try:
-            client = self._client_repo.load(client_id)
+            client = self._client_repo.load_descriptor(client_id)
         except Exception as ex:
             raise OAuth2InvalidClientError("Client %s can not be loaded: %s" % (client_id, str(ex)))
 
-        token_iv = base64.b64decode(client.token_iv.encode())
-        token_key = base64.b64decode(client.token_key.encode())
-
-        return self._encryptor.encrypt_token(token, token_iv, token_key)
+        return self._encryptor.encrypt_token(token, client.token_iv, client.token_key)
 
     def decrypt(self, encrypted_str):
         '''This method decrypts a given string and returns a concrete token object.'''
@@ -22,18 +22,27 @@ from fantastico.roa.query_parser_operations import QueryParserOperationBinaryEq,
     QueryParserOperationBinaryGt, QueryParserOperationBinaryLe, QueryParserOperationBinaryLt, QueryParserOperationBinaryLike, \
     QueryParserOperationBinaryIn, QueryParserOperationSortAsc, QueryParserOperationSortDesc, QueryParserOperationOr, \
     QueryParserOperationAnd, QueryParserOperationCompound
+from fantastico.utils.lru_cache import LruCache
 import re
+import threading
 
 class QueryParser(object):
     '''This class provides ROA query parser functionality. It provides methods for transforming filter and sorting expressions
-    (:doc:`/features/roa/rest_standard`) into mvc filters (:doc:`/features/mvc`).'''
+    (:doc:`/features/roa/rest_standard`) into mvc filters (:doc:`/features/mvc`).
+
+    Grammar tables are built only once per process (when the first parser is instantiated) so parsers are cheap to build.
+    In addition, parsed expressions are kept in a per process least recently used cache indexed by (model, expression): the
+    same expression received multiple times for a resource is parsed only once and the cached mvc filter is bound to each
+    query. Cache size is given by :py:attr:`FILTERS_CACHE_SIZE`.'''
 
     _lang_symbols = {"(": "(",
                     ")": ")",
                     ",": ","}
 
     _MAX_TOKEN_LENGTH = 4
-    _lang_rules = {}
+    _lang_rules = None
+    _lang_grammar = None
+    _grammar_lock = threading.Lock()
 
     _T_END = "$"
 
@@ -41,70 +50,88 @@ class QueryParser(object):
     RULE = 1
     regex_text = "[a-zA-Z\\. \"0-9\\[\\]]{1,}"
 
+    OPERATIONS = [QueryParserOperationBinaryEq, QueryParserOperationBinaryGt, QueryParserOperationBinaryGe,
+                  QueryParserOperationBinaryLt, QueryParserOperationBinaryLe, QueryParserOperationBinaryLike,
+                  QueryParserOperationBinaryIn, QueryParserOperationOr, QueryParserOperationAnd, QueryParserOperationSortAsc,
+                  QueryParserOperationSortDesc]
+
+    FILTERS_CACHE_SIZE = 1024
+    FILTERS_CACHE = LruCache(FILTERS_CACHE_SIZE)
+
     def __init__(self):
-        self._stack = [(self.TERM, self._T_END)]
+        self._build_grammar()
+
         self._model = None
+        self._reset()
 
-        self._lang_rules = {
-                self.regex_text: {
-                                ",": [(self.RULE, self.regex_text), (self.TERM, ")")],
-                                self.regex_text: [(self.TERM, self.regex_text)]
-                              },
-                ",": {
-                        ",": [(self.TERM, ",")]
-                      },
-                ")": {
-                        ")": [(self.TERM, ")")]
-                      },
-                "(": {}
-             }
-
-        self._lang_grammar = {self.regex_text: {
-                                            self.regex_text: (self.regex_text, self.regex_text, self._add_argument)
-                                        },
-                       ",": {
-                                ",": (",", ",", self._nop)
-                             },
-                       ")": {
-                                 ")": (")", ")", self._exec_operator)
-                             },
-                       "(": {}
-                     }
+    def _reset(self):
+        '''This method resets the parsing state of this parser.'''
 
+        self._stack = [(self.TERM, self._T_END)]
         self._last_operator = []
         self._discovered_tokens = []
         self._compound_arguments = []
 
-        self._register_all_operations()
-
-    def _register_all_operations(self):
-        '''This method register all supported operations of this parser.'''
-
-        self._register_operation(QueryParserOperationBinaryEq(self))
-        self._register_operation(QueryParserOperationBinaryGt(self))
-        self._register_operation(QueryParserOperationBinaryGe(self))
-        self._register_operation(QueryParserOperationBinaryLt(self))
-        self._register_operation(QueryParserOperationBinaryLe(self))
-        self._register_operation(QueryParserOperationBinaryLike(self))
-        self._register_operation(QueryParserOperationBinaryIn(self))
+    @classmethod
+    def _build_grammar(cls):
+        '''This method builds the grammar tables of all supported operations. Tables are built only once per process. Each
+        table action is a function which receives the parser executing the action.'''
 
-        self._register_operation(QueryParserOperationOr(self))
-        self._register_operation(QueryParserOperationAnd(self))
-
-        self._register_operation(QueryParserOperationSortAsc(self))
-        self._register_operation(QueryParserOperationSortDesc(self))
+        if cls._lang_grammar is not None:
+            return
 
-    def _register_operation(self, operator):
+        with cls._grammar_lock:
+            if cls._lang_grammar is not None:
+                return
+
+            lang_rules = {
+                    cls.regex_text: {
+                                    ",": [(cls.RULE, cls.regex_text), (cls.TERM, ")")],
+                                    cls.regex_text: [(cls.TERM, cls.regex_text)]
+                                  },
+                    ",": {
+                            ",": [(cls.TERM, ",")]
+                          },
+                    ")": {
+                            ")": [(cls.TERM, ")")]
+                          },
+                    "(": {}
+                 }
+
+            lang_grammar = {cls.regex_text: {
+                                            cls.regex_text: (cls.regex_text, cls.regex_text, QueryParser._add_argument)
+                                        },
+                           ",": {
+                                    ",": (",", ",", QueryParser._nop)
+                                 },
+                           ")": {
+                                     ")": (")", ")", QueryParser._exec_operator)
+                                 },
+                           "(": {}
+                         }
+
+            for operation_cls in cls.OPERATIONS:
+                cls._register_operation(operation_cls(cls), lang_grammar, lang_rules)
+
+            cls._lang_rules = lang_rules
+            cls._lang_grammar = lang_grammar
+
+    @classmethod
+    def _register_operation(cls, operator, lang_grammar, lang_rules):
         '''This method registers a given operations into the list of supported operations. Grammar rules are enriched based
         on the given operator.'''
 
         token = operator.get_token()
 
-        self._lang_grammar[token] = operator.get_grammar_table(self._new_operator)
-        self._lang_grammar["("][token] = ("(", token, self._nop)
-        self._lang_symbols[operator.get_token()] = token
-        self._lang_rules[token] = operator.get_grammar_rules()
-        self._lang_rules["("][token] = [(self.RULE, token)]
+        def new_mixin(operator_cls):
+            return lambda parser: parser._new_operator(operator_cls) # pylint: disable=W0212
+
+        lang_grammar[token] = {symbol: (rule[0], rule[1], lambda parser, action=rule[2]: action()(parser))
+                               for symbol, rule in operator.get_grammar_table(new_mixin).items()}
+        lang_grammar["("][token] = ("(", token, QueryParser._nop)
+        cls._lang_symbols[token] = token
+        lang_rules[token] = operator.get_grammar_rules()
+        lang_rules["("][token] = [(cls.RULE, token)]
 
     def _nop(self):
         '''This method is used as default values when a table grammar entry does not require any concrete action.'''
@@ -273,7 +300,8 @@ class QueryParser(object):
             self._stack.append(curr_rule)
 
     def parse_filter(self, filter_expr, model):
-        '''This method transform the given filter expression into mvc filters.
+        '''This method transform the given filter expression into mvc filters. Parsed filters are cached per process so
+        the returned mvc filter might be shared with other requests: it must not be changed.
 
         :param filter_expr: The filter string expression we want to convert to query objects.
         :type filter_exprt: string
@@ -284,6 +312,24 @@ class QueryParser(object):
         if not filter_expr or len(filter_expr.strip()) == 0:
             return
 
+        cache_key = (model, filter_expr)
+
+        model_filter = self.FILTERS_CACHE.get(cache_key)
+
+        if model_filter is not None:
+            return model_filter
+
+        model_filter = self._parse_filter(filter_expr, model)
+
+        self.FILTERS_CACHE.put(cache_key, model_filter)
+
+        return model_filter
+
+    def _parse_filter(self, filter_expr, model):
+        '''This method parses the given filter expression (without using the cache).'''
+
+        self._reset()
+
         self._model = model
         tokens = self._parse_lexic(filter_expr)
 
@@ -293,7 +339,7 @@ class QueryParser(object):
         model_filter = None
 
         for ll_rule in ll_derivation:
-            model_filter = ll_rule[2]()
+            model_filter = ll_rule[2](self)
 
         return model_filter
 
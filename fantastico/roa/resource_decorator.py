@@ -16,6 +16,8 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
 .. py:module:: fantastico.roa.resource_decorator
 '''
+from fantastico.mvc.model_facade import ModelFacade
+from fantastico.roa.roa_exceptions import FantasticoRoaError
 
 class Resource(object):
     '''
@@ -55,8 +57,60 @@ class Resource(object):
 
     If you do not define a user_id property for user dependent resources a runtime exception is raised. In order to find out more
     about OAuth2 authorization implemented into fantastico please read: :doc:`/features/oauth2`.
+
+    Each resource collection response contains **totalItems** attribute. Counting big tables can cost more than retrieving
+    a page so each resource can choose how **totalItems** is obtained (read more on :py:attr:`total_items`):
+
+    .. code-block:: python
+
+        @Resource(name="app-setting", url="/app-settings", total_items=Resource.TOTAL_ITEMS_CACHED, total_items_ttl=30)
+        class AppSetting(BASEMODEL):
+            pass
+
+    Resources which are exported in big pages can stream their collections (read more on :py:attr:`stream_batch_size`):
+
+    .. code-block:: python
+
+        @Resource(name="app-setting", url="/app-settings", stream_batch_size=500)
+        class AppSetting(BASEMODEL):
+            pass
+
+    Resources support conditional GET requests (**ETag** / **Last-Modified** / **304 Not Modified**) and can declare the
+    **Cache-Control** policy of their responses. Resources which declare a version attribute (read more on
+    :py:attr:`etag_attr`) are not even serialized when the client already holds the current representation:
+
+    .. code-block:: python
+
+        @Resource(name="app-setting", url="/app-settings", etag_attr="revision", last_modified_attr="modify_date",
+                  cache_control="max-age=30")
+        class AppSetting(BASEMODEL):
+            revision = Column("revision", Integer, nullable=False)
+            modify_date = Column("modify_date", DateTime, nullable=False)
+
+    Subresources requested through **fields** query parameter are eagerly loaded for whole collection pages. Each subresource
+    can declare its loading strategy (read more on :py:attr:`subresources_loading`):
+
+    .. code-block:: python
+
+        @Resource(name="person", url="/persons", subresources={"bill_address": ["bill_address_id"]},
+                  subresources_loading={"bill_address": Resource.LOAD_JOINED})
+        class Person(BASEMODEL):
+            pass
     '''
 
+    TOTAL_ITEMS_EXACT = "exact"
+    TOTAL_ITEMS_ESTIMATED = "estimated"
+    TOTAL_ITEMS_CACHED = "cached"
+    TOTAL_ITEMS_NONE = "none"
+
+    TOTAL_ITEMS_POLICIES = [TOTAL_ITEMS_EXACT, TOTAL_ITEMS_ESTIMATED, TOTAL_ITEMS_CACHED, TOTAL_ITEMS_NONE]
+
+    LOAD_SELECTIN = ModelFacade.LOAD_SELECTIN
+    LOAD_JOINED = ModelFacade.LOAD_JOINED
+    LOAD_SUBQUERY = ModelFacade.LOAD_SUBQUERY
+
+    LOAD_STRATEGIES = [LOAD_SELECTIN, LOAD_JOINED, LOAD_SUBQUERY]
+
     @property
     def name(self):
         '''This read only property holds the name of the resource.'''
@@ -120,6 +174,22 @@ class Resource(object):
 
         return self._subresources
 
+    @property
+    def subresources_loading(self):
+        '''This read only property holds the strategy used for eagerly loading each subresource when it is requested for a
+        collection page:
+
+        #. **selectin** (default) - subresources of the whole page are selected using one additional query (IN on the page
+            keys).
+        #. **joined** - subresources are selected in the same query using a LEFT OUTER JOIN (recommended for subresources
+            referenced by a foreign key).
+        #. **subquery** - subresources are selected using one additional query which joins the page query.
+
+        Streamed collections (:py:attr:`stream_batch_size`) load subresource lists and **subquery** subresources using
+        **selectin** strategy for each chunk.'''
+
+        return self._subresources_loading
+
     @property
     def validator(self):
         '''This property returns the validator type which must be used for this resource for creating / updating it. You can
@@ -127,14 +197,91 @@ class Resource(object):
 
         return self._validator
 
-    def __init__(self, name, url, version=1.0, subresources=None, validator=None, user_dependent=False):
+    @property
+    def total_items(self):
+        '''This read only property holds the policy used for obtaining **totalItems** of collection responses:
+
+        #. **exact** (default) - the page and the exact number of matching items are selected in a single query.
+        #. **estimated** - unfiltered collections use the number of rows estimated by database table statistics. Filtered
+            collections are counted exactly.
+        #. **cached** - the exact number of matching items is cached (per filter and user) for :py:attr:`total_items_ttl`
+            seconds.
+        #. **none** - **totalItems** is omitted from collection responses.'''
+
+        return self._total_items
+
+    @property
+    def total_items_ttl(self):
+        '''This read only property holds the number of seconds **totalItems** is cached when **cached** policy is used.'''
+
+        return self._total_items_ttl
+
+    @property
+    def stream_batch_size(self):
+        '''This read only property holds the number of items fetched from database at once when collections of this resource
+        are streamed. If it is not set (default) collection responses are built in memory. Otherwise, collection items are
+        fetched from a server side cursor and sent to the client in chunks of **stream_batch_size** items so that big pages
+        are served in constant memory. When streaming, the validator **format_collection** method receives each chunk of
+        items.'''
+
+        return self._stream_batch_size
+
+    @property
+    def etag_attr(self):
+        '''This read only property holds the name of the model attribute (e.g a version counter) which changes every time the
+        resource changes. If it is set, entity tags are calculated from the values of this attribute without serializing
+        the resources. Otherwise (default), entity tags are calculated from the serialized body. In both cases, entity tags of
+        user dependent resources vary by user.'''
+
+        return self._etag_attr
+
+    @property
+    def last_modified_attr(self):
+        '''This read only property holds the name of the model datetime attribute which holds the last modification date of
+        the resource. If it is set, item responses contain **Last-Modified** header and **If-Modified-Since** conditional
+        requests are supported. Collections are validated only by entity tags because the most recent modification date of
+        a page does not change when items are deleted or the page membership changes.'''
+
+        return self._last_modified_attr
+
+    @property
+    def cache_control(self):
+        '''This read only property holds the **Cache-Control** header value sent for resource GET responses
+        (e.g **max-age=30**). If it is not set, responses of user dependent resources are marked **private** and responses of
+        other resources do not contain the header.'''
+
+        return self._cache_control
+
+    def __init__(self, name, url, version=1.0, subresources=None, validator=None, user_dependent=False,
+                 total_items=TOTAL_ITEMS_EXACT, total_items_ttl=60, stream_batch_size=None, etag_attr=None,
+                 last_modified_attr=None, cache_control=None, subresources_loading=None):
+        if total_items not in Resource.TOTAL_ITEMS_POLICIES:
+            raise FantasticoRoaError("Resource %s totalItems policy %s is not supported." % (name, total_items))
+
+        subresources = subresources or {}
+        subresources_loading = subresources_loading or {}
+
+        for subresource_name, strategy in subresources_loading.items():
+            if subresource_name not in subresources:
+                raise FantasticoRoaError("Resource %s does not have subresource %s." % (name, subresource_name))
+
+            if strategy not in Resource.LOAD_STRATEGIES:
+                raise FantasticoRoaError("Resource %s loading strategy %s is not supported." % (name, strategy))
+
         self._name = name
         self._url = url
         self._version = float(version)
         self._model = None
-        self._subresources = subresources or {}
+        self._subresources = subresources
+        self._subresources_loading = subresources_loading
         self._validator = validator
         self._user_dependent = user_dependent
+        self._total_items = total_items
+        self._total_items_ttl = total_items_ttl
+        self._stream_batch_size = stream_batch_size
+        self._etag_attr = etag_attr
+        self._last_modified_attr = last_modified_attr
+        self._cache_control = cache_control
 
     def __call__(self, model_cls, resources_registry=None):
         '''This method is invoked when the model class is first imported into python virtual machine.'''
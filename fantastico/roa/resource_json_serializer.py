@@ -22,7 +22,7 @@ import json
 import re
 
 from fantastico.roa.resource_json_serializer_exceptions import ResourceJsonSerializerError
-
+from fantastico.utils.lru_cache import LruCache
 
 class ResourceJsonSerializer(object):
     '''This class provides the methods for serializing a given resource into a dictionary and deserializing a dictionary into
@@ -34,14 +34,33 @@ class ResourceJsonSerializer(object):
         json_serializer = ResourceJsonSerializer(AppSetting)
         resource_json = json_serializer.serialize(AppSetting("simple-setting", "0.19"))
         resource = json_serializer.deserialize(resource)
+
+    Resource model attributes are introspected only once per resource. Moreover, for each (resource, fields) combination a
+    serialization plan (the ordered list of attribute getters with their converters and subresources handling) is compiled
+    once and kept in a per process least recently used cache (:py:attr:`PLANS_CACHE_SIZE`). Plan steps do not hold references
+    to the serializer which compiled them: each step receives the serializer executing the plan. Serializing a model simply
+    executes the plan; :py:meth:`serialize_list` executes the plan for a whole list of models.
     '''
 
+    PLANS_CACHE_SIZE = 1024
+    PLANS_CACHE = LruCache(PLANS_CACHE_SIZE)
+
+    _RESOURCES_ATTRS = {}
+    _CONVERTERS = {datetime.datetime: lambda value: value.isoformat()}
+
     def __init__(self, resource_ref):
         self._resource_ref = resource_ref
-        self._subresources_attrs = self._identify_subres_attributes()
-        self._supported_attrs = self._identify_public_attrs(self._resource_ref.model)
+        self._converters = self._CONVERTERS
+
+        resource_attrs = ResourceJsonSerializer._RESOURCES_ATTRS.get(resource_ref)
 
-        self._converters = {datetime.datetime: lambda value: value.isoformat()}
+        if resource_attrs is None:
+            self._subresources_attrs = self._identify_subres_attributes()
+            resource_attrs = (self._subresources_attrs, self._identify_public_attrs(self._resource_ref.model))
+
+            ResourceJsonSerializer._RESOURCES_ATTRS[resource_ref] = resource_attrs
+
+        self._subresources_attrs, self._supported_attrs = resource_attrs
 
     def _identify_subres_attributes(self):
         '''This method returns all subresource attributes which must be ignored by serializer.'''
@@ -82,7 +101,8 @@ class ResourceJsonSerializer(object):
     def deserialize(self, body):
         '''This method converts the given body into a concrete model (if possible).
 
-        :param body: A JSON object we want to convert to the model compatible with this serializer.
+        :param body: A JSON object (string or already decoded dictionary) we want to convert to the model compatible with this
+            serializer.
         :type body: dict
         :returns: A model instance initiated with attributes from the given dictionary.
         :raises fantastico.roa.resource_json_serializer_exceptions.ResourceJsonSerializerError:
@@ -93,7 +113,12 @@ class ResourceJsonSerializer(object):
 
         model = model_cls()
 
-        body = json.loads(body)
+        if isinstance(body, str):
+            body = json.loads(body)
+
+        if not isinstance(body, dict):
+            raise ResourceJsonSerializerError("Resource %s body must be a json object." % self._resource_ref.name)
+
         for attr_name, attr_value in body.items():
             if not self._supported_attrs.get(attr_name):
                 raise ResourceJsonSerializerError("Resource %s model does not support attibute %s." % \
@@ -173,6 +198,69 @@ class ResourceJsonSerializer(object):
             raise ResourceJsonSerializerError("Submodel %s does not have attribute %s." % \
                                               (subfield_name, attr_name))
 
+    def _compile_field(self, field):
+        '''This method compiles the serialization step of a model attribute. The step receives the serializer executing the
+        plan, the model and the result dictionary.'''
+
+        def serialize_field(serializer, model, result):
+            try:
+                value = getattr(model, field)
+            except AttributeError:
+                raise ResourceJsonSerializerError("Model does not have attribute %s." % field)
+
+            resource_decorator = getattr(value, "_resource_decorator", None)
+
+            if resource_decorator is not None:
+                result[field] = ResourceJsonSerializer(resource_decorator).serialize(value)
+                return
+
+            converter = serializer._converters.get(value.__class__)
+
+            result[field] = converter(value) if converter else value
+
+        return serialize_field
+
+    def _compile_subfield(self, subfield_name, subfield_attr):
+        '''This method compiles the serialization step of a submodel attribute. The step receives the serializer executing the
+        plan, the model and the result dictionary.'''
+
+        def serialize_subfield(serializer, model, result):
+            subfield = getattr(model, subfield_name)
+
+            if isinstance(subfield, list):
+                serializer._serialize_subfield_list(subfield, subfield_name, subfield_attr, result)
+            else:
+                serializer._serialize_subfield_obj(subfield, subfield_name, subfield_attr, result)
+
+        return serialize_subfield
+
+    def _get_plan(self, fields):
+        '''This method returns the serialization plan for the given fields. The plan is compiled only once per (resource,
+        fields).'''
+
+        plan_key = (self._resource_ref, fields)
+        plan = self.PLANS_CACHE.get(plan_key)
+
+        if plan is not None:
+            return plan
+
+        plan = []
+
+        for field in self._parse_fields(fields):
+            if field.find(".") == -1:
+                plan.append(self._compile_field(field))
+                continue
+
+            subfield_name, subfield_attr = field.split(".")
+
+            plan.append(self._compile_subfield(subfield_name, subfield_attr))
+
+        plan = tuple(plan)
+
+        self.PLANS_CACHE.put(plan_key, plan)
+
+        return plan
+
     def serialize(self, model, fields=None):
         '''This method serialize the given model into a json object.
 
@@ -185,38 +273,56 @@ class ResourceJsonSerializer(object):
             Whenever requested fields for serialization are not found in model attributes.
         '''
 
-        fields = self._parse_fields(fields)
-
         result = {}
 
-        for field in fields:
-            if field.find(".") == -1:
-                try:
-                    result[field] = getattr(model, field)
-                    
-                    # pylint: disable=W0212
-                    if hasattr(result[field], "_resource_decorator"):
-                        result[field] = ResourceJsonSerializer(result[field]._resource_decorator)\
-                                            .serialize(result[field])
-                        
-                        continue
-                    
-                    converter = self._converters.get(result[field].__class__)
-                    
-                    if converter:
-                        result[field] = converter(result[field])
-                except AttributeError:
-                    raise ResourceJsonSerializerError("Model does not have attribute %s." % field)
+        for serialize_step in self._get_plan(fields):
+            serialize_step(self, model, result)
 
-                continue
+        return result
 
-            subfield_name, subfield_attr = field.split(".")
+    def serialize_list(self, models, fields=None):
+        '''This method serializes the given list of models into a list of json objects. The serialization plan is obtained
+        only once for the whole list.
 
-            subfield = getattr(model, subfield_name)
+        :param models: The models we want to convert to JSON objects.
+        :type models: list
+        :param fields: A list of fields we want to include in result. Read more on :ref:`partial-object-representation`
+        :type fields: str
+        :returns: A list of dictionaries containing all required attributes.
+        :rtype: list
+        :raises fantastico.roa.resource_json_serializer_exceptions.ResourceJsonSerializerError:
+            Whenever requested fields for serialization are not found in model attributes.
+        '''
 
-            if isinstance(subfield, list):
-                self._serialize_subfield_list(subfield, subfield_name, subfield_attr, result)
-            else:
-                self._serialize_subfield_obj(subfield, subfield_name, subfield_attr, result)
+        plan = self._get_plan(fields)
+        results = []
 
-        return result
+        for model in models:
+            result = {}
+
+            for serialize_step in plan:
+                serialize_step(self, model, result)
+
+            results.append(result)
+
+        return results
+
+    def get_projection(self, fields=None):
+        '''This method returns the model attributes which must be loaded in order to serialize the given fields. Submodel
+        attributes are returned as **submodel.attribute**. If no fields are given, None is returned (all attributes are
+        serialized).
+
+        .. code-block:: python
+
+            json_serializer.get_projection("name,address(city,street)") # ["address.city", "address.street", "name"]
+
+        :param fields: A list of fields we want to include in result. Read more on :ref:`partial-object-representation`
+        :type fields: str
+        :returns: A list of attribute names or None.
+        :rtype: list
+        '''
+
+        if not fields:
+            return None
+
+        return list(self._parse_fields(fields))
@@ -0,0 +1,78 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. py:module:: fantastico.roa.tests.bench_query_parser
+
+This module provides a micro benchmark which measures the duration of converting a ROA filter expression to mvc filters using
+:py:class:`fantastico.roa.query_parser.QueryParser`. It compares building grammar tables for each parser (previous
+behavior), grammar tables built once per process and parsed expressions cache.
+
+.. code-block:: bash
+
+    python -m fantastico.roa.tests.bench_query_parser
+'''
+from fantastico.roa.query_parser import QueryParser
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.schema import Column
+from sqlalchemy.types import Integer, String
+import timeit
+
+BENCH_BASEMODEL = declarative_base()
+
+class ParsedSetting(BENCH_BASEMODEL):
+    '''This class provides the model filtered by benchmark expressions.'''
+
+    __tablename__ = "bench_parsed_settings"
+
+    id = Column("id", Integer, primary_key=True)
+    name = Column("name", String(80))
+    value = Column("value", String(80))
+
+FILTER_EXPR = "and(or(eq(name, \"vat\"), like(name, \"%%vat%%\")), gt(id, 10))"
+
+def parse_rebuilt_grammar():
+    '''This method parses the filter expression rebuilding grammar tables (previous behavior).'''
+
+    QueryParser._lang_grammar = None
+
+    return QueryParser()._parse_filter(FILTER_EXPR, ParsedSetting)
+
+def parse_uncached():
+    '''This method parses the filter expression using grammar tables built once.'''
+
+    return QueryParser()._parse_filter(FILTER_EXPR, ParsedSetting)
+
+def parse_cached():
+    '''This method parses the filter expression using parsed expressions cache.'''
+
+    return QueryParser().parse_filter(FILTER_EXPR, ParsedSetting)
+
+def measure(parse_fn, parse_count):
+    '''This method returns the duration (in microseconds) of parsing the filter expression.'''
+
+    duration = min(timeit.repeat(parse_fn, number=parse_count, repeat=3))
+
+    return duration * 1000000 / parse_count
+
+def run_benchmark(parse_count=5000):
+    '''This method executes the benchmark and returns the duration (in microseconds) of each parsing strategy.'''
+
+    return [("rebuilt grammar", measure(parse_rebuilt_grammar, parse_count)),
+            ("grammar once", measure(parse_uncached, parse_count)),
+            ("cached", measure(parse_cached, parse_count))]
+
+if __name__ == "__main__":
+    for bench_name, duration in run_benchmark():
+        print("%-20s %.3f us / expression" % (bench_name, duration))
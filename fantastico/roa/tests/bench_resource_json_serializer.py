@@ -0,0 +1,90 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. py:module:: fantastico.roa.tests.bench_resource_json_serializer
+
+This module provides a micro benchmark which measures how many models per second are serialized by
+:py:class:`fantastico.roa.resource_json_serializer.ResourceJsonSerializer` for a 1000 models page. It compares compiling the
+serialization plan for each model (equivalent to the previous behavior which parsed fields for each model) with the cached
+serialization plan applied to the whole page.
+
+.. code-block:: bash
+
+    python -m fantastico.roa.tests.bench_resource_json_serializer
+'''
+from fantastico.roa.resource_decorator import Resource
+from fantastico.roa.resource_json_serializer import ResourceJsonSerializer
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.schema import Column
+from sqlalchemy.types import DateTime, Float, Integer, String
+import datetime
+import timeit
+
+BENCH_BASEMODEL = declarative_base()
+
+class SerializedInvoice(BENCH_BASEMODEL):
+    '''This class provides the model serialized by the benchmark.'''
+
+    __tablename__ = "bench_serialized_invoices"
+
+    id = Column("id", Integer, primary_key=True)
+    series = Column("series", String(10))
+    number = Column("number", Integer)
+    total = Column("total", Float)
+    vat = Column("vat", Float)
+    create_date = Column("create_date", DateTime)
+
+def build_page(page_size):
+    '''This method builds a page of models.'''
+
+    create_date = datetime.datetime(2014, 1, 1)
+
+    return [SerializedInvoice(id=idx, series="RR", number=idx, total=20.0, vat=4.8, create_date=create_date)
+            for idx in range(page_size)]
+
+def serialize_per_model(resource, models, fields):
+    '''This method serializes the page compiling the serialization plan for each model.'''
+
+    serializer = ResourceJsonSerializer(resource)
+
+    for model in models:
+        ResourceJsonSerializer.PLANS_CACHE.clear()
+        serializer.serialize(model, fields)
+
+def serialize_page(resource, models, fields):
+    '''This method serializes the page using the cached serialization plan.'''
+
+    ResourceJsonSerializer(resource).serialize_list(models, fields)
+
+def run_benchmark(page_size=1000, fields="id, series, number, total, create_date"):
+    '''This method executes the benchmark and returns the number of models serialized per second by each strategy.'''
+
+    resource = Resource(name="bench-invoice", url="/bench-invoices")
+    resource._model = SerializedInvoice # pylint: disable=W0212
+
+    models = build_page(page_size)
+
+    results = []
+
+    for bench_name, serialize_fn in [("plan per model", serialize_per_model), ("cached plan", serialize_page)]:
+        duration = min(timeit.repeat(lambda: serialize_fn(resource, models, fields), number=10, repeat=3)) / 10
+
+        results.append((bench_name, page_size / duration))
+
+    return results
+
+if __name__ == "__main__":
+    for bench_name, rows_per_second in run_benchmark():
+        print("%-20s %.0f rows / second" % (bench_name, rows_per_second))
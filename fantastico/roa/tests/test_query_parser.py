@@ -275,6 +275,49 @@ class QueryParserTests(FantasticoUnitTestsCase):
 
         self.assertTrue(str(ctx.exception).find(" not_found ") > -1)
 
+    def test_grammar_built_once(self):
+        '''This test case ensures grammar tables are built only once and shared by all parsers.'''
+
+        query_parser = QueryParser()
+
+        self.assertIs(self._query_parser._lang_grammar, query_parser._lang_grammar)
+        self.assertIs(self._query_parser._lang_rules, query_parser._lang_rules)
+        self.assertEqual(sorted(["eq", "gt", "ge", "lt", "le", "like", "in", "or", "and", "asc", "desc"]),
+                         sorted(query_parser._lang_grammar["("].keys()))
+
+    def test_parse_filter_cached(self):
+        '''This test case ensures a filter expression is parsed only once per model and the parsed filter is reused.'''
+
+        QueryParser.FILTERS_CACHE.clear()
+
+        filter_expr = "and(eq(name, \"vat\"), gt(id, 1))"
+
+        result = self._query_parser.parse_filter(filter_expr, AppSettingMock)
+
+        self.assertIsInstance(result, ModelFilterAnd)
+        self.assertIs(result, QueryParser().parse_filter(filter_expr, AppSettingMock))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1, "max_size": QueryParser.FILTERS_CACHE_SIZE},
+                         QueryParser.FILTERS_CACHE.stats)
+
+        sort_expr = self._query_parser.parse_sort(["asc(name)", "asc(name)"], AppSettingMock)
+
+        self.assertIs(sort_expr[0], sort_expr[1])
+
+        QueryParser.FILTERS_CACHE.clear()
+
+    def test_parse_filter_invalid_notcached(self):
+        '''This test case ensures invalid expressions are not cached and the parser can be reused after a failure.'''
+
+        QueryParser.FILTERS_CACHE.clear()
+
+        with self.assertRaises(FantasticoRoaError):
+            self._query_parser.parse_filter("eq(not_supported, vat)", AppSettingMock)
+
+        self.assertEqual(0, len(QueryParser.FILTERS_CACHE))
+        self.assertIsInstance(self._query_parser.parse_filter("eq(name, \"vat\")", AppSettingMock), ModelFilter)
+
+        QueryParser.FILTERS_CACHE.clear()
+
 class AppSettingMock(BASEMODEL):
     '''This is a very simple setting of an application.'''
 
@@ -17,6 +17,7 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.roa.tests.test_resource_decorator
 '''
 from fantastico.roa.resource_decorator import Resource
+from fantastico.roa.roa_exceptions import FantasticoRoaError
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
 
@@ -45,6 +46,60 @@ class ResourceDecoratorTests(FantasticoUnitTestsCase):
         self.assertEqual(resource.subresources, expected_subresources)
         self.assertIsNone(resource.model)
 
+    def test_total_items_policy(self):
+        '''This test case ensures totalItems policy defaults to exact and unsupported policies are rejected.'''
+
+        resource = Resource(name="app-setting", url="/app-settings")
+
+        self.assertEqual(Resource.TOTAL_ITEMS_EXACT, resource.total_items)
+        self.assertEqual(60, resource.total_items_ttl)
+
+        resource = Resource(name="app-setting", url="/app-settings", total_items=Resource.TOTAL_ITEMS_CACHED, total_items_ttl=5)
+
+        self.assertEqual(Resource.TOTAL_ITEMS_CACHED, resource.total_items)
+        self.assertEqual(5, resource.total_items_ttl)
+
+        with self.assertRaises(FantasticoRoaError):
+            Resource(name="app-setting", url="/app-settings", total_items="approximate")
+
+    def test_stream_batch_size(self):
+        '''This test case ensures collections are not streamed by default.'''
+
+        self.assertIsNone(Resource(name="app-setting", url="/app-settings").stream_batch_size)
+        self.assertEqual(500, Resource(name="app-setting", url="/app-settings", stream_batch_size=500).stream_batch_size)
+
+    def test_conditional_get_attrs(self):
+        '''This test case ensures entity tags are calculated from the body and no caching policy is declared by default.'''
+
+        resource = Resource(name="app-setting", url="/app-settings")
+
+        self.assertIsNone(resource.etag_attr)
+        self.assertIsNone(resource.last_modified_attr)
+        self.assertIsNone(resource.cache_control)
+
+        resource = Resource(name="app-setting", url="/app-settings", etag_attr="revision", last_modified_attr="modify_date",
+                            cache_control="max-age=30")
+
+        self.assertEqual("revision", resource.etag_attr)
+        self.assertEqual("modify_date", resource.last_modified_attr)
+        self.assertEqual("max-age=30", resource.cache_control)
+
+    def test_subresources_loading(self):
+        '''This test case ensures subresources loading strategies are validated against resource subresources.'''
+
+        self.assertEqual({}, Resource(name="person", url="/persons").subresources_loading)
+
+        subresources = {"bill_address": ["bill_address_id"]}
+
+        resource = Resource(name="person", url="/persons", subresources=subresources,
+                            subresources_loading={"bill_address": Resource.LOAD_JOINED})
+
+        self.assertEqual({"bill_address": Resource.LOAD_JOINED}, resource.subresources_loading)
+
+        for subresources_loading in [{"ship_address": Resource.LOAD_JOINED}, {"bill_address": "immediate"}]:
+            with self.assertRaises(FantasticoRoaError):
+                Resource(name="person", url="/persons", subresources=subresources, subresources_loading=subresources_loading)
+
     def test_check_call(self):
         '''This test case ensures call method correctly registers a resource to a given resource.'''
 
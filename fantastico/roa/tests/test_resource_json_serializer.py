@@ -81,6 +81,18 @@ class ResourceJsonSerializerTests(FantasticoUnitTestsCase):
         self.assertIsInstance(ctx.exception, ResourceJsonSerializerError)
         self.assertTrue(str(ctx.exception).find("unknown_column") > -1)
 
+    def test_deserialize_dict_ok(self):
+        '''This test case ensures already decoded json objects can be deserialized and other json values are rejected.'''
+
+        resource = self._serializer.deserialize({"series": "RR", "number": 111})
+
+        self.assertEqual("RR", resource.series)
+        self.assertEqual(111, resource.number)
+
+        for body in [[], "[]", 1]:
+            with self.assertRaises(ResourceJsonSerializerError):
+                self._serializer.deserialize(body)
+
     def test_serialize_mainresource_ok(self):
         '''This test case ensures a given resource model is correctly serialized into a json object.'''
 
@@ -218,6 +230,63 @@ class ResourceJsonSerializerTests(FantasticoUnitTestsCase):
         self._test_serialize_subresource_1ton_unknown("id,items(unknown_attr)", "items", "unknown_attr",
                                                       [InvoiceLineItemMock(), InvoiceLineItemMock()])
 
+    def test_serialize_plan_cached(self):
+        '''This test case ensures resource attributes are introspected once and a serialization plan is compiled once per
+        fields expression.'''
+
+        fields = "series, number"
+
+        self._serializer.serialize(InvoiceMock(series="RR", number=111), fields)
+
+        serializer = ResourceJsonSerializer(self.resource_ref)
+
+        self.assertIs(self._serializer._supported_attrs, serializer._supported_attrs)
+        self.assertIs(self._serializer._get_plan(fields), serializer._get_plan(fields))
+        self.assertIsNot(serializer._get_plan(fields), serializer._get_plan("series"))
+        self.assertEqual(2, len(serializer._get_plan(fields)))
+
+    def test_serialize_plan_shared(self):
+        '''This test case ensures a cached serialization plan does not keep the serializer which compiled it alive and always
+        runs against the serializer executing it.'''
+
+        fields = "series,items(quantity)"
+
+        plan = self._serializer._get_plan(fields)
+
+        for serialize_step in plan:
+            self.assertNotIn(self._serializer, [cell.cell_contents for cell in serialize_step.__closure__ or []])
+
+        serializer = ResourceJsonSerializer(self.resource_ref)
+        serializer._converters = {str: lambda value: value.lower()}
+
+        model = InvoiceMock(series="RR", items=InvoiceLineItemMock(quantity=5))
+
+        self.assertEqual({"series": "rr", "items": {"quantity": 5}}, serializer.serialize(model, fields))
+        self.assertEqual({"series": "RR", "items": {"quantity": 5}}, self._serializer.serialize(model, fields))
+        self.assertIs(plan, serializer._get_plan(fields))
+
+    def test_serialize_list_ok(self):
+        '''This test case ensures a list of models is serialized exactly like each model separately.'''
+
+        models = [InvoiceMock(series="RR", number=idx, total=20.00, vat_percent=0.24, vat=0.19) for idx in range(5)]
+
+        for fields in [None, "number, series"]:
+            self.assertEqual([self._serializer.serialize(model, fields) for model in models],
+                             self._serializer.serialize_list(models, fields))
+
+        self.assertEqual([], self._serializer.serialize_list([]))
+
+        with self.assertRaises(ResourceJsonSerializerError):
+            self._serializer.serialize_list(models, "unknown_attr")
+
+    def test_get_projection_ok(self):
+        '''This test case ensures requested fields are converted to the model attributes which must be loaded.'''
+
+        self.assertIsNone(self._serializer.get_projection(None))
+        self.assertIsNone(self._serializer.get_projection(""))
+        self.assertEqual(["number", "series"], self._serializer.get_projection("number, series"))
+        self.assertEqual(["items.name", "items.price", "number"], self._serializer.get_projection("number,items(name, price)"))
+
 class InvoiceMock(BASEMODEL):
     __tablename__ = "invoices_mock"
 
@@ -0,0 +1,136 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.routing_engine.controllers_pool
+'''
+from fantastico.utils import instantiator
+import threading
+
+class ControllersPool(object):
+    '''This class manages the lifecycle of controllers used for handling requests. Controller classes are resolved only once
+    per process and controller instances are reused according to the configured lifecycle:
+
+    * **request** - a new controller instance is built for each request (no reuse). This is the default lifecycle.
+    * **thread** - each worker thread holds its own controller instances. Controllers are reused by consecutive requests
+      so they must not keep per request state on **self** (it would leak from one request to the next).
+    * **process** - a single controller instance is shared by all threads of the worker. Controllers used with this lifecycle
+      must keep per request state thread local (:py:class:`fantastico.mvc.base_controller.BaseController` already does this).
+
+    .. code-block:: python
+
+        pool = ControllersPool(settings_facade, ControllersPool.LIFECYCLE_THREAD)
+
+        controller = pool.get_controller("fantastico.contrib.roa_discovery.roa_controller.RoaController")'''
+
+    LIFECYCLE_REQUEST = "request"
+    LIFECYCLE_THREAD = "thread"
+    LIFECYCLE_PROCESS = "process"
+
+    LIFECYCLES = [LIFECYCLE_REQUEST, LIFECYCLE_THREAD, LIFECYCLE_PROCESS]
+
+    @property
+    def lifecycle(self):
+        '''This property returns the lifecycle used by this pool for controller instances.'''
+
+        return self._lifecycle
+
+    def __init__(self, settings_facade, lifecycle=LIFECYCLE_REQUEST):
+        '''
+        :param settings_facade: The settings facade instance passed to each controller constructor.
+        :type settings_facade: :py:class:`fantastico.settings.SettingsFacade`
+        :param lifecycle: The lifecycle of controller instances. One of :py:attr:`ControllersPool.LIFECYCLES`.
+        :type lifecycle: str
+        '''
+
+        self._settings_facade = settings_facade
+        self._lifecycle = lifecycle
+        self._classes = {}
+        self._instances = {}
+        self._instances_local = threading.local()
+        self._instances_lock = threading.Lock()
+
+    def get_class(self, full_name):
+        '''This method resolves the given controller class full name to a class. Classes are imported only once.
+
+        :param full_name: Controller class fully qualified name.
+        :type full_name: str
+        :raises fantastico.exceptions.FantasticoClassNotFoundError: if the class can not be imported.'''
+
+        controller_cls = self._classes.get(full_name)
+
+        if controller_cls is None:
+            controller_cls = instantiator.import_class(full_name)
+            self._classes[full_name] = controller_cls
+
+        return controller_cls
+
+    def get_controller(self, full_name):
+        '''This method returns a controller instance for the given class full name according to the configured lifecycle.
+
+        :param full_name: Controller class fully qualified name.
+        :type full_name: str
+        :returns: A controller instance.'''
+
+        if self._lifecycle == ControllersPool.LIFECYCLE_PROCESS:
+            return self._get_process_controller(full_name)
+
+        if self._lifecycle == ControllersPool.LIFECYCLE_THREAD:
+            return self._get_thread_controller(full_name)
+
+        return self._new_controller(full_name)
+
+    def _new_controller(self, full_name):
+        '''This method builds a new controller instance.'''
+
+        return self.get_class(full_name)(self._settings_facade)
+
+    def _get_thread_controller(self, full_name):
+        '''This method returns the controller instance owned by the current thread.'''
+
+        instances = getattr(self._instances_local, "controllers", None)
+
+        if instances is None:
+            instances = self._instances_local.controllers = {}
+
+        controller = instances.get(full_name)
+
+        if controller is None:
+            controller = instances[full_name] = self._new_controller(full_name)
+
+        return controller
+
+    def _get_process_controller(self, full_name):
+        '''This method returns the controller instance shared by all threads of the current process.'''
+
+        controller = self._instances.get(full_name)
+
+        if controller is not None:
+            return controller
+
+        with self._instances_lock:
+            controller = self._instances.get(full_name)
+
+            if controller is None:
+                controller = self._instances[full_name] = self._new_controller(full_name)
+
+        return controller
+
+    def clear(self):
+        '''This method drops all cached controller instances. Resolved classes are kept.'''
+
+        with self._instances_lock:
+            self._instances = {}
+            self._instances_local = threading.local()
@@ -64,3 +64,106 @@ class RedirectResponse(Response):
             return
 
         self._destination = "%s?%s" % (self._destination, "&".join(params))
+
+class StreamedBody(object):
+    '''This class wraps an iterator of body chunks into a WSGI response iterable which notifies registered listeners when the
+    WSGI server closes it (after the whole body was sent or the client went away). Resources needed for producing the body
+    (e.g the db session of the request) are released by these listeners instead of being released when the application
+    returns. A guard (context manager factory) can be set in order to wrap the production of each chunk (e.g mark the db
+    session of the request as in use).'''
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._close_listeners = []
+        self._closed = False
+        self._guard = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._guard is None:
+            return next(self._chunks)
+
+        with self._guard():
+            return next(self._chunks)
+
+    def guard_with(self, guard):
+        '''This method sets the context manager factory entered while each chunk is produced and while the chunks iterator is
+        closed.'''
+
+        self._guard = guard
+
+    def on_close(self, listener):
+        '''This method registers a callable which is invoked when the body is closed.'''
+
+        self._close_listeners.append(listener)
+
+    def close(self):
+        '''This method closes the chunks iterator and notifies all registered listeners. It is invoked by the WSGI server
+        (PEP 3333) and it is safe to invoke it multiple times.'''
+
+        if self._closed:
+            return
+
+        self._closed = True
+
+        try:
+            if hasattr(self._chunks, "close"):
+                if self._guard is None:
+                    self._chunks.close()
+                else:
+                    with self._guard():
+                        self._chunks.close()
+        finally:
+            self._notify_listeners(self._close_listeners)
+
+    def _notify_listeners(self, listeners):
+        '''This method invokes the given listeners in order. All listeners are invoked even if some of them fail; the first
+        error is raised afterwards.'''
+
+        first_error = None
+
+        for listener in listeners:
+            try:
+                listener()
+            except Exception as ex:
+                first_error = first_error or ex
+
+        if first_error:
+            raise first_error
+
+class StreamedResponse(Response):
+    '''This class provides a response whose body is sent to the client chunk by chunk while it is produced. It is useful for
+    big bodies which must not be held in memory:
+
+    .. code-block:: python
+
+        @Controller(url="/export/persons", models={"Person": "persons.models.Person"})
+        def export_persons(self, request):
+            persons = request.models.Person.iter_records_paged(start_record=0, end_record=100000, batch_size=500)
+
+            return StreamedResponse((("%s,%s\\n" % (person.id, person.name)).encode() for person in persons),
+                                    content_type="text/csv")
+
+    The request resources (db session included) are released only after the whole body was sent.'''
+
+    def __init__(self, chunks, content_type="application/json", status=200, **kwargs):
+        super(StreamedResponse, self).__init__(app_iter=StreamedBody(chunks), content_type=content_type, status=status,
+                                               **kwargs)
+
+def release_after(app_iter, release_fn):
+    '''This method invokes the given release function once the given response body was sent. For
+    :py:class:`StreamedBody` bodies the function is invoked when the body is closed; all other bodies are already complete so
+    the function is invoked immediately.
+
+    :returns: The given response body.'''
+
+    if isinstance(app_iter, StreamedBody):
+        app_iter.on_close(release_fn)
+
+        return app_iter
+
+    release_fn()
+
+    return app_iter
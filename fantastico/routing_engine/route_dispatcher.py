@@ -0,0 +1,179 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.routing_engine.route_dispatcher
+'''
+import re
+
+class RouteTrieNode(object):
+    '''This class describes a node from the literal prefix trie used by :py:class:`RouteDispatcher`. Each node holds the
+    indexes of the compiled routes whose literal prefix ends exactly in this node.'''
+
+    __slots__ = ("children", "routes_idx")
+
+    def __init__(self):
+        self.children = {}
+        self.routes_idx = []
+
+class RouteDispatcher(object):
+    '''This class provides a compiled dispatch table for a given set of routes. It is built once when routes are registered
+    and it is used on each request to determine the routes which match a given url. Route patterns are compiled only once and
+    indexed by their literal prefix:
+
+    * anchored patterns (starting with **^**) are stored in a trie so only routes sharing a prefix with the url are tested.
+    * unanchored patterns are tested only when their literal prefix can be found in the url.
+
+    Candidate routes are always evaluated in registration order, so the results are identical with the ones obtained by
+    searching each registered pattern on the given url.
+
+    .. code-block:: python
+
+        dispatcher = RouteDispatcher({"^/simple/url$": {"http_verbs": {"GET": "simple.Controller.handle"}}})
+
+        for route_config, url_params in dispatcher.match("/simple/url"):
+            print(route_config, url_params)'''
+
+    REGEX_METACHARS = ".^$*+?{}[]|()\\"
+    REGEX_QUANTIFIERS = "*?{"
+    REGEX_ESCAPED_LITERALS = "./-_~:;,=&%#@!'\"<> "
+
+    def __init__(self, routes):
+        '''
+        :param routes: A dictionary of routes (compatible with :py:meth:`fantastico.routing_engine.router.Router.register_routes`).
+        :type routes: dict
+        '''
+
+        self._compiled_routes = []
+        self._trie_root = RouteTrieNode()
+        self._unanchored_routes = []
+
+        for route_pat, route_config in routes.items():
+            self._register_route(route_pat, route_config)
+
+    @property
+    def routes_count(self):
+        '''This property returns the number of compiled routes held by this dispatcher.'''
+
+        return len(self._compiled_routes)
+
+    def _register_route(self, route_pat, route_config):
+        '''This method compiles the given route pattern and indexes it by literal prefix.'''
+
+        route_idx = len(self._compiled_routes)
+        anchored, literal_prefix = self.extract_literal_prefix(route_pat)
+
+        self._compiled_routes.append((re.compile(route_pat), route_config, literal_prefix))
+
+        if not anchored:
+            self._unanchored_routes.append(route_idx)
+            return
+
+        node = self._trie_root
+
+        for char in literal_prefix:
+            node = node.children.setdefault(char, RouteTrieNode())
+
+        node.routes_idx.append(route_idx)
+
+    @classmethod
+    def extract_literal_prefix(cls, route_pat):
+        '''This method determines the literal prefix of a given route pattern. The prefix is conservative: every url matched by
+        the pattern is guaranteed to contain it (at the beginning for anchored patterns).
+
+        :param route_pat: The regular expression describing the route.
+        :type route_pat: str
+        :returns: A tuple (anchored, literal_prefix).
+        :rtype: tuple'''
+
+        anchored = route_pat.startswith("^")
+
+        if cls._has_alternation(route_pat):
+            return anchored, ""
+
+        prefix = []
+        idx = 1 if anchored else 0
+
+        while idx < len(route_pat):
+            char = route_pat[idx]
+
+            if char == "\\" and idx + 1 < len(route_pat) and route_pat[idx + 1] in cls.REGEX_ESCAPED_LITERALS:
+                literal, idx = route_pat[idx + 1], idx + 2
+            elif char in cls.REGEX_METACHARS:
+                break
+            else:
+                literal, idx = char, idx + 1
+
+            if idx < len(route_pat) and route_pat[idx] in cls.REGEX_QUANTIFIERS:
+                break
+
+            prefix.append(literal)
+
+        return anchored, "".join(prefix)
+
+    @staticmethod
+    def _has_alternation(route_pat):
+        '''This method detects if the given pattern contains an unescaped alternation operator.'''
+
+        escaped = False
+
+        for char in route_pat:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == "|":
+                return True
+
+        return False
+
+    def match(self, url):
+        '''This method returns all routes matching the given url in registration order.
+
+        :param url: The relative url we want to resolve. E.g: /component1/test/url
+        :type url: str
+        :returns: A list of tuples (route_config, url_params).
+        :rtype: list'''
+
+        candidates = list(self._unanchored_routes)
+        node = self._trie_root
+        candidates.extend(node.routes_idx)
+
+        for char in url:
+            node = node.children.get(char)
+
+            if node is None:
+                break
+
+            candidates.extend(node.routes_idx)
+
+        candidates.sort()
+
+        matches = []
+
+        for route_idx in candidates:
+            route_regex, route_config, literal_prefix = self._compiled_routes[route_idx]
+
+            if literal_prefix not in url:
+                continue
+
+            match = route_regex.search(url)
+
+            if not match:
+                continue
+
+            matches.append((route_config, match.groupdict()))
+
+        return matches
@@ -18,14 +18,62 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 .. py:module:: fantastico.routing_engine.router
 '''
 from fantastico.exceptions import FantasticoDuplicateRouteError, FantasticoNoRoutesError, FantasticoRouteNotFoundError, \
-    FantasticoHttpVerbNotSupported
+    FantasticoHttpVerbNotSupported, FantasticoSettingNotFoundError
+from fantastico.routing_engine.controllers_pool import ControllersPool
+from fantastico.routing_engine.route_dispatcher import RouteDispatcher
 from fantastico.settings import SettingsFacade
 from fantastico.utils import instantiator
-import re
+from fantastico.utils.lru_cache import LruCache
+from types import MappingProxyType
 import threading
 
+class RouteMatch(object):
+    '''This class holds the result of routing a request: the controller instance, the controller method name which must be
+    executed and the parameters extracted from url. A route match is immutable and it is built for each request, so concurrent
+    requests never share url parameters. It is stored in WSGI environ under :py:attr:`Router.ROUTE_MATCH_KEY` key.'''
+
+    __slots__ = ("_controller", "_method", "_url_params")
+
+    EMPTY_URL_PARAMS = MappingProxyType({})
+
+    def __init__(self, controller, method, url_params=None):
+        object.__setattr__(self, "_controller", controller)
+        object.__setattr__(self, "_method", method)
+        object.__setattr__(self, "_url_params", url_params if url_params is not None else RouteMatch.EMPTY_URL_PARAMS)
+
+    @property
+    def controller(self):
+        '''This property returns the controller instance which handles the request.'''
+
+        return self._controller
+
+    @property
+    def method(self):
+        '''This property returns the name of the controller method which handles the request.'''
+
+        return self._method
+
+    @property
+    def url_params(self):
+        '''This property returns a read only mapping of the named groups extracted from url.'''
+
+        return self._url_params
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RouteMatch is immutable.")
+
 class Router(object):
-    '''This class is used for registering all available routes by using all registered loaders.'''
+    '''This class is used for registering all available routes by using all registered loaders. Resolved routes are kept
+    in a per process least recently used cache keyed by (url, http verb) so that hot urls skip routes matching completely.
+    The size of the cache is configured through **routes_cache_size** setting
+    (:py:attr:`fantastico.settings.BasicSettings.routes_cache_size`).
+
+    Controller instances which handle the requests are obtained from a
+    :py:class:`fantastico.routing_engine.controllers_pool.ControllersPool` configured through **controllers_lifecycle** setting
+    (:py:attr:`fantastico.settings.BasicSettings.controllers_lifecycle`).'''
+
+    ROUTES_CACHE_SIZE_DEFAULT = 1024
+    ROUTE_MATCH_KEY = "fantastico.route_match"
 
     def __init__(self, settings_facade=SettingsFacade):
         self._settings_facade = settings_facade()
@@ -33,6 +81,9 @@ class Router(object):
         self._loader_lock = None
         self._routes_lock = None
         self._routes = {}
+        self._dispatcher = None
+        self._routes_cache = None
+        self._controllers_pool = None
 
     def get_loaders(self):
         '''Method used to retrieve all available loaders. If loaders are not currently instantiated they are by these method.
@@ -66,7 +117,9 @@ class Router(object):
     def register_routes(self):
         '''Method used to register all routes from all loaders. If the loaders are not yet initialized this method will first
         load all available loaders and then it will register all available routes. Also, this method initialize available routes
-        only once when it is first invoked.'''
+        only once when it is first invoked. Once routes are registered, a compiled dispatch table
+        (:py:class:`fantastico.routing_engine.route_dispatcher.RouteDispatcher`) is built for them and the resolved routes cache
+        is reset (:py:meth:`_compile_routes`).'''
 
         if len(self._loaders) == 0:
             self.get_loaders()
@@ -87,6 +140,9 @@ class Router(object):
 
                     self._routes[route] = loader_routes[route]
 
+            self._compile_routes()
+            self._controllers_pool = self._build_controllers_pool()
+
         if self._routes_lock:
             self._routes_lock.release()
             self._routes_lock = None
@@ -96,16 +152,89 @@ class Router(object):
 
         return self._routes
 
+    def _compile_routes(self):
+        '''This method builds the dispatch table for the currently registered routes and drops all resolved routes. It must be
+        invoked every time registered routes change; route lookups never rebuild the dispatch table.'''
+
+        self._dispatcher = RouteDispatcher(self._routes)
+        self._routes_cache = self._build_routes_cache()
+
+    def _build_routes_cache(self):
+        '''This method builds the resolved routes cache using the configured size. If the size is not configured (or it is
+        invalid) a default size is used.'''
+
+        try:
+            cache_size = self._settings_facade.get("routes_cache_size")
+        except FantasticoSettingNotFoundError:
+            cache_size = None
+
+        if not isinstance(cache_size, int):
+            cache_size = Router.ROUTES_CACHE_SIZE_DEFAULT
+
+        return LruCache(cache_size)
+
+    def _build_controllers_pool(self):
+        '''This method builds the controllers pool using the configured controllers lifecycle. If the lifecycle is not configured
+        (or it is invalid) request lifecycle is used.'''
+
+        try:
+            lifecycle = self._settings_facade.get("controllers_lifecycle")
+        except FantasticoSettingNotFoundError:
+            lifecycle = None
+
+        if lifecycle not in ControllersPool.LIFECYCLES:
+            lifecycle = ControllersPool.LIFECYCLE_REQUEST
+
+        return ControllersPool(self._settings_facade, lifecycle)
+
+    def get_cache_stats(self):
+        '''This method returns resolved routes cache statistics. It is useful for monitoring cache efficiency.
+
+        :returns: A dictionary containing **hits**, **misses**, **size** and **max_size** keys.
+        :rtype: dict'''
+
+        if self._routes_cache is None:
+            self._routes_cache = self._build_routes_cache()
+
+        return self._routes_cache.stats
+
     def handle_route(self, url, environ):
-        '''Method used to identify the given url method handler. It enrich the environ dictionary with a new entry that
-        holds a controller instance and a function to be executed from that controller.'''
+        '''Method used to identify the given url method handler. It enrich the environ dictionary with a
+        :py:class:`RouteMatch` instance (stored under :py:attr:`Router.ROUTE_MATCH_KEY`) that holds a controller instance and
+        a function to be executed from that controller. Resolved routes are cached so that subsequent requests for the same url
+        and http verb do not match routes again.'''
 
-        route_configs = self._find_url_regex(url)
-        route_config = None
+        http_verb = (environ.get("REQUEST_METHOD") or "").upper()
+
+        if self._routes_cache is None:
+            self._routes_cache = self._build_routes_cache()
+
+        cache_key = (url, http_verb)
+        resolved_route = self._routes_cache.get(cache_key)
+
+        if resolved_route is None:
+            resolved_route = self._resolve_route(url, http_verb)
+            self._routes_cache.put(cache_key, resolved_route)
+
+        controller_cls, controller_meth, url_params = resolved_route
+
+        if self._controllers_pool is None:
+            self._controllers_pool = self._build_controllers_pool()
 
-        http_verb = environ.get("REQUEST_METHOD").upper()
+        environ[Router.ROUTE_MATCH_KEY] = RouteMatch(self._controllers_pool.get_controller(controller_cls), controller_meth,
+                                                     url_params)
 
-        for route_config in route_configs:
+    def _resolve_route(self, url, http_verb):
+        '''This method determines the controller class, controller method and url parameters which can handle the given url
+        and http verb.
+
+        :returns: A tuple (controller_cls, controller_meth, url_params). Url params are read only.
+        :rtype: tuple'''
+
+        route_configs = self._find_url_regex(url)
+        route_config, url_params = None, None
+
+        for route_config, url_params in route_configs:
             if http_verb not in route_config["http_verbs"]:
                 route_config = None
                 continue
@@ -125,36 +254,21 @@ class Router(object):
         controller_cls = http_verb_config[:last_dot]
         controller_meth = http_verb_config[last_dot + 1:]
 
-        environ["route_%s_handler" % url] = {"controller": instantiator.instantiate_class(controller_cls,
-                                                                                          [self._settings_facade]),
-                                             "method": controller_meth,
-                                             "url_params": route_config.get("url_params")}
+        return controller_cls, controller_meth, MappingProxyType(url_params)
 
     def _find_url_regex(self, url):
         '''This method is used to obtain route configuration starting from a given url.
 
         :param url: the relative url we want to serve. E.g: /component1/test/url
         :type url: string
-        :returns: A list of dictionaries containing the method and http_verbs supported.
+        :returns: A list of tuples (route_config, url_params). Each route config is a dictionary containing the method and
+            http_verbs supported. Route configs are never modified.
         :raises FantasticoNoRoutesError: This exception is raised if the url does not match any registered patterns.
         '''
 
-        route_configs = []
-        route_config = None
-
-        for route_pat in self._routes.keys():
-            match = re.search(route_pat, url)
+        route_configs = self._dispatcher.match(url) if self._dispatcher else None
 
-            if not match:
-                continue
-
-            route_config = self._routes[route_pat]
-
-            route_config["url_params"] = match.groupdict()
-
-            route_configs.append(route_config)
-
-        if not route_config:
+        if not route_configs:
             raise FantasticoRouteNotFoundError("Route %s is not registered or no config registered." % url)
 
         return route_configs
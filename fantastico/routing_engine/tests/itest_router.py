@@ -49,9 +49,8 @@ class RouterIntegration(FantasticoIntegrationTestCase):
         self._router.register_routes()
         self._router.handle_route(DummyRouteLoader.DUMMY_ROUTE, self._environ)
 
-        route_handler = "route_%s_handler" % DummyRouteLoader.DUMMY_ROUTE
-        route_handler = self._environ.get(route_handler)
+        route_handler = self._environ.get(Router.ROUTE_MATCH_KEY)
 
         self.assertIsNotNone(route_handler)
-        self.assertIsInstance(route_handler["controller"], DummyRouteLoader)
-        self.assertEqual("display_test", route_handler["method"])
+        self.assertIsInstance(route_handler.controller, DummyRouteLoader)
+        self.assertEqual("display_test", route_handler.method)
@@ -0,0 +1,116 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.routing_engine.tests.test_controllers_pool
+'''
+from fantastico.exceptions import FantasticoClassNotFoundError
+from fantastico.routing_engine.controllers_pool import ControllersPool
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from mock import Mock
+from threading import Thread
+
+class ControllersPoolTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases for controllers pool lifecycles.'''
+
+    CONTROLLER_CLS = "fantastico.routing_engine.tests.test_controllers_pool.SimpleController"
+
+    def init(self):
+        '''This method resets the number of built controllers before each test case.'''
+
+        self._settings_facade = Mock()
+        SimpleController.INSTANCES_COUNT = 0
+
+    def _get_controllers_async(self, pool, threads_count=5):
+        '''This method obtains a controller from the given pool on multiple threads and returns all obtained instances.'''
+
+        controllers = []
+
+        def get_controller():
+            controllers.append(pool.get_controller(self.CONTROLLER_CLS))
+            controllers.append(pool.get_controller(self.CONTROLLER_CLS))
+
+        threads = [Thread(target=get_controller) for idx in range(threads_count)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(100)
+
+        return controllers
+
+    def test_request_lifecycle(self):
+        '''This test case ensures a new controller is built for each request when request lifecycle is used.'''
+
+        pool = ControllersPool(self._settings_facade, ControllersPool.LIFECYCLE_REQUEST)
+
+        controller1 = pool.get_controller(self.CONTROLLER_CLS)
+        controller2 = pool.get_controller(self.CONTROLLER_CLS)
+
+        self.assertIsInstance(controller1, SimpleController)
+        self.assertFalse(controller1 is controller2)
+        self.assertEqual(self._settings_facade, controller1.settings_facade)
+        self.assertEqual(2, SimpleController.INSTANCES_COUNT)
+
+    def test_thread_lifecycle(self):
+        '''This test case ensures each thread reuses its own controller instance when thread lifecycle is used.'''
+
+        pool = ControllersPool(self._settings_facade, ControllersPool.LIFECYCLE_THREAD)
+
+        controllers = self._get_controllers_async(pool, threads_count=5)
+
+        self.assertEqual(10, len(controllers))
+        self.assertEqual(5, len(set([id(controller) for controller in controllers])))
+        self.assertEqual(5, SimpleController.INSTANCES_COUNT)
+
+    def test_process_lifecycle(self):
+        '''This test case ensures a single controller instance is shared by all threads when process lifecycle is used.'''
+
+        pool = ControllersPool(self._settings_facade, ControllersPool.LIFECYCLE_PROCESS)
+
+        controllers = self._get_controllers_async(pool, threads_count=5)
+
+        self.assertEqual(10, len(controllers))
+        self.assertEqual(1, len(set([id(controller) for controller in controllers])))
+        self.assertEqual(1, SimpleController.INSTANCES_COUNT)
+
+    def test_clear(self):
+        '''This test case ensures cached controller instances are dropped by clear.'''
+
+        pool = ControllersPool(self._settings_facade, ControllersPool.LIFECYCLE_PROCESS)
+
+        controller = pool.get_controller(self.CONTROLLER_CLS)
+        pool.clear()
+
+        self.assertFalse(controller is pool.get_controller(self.CONTROLLER_CLS))
+
+    def test_class_notfound(self):
+        '''This test case ensures an exception is raised for controller classes which can not be resolved.'''
+
+        pool = ControllersPool(self._settings_facade)
+
+        self.assertRaises(FantasticoClassNotFoundError, pool.get_controller,
+                          "fantastico.routing_engine.tests.not_found.Controller")
+
+class SimpleController(object):
+    '''This class provides a simple controller used for unit testing purposes.'''
+
+    INSTANCES_COUNT = 0
+
+    def __init__(self, settings_facade):
+        self.settings_facade = settings_facade
+
+        SimpleController.INSTANCES_COUNT += 1
@@ -0,0 +1,84 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.routing_engine.tests.test_route_dispatcher
+'''
+from fantastico.routing_engine.route_dispatcher import RouteDispatcher
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+import re
+
+class RouteDispatcherTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases which ensure compiled route dispatcher matches exactly the same routes as a linear
+    search through all registered patterns.'''
+
+    ROUTES = {"/index.html": {"http_verbs": {"GET": "Controller.index"}},
+              "^/api/(?P<version>\\d{1,}\\.\\d{1,})(?P<resource_url>/[^/]*?)$": {"http_verbs": {"GET": "Roa.collection"}},
+              "^/api/latest(?P<resource_url>/[^/]*?)$": {"http_verbs": {"GET": "Roa.collection_latest"}},
+              "^/api/(?P<version>\\d{1,}\\.\\d{1,})(?P<resource_url>/[^/]*?)/(?P<resource_id>.*?)$":
+                    {"http_verbs": {"GET": "Roa.item"}},
+              "/roa/resources(/)?$": {"http_verbs": {"GET": "Discovery.list"}},
+              "^/tracking-codes/codes(/)?$": {"http_verbs": {"GET": "Tracking.list"}},
+              "^/oauth/idp/(ui/login|login)$": {"http_verbs": {"GET": "Idp.login"}},
+              "^/(?P<component_name>.*)/static/(?P<path>.*)$": {"http_verbs": {"GET": "Static.serve"}},
+              "/dynamic/(?P<page_url>.*)$": {"http_verbs": {"GET": "Pages.serve"}},
+              "^/x?y/opt$": {"http_verbs": {"GET": "Opt.serve"}}}
+
+    def init(self):
+        '''This method builds a dispatcher for the routes used in this test case.'''
+
+        self._dispatcher = RouteDispatcher(self.ROUTES)
+
+    def _linear_match(self, url):
+        '''This method provides the reference results obtained by searching every pattern on the given url.'''
+
+        matches = []
+
+        for route_pat, route_config in self.ROUTES.items():
+            match = re.search(route_pat, url)
+
+            if match:
+                matches.append((route_config, match.groupdict()))
+
+        return matches
+
+    def test_literal_prefix_extraction(self):
+        '''This test case ensures literal prefixes are extracted conservatively from route patterns.'''
+
+        self.assertEqual((False, "/index"), RouteDispatcher.extract_literal_prefix("/index.html"))
+        self.assertEqual((True, "/api/latest"), RouteDispatcher.extract_literal_prefix("^/api/latest(?P<resource_url>/.*)$"))
+        self.assertEqual((True, "/tracking-codes/codes"), RouteDispatcher.extract_literal_prefix("^/tracking-codes/codes(/)?$"))
+        self.assertEqual((True, "/api/v1.0"), RouteDispatcher.extract_literal_prefix("^/api/v1\\.0$"))
+        self.assertEqual((True, "/"), RouteDispatcher.extract_literal_prefix("^/x?y/opt$"))
+        self.assertEqual((True, ""), RouteDispatcher.extract_literal_prefix("^/a|/b$"))
+
+    def test_match_same_as_linear_search(self):
+        '''This test case ensures dispatcher results (including order and url params) are identical with the ones obtained
+        by searching every registered pattern.'''
+
+        urls = ["/index.html", "/index2.html", "/prefix/index.html", "/api/1.0/persons", "/api/1.0/persons/10",
+                "/api/latest/persons", "/api/latest/persons/10", "/roa/resources", "/roa/resources/",
+                "/tracking-codes/codes", "/tracking-codes/codes/", "/oauth/idp/login", "/oauth/idp/ui/login",
+                "/comp/static/css/main.css", "/dynamic/page/1", "/comp/dynamic/static/a", "/y/opt", "/xy/opt",
+                "/not/found", ""]
+
+        for url in urls:
+            self.assertEqual(self._linear_match(url), self._dispatcher.match(url), url)
+
+    def test_match_notfound(self):
+        '''This test case ensures an empty list is returned for unregistered urls.'''
+
+        self.assertEqual([], self._dispatcher.match("/simple/not-registered"))
+        self.assertEqual(len(self.ROUTES), self._dispatcher.routes_count)
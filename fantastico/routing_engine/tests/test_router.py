@@ -19,7 +19,8 @@ ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEAL
 '''
 from fantastico.exceptions import FantasticoClassNotFoundError, FantasticoDuplicateRouteError, FantasticoNoRoutesError, \
     FantasticoRouteNotFoundError, FantasticoHttpVerbNotSupported
-from fantastico.routing_engine.router import Router
+from fantastico.routing_engine.controllers_pool import ControllersPool
+from fantastico.routing_engine.router import Router, RouteMatch
 from fantastico.routing_engine.routing_loaders import RouteLoader
 from fantastico.tests.base_case import FantasticoUnitTestsCase
 from mock import Mock
@@ -174,11 +175,12 @@ class RouterTests(FantasticoUnitTestsCase):
 
         self._router.handle_route("/index.html", environ)
 
-        handler = environ.get("route_/index.html_handler")
+        handler = environ.get(Router.ROUTE_MATCH_KEY)
 
-        self.assertIsNotNone(handler)
-        self.assertIsInstance(handler.get("controller"), Controller)
-        self.assertEqual("do_stuff", handler.get("method"))
+        self.assertIsInstance(handler, RouteMatch)
+        self.assertIsInstance(handler.controller, Controller)
+        self.assertEqual("do_stuff", handler.method)
+        self.assertEqual({}, dict(handler.url_params))
 
     def test_handle_route_regex_ok(self):
         '''Test case that ensures handle route correctly identifies a reg ex mapped url and execute it accordingly.'''
@@ -191,13 +193,13 @@ class RouterTests(FantasticoUnitTestsCase):
 
         self._router.handle_route("/test-component/static-test/path/to/nowhere", environ)
 
-        handler = environ.get("route_/test-component/static-test/path/to/nowhere_handler")
+        handler = environ.get(Router.ROUTE_MATCH_KEY)
 
         self.assertIsNotNone(handler)
-        self.assertIsInstance(handler.get("controller"), Controller)
-        self.assertEqual("do_regex_action", handler.get("method"))
+        self.assertIsInstance(handler.controller, Controller)
+        self.assertEqual("do_regex_action", handler.method)
 
-        url_params = handler.get("url_params")
+        url_params = handler.url_params
         self.assertIsNotNone(url_params)
         self.assertEqual("test-component", url_params.get("component_name"))
         self.assertEqual("path/to/nowhere", url_params.get("path"))
@@ -250,6 +252,156 @@ class RouterTests(FantasticoUnitTestsCase):
 
         self.assertEqual("POST", cm.exception.http_verb)
 
+    def test_handle_route_cached(self):
+        '''This test case ensures subsequent requests for the same url and http verb are resolved from routes cache without
+        matching routes again.'''
+
+        self._settings_facade.get = Mock(return_value=["fantastico.routing_engine.tests.test_router.TestLoader"])
+
+        self._router.register_routes()
+
+        url = "/test-component/static-test/path/to/nowhere"
+
+        self._router.handle_route(url, {"REQUEST_METHOD": "GET"})
+
+        self._router._find_url_regex = Mock(side_effect=Exception("Routes matching must not be invoked."))
+
+        environ = {"REQUEST_METHOD": "GET"}
+        self._router.handle_route(url, environ)
+
+        handler = environ.get(Router.ROUTE_MATCH_KEY)
+
+        self.assertIsInstance(handler.controller, Controller)
+        self.assertEqual("do_regex_action", handler.method)
+        self.assertEqual({"component_name": "test-component", "path": "path/to/nowhere"}, dict(handler.url_params))
+
+        stats = self._router.get_cache_stats()
+
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["size"])
+        self.assertEqual(Router.ROUTES_CACHE_SIZE_DEFAULT, stats["max_size"])
+
+    def test_handle_route_recompiled(self):
+        '''This test case ensures route lookups never rebuild the dispatch table: it is rebuilt (and resolved routes are
+        dropped) only when registered routes are compiled again, even if a route is replaced without changing routes count.'''
+
+        self._settings_facade.get = Mock(return_value=["fantastico.routing_engine.tests.test_router.TestLoader"])
+
+        routes = self._router.register_routes()
+
+        self._router.handle_route("/index.html", {"REQUEST_METHOD": "GET"})
+
+        routes["/index.html"] = {"http_verbs": {"GET": "fantastico.routing_engine.tests.test_router.Controller.do_stuff2"}}
+
+        self._router._routes_cache.clear()
+
+        environ = {"REQUEST_METHOD": "GET"}
+        self._router.handle_route("/index.html", environ)
+
+        self.assertEqual("do_stuff", environ[Router.ROUTE_MATCH_KEY].method)
+
+        self._router._compile_routes()
+
+        self.assertEqual(0, self._router.get_cache_stats()["size"])
+
+        self._router.handle_route("/index.html", environ)
+
+        self.assertEqual("do_stuff2", environ[Router.ROUTE_MATCH_KEY].method)
+
+    def test_handle_route_notregistered(self):
+        '''This test case ensures no route is found before routes are registered.'''
+
+        self.assertRaises(FantasticoRouteNotFoundError, self._router.handle_route, *["/index.html", {"REQUEST_METHOD": "GET"}])
+
+    def test_handle_route_controller_default(self):
+        '''This test case ensures a new controller instance is built for each request by default (request lifecycle).'''
+
+        self._settings_facade.get = Mock(return_value=["fantastico.routing_engine.tests.test_router.TestLoader"])
+
+        self._router.register_routes()
+
+        environ1, environ2 = {"REQUEST_METHOD": "GET"}, {"REQUEST_METHOD": "GET"}
+
+        self._router.handle_route("/index.html", environ1)
+        self._router.handle_route("/index.html", environ2)
+
+        controller = environ1[Router.ROUTE_MATCH_KEY].controller
+
+        self.assertIsInstance(controller, Controller)
+        self.assertFalse(controller is environ2[Router.ROUTE_MATCH_KEY].controller)
+
+    def test_handle_route_controller_reused(self):
+        '''This test case ensures controller instances are reused between requests when thread lifecycle is configured.'''
+
+        def get_setting(setting_name):
+            if setting_name == "controllers_lifecycle":
+                return ControllersPool.LIFECYCLE_THREAD
+
+            return ["fantastico.routing_engine.tests.test_router.TestLoader"]
+
+        self._settings_facade.get = Mock(side_effect=get_setting)
+
+        self._router.register_routes()
+
+        environ1, environ2 = {"REQUEST_METHOD": "GET"}, {"REQUEST_METHOD": "GET"}
+
+        self._router.handle_route("/index.html", environ1)
+        self._router.handle_route("/index.html", environ2)
+
+        controller = environ1[Router.ROUTE_MATCH_KEY].controller
+
+        self.assertIsInstance(controller, Controller)
+        self.assertTrue(controller is environ2[Router.ROUTE_MATCH_KEY].controller)
+
+    def test_handle_route_match_isolated(self):
+        '''This test case ensures each request receives its own immutable route match and registered routes configuration is
+        never changed by requests handling.'''
+
+        self._settings_facade.get = Mock(return_value=["fantastico.routing_engine.tests.test_router.TestLoader"])
+
+        routes = self._router.register_routes()
+
+        environ1, environ2 = {"REQUEST_METHOD": "GET"}, {"REQUEST_METHOD": "GET"}
+
+        self._router.handle_route("/comp1/static-test/path1", environ1)
+        self._router.handle_route("/comp2/static-test/path2", environ2)
+
+        route_match1, route_match2 = environ1[Router.ROUTE_MATCH_KEY], environ2[Router.ROUTE_MATCH_KEY]
+
+        self.assertEqual({"component_name": "comp1", "path": "path1"}, dict(route_match1.url_params))
+        self.assertEqual({"component_name": "comp2", "path": "path2"}, dict(route_match2.url_params))
+
+        for route_config in routes.values():
+            self.assertFalse("url_params" in route_config)
+
+        with self.assertRaises(AttributeError):
+            route_match1.method = "do_stuff"
+
+        with self.assertRaises(TypeError):
+            route_match1.url_params["path"] = "changed"
+
+    def test_handle_route_cache_size(self):
+        '''This test case ensures routes cache size is read from settings.'''
+
+        def get_setting(name):
+            if name == "routes_cache_size":
+                return 1
+
+            return ["fantastico.routing_engine.tests.test_router.TestLoader"]
+
+        self._settings_facade.get = Mock(side_effect=get_setting)
+
+        self._router.register_routes()
+
+        self._router.handle_route("/index.html", {"REQUEST_METHOD": "GET"})
+        self._router.handle_route("/test-component/static-test/path", {"REQUEST_METHOD": "GET"})
+
+        stats = self._router.get_cache_stats()
+
+        self.assertEqual(1, stats["size"])
+        self.assertEqual(1, stats["max_size"])
+
 class TestLoader(RouteLoader):
     '''Simple route loader used for unit testing.'''
 
@@ -0,0 +1,116 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. py:module:: fantastico.routing_engine.tests.test_streamed_response
+'''
+from fantastico.routing_engine.custom_responses import StreamedBody, StreamedResponse, release_after
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from mock import Mock
+from webob.response import Response
+
+class StreamedResponseTests(FantasticoUnitTestsCase):
+    '''This class provides test cases for ensuring streamed responses send their body chunk by chunk and release resources
+    only after the body was sent.'''
+
+    def test_streamed_response_ok(self):
+        '''This test case ensures a streamed response body is produced lazily from the given chunks.'''
+
+        produced = []
+
+        def produce_chunks():
+            for chunk in [b'{"items": [', b"1, 2", b"]}"]:
+                produced.append(chunk)
+
+                yield chunk
+
+        response = StreamedResponse(produce_chunks())
+
+        self.assertIsInstance(response, Response)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("application/json", response.content_type)
+        self.assertIsInstance(response.app_iter, StreamedBody)
+        self.assertEqual([], produced)
+
+        self.assertEqual(b'{"items": [', next(response.app_iter))
+        self.assertEqual(1, len(produced))
+        self.assertEqual([b"1, 2", b"]}"], list(response.app_iter))
+
+    def test_streamed_body_close(self):
+        '''This test case ensures close listeners are notified only once, even if one of them fails, and the underlining
+        chunks iterator is closed.'''
+
+        chunks = Mock()
+        listener1 = Mock(side_effect=ValueError("Unexpected error."))
+        listener2 = Mock()
+
+        body = StreamedBody([])
+        body._chunks = chunks
+
+        body.on_close(listener1)
+        body.on_close(listener2)
+
+        with self.assertRaises(ValueError):
+            body.close()
+
+        body.close()
+
+        chunks.close.assert_called_once_with()
+        listener1.assert_called_once_with()
+        listener2.assert_called_once_with()
+
+    def test_streamed_body_guard(self):
+        '''This test case ensures the guard wraps the production of each chunk and the closing of the chunks iterator.'''
+
+        events = []
+
+        class Guard(object):
+            def __enter__(self):
+                events.append("enter")
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                events.append("exit")
+
+        def produce_chunks():
+            for chunk in [b"Hello ", b"world"]:
+                events.append(chunk)
+
+                yield chunk
+
+        body = StreamedBody(produce_chunks())
+        body.guard_with(Guard)
+
+        self.assertEqual(b"Hello ", next(body))
+        body.close()
+
+        self.assertEqual(["enter", b"Hello ", "exit", "enter", "exit"], events)
+
+    def test_release_after(self):
+        '''This test case ensures complete bodies are released immediately and streamed bodies are released when closed.'''
+
+        release_fn = Mock()
+
+        self.assertEqual([b"Hello world"], release_after([b"Hello world"], release_fn))
+        release_fn.assert_called_once_with()
+
+        release_fn = Mock()
+        body = StreamedBody([b"Hello world"])
+
+        self.assertEqual(body, release_after(body, release_fn))
+        self.assertEqual([b"Hello world"], list(body))
+        self.assertEqual(0, release_fn.call_count)
+
+        body.close()
+
+        release_fn.assert_called_once_with()
@@ -0,0 +1,66 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.sdk.commands.command_flush_oauth2_clients
+'''
+from fantastico import mvc
+from fantastico.oauth2.models.client_repository import ClientRepository
+from fantastico.sdk import sdk_decorators
+from fantastico.sdk.sdk_core import SdkCommand
+from fantastico.settings import SettingsFacade
+import uuid
+
+@sdk_decorators.SdkCommand(name="flush-oauth2-clients", target="fantastico",
+                           help="Flushes OAuth2 client descriptors cached by running Fantastico processes.")
+class SdkCommandFlushOAuth2Clients(SdkCommand):
+    '''This class provides the command for flushing the OAuth2 client descriptors cache
+    (:py:class:`fantastico.oauth2.models.client_repository.ClientRepository`). The clients cache version is incremented in the
+    database configured by the active settings profile and running processes (on all hosts) flush their cache at most
+    **FLUSH_CHECK_INTERVAL** seconds later. Use this command after changing clients encryption keys, return urls or revoking
+    clients.
+
+    .. code-block:: bash
+
+        # display help information for flush-oauth2-clients command in sdk context
+        fsdk flush-oauth2-clients --help
+
+        # flush client descriptors cache
+        fsdk flush-oauth2-clients
+    '''
+
+    def __init__(self, argv, cmd_factory, client_repo_cls=ClientRepository, settings_facade_cls=SettingsFacade,
+                 init_db_engine_fn=mvc.init_dm_db_engine):
+        super(SdkCommandFlushOAuth2Clients, self).__init__(argv, cmd_factory)
+
+        self._client_repo_cls = client_repo_cls
+        self._settings_facade_cls = settings_facade_cls
+        self._init_db_engine_fn = init_db_engine_fn
+
+    def get_arguments(self):
+        return []
+
+    def exec(self, print_fn=print):
+        '''This method flushes the client descriptors cache.'''
+
+        conn_manager = self._init_db_engine_fn(self._settings_facade_cls().get("database_config"))
+        request_id = uuid.uuid4()
+
+        try:
+            self._client_repo_cls(conn_manager.get_connection(request_id)).flush()
+        finally:
+            conn_manager.close_connection(request_id)
+
+        print_fn("OAuth2 clients cache flushed.")
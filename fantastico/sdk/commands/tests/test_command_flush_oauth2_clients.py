@@ -0,0 +1,72 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+.. codeauthor:: Radu Viorel Cosnita <radu.cosnita@gmail.com>
+.. py:module:: fantastico.sdk.commands.tests.test_command_flush_oauth2_clients
+'''
+from fantastico.sdk.commands.command_flush_oauth2_clients import SdkCommandFlushOAuth2Clients
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from mock import Mock
+
+class SdkCommandFlushOAuth2ClientsTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases for flush-oauth2-clients sdk command.'''
+
+    def test_flush_ok(self):
+        '''This test case ensures the command flushes the client descriptors cache using a connection to the configured
+        database and releases the connection afterwards.'''
+
+        db_config = {"drivername": "mysql+mysqlconnector"}
+        db_conn = Mock()
+
+        client_repo_cls = Mock()
+        print_fn = Mock()
+
+        settings_facade = Mock()
+        settings_facade.get = Mock(return_value=db_config)
+
+        conn_manager = Mock()
+        conn_manager.get_connection = Mock(return_value=db_conn)
+        init_db_engine_fn = Mock(return_value=conn_manager)
+
+        cmd = SdkCommandFlushOAuth2Clients(["flush-oauth2-clients"], Mock(), client_repo_cls,
+                                           settings_facade_cls=Mock(return_value=settings_facade),
+                                           init_db_engine_fn=init_db_engine_fn)
+        cmd.exec(print_fn)
+
+        settings_facade.get.assert_called_once_with("database_config")
+        init_db_engine_fn.assert_called_once_with(db_config)
+        client_repo_cls.assert_called_once_with(db_conn)
+        client_repo_cls.return_value.flush.assert_called_once_with()
+
+        request_id = conn_manager.get_connection.call_args[0][0]
+        conn_manager.close_connection.assert_called_once_with(request_id)
+        print_fn.assert_called_once_with("OAuth2 clients cache flushed.")
+
+    def test_flush_dbex(self):
+        '''This test case ensures the connection is released even if the cache can not be flushed.'''
+
+        conn_manager = Mock()
+        client_repo_cls = Mock()
+        client_repo_cls.return_value.flush = Mock(side_effect=Exception("Unexpected db error."))
+        print_fn = Mock()
+
+        cmd = SdkCommandFlushOAuth2Clients(["flush-oauth2-clients"], Mock(), client_repo_cls,
+                                           settings_facade_cls=Mock(), init_db_engine_fn=Mock(return_value=conn_manager))
+
+        with self.assertRaises(Exception):
+            cmd.exec(print_fn)
+
+        self.assertEqual(1, conn_manager.close_connection.call_count)
+        self.assertEqual(0, print_fn.call_count)
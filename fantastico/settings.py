@@ -44,6 +44,16 @@ class BasicSettings(object):
                 "fantastico.oauth2.middleware.exceptions_middleware.OAuth2ExceptionsMiddleware",
                 "fantastico.oauth2.middleware.tokens_middleware.OAuth2TokensMiddleware"]
 
+    @property
+    def middleware_pipeline_compiled(self):
+        '''This property enables the compiled fast path for middlewares pipeline. The fast path is used only when
+        :py:attr:`installed_middleware` contains exactly the standard middlewares (in the standard order). Read more on
+        :py:class:`fantastico.middleware.middleware_pipeline.CompiledMiddlewarePipeline`. The fast path produces exactly the
+        same responses (and db sessions handling) as the chained standard middlewares; set this to False in order to always
+        execute the middlewares chain.'''
+
+        return True
+
     @property
     def supported_languages(self):
         '''Property that holds all supported languages by this fantastico instance.'''
@@ -58,6 +68,27 @@ class BasicSettings(object):
                 "fantastico.mvc.controller_registrator.ControllerRouteLoader",
                 "fantastico.roa.resources_registrator.ResourcesRegistrator"]
 
+    @property
+    def routes_cache_size(self):
+        '''This property holds the maximum number of resolved routes (url, http verb) cached by each worker. Cached routes
+        skip routes matching completely. By default, 1024 routes are cached. Set this to 0 in order to disable the cache.'''
+
+        return 1024
+
+    @property
+    def controllers_lifecycle(self):
+        '''This property holds the lifecycle of controller instances used for handling requests:
+
+        * **request** - a new controller instance is built for each request (default).
+        * **thread** - controller instances are reused by each worker thread.
+        * **process** - controller instances are shared by all threads of a worker.
+
+        Reusing controller instances is opt in: controllers which store per request state on **self** (other than
+        **curr_request**, which is thread local) must not be pooled. Read more on
+        :py:class:`fantastico.routing_engine.controllers_pool.ControllersPool`.'''
+
+        return "request"
+
     @property
     def mvc_additional_paths(self):
         '''This property defines additional packages which must be scanned for controllers. You can use this in order to specify
@@ -110,9 +141,13 @@ class BasicSettings(object):
                         "database": "fantastico",
                         "additional_params": {"charset": "utf8"},
                         "show_sql": True,
+                        "session_timeout": 300,
                         "additional_engine_settings": {
                             "pool_size": 20,
-                            "pool_recycle": 600}
+                            "max_overflow": 10,
+                            "pool_timeout": 30,
+                            "pool_recycle": 600,
+                            "pool_pre_ping": True}
                       }
 
         As you can see, in your configuration you can influence many attributes used when configuring the driver / database.
@@ -120,6 +155,13 @@ class BasicSettings(object):
 
         Moreover, by default **Fantastico** holds connections opened for 10 minutes. After 10 minutes it refreshes the connection
         and ensures no thread is using that connection till is completely refreshed.
+
+        Connections pool of each worker is configured through **additional_engine_settings**: **pool_size** connections are kept
+        opened, at most **max_overflow** additional connections are opened during load peaks, a request waits at most
+        **pool_timeout** seconds for a connection and **pool_pre_ping** ensures stale connections are detected before being used.
+
+        Db sessions which are not in use and were idle for longer than **session_timeout** seconds are considered leaked and
+        they are closed by a background reaper (read more on :py:class:`fantastico.mvc.DbSessionManager`).
         '''
 
         return {"drivername": "mysql+mysqlconnector",
@@ -130,9 +172,13 @@ class BasicSettings(object):
                 "database": "fantastico",
                 "additional_params": {"charset": "utf8"},
                 "show_sql": False,
+                "session_timeout": 300,
                 "additional_engine_settings": {
                     "pool_size": 20,
-                    "pool_recycle": 600}
+                    "max_overflow": 10,
+                    "pool_timeout": 30,
+                    "pool_recycle": 600,
+                    "pool_pre_ping": True}
                }
 
     @property
@@ -159,18 +205,24 @@ class BasicSettings(object):
         Additionaly, you can control default idp index page. Usually, Fantastico OAuth2 identity provider login page should be
         good enough.
 
+        Passwords are hashed using **passwords_hasher** algorithm (see
+        :py:class:`fantastico.oauth2.passwords_hasher_factory.PasswordsHasherFactory`). It is recommended to use a slow
+        algorithm (pbkdf2-sha256 or scrypt); existing passwords are rehashed transparently when users login.
+
         .. code-block:: python
 
             return {"client_id": "11111111-1111-1111-1111-111111111111",
                     "template": "/components/frontend/views/custom_login.html",
                     "expires_in": 1209600,
-                    "idp_index": "/oauth/idp/ui/login"}
+                    "idp_index": "/oauth/idp/ui/login",
+                    "passwords_hasher": "pbkdf2-sha256"}
         '''
 
         return {"client_id": "11111111-1111-1111-1111-111111111111",
                 "template": "login.html",
                 "expires_in": 1209600,
-                "idp_index": "/oauth/idp/ui/login"}
+                "idp_index": "/oauth/idp/ui/login",
+                "passwords_hasher": "sha512-salt"}
 
     @property
     def access_token_validity(self):
@@ -178,6 +230,21 @@ class BasicSettings(object):
         to 1h = 3600 seconds.'''
 
         return 3600
+
+    @property
+    def oauth2_token_format(self):
+        '''This property defines the format used for encrypting oauth2 tokens. Supported formats are:
+
+            * public - base64 encoded json envelope which holds client_id, type and the AES encrypted token.
+            * compact - binary header (client_id, type, expiration time) followed by the encrypted and signed token attributes
+              (:py:class:`fantastico.oauth2.token_encryption.CompactTokenEncryption`). Compact tokens are smaller, cheaper to
+              encode / decode and expired tokens are rejected before decryption. Compact format requires **pycryptodome**
+              (AES GCM mode).
+
+        Tokens issued in one format can not be decrypted after switching to the other format. By default, this property is set
+        to public.'''
+
+        return "public"
     
     @property
     def global_response_headers(self):
@@ -24,6 +24,8 @@ from fantastico.oauth2.tokengenerator_factory import TokenGeneratorFactory
 from fantastico.oauth2.tokens_service import TokensService
 from fantastico.settings import BasicSettings, SettingsFacade, AwsStageSettings
 from fantastico.utils import instantiator
+from sqlalchemy import event
+import contextlib
 import inspect
 import os
 import unittest
@@ -64,6 +66,39 @@ class FantasticoBaseTestCase(unittest.TestCase):
             cleanup = getattr(cls, "cleanup_once")
             cleanup()
 
+    @contextlib.contextmanager
+    def assert_queries_count(self, engine, expected_count):
+        '''This method provides a context in which all sql statements executed through the given engine (or connection) are
+        counted. When the context ends, the test fails if the number of executed statements is not the expected one. It is
+        extremely useful for catching lazy loads (N+1 queries) regressions:
+
+        .. code-block:: python
+
+            with self.assert_queries_count(engine, 2) as statements:
+                facade.get_records_paged(start_record=0, end_record=100, eager_load={"address": ModelFacade.LOAD_SELECTIN})
+
+        :param engine: The sqlalchemy engine or connection which executes the statements.
+        :param expected_count: The number of statements which must be executed in the context.
+        :type expected_count: int
+        :returns: The list of executed statements (populated while the context is active).
+        '''
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany): # pylint: disable=R0913,W0613
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        self.assertEqual(expected_count, len(statements),
+                         "Expected %s statements but %s were executed:\n%s" % (expected_count, len(statements),
+                                                                                "\n".join(statements)))
+
 class FakeControllerDecorator(object):
     '''This is a simple mock that can be used to replace Controller decorator.'''
 
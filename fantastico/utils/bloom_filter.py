@@ -0,0 +1,97 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.utils.bloom_filter
+'''
+import math
+
+class BloomFilter(object):
+    '''This class provides an in memory Bloom filter: a compact probabilistic set which never reports false negatives and
+    reports false positives with (approximately) the given probability as long as it holds at most **expected_items** keys.
+    Keys can not be removed: in order to forget keys, build a new filter.
+
+    .. code-block:: python
+
+        bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+
+        bloom.add("token-1")
+
+        "token-1" in bloom # True
+        "token-2" in bloom # False (or True with 1% probability)
+
+    Bit positions are obtained by double hashing the builtin hash of the key, so a filter must not be shared between
+    processes.'''
+
+    def __init__(self, expected_items, false_positive_rate=0.01):
+        expected_items = max(expected_items, 1)
+
+        self._bits_count = max(int(math.ceil(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2))), 8)
+        self._hashes_count = max(int(round(self._bits_count / expected_items * math.log(2))), 1)
+        self._bits = bytearray((self._bits_count + 7) // 8)
+        self._items_count = 0
+
+    @property
+    def bits_count(self):
+        '''This property returns the size (in bits) of this filter.'''
+
+        return self._bits_count
+
+    @property
+    def hashes_count(self):
+        '''This property returns the number of bits set for each key.'''
+
+        return self._hashes_count
+
+    def add(self, key):
+        '''This method adds the given key into the filter.'''
+
+        bits = self._bits
+        bits_count = self._bits_count
+        key_hash = hash(key)
+        position = key_hash & 0xFFFFFFFF
+        step = (key_hash >> 32) & 0xFFFFFFFF | 1
+
+        for _ in range(self._hashes_count):
+            position %= bits_count
+            bits[position >> 3] |= 1 << (position & 7)
+            position += step
+
+        self._items_count += 1
+
+    def __contains__(self, key):
+        '''This method returns False if the given key was never added into the filter and True if the key might have been
+        added.'''
+
+        bits = self._bits
+        bits_count = self._bits_count
+        key_hash = hash(key)
+        position = key_hash & 0xFFFFFFFF
+        step = (key_hash >> 32) & 0xFFFFFFFF | 1
+
+        for _ in range(self._hashes_count):
+            position %= bits_count
+
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+
+            position += step
+
+        return True
+
+    def __len__(self):
+        '''This method returns the number of keys added into the filter.'''
+
+        return self._items_count
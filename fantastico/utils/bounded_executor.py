@@ -0,0 +1,89 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.utils.bounded_executor
+'''
+from concurrent.futures import ThreadPoolExecutor
+from fantastico.exceptions import FantasticoExecutorBusyError
+import threading
+
+class BoundedExecutor(object):
+    '''This class provides a thread pool with a bounded queue. It is used for running expensive cpu bound operations (e.g
+    password hashing) outside request threads without letting a burst of such operations starve other requests: at most
+    **max_workers** tasks run concurrently, at most **max_queue** tasks wait for a worker and any other task is rejected
+    immediately with :py:class:`fantastico.exceptions.FantasticoExecutorBusyError` (mapped to http 503).
+
+    .. code-block:: python
+
+        executor = BoundedExecutor(max_workers=2, max_queue=8)
+
+        passwd_hash = executor.run(hasher.hash_password, "plain password")
+
+    Worker threads are started lazily (when the first task is submitted).'''
+
+    def __init__(self, max_workers, max_queue, thread_name_prefix="fantastico-executor", executor_cls=ThreadPoolExecutor):
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor = executor_cls(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+    @property
+    def max_workers(self):
+        '''This property returns the maximum number of tasks executed concurrently.'''
+
+        return self._max_workers
+
+    @property
+    def max_queue(self):
+        '''This property returns the maximum number of tasks waiting for a free worker.'''
+
+        return self._max_queue
+
+    def submit(self, func, *args, **kwargs):
+        '''This method schedules the given callable and returns a future for its result.
+
+        :raises fantastico.exceptions.FantasticoExecutorBusyError: if all workers are busy and the queue is full.'''
+
+        if not self._slots.acquire(blocking=False):
+            raise FantasticoExecutorBusyError("Executor is busy: %s tasks running or queued." % \
+                                              (self._max_workers + self._max_queue))
+
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+
+            raise
+
+        future.add_done_callback(self._release_slot)
+
+        return future
+
+    def run(self, func, *args, **kwargs):
+        '''This method executes the given callable on a worker, waits for it to complete and returns its result (exceptions
+        raised by the callable are raised again in the calling thread).'''
+
+        return self.submit(func, *args, **kwargs).result()
+
+    def shutdown(self, wait=True):
+        '''This method stops the worker threads once all scheduled tasks complete.'''
+
+        self._executor.shutdown(wait=wait)
+
+    def _release_slot(self, future): # pylint: disable=W0613
+        '''This method frees the slot of a completed task.'''
+
+        self._slots.release()
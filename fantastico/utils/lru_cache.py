@@ -0,0 +1,144 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.utils.lru_cache
+'''
+from collections import OrderedDict
+import threading
+import time
+
+class LruCache(object):
+    '''This class provides a bounded, thread safe least recently used cache. Once the cache is full, the least recently
+    accessed entry is evicted. Hits and misses are counted so that cache efficiency can be monitored.
+
+    .. code-block:: python
+
+        cache = LruCache(max_size=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a") # 1
+        cache.put("c", 3) # "b" is evicted.
+
+        print(cache.stats) # {"hits": 1, "misses": 0, "size": 2, "max_size": 2}
+
+    A cache with **max_size** less or equal to 0 is disabled: it never stores entries. If **ttl** (seconds) is given, entries
+    expire after the given number of seconds from the moment they were stored (expired entries are accounted as misses). Each
+    entry can override the cache ttl when it is stored.'''
+
+    def __init__(self, max_size, ttl=None, clock=time.monotonic):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self):
+        '''This property returns the maximum number of entries held by this cache.'''
+
+        return self._max_size
+
+    @property
+    def ttl(self):
+        '''This property returns the number of seconds after which entries expire (None if entries never expire).'''
+
+        return self._ttl
+
+    @property
+    def stats(self):
+        '''This property returns a dictionary containing hits / misses counters, the current size and the maximum size of this
+        cache.'''
+
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._entries), "max_size": self._max_size}
+
+    def get(self, key, default=None):
+        '''This method returns the value cached for the given key or default if the key is not cached. A successful lookup
+        marks the entry as most recently used.'''
+
+        with self._lock:
+            try:
+                value, expires_at = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def put(self, key, value, ttl=None):
+        '''This method stores the given value under the given key. If the cache is full the least recently used entry is
+        evicted. If ttl (seconds) is given, the entry expires after the given number of seconds instead of cache ttl.'''
+
+        if self._max_size <= 0:
+            return
+
+        ttl = ttl if ttl is not None else self._ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        '''This method removes the given key from cache (if cached).'''
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate):
+        '''This method removes all entries for which predicate(key, value) returns True. All entries are checked so this
+        method is meant for rare invalidations of entries which can not be identified by key.
+
+        :returns: The number of removed entries.
+        :rtype: int'''
+
+        with self._lock:
+            keys = [key for key, (value, _) in self._entries.items() if predicate(key, value)]
+
+            for key in keys:
+                del self._entries[key]
+
+            return len(keys)
+
+    def clear(self):
+        '''This method removes all cached entries and resets hits / misses counters.'''
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        entry = self._entries.get(key)
+
+        return entry is not None and (entry[1] is None or entry[1] > self._clock())
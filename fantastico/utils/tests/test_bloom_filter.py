@@ -0,0 +1,62 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.utils.tests.test_bloom_filter
+'''
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from fantastico.utils.bloom_filter import BloomFilter
+
+class BloomFilterTests(FantasticoUnitTestsCase):
+    '''This class provides the tests suite for in memory bloom filter.'''
+
+    def test_sizing(self):
+        '''This test case ensures filter size and number of hashes are derived from expected items and false positive rate.'''
+
+        bloom = BloomFilter(1000, 0.01)
+
+        self.assertEqual(9586, bloom.bits_count)
+        self.assertEqual(7, bloom.hashes_count)
+        self.assertEqual(0, len(bloom))
+
+        bloom = BloomFilter(0, 0.01)
+
+        self.assertEqual(10, bloom.bits_count)
+        self.assertEqual(7, bloom.hashes_count)
+
+    def test_no_false_negatives(self):
+        '''This test case ensures all added keys are found in the filter.'''
+
+        bloom = BloomFilter(1000, 0.01)
+
+        for idx in range(1000):
+            bloom.add("token-%s" % idx)
+
+        self.assertEqual(1000, len(bloom))
+
+        for idx in range(1000):
+            self.assertTrue("token-%s" % idx in bloom)
+
+    def test_false_positive_rate(self):
+        '''This test case ensures the false positive rate of a full filter is close to the requested one.'''
+
+        bloom = BloomFilter(1000, 0.01)
+
+        for idx in range(1000):
+            bloom.add("token-%s" % idx)
+
+        false_positives = len([idx for idx in range(10000) if "other-token-%s" % idx in bloom])
+
+        self.assertLess(false_positives, 300)
@@ -0,0 +1,91 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.utils.tests.test_bounded_executor
+'''
+from fantastico.exceptions import FantasticoExecutorBusyError
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from fantastico.utils.bounded_executor import BoundedExecutor
+from mock import Mock
+import threading
+
+class BoundedExecutorTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases for bounded thread pool executor.'''
+
+    _executor = None
+
+    def init(self):
+        '''This method is invoked automatically in order to setup common dependencies for all test cases.'''
+
+        self._executor = BoundedExecutor(max_workers=1, max_queue=1)
+
+    def cleanup(self):
+        '''This method is invoked automatically in order to stop executor workers.'''
+
+        self._executor.shutdown()
+
+    def test_run_ok(self):
+        '''This test case ensures tasks are executed on a worker thread and their result is returned.'''
+
+        self.assertEqual(1, self._executor.max_workers)
+        self.assertEqual(1, self._executor.max_queue)
+
+        thread_name = self._executor.run(lambda: threading.current_thread().name)
+
+        self.assertNotEqual(threading.current_thread().name, thread_name)
+        self.assertEqual(5, self._executor.run(lambda x, y=0: x + y, 2, y=3))
+
+    def test_run_ex(self):
+        '''This test case ensures exceptions raised by tasks are raised in the calling thread and the task slot is freed.'''
+
+        def fail():
+            raise ValueError("Unexpected error.")
+
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                self._executor.run(fail)
+
+    def test_submit_busy(self):
+        '''This test case ensures tasks are rejected once all workers are busy and the queue is full. Slots are freed once
+        tasks complete.'''
+
+        release = threading.Event()
+
+        running = self._executor.submit(release.wait)
+        queued = self._executor.submit(release.wait)
+
+        with self.assertRaises(FantasticoExecutorBusyError) as ctx:
+            self._executor.submit(release.wait)
+
+        self.assertEqual(503, ctx.exception.http_code)
+
+        release.set()
+        running.result()
+        queued.result()
+
+        self.assertTrue(self._executor.run(release.wait))
+
+    def test_submit_executor_ex(self):
+        '''This test case ensures the task slot is freed if the underlining executor rejects the task.'''
+
+        thread_pool = Mock()
+        thread_pool.submit = Mock(side_effect=RuntimeError("Executor is shutdown."))
+
+        executor = BoundedExecutor(max_workers=1, max_queue=0, executor_cls=Mock(return_value=thread_pool))
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                executor.submit(Mock())
@@ -0,0 +1,132 @@
+'''
+Copyright 2013 Cosnita Radu Viorel
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+.. py:module:: fantastico.utils.tests.test_lru_cache
+'''
+from fantastico.tests.base_case import FantasticoUnitTestsCase
+from fantastico.utils.lru_cache import LruCache
+
+class LruCacheTests(FantasticoUnitTestsCase):
+    '''This class provides the test cases for least recently used cache.'''
+
+    def test_get_put_ok(self):
+        '''This test case ensures cached values are correctly retrieved and hits / misses are counted.'''
+
+        cache = LruCache(max_size=5)
+
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual("default", cache.get("b", "default"))
+
+        self.assertEqual({"hits": 1, "misses": 2, "size": 1, "max_size": 5}, cache.stats)
+
+    def test_eviction_lru(self):
+        '''This test case ensures least recently used entry is evicted once the cache is full.'''
+
+        cache = LruCache(max_size=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertTrue("c" in cache)
+
+    def test_invalidate_clear(self):
+        '''This test case ensures entries can be explicitly removed from cache.'''
+
+        cache = LruCache(max_size=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.invalidate("a")
+        cache.invalidate("not-cached")
+
+        self.assertFalse("a" in cache)
+        self.assertEqual(2, cache.get("b"))
+
+        cache.clear()
+
+        self.assertEqual({"hits": 0, "misses": 0, "size": 0, "max_size": 2}, cache.stats)
+
+    def test_disabled_cache(self):
+        '''This test case ensures a cache with no size never stores values.'''
+
+        cache = LruCache(max_size=0)
+
+        cache.put("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+
+    def test_ttl_expiry(self):
+        '''This test case ensures entries expire once ttl seconds passed since they were stored.'''
+
+        now = [100.0]
+        cache = LruCache(max_size=5, ttl=10, clock=lambda: now[0])
+
+        cache.put("a", 1)
+        now[0] = 109.9
+
+        self.assertEqual(10, cache.ttl)
+        self.assertTrue("a" in cache)
+        self.assertEqual(1, cache.get("a"))
+
+        now[0] = 110.0
+
+        self.assertFalse("a" in cache)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 0, "max_size": 5}, cache.stats)
+
+        cache.put("a", 2)
+
+        self.assertEqual(2, cache.get("a"))
+
+    def test_entry_ttl_expiry(self):
+        '''This test case ensures entries stored with their own ttl expire independently of cache ttl.'''
+
+        now = [100.0]
+        cache = LruCache(max_size=5, ttl=10, clock=lambda: now[0])
+
+        cache.put("a", 1, ttl=2)
+        cache.put("b", 2)
+        cache.put("c", 3, ttl=30)
+        now[0] = 102.0
+
+        self.assertFalse("a" in cache)
+        self.assertTrue("b" in cache)
+
+        now[0] = 110.0
+
+        self.assertFalse("b" in cache)
+        self.assertEqual(3, cache.get("c"))
+
+    def test_invalidate_if(self):
+        '''This test case ensures all entries matching a predicate can be removed from cache.'''
+
+        cache = LruCache(max_size=5)
+
+        for key, value in [("a", 1), ("b", 2), ("c", 1)]:
+            cache.put(key, value)
+
+        self.assertEqual(2, cache.invalidate_if(lambda key, value: value == 1))
+        self.assertEqual(0, cache.invalidate_if(lambda key, value: value == 1))
+        self.assertEqual(1, len(cache))
+        self.assertEqual(2, cache.get("b"))
@@ -13,4 +13,4 @@ pip install virtual_env/libs/mysql-connector
 pip install sqlalchemy
 pip install mock
 pip install uwsgi
-pip install "pycrypto>=2.6"
+pip install "pycryptodome>=3.4"